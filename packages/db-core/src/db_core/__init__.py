@@ -2,7 +2,7 @@
 
 This package provides common database utilities:
 - Configuration: DatabaseConfig, get_database_config
-- Connection: get_engine, reset_engine
+- Connection: get_engine, warm_pool, reset_engine
 - Session: get_session_factory, reset_session_factory, get_db_session, transaction
 - Lifecycle: init_db, drop_all_tables
 - Base: SQLAlchemy declarative Base
@@ -29,6 +29,7 @@ from db_core.base import Base
 # Connection
 from db_core.connection import (
     get_engine,
+    warm_pool,
     reset_engine,
 )
 
@@ -72,6 +73,7 @@ __all__ = [
     "Base",
     # Connection
     "get_engine",
+    "warm_pool",
     "reset_engine",
     # Session
     "get_session_factory",
@@ -2,13 +2,15 @@
 
 This module provides thread-safe database engine management:
 - get_engine: Get or create singleton SQLAlchemy engine
+- warm_pool: Open pooled connections ahead of the first requests
 - reset_engine: Dispose and reset the global engine
 """
 
 import threading
+from contextlib import ExitStack
 from typing import Optional
 
-from sqlalchemy import create_engine, Engine, text
+from sqlalchemy import create_engine, Engine, QueuePool, text
 
 from db_core.config import get_database_config
 from db_core.exceptions import DatabaseConnectionError
@@ -56,6 +58,37 @@ def get_engine() -> Engine:
     return _engine
 
 
+def warm_pool(min_size: int) -> int:
+    """Open connections until the engine's pool holds at least min_size of them.
+
+    The connections are checked out together and then returned, so they stay
+    open in the pool instead of being opened by the first requests.
+
+    Args:
+        min_size: Number of connections to keep open, capped at the pool size
+
+    Returns:
+        Number of connections open in the pool
+
+    Raises:
+        DatabaseConnectionError: If connection fails
+    """
+    engine = get_engine()
+    if not isinstance(engine.pool, QueuePool):
+        # Other pools do not keep a fixed number of connections open
+        return 0
+    target = max(0, min(min_size, engine.pool.size()))
+
+    try:
+        with ExitStack() as stack:
+            for _ in range(target):
+                stack.enter_context(engine.connect())
+    except Exception as e:
+        raise DatabaseConnectionError(f"Failed to connect to database: {e}") from e
+
+    return target
+
+
 def reset_engine() -> None:
     """Reset the global engine.
 
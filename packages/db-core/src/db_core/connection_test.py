@@ -4,9 +4,9 @@ from unittest.mock import patch, MagicMock
 import threading
 
 import pytest
-from sqlalchemy import Engine
+from sqlalchemy import Engine, NullPool, create_engine
 
-from db_core.connection import get_engine, reset_engine
+from db_core.connection import get_engine, reset_engine, warm_pool
 from db_core.config import DatabaseConfig
 from db_core.exceptions import DatabaseConnectionError
 
@@ -198,6 +198,33 @@ class TestGetEngineThreadSafety:
             mock_create.assert_called_once()
 
 
+class TestWarmPool:
+    """Test suite for warm_pool function."""
+
+    def test_opens_connections_up_to_pool_size(self, tmp_path):
+        """warm_pool leaves min_size connections open in the pool, capped at its size."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'warm.db'}", pool_size=3)
+        with patch("db_core.connection.get_engine", return_value=engine):
+            opened = warm_pool(5)
+
+        assert opened == 3
+        assert engine.pool.checkedin() == 3
+        engine.dispose()
+
+    def test_skips_pools_without_fixed_size(self, tmp_path):
+        """warm_pool opens nothing for pools that do not keep connections."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'warm.db'}", poolclass=NullPool)
+        with patch("db_core.connection.get_engine", return_value=engine):
+            assert warm_pool(5) == 0
+
+    def test_raises_database_connection_error_on_failure(self):
+        """warm_pool raises DatabaseConnectionError when a connection fails."""
+        engine = create_engine("sqlite:////nonexistent/dir/warm.db", pool_size=2)
+        with patch("db_core.connection.get_engine", return_value=engine):
+            with pytest.raises(DatabaseConnectionError):
+                warm_pool(2)
+
+
 class TestResetEngine:
     """Test suite for reset_engine function."""
 
@@ -0,0 +1,57 @@
+"""add embedding_pending marker to essays
+
+Revision ID: 005_add_embedding_pending
+Revises: 004_fix_embedding_column_type
+Create Date: 2026-10-16
+
+Embeddings are generated in the background after an essay is created or updated.
+The embedding_pending column marks essays whose embedding is missing or stale, so
+work lost to a failure or a shutdown is picked up again by the next backfill.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "005_add_embedding_pending"
+down_revision: Union[str, None] = "004_fix_embedding_column_type"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "essays",
+        sa.Column(
+            "embedding_pending",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.true(),
+        ),
+        schema="essays",
+    )
+
+    # Existing essays only need work if they never got an embedding
+    op.execute(
+        """
+        UPDATE essays.essays
+        SET embedding_pending = false
+        WHERE embedding IS NOT NULL
+        """
+    )
+
+    # Partial index, so finding pending essays does not scan the whole table
+    op.execute(
+        """
+        CREATE INDEX ix_essays_embedding_pending
+        ON essays.essays (id)
+        WHERE embedding_pending
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS essays.ix_essays_embedding_pending")
+    op.drop_column("essays", "embedding_pending", schema="essays")
@@ -0,0 +1,43 @@
+"""add HNSW index on essay embeddings
+
+Revision ID: 006_add_embedding_hnsw_index
+Revises: 005_add_embedding_pending
+Create Date: 2026-10-16
+
+Vector search orders essays by cosine distance (<=>) to the query embedding.
+Without an index every search computes the distance to every essay. The HNSW
+index with vector_cosine_ops answers these searches approximately, and the
+hnsw.ef_search setting trades recall for latency per query.
+
+The index is built concurrently so essays stay writable while it is built.
+Requires pgvector 0.5.0 or later.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "006_add_embedding_hnsw_index"
+down_revision: Union[str, None] = "005_add_embedding_pending"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        # m and ef_construction are pgvector's defaults, spelled out for reference
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_essays_embedding_hnsw
+            ON essays.essays
+            USING hnsw (embedding vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS essays.ix_essays_embedding_hnsw")
@@ -0,0 +1,38 @@
+"""add content_version to essays
+
+Revision ID: 007_add_essay_content_version
+Revises: 006_add_embedding_hnsw_index
+Create Date: 2026-10-16
+
+Background embedding work can finish out of order, and a backfill page can be read
+before an edit. content_version is bumped with every edit, so an embedding computed
+from older content neither overwrites a newer one nor clears embedding_pending.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "007_add_essay_content_version"
+down_revision: Union[str, None] = "006_add_embedding_hnsw_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "essays",
+        sa.Column(
+            "content_version",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+        schema="essays",
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("essays", "content_version", schema="essays")
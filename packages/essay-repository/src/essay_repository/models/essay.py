@@ -3,7 +3,7 @@
 from datetime import datetime, UTC
 from typing import Any, Optional
 
-from sqlalchemy import Text
+from sqlalchemy import Text, true
 from sqlalchemy.dialects.postgresql import ARRAY, VARCHAR, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 from pgvector.sqlalchemy import Vector
@@ -24,6 +24,12 @@ class Essay(Base):
     keywords: Mapped[Optional[list[str]]] = mapped_column(ARRAY(VARCHAR), nullable=True)
     embedding: Mapped[Optional[list[float]]] = mapped_column(Vector(512), nullable=True)
     search_vector: Mapped[Optional[Any]] = mapped_column(TSVECTOR, nullable=True)
+    # Set while the embedding is missing or older than the essay's content
+    embedding_pending: Mapped[bool] = mapped_column(
+        default=True, server_default=true(), nullable=False
+    )
+    # Bumped on every edit; embeddings are stored only for the version they were computed from
+    content_version: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
 
     created_at: Mapped[datetime] = mapped_column(default=lambda: datetime.now(UTC), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
@@ -5,11 +5,11 @@ the IEssayRepository interface for CRUD operations on essays.
 Search functionality is provided by the EssaySearchMixin.
 """
 
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy import select, func, desc
+from sqlalchemy import CursorResult, bindparam, desc, func, select, text, update
 
 from db_core import BaseRepository, TransactionError
 from job_agent_platform_contracts.essay_repository import IEssayRepository
@@ -24,6 +24,20 @@ from essay_repository.models import Essay
 from essay_repository.repository.search_mixin import EssaySearchMixin
 
 
+# Joins the pages of IDs, content versions and vectors of update_embeddings to the
+# table. Vectors are sent as text, since psycopg2 has no array adapter for pgvector's type.
+_BULK_UPDATE_EMBEDDINGS = text(
+    """
+    UPDATE essays.essays AS e
+    SET embedding = CAST(d.vector AS vector), embedding_pending = false
+    FROM unnest(
+        CAST(:ids AS integer[]), CAST(:versions AS integer[]), CAST(:vectors AS text[])
+    ) AS d(id, version, vector)
+    WHERE e.id = d.id AND e.content_version = d.version
+    """
+)
+
+
 class EssayRepository(EssaySearchMixin, BaseRepository, IEssayRepository):
     """Repository that persists essays to the database.
 
@@ -235,6 +249,9 @@ class EssayRepository(EssaySearchMixin, BaseRepository, IEssayRepository):
                     essay.answer = essay_data["answer"]
                 if "keywords" in essay_data:
                     essay.keywords = essay_data["keywords"]
+                if essay_data:
+                    essay.embedding_pending = True
+                    essay.content_version = Essay.content_version + 1
 
                 session.flush()
 
@@ -251,34 +268,127 @@ class EssayRepository(EssaySearchMixin, BaseRepository, IEssayRepository):
         except SQLAlchemyError as e:
             raise TransactionError(f"Failed to update essay: {e}") from e
 
-    def update_embedding(self, essay_id: int, embedding: List[float]) -> bool:
+    def update_embedding(self, essay_id: int, embedding: List[float], content_version: int) -> bool:
         """
-        Update the embedding for an essay.
+        Update the embedding for an essay and clear its pending marker.
+
+        The embedding is stored only while the essay is still at the content version
+        it was computed from, so a task that lost a race with an edit changes nothing.
 
         Args:
             essay_id: The essay's primary key identifier
             embedding: The embedding vector (1536 dimensions)
+            content_version: The essay's content_version the embedding was computed from
 
         Returns:
-            True if updated, False if essay not found
+            True if updated, False if essay not found or edited since
         """
         if essay_id <= 0:
             return False
 
         try:
             with self._session_scope(commit=True) as session:
-                stmt = select(Essay).where(Essay.id == essay_id)
-                essay = session.scalar(stmt)
+                stmt = (
+                    update(Essay)
+                    .where(Essay.id == essay_id, Essay.content_version == content_version)
+                    .values(embedding=embedding, embedding_pending=False)
+                )
+                result = cast(CursorResult[Any], session.execute(stmt))
+                return result.rowcount > 0
 
-                if essay is None:
-                    return False
+        except SQLAlchemyError as e:
+            raise TransactionError(f"Failed to update embedding: {e}") from e
 
-                essay.embedding = embedding
-                session.flush()
-                return True
+    def get_pending_embeddings(self, limit: int, after_id: int = 0) -> List[EssaySchema]:
+        """
+        Get a page of essays whose embedding is missing or stale.
+
+        Args:
+            limit: Maximum number of essays to return
+            after_id: Only essays with a greater ID are returned, so pages are
+                fetched by passing the last ID of the previous page
+
+        Returns:
+            List of Essay schema instances ordered by ID (may be empty)
+        """
+        if limit <= 0:
+            return []
+
+        with self._session_scope(commit=False) as session:
+            stmt = (
+                select(Essay)
+                .where(Essay.embedding_pending.is_(True), Essay.id > after_id)
+                .order_by(Essay.id)
+                .limit(limit)
+            )
+            essays = session.scalars(stmt).all()
+
+            if self._close_session:
+                for essay in essays:
+                    session.expunge(essay)
+
+            return [self._model_to_schema(essay) for essay in essays]
+
+    def update_embeddings(self, embeddings: Dict[int, Tuple[int, List[float]]]) -> int:
+        """
+        Update the embeddings of several essays in one statement.
+
+        On PostgreSQL the IDs, content versions and vectors are sent as arrays and
+        joined to the table by a single UPDATE, so a page costs one round trip.
+        Pending markers are cleared. Essays that no longer exist or were edited
+        after their embedding was computed are left unchanged.
+
+        Args:
+            embeddings: (content_version, embedding vector) pairs by essay ID, where
+                content_version is the one the embedding was computed from
+
+        Returns:
+            Number of essays updated
+
+        Raises:
+            TransactionError: If database transaction fails
+        """
+        if not embeddings:
+            return 0
+
+        try:
+            with self._session_scope(commit=True) as session:
+                if session.get_bind().dialect.name == "postgresql":
+                    result = session.execute(
+                        _BULK_UPDATE_EMBEDDINGS,
+                        {
+                            "ids": list(embeddings),
+                            "versions": [version for version, _ in embeddings.values()],
+                            "vectors": [
+                                "[" + ",".join(str(v) for v in embedding) + "]"
+                                for _, embedding in embeddings.values()
+                            ],
+                        },
+                    )
+                else:
+                    # Dialects without arrays (SQLite in tests) update row by row
+                    table = Essay.__table__
+                    stmt = (
+                        update(table)
+                        .where(
+                            table.c.id == bindparam("essay_id"),
+                            table.c.content_version == bindparam("version"),
+                        )
+                        .values(embedding=bindparam("vector"), embedding_pending=False)
+                    )
+                    result = session.execute(
+                        stmt,
+                        [
+                            {"essay_id": essay_id, "version": version, "vector": embedding}
+                            for essay_id, (version, embedding) in embeddings.items()
+                        ],
+                    )
+
+                # UPDATE statements return a CursorResult, which carries the rowcount
+                return cast(CursorResult[Any], result).rowcount
 
         except SQLAlchemyError as e:
-            raise TransactionError(f"Failed to update embedding: {e}") from e
+            raise TransactionError(f"Failed to update embeddings: {e}") from e
 
     def update_keywords(self, essay_id: int, keywords: List[str]) -> bool:
         """
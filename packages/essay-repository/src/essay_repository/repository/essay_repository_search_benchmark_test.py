@@ -0,0 +1,182 @@
+"""Benchmark of essay search over a large corpus.
+
+Inserts ESSAY_COUNT essays into the migrated PostgreSQL database at DATABASE_URL
+inside a transaction that is rolled back afterwards, checks the query plan of the
+search and times it. Needs PostgreSQL, so it is skipped where DATABASE_URL is
+not a PostgreSQL URL.
+
+Run with: pytest -m benchmark -s
+"""
+
+import os
+import random
+import time
+from typing import Generator, List, Optional
+
+import pytest
+from sqlalchemy import Select, create_engine, insert, text
+from sqlalchemy.orm import Session
+
+from essay_repository.models import Essay
+from essay_repository.repository import EssayRepository
+from essay_repository.repository.search_mixin import (
+    hybrid_search_statement,
+    text_search_statement,
+)
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(
+        not os.environ.get("DATABASE_URL", "").startswith("postgresql"),
+        reason="Requires PostgreSQL with the essay migrations applied",
+    ),
+]
+
+ESSAY_COUNT = 10_000
+QUERY_RUNS = 50
+EMBEDDING_DIMENSIONS = 1536
+
+_VOCABULARY = (
+    "team project deadline customer python django postgres docker cloud budget "
+    "mentoring conflict feedback release migration testing design architecture "
+    "leadership hiring incident latency scaling security analytics roadmap"
+).split()
+# Rare enough that the index is the cheaper way to find its essays
+_RARE_WORD = "kubernetes"
+
+
+def _random_embedding(rng: random.Random) -> List[float]:
+    return [rng.uniform(-1.0, 1.0) for _ in range(EMBEDDING_DIMENSIONS)]
+
+
+def _essay_rows(count: int) -> List[dict]:
+    rng = random.Random(42)
+    rows = []
+    for i in range(count):
+        words = rng.choices(_VOCABULARY, k=60)
+        if i % 200 == 0:
+            words.append(_RARE_WORD)
+        rows.append(
+            {
+                "question": f"Tell us about {' '.join(rng.choices(_VOCABULARY, k=4))}",
+                "answer": " ".join(words),
+                "keywords": rng.sample(_VOCABULARY, 3),
+                "embedding": _random_embedding(rng),
+                "embedding_pending": False,
+            }
+        )
+    return rows
+
+
+@pytest.fixture(scope="module")
+def session() -> Generator[Session, None, None]:
+    """Session on a transaction holding the benchmark corpus, rolled back afterwards."""
+    engine = create_engine(os.environ["DATABASE_URL"])
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    session.execute(insert(Essay), _essay_rows(ESSAY_COUNT))
+    # Index built after the load, as the migration does for an existing table
+    session.execute(text("REINDEX INDEX essays.ix_essays_embedding_hnsw"))
+    session.execute(text("ANALYZE essays.essays"))
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+        engine.dispose()
+
+
+def _explain(session: Session, statement: Select) -> List[str]:
+    dialect = session.get_bind().dialect
+    compiled = statement.compile(dialect=dialect)
+    params = {}
+    for name, value in compiled.params.items():
+        process = compiled.binds[name].type.bind_processor(dialect)
+        params[name] = process(value) if process else value
+
+    plan = session.connection().exec_driver_sql(f"EXPLAIN {compiled}", params).scalars().all()
+    print("\n" + "\n".join(plan))
+    return list(plan)
+
+
+def test_text_search_uses_the_gin_index(session: Session) -> None:
+    plan = _explain(session, text_search_statement(_RARE_WORD, 10))
+
+    assert any("ix_essays_search_vector" in line for line in plan)
+
+
+def test_text_search_latency(session: Session) -> None:
+    repository = EssayRepository(session=session)
+
+    started = time.perf_counter()
+    for _ in range(QUERY_RUNS):
+        results = repository.search_by_text(f"{_RARE_WORD} leadership", limit=10)
+    elapsed = time.perf_counter() - started
+
+    print(f"\nsearch_by_text over {ESSAY_COUNT} essays: {elapsed / QUERY_RUNS * 1000:.2f} ms")
+    assert results
+    assert all(_RARE_WORD in essay.answer for essay in results)
+
+
+def test_vector_search_uses_the_hnsw_index(session: Session) -> None:
+    vector = "[" + ",".join(str(v) for v in _random_embedding(random.Random(7))) + "]"
+
+    plan = (
+        session.execute(
+            text(
+                f"""
+                EXPLAIN SELECT id FROM essays.essays
+                WHERE embedding IS NOT NULL
+                ORDER BY embedding <=> '{vector}'::vector
+                LIMIT 10
+                """
+            )
+        )
+        .scalars()
+        .all()
+    )
+    print("\n" + "\n".join(plan))
+
+    assert any("ix_essays_embedding_hnsw" in line for line in plan)
+
+
+@pytest.mark.parametrize("ef_search", [None, 200])
+def test_vector_search_latency(session: Session, ef_search: Optional[int]) -> None:
+    repository = EssayRepository(session=session)
+    embedding = _random_embedding(random.Random(7))
+
+    started = time.perf_counter()
+    for _ in range(QUERY_RUNS):
+        results = repository.search_by_embedding(embedding, limit=10, ef_search=ef_search)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"\nsearch_by_embedding over {ESSAY_COUNT} essays, ef_search={ef_search}: "
+        f"{elapsed / QUERY_RUNS * 1000:.2f} ms"
+    )
+    assert len(results) == 10
+
+
+def test_hybrid_search_uses_both_indexes(session: Session) -> None:
+    embedding = _random_embedding(random.Random(7))
+
+    plan = _explain(session, hybrid_search_statement(embedding, _RARE_WORD, 10))
+
+    assert any("ix_essays_embedding_hnsw" in line for line in plan)
+    assert any("ix_essays_search_vector" in line for line in plan)
+
+
+def test_hybrid_search_latency(session: Session) -> None:
+    repository = EssayRepository(session=session)
+    embedding = _random_embedding(random.Random(7))
+
+    started = time.perf_counter()
+    for _ in range(QUERY_RUNS):
+        results = repository.search_hybrid(embedding, f"{_RARE_WORD} leadership", limit=10)
+    elapsed = time.perf_counter() - started
+
+    print(f"\nsearch_hybrid over {ESSAY_COUNT} essays: {elapsed / QUERY_RUNS * 1000:.2f} ms")
+    assert len(results) == 10
+    assert any(result.text_rank is not None for result in results)
@@ -8,7 +8,9 @@ The tests are designed to fail until the search methods are implemented.
 """
 
 import os
+from types import SimpleNamespace
 from typing import List
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -73,7 +75,9 @@ class TestEssayRepositoryUpdateEmbedding:
         self, repository, sample_embedding, repo_sample_essay
     ):
         """Test that update_embedding returns True for existing essay."""
-        result = repository.update_embedding(repo_sample_essay.id, sample_embedding)
+        result = repository.update_embedding(
+            repo_sample_essay.id, sample_embedding, repo_sample_essay.content_version
+        )
 
         assert result is True
 
@@ -81,19 +85,19 @@ class TestEssayRepositoryUpdateEmbedding:
         self, repository, sample_embedding
     ):
         """Test that update_embedding returns False for non-existent essay."""
-        result = repository.update_embedding(99999, sample_embedding)
+        result = repository.update_embedding(99999, sample_embedding, 0)
 
         assert result is False
 
     def test_update_embedding_returns_false_for_zero_id(self, repository, sample_embedding):
         """Test that update_embedding returns False for zero ID."""
-        result = repository.update_embedding(0, sample_embedding)
+        result = repository.update_embedding(0, sample_embedding, 0)
 
         assert result is False
 
     def test_update_embedding_returns_false_for_negative_id(self, repository, sample_embedding):
         """Test that update_embedding returns False for negative ID."""
-        result = repository.update_embedding(-1, sample_embedding)
+        result = repository.update_embedding(-1, sample_embedding, 0)
 
         assert result is False
 
@@ -129,7 +133,7 @@ class TestEssayRepositorySearchByEmbedding:
             )
             # Store embedding that varies by index
             embedding = [float(i * j) / 1536 for j in range(1536)]
-            repository.update_embedding(essay.id, embedding)
+            repository.update_embedding(essay.id, embedding, essay.content_version)
             essays.append(essay)
         return essays
 
@@ -274,6 +278,25 @@ class TestEssayRepositorySearchByText:
 
         assert len(result) >= 1
 
+    def test_search_by_text_excludes_non_matching_essays(self, repository, searchable_essays):
+        """Test that only essays matching the query are returned."""
+        result = repository.search_by_text("pipelines", limit=10)
+
+        assert [e.id for e in result] == [searchable_essays[2].id]
+
+    def test_search_by_text_ranks_question_matches_first(self, repository, searchable_essays):
+        """Test that matches in the question outrank matches in the answer only."""
+        essay = repository.create(
+            {
+                "question": "Describe a project",
+                "answer": "I built Python tooling.",
+            }
+        )
+
+        result = repository.search_by_text("python", limit=10)
+
+        assert [e.id for e in result] == [searchable_essays[0].id, essay.id]
+
     def test_search_by_text_returns_empty_for_no_matches(self, repository):
         """Test that no matches returns empty list."""
         repository.create({"answer": "Unrelated content"})
@@ -283,6 +306,229 @@ class TestEssayRepositorySearchByText:
         assert result == []
 
 
+class TestTextSearchStatement:
+    """Tests for the SQL issued by search_by_text, compiled without a database."""
+
+    def _compile(self, query: str, limit: int):
+        from sqlalchemy.dialects import postgresql
+
+        from essay_repository.repository.search_mixin import text_search_statement
+
+        return text_search_statement(query, limit).compile(dialect=postgresql.dialect())
+
+    def test_matches_search_vector_with_websearch_query(self):
+        """Rows are filtered by search_vector @@ websearch_to_tsquery."""
+        compiled = self._compile("python -java", 5)
+
+        assert "search_vector @@ websearch_to_tsquery(" in str(compiled)
+        assert "english" in compiled.params.values()
+        assert "python -java" in compiled.params.values()
+
+    def test_orders_by_cover_density_rank_in_the_database(self):
+        """Ranking and limit are applied by PostgreSQL."""
+        compiled = self._compile("python", 7)
+        sql = str(compiled)
+
+        assert "ORDER BY ts_rank_cd(" in sql
+        assert "DESC" in sql
+        assert 7 in compiled.params.values()
+
+    def test_blank_query_returns_no_essays(self, db_session):
+        """Blank queries return nothing without querying the database."""
+        repository = EssayRepository(session=db_session)
+        repository.create({"answer": "Some answer"})
+
+        assert repository.search_by_text("   ", limit=10) == []
+
+    def test_non_positive_limit_returns_no_essays(self, db_session):
+        """A limit of zero returns nothing."""
+        repository = EssayRepository(session=db_session)
+        repository.create({"answer": "Some answer"})
+
+        assert repository.search_by_text("answer", limit=0) == []
+
+
+class TestEfSearch:
+    """Tests for the hnsw.ef_search setting of the vector search, without a database."""
+
+    @pytest.fixture
+    def session(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def repository(self, session):
+        repository = EssayRepository(session=session)
+        scope = MagicMock()
+        scope.return_value.__enter__.return_value = session
+        repository._session_scope = scope
+        return repository
+
+    def _ef_search_settings(self, session) -> List[str]:
+        return [
+            call.args[1]["ef_search"]
+            for call in session.execute.call_args_list
+            if "hnsw.ef_search" in str(call.args[0])
+        ]
+
+    def test_default_ef_search_leaves_setting_untouched(self, repository, session):
+        """Small searches run with pgvector's default."""
+        repository.search_by_embedding([0.1, 0.2], limit=10)
+
+        assert self._ef_search_settings(session) == []
+
+    def test_ef_search_is_set_for_the_transaction(self, repository, session):
+        """A requested ef_search is applied with a transaction-local set_config."""
+        repository.search_by_embedding([0.1, 0.2], limit=10, ef_search=200)
+
+        assert self._ef_search_settings(session) == ["200"]
+        assert "set_config('hnsw.ef_search', :ef_search, true)" in str(
+            session.execute.call_args_list[0].args[0]
+        )
+
+    def test_ef_search_is_raised_to_the_limit(self, repository, session):
+        """HNSW returns at most ef_search rows, so it never stays below limit."""
+        repository.search_by_embedding([0.1, 0.2], limit=100, ef_search=20)
+
+        assert self._ef_search_settings(session) == ["100"]
+
+    def test_search_hybrid_sets_ef_search_for_its_vector_candidates(self, repository, session):
+        """search_hybrid applies ef_search, raised to its candidate pool size."""
+        repository.search_hybrid([0.1, 0.2], "python", limit=5, ef_search=80)
+        repository.search_hybrid([0.1, 0.2], "python", limit=20, ef_search=30)
+
+        assert self._ef_search_settings(session) == ["80", "60"]
+
+
+class TestHybridSearchStatement:
+    """Tests for the single statement issued by search_hybrid, compiled without a database."""
+
+    def _compile(self, query: str = "python", limit: int = 5, vector_weight: float = 0.5):
+        from sqlalchemy.dialects import postgresql
+
+        from essay_repository.repository.search_mixin import hybrid_search_statement
+
+        return hybrid_search_statement(
+            [0.1, 0.2], query, limit, vector_weight=vector_weight
+        ).compile(dialect=postgresql.dialect())
+
+    def test_ranks_vector_and_text_candidates_in_ctes(self):
+        """Both rankings run as CTEs over a candidate pool of three times the limit."""
+        compiled = self._compile(limit=5)
+        sql = str(compiled)
+
+        assert sql.startswith("WITH vector_ranked AS")
+        assert "text_ranked AS" in sql
+        assert "embedding <=> %(embedding_1)s) AS rank" in sql
+        assert "search_vector @@ websearch_to_tsquery(" in sql
+        assert list(compiled.params.values()).count(15) == 2
+
+    def test_fuses_rankings_with_weighted_rrf_in_sql(self):
+        """RRF scores are computed and ordered by the database, which applies the limit."""
+        compiled = self._compile(limit=5, vector_weight=0.8)
+        sql = str(compiled)
+
+        assert "FULL OUTER JOIN text_ranked" in sql
+        assert sql.rstrip().endswith("LIMIT %(param_5)s::INTEGER")
+        assert "ORDER BY fused.score DESC" in sql
+        assert 0.8 in compiled.params.values()
+        assert 60 in compiled.params.values()
+
+    def test_selects_only_search_result_columns(self):
+        """The embedding and search_vector columns are not loaded."""
+        select_list = str(self._compile()).rsplit(" SELECT ", 1)[1].split(" FROM ")[0]
+
+        assert "embedding" not in select_list
+        assert "search_vector" not in select_list
+        assert "fused.score" in select_list
+
+    def test_blank_text_query_matches_no_text_candidates(self):
+        """A blank text query leaves the search to the vector ranking."""
+        assert "WHERE false" in str(self._compile(query=""))
+
+    def test_non_positive_limit_returns_no_results(self, db_session):
+        """A limit of zero returns nothing without querying the database."""
+        repository = EssayRepository(session=db_session)
+
+        assert repository.search_hybrid([0.1, 0.2], "python", limit=0) == []
+
+    def test_embeddings_are_selected_only_for_diversifying(self):
+        """The candidates' embeddings come back in the same query when requested."""
+        from sqlalchemy.dialects import postgresql
+
+        from essay_repository.repository.search_mixin import hybrid_search_statement
+
+        def select_list(with_embeddings: bool) -> str:
+            statement = hybrid_search_statement(
+                [0.1, 0.2], "python", 15, candidate_limit=15, with_embeddings=with_embeddings
+            )
+            sql = str(statement.compile(dialect=postgresql.dialect()))
+            return sql.rsplit(" SELECT ", 1)[1].split(" FROM ")[0]
+
+        assert "embedding" in select_list(True)
+        assert "embedding" not in select_list(False)
+
+
+class TestSearchHybridDiversity:
+    """Tests for the MMR diversification of search_hybrid, without a database."""
+
+    def _row(self, essay_id: int, score: float, embedding):
+        from datetime import datetime, timezone
+
+        now = datetime.now(timezone.utc)
+        return SimpleNamespace(
+            id=essay_id,
+            question=None,
+            answer=f"Answer {essay_id}",
+            keywords=None,
+            created_at=now,
+            updated_at=now,
+            score=score,
+            vector_rank=essay_id,
+            text_rank=None,
+            embedding=embedding,
+        )
+
+    @pytest.fixture
+    def session(self):
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [
+            self._row(1, 0.030, [1.0, 0.0]),
+            self._row(2, 0.029, [1.0, 0.0]),
+            self._row(3, 0.020, [0.0, 1.0]),
+            self._row(4, 0.015, None),
+        ]
+        return session
+
+    @pytest.fixture
+    def repository(self, session):
+        repository = EssayRepository(session=session)
+        scope = MagicMock()
+        scope.return_value.__enter__.return_value = session
+        repository._session_scope = scope
+        return repository
+
+    def test_near_identical_essays_are_skipped(self, repository):
+        """An essay identical to a better one gives way to a different essay."""
+        results = repository.search_hybrid([1.0, 0.0], "python", limit=2, diversity=0.5)
+
+        assert [result.essay.id for result in results] == [1, 3]
+        assert results[0].score == 0.030
+
+    def test_full_relevance_keeps_rrf_order(self, repository, session):
+        """With diversity 1.0 the database ranking is returned as is."""
+        results = repository.search_hybrid([1.0, 0.0], "python", limit=2, diversity=1.0)
+
+        assert [result.essay.id for result in results] == [1, 2, 3, 4]
+        statement = session.execute.call_args_list[-1].args[0]
+        assert "embedding" not in [column.name for column in statement.selected_columns]
+
+    def test_essays_without_embedding_can_be_selected(self, repository):
+        """Text-only matches take part in the selection."""
+        results = repository.search_hybrid([1.0, 0.0], "python", limit=4, diversity=0.5)
+
+        assert sorted(result.essay.id for result in results) == [1, 2, 3, 4]
+
+
 @requires_postgres
 class TestEssayRepositorySearchHybrid:
     """Tests for EssayRepository.search_hybrid method.
@@ -321,7 +567,7 @@ class TestEssayRepositorySearchHybrid:
             )
             # Add embedding
             embedding = [float(i * j) / 1536 for j in range(1536)]
-            repository.update_embedding(essay.id, embedding)
+            repository.update_embedding(essay.id, embedding, essay.content_version)
             essays.append(essay)
         return essays
 
@@ -5,7 +5,7 @@ the IEssayRepository interface contract.
 """
 
 from datetime import datetime, UTC
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from sqlalchemy.exc import SQLAlchemyError
@@ -698,3 +698,172 @@ class TestEssayRepositoryGetPaginated:
 
         assert len(essays) == 2
         assert total_count == 7
+
+
+class TestEssayRepositoryPendingEmbeddings:
+    """Tests for the embedding_pending marker and get_pending_embeddings."""
+
+    @pytest.fixture
+    def repository(self, db_session):
+        """Create an EssayRepository instance."""
+        return EssayRepository(session=db_session)
+
+    def test_created_essay_is_pending(self, repository):
+        """A new essay is pending until its embedding is stored."""
+        essay = repository.create({"answer": "Answer"})
+
+        assert [pending.id for pending in repository.get_pending_embeddings(limit=10)] == [essay.id]
+
+    def test_update_embedding_clears_pending(self, repository):
+        """Storing an embedding clears the pending marker."""
+        essay = repository.create({"answer": "Answer"})
+
+        repository.update_embedding(essay.id, [0.1] * 512, essay.content_version)
+
+        assert repository.get_pending_embeddings(limit=10) == []
+
+    def test_update_marks_essay_pending_again(self, repository):
+        """Changing an essay's content makes its embedding stale."""
+        essay = repository.create({"answer": "Answer"})
+        repository.update_embedding(essay.id, [0.1] * 512, essay.content_version)
+
+        repository.update(essay.id, {"answer": "Changed answer"})
+
+        assert [pending.id for pending in repository.get_pending_embeddings(limit=10)] == [essay.id]
+
+    def test_update_bumps_content_version(self, repository):
+        """Every edit gets a new content version."""
+        essay = repository.create({"answer": "Answer"})
+
+        updated = repository.update(essay.id, {"answer": "Changed answer"})
+
+        assert updated.content_version == essay.content_version + 1
+
+    def test_embedding_of_edited_content_is_not_stored(self, repository, db_session):
+        """An embedding computed before an edit neither lands nor clears the marker."""
+        essay = repository.create({"answer": "Answer"})
+        repository.update(essay.id, {"answer": "Changed answer"})
+
+        stored = repository.update_embedding(essay.id, [0.1] * 512, essay.content_version)
+
+        assert stored is False
+        db_session.expire_all()
+        assert db_session.get(Essay, essay.id).embedding is None
+        assert [pending.id for pending in repository.get_pending_embeddings(limit=10)] == [essay.id]
+
+    def test_update_keywords_keeps_embedding_current(self, repository):
+        """Generated keywords do not mark the essay pending."""
+        essay = repository.create({"answer": "Answer"})
+        repository.update_embedding(essay.id, [0.1] * 512, essay.content_version)
+
+        repository.update_keywords(essay.id, ["keyword"])
+
+        assert repository.get_pending_embeddings(limit=10) == []
+
+    def test_pending_essays_are_ordered_by_id(self, repository):
+        """Pending essays come back oldest first."""
+        ids = [repository.create({"answer": f"Answer {i}"}).id for i in range(3)]
+
+        assert [essay.id for essay in repository.get_pending_embeddings(limit=10)] == ids
+
+    def test_pending_essays_are_paged_by_id(self, repository):
+        """Pages continue after the last ID of the previous page."""
+        ids = [repository.create({"answer": f"Answer {i}"}).id for i in range(5)]
+
+        first = repository.get_pending_embeddings(limit=2)
+        second = repository.get_pending_embeddings(limit=2, after_id=first[-1].id)
+        last = repository.get_pending_embeddings(limit=2, after_id=second[-1].id)
+
+        assert [essay.id for essay in first + second + last] == ids
+
+    def test_non_positive_limit_returns_no_essays(self, repository):
+        """A limit of zero returns an empty page."""
+        repository.create({"answer": "Answer"})
+
+        assert repository.get_pending_embeddings(limit=0) == []
+
+
+class TestEssayRepositoryUpdateEmbeddings:
+    """Tests for EssayRepository.update_embeddings method."""
+
+    @pytest.fixture
+    def repository(self, db_session):
+        """Create an EssayRepository instance."""
+        return EssayRepository(session=db_session)
+
+    def test_updates_all_given_essays(self, repository, db_session):
+        """Every essay in the mapping gets its embedding and leaves the pending set."""
+        first = repository.create({"answer": "First"})
+        second = repository.create({"answer": "Second"})
+        third = repository.create({"answer": "Third"})
+
+        updated = repository.update_embeddings(
+            {first.id: (0, [0.1] * 512), second.id: (0, [0.2] * 512)}
+        )
+
+        assert updated == 2
+        db_session.expire_all()
+        stored = {essay.id: essay for essay in db_session.query(Essay).all()}
+        assert stored[first.id].embedding is not None
+        assert stored[second.id].embedding is not None
+        assert stored[third.id].embedding is None
+        pending = repository.get_pending_embeddings(limit=10)
+        assert [essay.id for essay in pending] == [third.id]
+
+    def test_ignores_missing_essays(self, repository):
+        """IDs of deleted essays do not fail the update."""
+        essay = repository.create({"answer": "Answer"})
+
+        repository.update_embeddings({essay.id: (0, [0.1] * 512), 99999: (0, [0.2] * 512)})
+
+        assert repository.get_pending_embeddings(limit=10) == []
+
+    def test_empty_mapping_is_a_no_op(self, repository):
+        """Nothing is written for an empty mapping."""
+        repository.create({"answer": "Answer"})
+
+        assert repository.update_embeddings({}) == 0
+        assert len(repository.get_pending_embeddings(limit=10)) == 1
+
+    def test_skips_essays_edited_since_the_page_was_read(self, repository):
+        """Essays whose content version moved on stay pending."""
+        edited = repository.create({"answer": "Edited"})
+        unchanged = repository.create({"answer": "Unchanged"})
+        page = repository.get_pending_embeddings(limit=10)
+        repository.update(edited.id, {"answer": "Edited again"})
+
+        updated = repository.update_embeddings(
+            {essay.id: (essay.content_version, [0.1] * 512) for essay in page}
+        )
+
+        assert updated == 1
+        pending = repository.get_pending_embeddings(limit=10)
+        assert [essay.id for essay in pending] == [edited.id]
+        assert unchanged.id not in [essay.id for essay in pending]
+
+    def test_postgresql_updates_a_page_with_one_statement(self):
+        """On PostgreSQL the page is sent as arrays to a single UPDATE."""
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+        repository = EssayRepository(session=session)
+
+        repository.update_embeddings({1: (0, [0.1, 0.2]), 2: (3, [0.3, 0.4])})
+
+        session.execute.assert_called_once()
+        stmt, params = session.execute.call_args.args
+        assert "unnest" in str(stmt)
+        assert params == {
+            "ids": [1, 2],
+            "versions": [0, 3],
+            "vectors": ["[0.1,0.2]", "[0.3,0.4]"],
+        }
+
+    def test_database_error_raises_transaction_error(self, repository):
+        """Database errors are wrapped in TransactionError."""
+        essay = repository.create({"answer": "Answer"})
+
+        with patch.object(
+            repository, "_session_scope", side_effect=SQLAlchemyError("connection lost")
+        ):
+            with pytest.raises(TransactionError):
+                repository.update_embeddings({essay.id: (0, [0.1] * 512)})
@@ -0,0 +1,59 @@
+"""Maximal Marginal Relevance (MMR) selection."""
+
+from typing import List, Sequence
+
+import numpy as np
+
+
+def maximal_marginal_relevance(
+    relevance: Sequence[float],
+    embeddings: Sequence[Sequence[float]],
+    k: int,
+    diversity: float = 0.5,
+) -> List[int]:
+    """
+    Select k candidates that are relevant but not similar to each other.
+
+    Greedily picks the candidate maximising
+    diversity * relevance - (1 - diversity) * max similarity to the picked ones.
+    Cosine similarities between all candidates come from one matrix product,
+    and the max similarity to the picked candidates is updated with one row
+    per pick, so selection is O(k * n) on top of the matrix.
+
+    Args:
+        relevance: Relevance score of each candidate, on a comparable scale
+                   to cosine similarity (0.0 to 1.0)
+        embeddings: Embedding of each candidate, all of the same dimension.
+                    A zero vector is treated as similar to nothing.
+        k: Number of candidates to select
+        diversity: Trade-off between relevance and diversity (0.0 to 1.0).
+                   0.0 = max diversity, 1.0 = max relevance.
+
+    Returns:
+        Indices of the selected candidates in selection order
+    """
+    n = len(relevance)
+    k = min(k, n)
+    if k <= 0:
+        return []
+
+    scores = np.asarray(relevance, dtype=np.float64)
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    unit = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+    similarity = unit @ unit.T
+
+    selected = [int(np.argmax(scores))]
+    available = np.ones(n, dtype=bool)
+    available[selected[0]] = False
+    max_similarity = similarity[selected[0]].astype(np.float64)
+
+    for _ in range(k - 1):
+        mmr = diversity * scores - (1 - diversity) * max_similarity
+        mmr[~available] = -np.inf
+        best = int(np.argmax(mmr))
+        selected.append(best)
+        available[best] = False
+        np.maximum(max_similarity, similarity[best], out=max_similarity)
+
+    return selected
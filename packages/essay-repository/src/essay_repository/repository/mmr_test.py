@@ -0,0 +1,58 @@
+"""Tests for Maximal Marginal Relevance selection."""
+
+import time
+
+import numpy as np
+
+from essay_repository.repository.mmr import maximal_marginal_relevance
+
+
+class TestMaximalMarginalRelevance:
+    """Tests for maximal_marginal_relevance."""
+
+    def test_skips_near_duplicates_of_picked_candidates(self):
+        """A near-duplicate of the best candidate loses to a distinct one."""
+        relevance = [1.0, 0.95, 0.6]
+        embeddings = [[1.0, 0.0], [0.99, 0.01], [0.0, 1.0]]
+
+        assert maximal_marginal_relevance(relevance, embeddings, k=2) == [0, 2]
+
+    def test_full_relevance_keeps_relevance_order(self):
+        """With diversity 1.0 similarity is ignored."""
+        relevance = [0.2, 1.0, 0.5]
+        embeddings = [[1.0, 0.0], [1.0, 0.0], [1.0, 0.0]]
+
+        assert maximal_marginal_relevance(relevance, embeddings, k=3, diversity=1.0) == [1, 2, 0]
+
+    def test_zero_vectors_are_similar_to_nothing(self):
+        """Candidates without an embedding are not penalised and do not penalise."""
+        relevance = [1.0, 0.9, 0.8]
+        embeddings = [[1.0, 0.0], [1.0, 0.0], [0.0, 0.0]]
+
+        assert maximal_marginal_relevance(relevance, embeddings, k=2) == [0, 2]
+
+    def test_selects_each_candidate_at_most_once(self):
+        """k larger than the pool returns every candidate once."""
+        selected = maximal_marginal_relevance([0.5, 1.0], [[1.0, 0.0], [0.0, 1.0]], k=5)
+
+        assert sorted(selected) == [0, 1]
+
+    def test_empty_pool_or_non_positive_k_selects_nothing(self):
+        """Nothing is selected without candidates or with k <= 0."""
+        assert maximal_marginal_relevance([], [], k=3) == []
+        assert maximal_marginal_relevance([1.0], [[1.0]], k=0) == []
+
+    def test_selection_over_a_hundred_candidates_is_fast(self):
+        """MMR over a typical candidate pool adds well under a millisecond on average."""
+        rng = np.random.default_rng(0)
+        relevance = rng.random(100)
+        embeddings = rng.standard_normal((100, 512))
+        runs = 20
+
+        started = time.perf_counter()
+        for _ in range(runs):
+            maximal_marginal_relevance(relevance, embeddings, k=10)
+        elapsed = (time.perf_counter() - started) / runs
+
+        # Generous bound so slow CI machines do not flake
+        assert elapsed < 0.01
@@ -4,9 +4,9 @@ This module provides the SearchMixin class that encapsulates
 all search-related functionality (vector, text, hybrid) for essays.
 """
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import select, text
+from sqlalchemy import Float, Select, false, func, select, text
 
 from job_agent_platform_contracts.essay_repository.schemas import (
     Essay as EssaySchema,
@@ -14,6 +14,7 @@ from job_agent_platform_contracts.essay_repository.schemas import (
 )
 
 from essay_repository.models import Essay
+from essay_repository.repository.mmr import maximal_marginal_relevance
 
 if TYPE_CHECKING:
     from contextlib import contextmanager
@@ -22,6 +23,131 @@ if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
 
+# Text search configuration used by the search_vector trigger of migration 003
+TEXT_SEARCH_CONFIG = "english"
+
+# pgvector's default hnsw.ef_search
+DEFAULT_EF_SEARCH = 40
+
+# Reciprocal Rank Fusion constant
+RRF_K = 60
+
+# Each ranking of the hybrid search considers limit * HYBRID_CANDIDATE_FACTOR essays
+HYBRID_CANDIDATE_FACTOR = 3
+
+
+def text_search_statement(query: str, limit: int) -> Select:
+    """Build the full-text search query over essays, best matches first.
+
+    Args:
+        query: Text query in web search syntax
+        limit: Maximum number of essays selected
+
+    Returns:
+        Statement selecting matching essays ordered by ts_rank_cd
+    """
+    ts_query = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, query)
+    rank = func.ts_rank_cd(Essay.search_vector, ts_query)
+    return (
+        select(Essay)
+        .where(Essay.search_vector.bool_op("@@")(ts_query))
+        .order_by(rank.desc(), Essay.id)
+        .limit(limit)
+    )
+
+
+def hybrid_search_statement(
+    embedding: List[float],
+    query: str,
+    limit: int,
+    vector_weight: float = 0.5,
+    k: int = RRF_K,
+    candidate_limit: Optional[int] = None,
+    with_embeddings: bool = False,
+) -> Select:
+    """Build the hybrid search query fusing vector and text rankings with RRF.
+
+    The vector_ranked and text_ranked CTEs rank up to candidate_limit
+    candidates each, the fused CTE joins them and scores every essay with
+    vector_weight / (k + vector_rank) + (1 - vector_weight) / (k + text_rank),
+    a missing rank contributing nothing.
+
+    Args:
+        embedding: The query embedding vector
+        query: Text query in web search syntax, blank matches no essays
+        limit: Maximum number of essays selected
+        vector_weight: Weight of the vector ranking, the text ranking gets the rest
+        k: RRF constant, higher values flatten the difference between ranks
+        candidate_limit: Essays ranked by each search, defaults to
+                         limit * HYBRID_CANDIDATE_FACTOR
+        with_embeddings: Also select the embedding column, for diversifying
+                         the results
+
+    Returns:
+        Statement selecting the essay columns with score, vector_rank and
+        text_rank, best score first
+    """
+    if candidate_limit is None:
+        candidate_limit = limit * HYBRID_CANDIDATE_FACTOR
+
+    distance = Essay.embedding.cosine_distance(embedding)
+    vector_ranked = (
+        select(Essay.id, func.row_number().over(order_by=distance).label("rank"))
+        .where(Essay.embedding.is_not(None))
+        .order_by(distance)
+        .limit(candidate_limit)
+        .cte("vector_ranked")
+    )
+
+    ts_query = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, query)
+    text_order = (func.ts_rank_cd(Essay.search_vector, ts_query).desc(), Essay.id)
+    text_ranked = (
+        select(Essay.id, func.row_number().over(order_by=text_order).label("rank"))
+        .where(Essay.search_vector.bool_op("@@")(ts_query) if query else false())
+        .order_by(*text_order)
+        .limit(candidate_limit)
+        .cte("text_ranked")
+    )
+
+    fused = (
+        select(
+            func.coalesce(vector_ranked.c.id, text_ranked.c.id).label("id"),
+            vector_ranked.c.rank.label("vector_rank"),
+            text_ranked.c.rank.label("text_rank"),
+            (
+                vector_weight * func.coalesce(1.0 / (k + vector_ranked.c.rank).cast(Float), 0.0)
+                + (1 - vector_weight)
+                * func.coalesce(1.0 / (k + text_ranked.c.rank).cast(Float), 0.0)
+            ).label("score"),
+        )
+        .select_from(
+            vector_ranked.join(text_ranked, vector_ranked.c.id == text_ranked.c.id, full=True)
+        )
+        .cte("fused")
+    )
+
+    columns = [
+        Essay.id,
+        Essay.question,
+        Essay.answer,
+        Essay.keywords,
+        Essay.created_at,
+        Essay.updated_at,
+        fused.c.score,
+        fused.c.vector_rank,
+        fused.c.text_rank,
+    ]
+    if with_embeddings:
+        columns.append(Essay.embedding)
+
+    return (
+        select(*columns)
+        .join(fused, Essay.id == fused.c.id)
+        .order_by(fused.c.score.desc(), Essay.id)
+        .limit(limit)
+    )
+
+
 class EssaySearchMixin:
     """Mixin providing search functionality for essay repository.
 
@@ -43,13 +169,36 @@ class EssaySearchMixin:
 
         def _model_to_schema(self, essay: Essay) -> EssaySchema: ...
 
-    def search_by_embedding(self, embedding: List[float], limit: int) -> List[EssaySchema]:
+    def _set_ef_search(self, session: "Session", ef_search: Optional[int], limit: int) -> None:
+        """Set hnsw.ef_search for the current transaction.
+
+        HNSW returns at most ef_search rows, so the setting is raised to at
+        least limit. Local to the transaction, so pooled connections keep the
+        default.
+        """
+        effective_ef_search = max(ef_search or DEFAULT_EF_SEARCH, limit)
+        if effective_ef_search != DEFAULT_EF_SEARCH:
+            session.execute(
+                text("SELECT set_config('hnsw.ef_search', :ef_search, true)"),
+                {"ef_search": str(effective_ef_search)},
+            )
+
+    def search_by_embedding(
+        self, embedding: List[float], limit: int, ef_search: Optional[int] = None
+    ) -> List[EssaySchema]:
         """
         Search essays by vector similarity.
 
+        The search runs on the HNSW index, which only returns the best
+        ef_search candidates it visits, so ef_search is raised to at least
+        limit.
+
         Args:
             embedding: The query embedding vector (1536 dimensions)
             limit: Maximum number of results to return
+            ef_search: Size of the HNSW candidate list (defaults to pgvector's 40).
+                      Higher values find more of the true nearest essays at the
+                      cost of latency.
 
         Returns:
             List of Essay entities ordered by cosine similarity
@@ -59,6 +208,8 @@ class EssaySearchMixin:
             Results exclude essays without embeddings.
         """
         with self._session_scope(commit=False) as session:
+            self._set_ef_search(session, ef_search, limit)
+
             # Use pgvector cosine distance operator (<=>)
             # cosine_distance = 1 - cosine_similarity, so ORDER BY ASC gives highest similarity
             # Convert embedding list to pgvector string format: '[val1,val2,...]'
@@ -95,20 +246,27 @@ class EssaySearchMixin:
         """
         Search essays by full-text search.
 
+        The query is parsed with websearch_to_tsquery, so quoted phrases, "or"
+        and "-word" work as in web search engines. Matches are found through the
+        GIN index on search_vector and ranked with ts_rank_cd, which weights
+        the question and keywords above the answer.
+
         Args:
             query: The text query
             limit: Maximum number of results to return
 
         Returns:
-            List of Essay entities ordered by text relevance
+            List of matching Essay entities ordered by text relevance
 
         Note:
             This method requires PostgreSQL for tsvector functionality.
         """
+        trimmed_query = query.strip()
+        if not trimmed_query or limit <= 0:
+            return []
+
         with self._session_scope(commit=False) as session:
-            # Simple text search - will be enhanced with tsvector in PostgreSQL
-            stmt = select(Essay).limit(limit)
-            essays = session.scalars(stmt).all()
+            essays = session.scalars(text_search_statement(trimmed_query, limit)).all()
 
             if self._close_session:
                 for essay in essays:
@@ -116,68 +274,6 @@ class EssaySearchMixin:
 
             return [self._model_to_schema(essay) for essay in essays]
 
-    def _rrf(
-        self,
-        vector_results: List[EssaySchema],
-        text_results: List[EssaySchema],
-        vector_weight: float = 0.5,
-        k: int = 60,
-    ) -> List[EssaySearchResult]:
-        """
-        Reciprocal Rank Fusion (RRF) to combine multiple ranked lists.
-
-        Fuses results from vector and text searches into a single ranked list.
-        RRF score = sum(1 / (k + rank)) for each ranked list where item appears.
-
-        Args:
-            vector_results: Essays from vector similarity search (ordered by similarity)
-            text_results: Essays from full-text search (ordered by relevance)
-            vector_weight: Weight for vector scores (0.0 to 1.0).
-                          Text weight is (1 - vector_weight). Default 0.5.
-            k: RRF constant controlling rank sensitivity. Default 60.
-
-        Returns:
-            List of EssaySearchResult ordered by combined RRF score
-        """
-        # Build rank dictionaries (1-indexed)
-        vector_ranks = {essay.id: rank + 1 for rank, essay in enumerate(vector_results)}
-        text_ranks = {essay.id: rank + 1 for rank, essay in enumerate(text_results)}
-
-        # Combine all unique essays
-        all_essay_ids = set(vector_ranks.keys()) | set(text_ranks.keys())
-        essays_by_id = {essay.id: essay for essay in vector_results}
-        for essay in text_results:
-            if essay.id not in essays_by_id:
-                essays_by_id[essay.id] = essay
-
-        # Compute RRF scores
-        scored_results = []
-        for essay_id in all_essay_ids:
-            essay = essays_by_id[essay_id]
-
-            vector_rank = vector_ranks.get(essay_id)
-            text_rank = text_ranks.get(essay_id)
-
-            # RRF score: 1 / (k + rank)
-            vector_score = (1.0 / (k + vector_rank)) if vector_rank else 0.0
-            text_score = (1.0 / (k + text_rank)) if text_rank else 0.0
-
-            # Weighted combination
-            combined_score = vector_weight * vector_score + (1 - vector_weight) * text_score
-
-            scored_results.append(
-                EssaySearchResult(
-                    essay=essay,
-                    score=combined_score,
-                    vector_rank=vector_rank,
-                    text_rank=text_rank,
-                )
-            )
-
-        # Sort by score descending
-        scored_results.sort(key=lambda r: r.score, reverse=True)
-        return scored_results
-
     def search_hybrid(
         self,
         embedding: List[float],
@@ -185,13 +281,17 @@ class EssaySearchMixin:
         limit: int,
         vector_weight: float = 0.5,
         diversity: float = 0.5,
+        ef_search: Optional[int] = None,
     ) -> List[EssaySearchResult]:
         """
         Hybrid search combining vector similarity and full-text search.
 
-        Uses Reciprocal Rank Fusion (RRF) to combine results from both
-        search methods, then applies Maximal Marginal Relevance (MMR)
-        to diversify the final results.
+        Runs as a single statement: the vector and text rankings of a
+        candidate pool of limit * 3 essays each are fused with weighted
+        Reciprocal Rank Fusion (RRF) in the database. Unless diversity is
+        1.0, the best limit * 3 fused essays are returned with their
+        embeddings and Maximal Marginal Relevance (MMR) picks limit of them,
+        skipping essays nearly identical to ones already picked.
 
         Args:
             embedding: The query embedding vector (1536 dimensions)
@@ -201,26 +301,64 @@ class EssaySearchMixin:
                           Text weight is (1 - vector_weight). Default 0.5.
             diversity: MMR diversity parameter (0.0 to 1.0).
                       0.0 = max diversity, 1.0 = max relevance. Default 0.5.
+            ef_search: HNSW candidate list size of the vector search, trading
+                      latency for recall. Defaults to pgvector's 40, and is
+                      raised to at least the candidate pool size.
 
         Returns:
-            List of EssaySearchResult ordered by MMR score
+            List of EssaySearchResult in MMR selection order, RRF score
+            order when diversity is 1.0
 
         Note:
             This method requires PostgreSQL with pgvector extension.
             Essays without embeddings participate only in text search.
         """
-        # Use larger candidate pool for better fusion and MMR selection
-        candidate_limit = limit * 3
-
-        vector_results = self.search_by_embedding(embedding, candidate_limit)
-        text_results = self.search_by_text(text_query, candidate_limit)
-
-        # Fuse results using RRF
-        fused_results = self._rrf(
-            vector_results=vector_results,
-            text_results=text_results,
+        if limit <= 0:
+            return []
+
+        candidate_limit = limit * HYBRID_CANDIDATE_FACTOR
+        diversify = diversity < 1.0
+        statement = hybrid_search_statement(
+            embedding,
+            text_query.strip(),
+            candidate_limit if diversify else limit,
             vector_weight=vector_weight,
+            candidate_limit=candidate_limit,
+            with_embeddings=diversify,
         )
 
-        # Apply the requested limit to final results
-        return fused_results[:limit] if fused_results else []
+        with self._session_scope(commit=False) as session:
+            self._set_ef_search(session, ef_search, candidate_limit)
+            rows = session.execute(statement).all()
+
+        if diversify and len(rows) > 1:
+            # RRF scores are tiny, scale them to the range of cosine similarity
+            top_score = rows[0].score
+            # Essays without an embedding count as similar to nothing
+            no_embedding = [0.0] * len(embedding)
+            selected = maximal_marginal_relevance(
+                relevance=[row.score / top_score for row in rows],
+                embeddings=[
+                    row.embedding if row.embedding is not None else no_embedding for row in rows
+                ],
+                k=limit,
+                diversity=diversity,
+            )
+            rows = [rows[index] for index in selected]
+
+        return [
+            EssaySearchResult(
+                essay=EssaySchema(
+                    id=row.id,
+                    question=row.question,
+                    answer=row.answer,
+                    keywords=row.keywords,
+                    created_at=row.created_at,
+                    updated_at=row.updated_at,
+                ),
+                score=row.score,
+                vector_rank=row.vector_rank,
+                text_rank=row.text_rank,
+            )
+            for row in rows
+        ]
@@ -1,9 +1,15 @@
 """Shared test fixtures for job_agent_backend package tests.
 
 These fixtures are available to all tests in the job_agent_backend package
-and its subpackages (core, filter_service, workflows, etc.).
+and its subpackages (core, filter_service, workflows, etc.). The import-time
+helpers are shared with the import-time tests of packages built on the backend.
 """
 
+import os
+import subprocess
+import sys
+from typing import Dict, Iterable, List, Mapping
+
 import pytest
 
 
@@ -68,3 +74,54 @@ def sample_jobs_list():
             "location": {"region": "Austin", "can_apply": True},
         },
     ]
+
+
+# Modules that take seconds to import and must wait until they are first needed
+HEAVY_MODULES = (
+    "langgraph",
+    "langchain_core",
+    "sqlalchemy",
+    "pika",
+    "jobs_repository",
+    "essay_repository",
+    "cvs_repository",
+    "job_agent_backend.core.orchestrator",
+    "job_agent_backend.workflows.job_processing",
+)
+
+
+def import_times(module: str) -> Dict[str, float]:
+    """Import module in a fresh interpreter and get the cumulative import time of every module.
+
+    Args:
+        module: Name of the module to import
+
+    Returns:
+        Cumulative import time in seconds by name of every module imported
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    times: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+
+def imported_heavy_modules(
+    times: Mapping[str, float], heavy_modules: Iterable[str] = HEAVY_MODULES
+) -> List[str]:
+    """Get the imported modules that are heavy modules or belong to one, sorted by name."""
+    heavy = tuple(heavy_modules)
+    return sorted(
+        name
+        for name in times
+        if any(name == module or name.startswith(f"{module}.") for module in heavy)
+    )
@@ -1,23 +1,99 @@
 """Dependency injection container for backend components."""
 
-from typing import Any, Callable, Dict
+import atexit
+import functools
+import importlib
+import os
+from typing import Any, Callable, Dict, List, Optional
 
 from dependency_injector import containers, providers
 
-from cvs_repository import CVRepository
-from essay_repository import get_essay_repository
-from job_agent_backend.core.orchestrator import JobAgentOrchestrator
-from job_agent_backend.contracts import IEssaySearchService
-from job_agent_backend.cv_loader import CVLoader, ICVLoader
-from job_agent_backend.filter_service import FilterService, IFilterService
-from job_agent_backend.messaging import ScrapperClient, IScrapperClient
-from job_agent_backend.model_providers import IModelFactory
-from job_agent_backend.model_providers.container import get_model_factory
-from job_agent_backend.services import EssaySearchService
-from job_agent_backend.services.keyword_generation import KeywordGenerator
+from job_agent_backend.contracts import (
+    ICVLoader,
+    IEssaySearchService,
+    IFilterService,
+    IModelFactory,
+    IScrapperClient,
+)
+from job_agent_backend.core.warmup import WarmupStep, run_warmup, warm_up_model
+from job_agent_backend.core.work_queue import WorkQueue
 from job_agent_platform_contracts import IJobAgentOrchestrator
-from jobs_repository import init_db
-from jobs_repository.container import get_job_repository
+
+
+def _lazy(module: str, name: str) -> Callable[..., Any]:
+    """Return a callable importing module.name on its first call and forwarding to it.
+
+    Repositories, workflows, LangChain and pika take seconds to import, so the
+    container only imports them once a provider is first resolved.
+    """
+
+    def call(*args: Any, **kwargs: Any) -> Any:
+        return getattr(importlib.import_module(module), name)(*args, **kwargs)
+
+    call.__qualname__ = call.__name__ = name
+    return call
+
+
+def _get_job_processing_max_workers() -> int:
+    """Read the number of concurrently processed jobs from the environment."""
+    return int(os.getenv("JOB_PROCESSING_MAX_WORKERS", "1"))
+
+
+def _get_job_store_batch_size() -> int:
+    """Read the number of processed jobs stored per batch from the environment."""
+    return int(os.getenv("JOB_STORE_BATCH_SIZE", "50"))
+
+
+def _get_job_store_flush_interval_ms() -> int:
+    """Read how long processed jobs may wait to be stored from the environment."""
+    return int(os.getenv("JOB_STORE_FLUSH_INTERVAL_MS", "5000"))
+
+
+def _get_shared_scrape_enabled() -> bool:
+    """Read whether concurrent searches with the same filters share a scrape."""
+    return os.getenv("SHARED_SCRAPE_ENABLED", "true").lower() == "true"
+
+
+def _get_shared_scrape_max_lag() -> int:
+    """Read how many batches a shared scrape may run ahead of its slowest search."""
+    return int(os.getenv("SHARED_SCRAPE_MAX_LAG_BATCHES", "4"))
+
+
+def _get_combined_skill_extraction() -> bool:
+    """Read whether both skill lists are extracted with one model call from the environment."""
+    return os.getenv("COMBINED_SKILL_EXTRACTION", "").lower() == "true"
+
+
+def _get_db_pool_min_size() -> int:
+    """Read the number of database connections opened on warm-up from the environment."""
+    return int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+
+
+def _get_warmup_timeout() -> float:
+    """Read how long to wait for the warm-up steps from the environment."""
+    return float(os.getenv("WARMUP_TIMEOUT_SECONDS", "120"))
+
+
+def _get_essay_work_max_workers() -> int:
+    """Read the number of threads running background essay work from the environment."""
+    return int(os.getenv("ESSAY_WORK_MAX_WORKERS", "2"))
+
+
+def _get_essay_work_queue_size() -> int:
+    """Read how many essay tasks may wait for a worker from the environment."""
+    return int(os.getenv("ESSAY_WORK_QUEUE_SIZE", "100"))
+
+
+def _get_essay_work_drain_timeout() -> float:
+    """Read how long queued essay work may finish on shutdown from the environment."""
+    return float(os.getenv("ESSAY_WORK_DRAIN_TIMEOUT_SECONDS", "30"))
+
+
+def _create_essay_work_queue(max_workers: int, max_size: int, drain_timeout: float) -> WorkQueue:
+    """Create the essay work queue, draining it when the process exits."""
+    work_queue = WorkQueue(max_workers=max_workers, max_size=max_size, name="essay-work")
+    atexit.register(work_queue.drain, drain_timeout)
+    return work_queue
 
 
 class ApplicationContainer(containers.DeclarativeContainer):
@@ -25,45 +101,82 @@ class ApplicationContainer(containers.DeclarativeContainer):
 
     config = providers.Configuration()
 
-    cv_repository = providers.Object(CVRepository)
-    cv_loader = providers.Singleton(CVLoader)
-    job_repository_factory = providers.Object(get_job_repository)
+    cv_repository = providers.Object(_lazy("cvs_repository", "CVRepository"))
+    cv_loader = providers.Singleton(_lazy("job_agent_backend.cv_loader", "CVLoader"))
+    job_repository_factory = providers.Object(
+        _lazy("jobs_repository.container", "get_job_repository")
+    )
+    run_ledger_factory = providers.Object(
+        _lazy("jobs_repository.container", "get_pipeline_run_repository")
+    )
 
     # Model factory from model_providers container
-    model_factory = providers.Factory(get_model_factory)
+    model_factory = providers.Factory(
+        _lazy("job_agent_backend.model_providers.container", "get_model_factory")
+    )
 
-    scrapper_manager = providers.Singleton(
-        ScrapperClient,
+    scrapper_client = providers.Singleton(
+        _lazy("job_agent_backend.messaging", "ScrapperClient"),
         job_repository_factory=job_repository_factory,
     )
-    filter_service = providers.Singleton(
-        FilterService,
-        job_repository_factory=job_repository_factory,
+    # Concurrent searches with the same filters share one scrape. Stored jobs are
+    # dropped once per scrape, so they are not checked again by the filter service.
+    scrapper_manager = providers.Singleton(
+        _lazy("job_agent_backend.messaging", "SharedScrapeClient"),
+        client=scrapper_client,
+        shared=providers.Callable(_get_shared_scrape_enabled),
+        max_lag=providers.Callable(_get_shared_scrape_max_lag),
+        job_filter=providers.Factory(
+            _lazy("job_agent_backend.filter_service", "ExistingJobFilter"),
+            job_repository_factory=job_repository_factory,
+        ),
+    )
+    # CV-independent node results shared by the orchestrators of all users
+    shared_job_results = providers.Singleton(
+        _lazy("job_agent_backend.workflows", "SharedJobResults")
     )
-    database_initializer = providers.Object(init_db)
+    filter_service = providers.Singleton(_lazy("job_agent_backend.filter_service", "FilterService"))
+    database_initializer = providers.Object(_lazy("jobs_repository", "init_db"))
 
     # Essay repository and search service
-    essay_repository_factory = providers.Factory(get_essay_repository)
+    essay_repository_factory = providers.Factory(_lazy("essay_repository", "get_essay_repository"))
     keyword_generator = providers.Factory(
-        KeywordGenerator,
+        _lazy("job_agent_backend.services.keyword_generation", "KeywordGenerator"),
         model_factory=model_factory,
         repository=essay_repository_factory,
     )
+    # Shared by all service instances, so background work runs on a fixed set of threads
+    essay_work_queue = providers.Singleton(
+        _create_essay_work_queue,
+        max_workers=providers.Callable(_get_essay_work_max_workers),
+        max_size=providers.Callable(_get_essay_work_queue_size),
+        drain_timeout=providers.Callable(_get_essay_work_drain_timeout),
+    )
     essay_search_service = providers.Factory(
-        EssaySearchService,
+        _lazy("job_agent_backend.services", "EssaySearchService"),
         repository=essay_repository_factory,
         model_factory=model_factory,
         keyword_generator=keyword_generator,
+        work_queue=essay_work_queue,
     )
 
     orchestrator = providers.Factory(
-        JobAgentOrchestrator,
+        _lazy("job_agent_backend.core.orchestrator", "JobAgentOrchestrator"),
         cv_repository_class=cv_repository,
         cv_loader=cv_loader,
         job_repository_factory=job_repository_factory,
         scrapper_manager=scrapper_manager,
         filter_service=filter_service,
         database_initializer=database_initializer,
+        max_workers=providers.Callable(_get_job_processing_max_workers),
+        run_ledger_factory=run_ledger_factory,
+        store_batch_size=providers.Callable(_get_job_store_batch_size),
+        store_flush_interval_ms=providers.Callable(_get_job_store_flush_interval_ms),
+        shared_results=shared_job_results,
+        combined_skill_extraction=providers.Callable(_get_combined_skill_extraction),
+        cache_stats=providers.Object(
+            _lazy("job_agent_backend.model_providers.container", "get_cache_stats")
+        ),
     )
 
 
@@ -101,6 +214,56 @@ def get_essay_search_service() -> IEssaySearchService:
     return container.essay_search_service()
 
 
+def get_essay_work_queue() -> WorkQueue:
+    """Get the queue running essay embedding and keyword generation."""
+    return container.essay_work_queue()
+
+
+def _warm_up_registered_model(model_factory: IModelFactory, model_id: str) -> None:
+    warm_up_model(model_factory.get_model(model_id=model_id))
+
+
+def _check_message_broker() -> None:
+    """Open and close a broker connection to check that RabbitMQ is reachable.
+
+    The connection is not kept: nothing drives an idle BlockingConnection's
+    heartbeats, so the broker would drop it before the first scrape used it.
+    """
+    from job_agent_backend.messaging import RabbitMQConnection
+
+    url = container.scrapper_client().producer.rabbitmq_connection.rabbitmq_url
+    with RabbitMQConnection(url):
+        pass
+
+
+def warm_up(timeout: Optional[float] = None, message_broker: bool = True) -> List[WarmupStep]:
+    """Warm up the registered models and the database pool, and check the broker.
+
+    Every registered model is loaded and called once, the database pool is filled
+    to DB_POOL_MIN_SIZE connections and a connection to the message broker is
+    opened and closed again, all concurrently.
+
+    Args:
+        timeout: Seconds to wait for the steps, defaults to WARMUP_TIMEOUT_SECONDS
+        message_broker: Whether to check the broker, for processes that scrape
+
+    Returns:
+        Outcome of every warm-up step
+    """
+    from job_agent_backend.model_providers.container import get_model_registry
+    from jobs_repository import warm_pool
+
+    model_factory = container.model_factory()
+    steps: Dict[str, Callable[[], Any]] = {
+        f"model:{model_id}": functools.partial(_warm_up_registered_model, model_factory, model_id)
+        for model_id in get_model_registry().list_models()
+    }
+    steps["database_pool"] = lambda: warm_pool(_get_db_pool_min_size())
+    if message_broker:
+        steps["message_broker"] = _check_message_broker
+    return run_warmup(steps, timeout=_get_warmup_timeout() if timeout is None else timeout)
+
+
 # Type-safe dependency resolution mapping
 _DEPENDENCY_MAP: Dict[type, Callable[[], Any]] = {
     IModelFactory: get_model_factory_instance,
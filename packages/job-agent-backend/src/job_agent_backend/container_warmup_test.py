@@ -0,0 +1,47 @@
+"""Tests for the container's warm-up steps."""
+
+from unittest.mock import MagicMock, patch
+
+from job_agent_backend import container as container_module
+
+
+class TestWarmUp:
+    """Tests for warm_up()."""
+
+    def _steps(self, **kwargs) -> dict:
+        run_warmup = MagicMock(return_value=[])
+        registry = MagicMock()
+        registry.list_models.return_value = []
+        with (
+            patch.object(container_module, "run_warmup", run_warmup),
+            patch(
+                "job_agent_backend.model_providers.container.get_model_registry",
+                return_value=registry,
+            ),
+            patch.object(container_module.container, "model_factory", MagicMock()),
+        ):
+            container_module.warm_up(**kwargs)
+        return run_warmup.call_args.args[0]
+
+    def test_broker_is_checked_by_default(self):
+        """Processes that scrape check the broker on warm-up."""
+        assert set(self._steps()) == {"database_pool", "message_broker"}
+
+    def test_broker_check_can_be_skipped(self):
+        """Processes that never scrape leave the broker alone."""
+        assert set(self._steps(message_broker=False)) == {"database_pool"}
+
+    def test_broker_check_does_not_keep_the_connection(self):
+        """The check connection is closed, so no idle connection outlives its heartbeats."""
+        connection = MagicMock(is_closed=False)
+        connection.channel.return_value.is_closed = False
+
+        with (
+            patch("pika.URLParameters"),
+            patch("pika.BlockingConnection", return_value=connection),
+        ):
+            container_module._check_message_broker()
+
+        connection.close.assert_called_once()
+        client_connection = container_module.container.scrapper_client().producer
+        assert client_connection.rabbitmq_connection.connection is None
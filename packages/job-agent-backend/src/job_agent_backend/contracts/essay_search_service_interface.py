@@ -31,7 +31,7 @@ class IEssaySearchService(Protocol):
         ...
 
     def backfill_embeddings(self) -> int:
-        """Generate embeddings for all essays without one."""
+        """Generate embeddings for all essays whose embedding is missing or stale."""
         ...
 
     def get_paginated(self, page: int, page_size: int) -> Tuple[List[Essay], int]:
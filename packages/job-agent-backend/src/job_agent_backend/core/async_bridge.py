@@ -0,0 +1,88 @@
+"""Bridge from blocking iterators to async iterators.
+
+Some stages only have a blocking API (e.g. the RabbitMQ scrapper client). Instead
+of handing every next() call to the event loop's default executor, the iterator is
+driven by one dedicated thread for its whole lifetime, and items are passed to the
+event loop through a bounded handover so the producer cannot run far ahead.
+"""
+
+import asyncio
+import threading
+from typing import AsyncGenerator, Callable, Iterable, Iterator, Optional, TypeVar, Union
+
+from job_agent_backend.core.pipeline import DEFAULT_QUEUE_SIZE
+from job_agent_backend.core.stream_markers import POLL_INTERVAL_SECONDS, EndOfStream, StageFailure
+
+
+T = TypeVar("T")
+
+
+async def iterate_in_thread(
+    make_iterable: Callable[[], Iterable[T]],
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    thread_name: str = "async-bridge",
+) -> AsyncGenerator[T, None]:
+    """Iterate a blocking iterable from async code using one dedicated thread.
+
+    Args:
+        make_iterable: Callable creating the iterable; called in the worker thread
+        queue_size: Maximum number of items produced ahead of the consumer
+        thread_name: Name of the worker thread
+
+    Yields:
+        Items of the iterable, in order
+
+    Raises:
+        ValueError: If queue_size is less than 1
+        Exception: Any exception raised while iterating is re-raised here
+    """
+    if queue_size < 1:
+        raise ValueError("queue_size must be at least 1")
+
+    loop = asyncio.get_running_loop()
+    items: "asyncio.Queue[Union[T, EndOfStream, StageFailure]]" = asyncio.Queue()
+    slots = threading.Semaphore(queue_size)
+    stop = threading.Event()
+
+    def hand_over(item: Union[T, EndOfStream, StageFailure]) -> bool:
+        while not slots.acquire(timeout=POLL_INTERVAL_SECONDS):
+            if stop.is_set():
+                return False
+        if stop.is_set():
+            return False
+        try:
+            loop.call_soon_threadsafe(items.put_nowait, item)
+        except RuntimeError:
+            # Event loop already closed
+            return False
+        return True
+
+    def produce() -> None:
+        iterator: Optional[Iterator[T]] = None
+        try:
+            iterator = iter(make_iterable())
+            for item in iterator:
+                if not hand_over(item):
+                    return
+            hand_over(EndOfStream())
+        except Exception as e:
+            hand_over(StageFailure(e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    threading.Thread(target=produce, name=thread_name, daemon=True).start()
+
+    try:
+        while True:
+            item = await items.get()
+            slots.release()
+            if isinstance(item, EndOfStream):
+                return
+            if isinstance(item, StageFailure):
+                raise item.error
+            yield item
+    finally:
+        # The worker notices on its next handover and closes the iterator
+        stop.set()
@@ -0,0 +1,71 @@
+"""Tests for the blocking-to-async iterator bridge."""
+
+import threading
+
+import pytest
+
+from job_agent_backend.core.async_bridge import iterate_in_thread
+
+
+class TestIterateInThread:
+    """Test suite for iterate_in_thread."""
+
+    async def test_rejects_non_positive_queue_size(self):
+        """The bridge requires room for at least one item."""
+        with pytest.raises(ValueError, match="queue_size"):
+            async for _ in iterate_in_thread(lambda: [1], queue_size=0):
+                pass
+
+    async def test_yields_items_in_order(self):
+        """All items of the blocking iterable are yielded in order."""
+        items = [item async for item in iterate_in_thread(lambda: range(5))]
+
+        assert items == [0, 1, 2, 3, 4]
+
+    async def test_iterates_in_one_dedicated_thread(self):
+        """The whole iterable is driven by a single named worker thread."""
+        threads = set()
+
+        def produce():
+            for item in range(3):
+                threads.add(threading.current_thread().name)
+                yield item
+
+        items = [item async for item in iterate_in_thread(produce, thread_name="worker")]
+
+        assert items == [0, 1, 2]
+        assert threads == {"worker"}
+
+    async def test_exceptions_are_raised_to_consumer(self):
+        """Errors from the blocking iterable surface in the async consumer."""
+
+        def produce():
+            yield 1
+            raise TimeoutError("scrapper timed out")
+
+        received = []
+        with pytest.raises(TimeoutError, match="scrapper timed out"):
+            async for item in iterate_in_thread(produce):
+                received.append(item)
+
+        assert received == [1]
+
+    async def test_closing_stops_the_producer(self):
+        """Stopping iteration early closes the blocking iterator."""
+        produced = []
+        closed = threading.Event()
+
+        def produce():
+            try:
+                for item in range(100):
+                    produced.append(item)
+                    yield item
+            finally:
+                closed.set()
+
+        items = iterate_in_thread(produce, queue_size=1)
+        assert await items.__anext__() == 0
+        await items.aclose()
+
+        assert closed.wait(timeout=5)
+        assert len(produced) < 100
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
@@ -10,6 +10,7 @@ from dependency_injector import providers
 
 from job_agent_backend.container import ApplicationContainer
 from job_agent_backend.filter_service.filter import FilterService
+from job_agent_platform_contracts import PipelineRun, PipelineRunStatus
 
 
 class StubJobRepository:
@@ -21,8 +22,13 @@ class StubJobRepository:
 
     def __init__(self):
         self.saved_filtered_jobs: list = []
+        self.created_jobs: list = []
         self.latest_updated_at: Optional[datetime] = None
 
+    def create_many(self, jobs_data):
+        self.created_jobs.extend(jobs_data)
+        return list(jobs_data)
+
     def get_by_external_id(self, external_id, source=None):
         return None
 
@@ -43,22 +49,98 @@ def stub_job_repository():
     return StubJobRepository()
 
 
+class StubPipelineRunRepository:
+    """In-memory stub of IPipelineRunRepository for testing run checkpointing."""
+
+    def __init__(self):
+        self.runs: dict[int, PipelineRun] = {}
+        self.jobs: dict[int, dict[str, dict]] = {}
+        self.processed: dict[int, set[str]] = {}
+
+    def create_run(self, user_id, search_key, posted_after):
+        now = datetime.now(timezone.utc)
+        run = PipelineRun(
+            id=len(self.runs) + 1,
+            user_id=user_id,
+            search_key=search_key,
+            posted_after=posted_after,
+            status=PipelineRunStatus.RUNNING,
+            scrape_completed=False,
+            batches_received=0,
+            total_scraped=0,
+            total_filtered=0,
+            total_processed=0,
+            created_at=now,
+            updated_at=now,
+        )
+        self.runs[run.id] = run
+        self.jobs[run.id] = {}
+        self.processed[run.id] = set()
+        return run.model_copy()
+
+    def find_unfinished_run(self, user_id, search_key, started_after):
+        for run in reversed(list(self.runs.values())):
+            if (
+                run.user_id == user_id
+                and run.search_key == search_key
+                and run.status == PipelineRunStatus.RUNNING
+                and run.created_at >= started_after
+            ):
+                return run.model_copy()
+        return None
+
+    def record_batch(self, run_id, scraped_count, passed_jobs):
+        run = self.runs[run_id]
+        new_jobs = []
+        for job in passed_jobs:
+            key = str(job["job_id"])
+            if key not in self.jobs[run_id]:
+                self.jobs[run_id][key] = job
+                new_jobs.append(job)
+        run.batches_received += 1
+        run.total_scraped += scraped_count
+        run.total_filtered += len(new_jobs)
+        return new_jobs
+
+    def get_pending_jobs(self, run_id):
+        return [job for key, job in self.jobs[run_id].items() if key not in self.processed[run_id]]
+
+    def mark_jobs_processed(self, run_id, jobs):
+        marked = 0
+        for job in jobs:
+            key = str(job["job_id"])
+            if key in self.jobs[run_id] and key not in self.processed[run_id]:
+                self.processed[run_id].add(key)
+                self.runs[run_id].total_processed += 1
+                marked += 1
+        return marked
+
+    def mark_scrape_completed(self, run_id):
+        self.runs[run_id].scrape_completed = True
+
+    def complete_run(self, run_id):
+        self.runs[run_id].status = PipelineRunStatus.COMPLETED
+
+
+@pytest.fixture
+def stub_run_ledger():
+    """Create a fresh StubPipelineRunRepository instance for testing."""
+    return StubPipelineRunRepository()
+
+
 @pytest.fixture
 def app_container_with_stub_repository(stub_job_repository):
     """Provide an ApplicationContainer configured with a stub job repository.
 
     This fixture creates an ApplicationContainer with the job_repository_factory
-    and filter_service overridden to use the stub repository. Test classes can
-    use this instead of creating their own container configuration.
+    overridden to use the stub repository, and without a run ledger so runs are
+    not checkpointed. Test classes can use this instead of creating their own
+    container configuration.
     """
     container = ApplicationContainer()
     container.job_repository_factory.override(providers.Object(lambda: stub_job_repository))
-    container.filter_service.override(
-        providers.Singleton(
-            FilterService,
-            job_repository_factory=container.job_repository_factory,
-        )
-    )
+    container.run_ledger_factory.override(providers.Object(None))
+    container.filter_service.override(providers.Singleton(FilterService))
     return container
 
 
@@ -5,30 +5,59 @@ It can be used by any interface (CLI, Telegram, Web, etc.).
 CV management is delegated to CVManager.
 """
 
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import aclosing
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Callable, Iterator, Optional, Sequence, cast
+from typing import AsyncGenerator, Callable, Dict, Iterator, List, Optional, Sequence, cast
 
 from cvs_repository import CVRepository
 from job_scrapper_contracts import JobDict
 from job_agent_platform_contracts import (
+    CacheStats,
     ICVRepository,
     IJobRepository,
     IJobAgentOrchestrator,
+    IPipelineRunRepository,
     JobProcessingResult,
+    PipelineRun,
     PipelineSummary,
+    PipelineTimings,
 )
 from job_agent_backend.cv_loader import ICVLoader
 from job_agent_backend.filter_service import IFilterService
 from job_agent_backend.messaging import IScrapperClient
-from job_agent_backend.workflows import run_job_processing, run_pii_removal
+from job_agent_backend.utils.timing import StageTimer, TimedStage
+from job_agent_backend.workflows import (
+    JobBatchWriter,
+    JobProcessingSession,
+    SharedJobResults,
+    run_job_processing,
+    run_pii_removal,
+)
+from job_agent_backend.workflows.job_processing.nodes.store_job.batch_writer import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_FLUSH_INTERVAL_MS,
+)
 from job_agent_backend.workflows.job_processing.state import AgentState
+from job_agent_backend.core.async_bridge import iterate_in_thread
 from job_agent_backend.core.cv_manager import CVManager
+from job_agent_backend.core.pipeline import DEFAULT_QUEUE_SIZE, JobPipeline
 
 
 # Maximum number of days to look back when auto-calculating posted_after
 MAX_AUTO_DAYS = 5
 
+# Default number of jobs processed concurrently (1 keeps the sequential behaviour)
+DEFAULT_MAX_WORKERS = 1
+
+# Unfinished runs older than this are started over instead of resumed
+RUN_RESUME_WINDOW = timedelta(days=1)
+
 
 CVRepositoryFactory = Callable[[str | Path], ICVRepository]
 
@@ -50,6 +79,13 @@ class JobAgentOrchestrator(IJobAgentOrchestrator):
         filter_service: IFilterService,
         database_initializer: Callable[[], None],
         logger: Optional[Callable[[str], None]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        run_ledger_factory: Optional[Callable[[], IPipelineRunRepository]] = None,
+        store_batch_size: int = DEFAULT_BATCH_SIZE,
+        store_flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+        shared_results: Optional[SharedJobResults] = None,
+        combined_skill_extraction: bool = False,
+        cache_stats: Optional[Callable[[], Dict[str, CacheStats]]] = None,
     ):
         """Initialize the orchestrator.
 
@@ -66,6 +102,20 @@ class JobAgentOrchestrator(IJobAgentOrchestrator):
                             If None, will create a new ScrapperManager().
             filter_service: Optional filter service instance. If not provided, the
                             default configuration-based implementation is used.
+            max_workers: Default number of jobs whose workflows run concurrently.
+                        1 processes jobs sequentially.
+            run_ledger_factory: Optional factory for the pipeline run ledger. If
+                               None, runs are not checkpointed and cannot be resumed.
+            store_batch_size: Number of processed jobs stored together in one batch
+            store_flush_interval_ms: Longest time in milliseconds a processed job
+                                     waits to be stored with its batch
+            shared_results: Optional memo shared by the orchestrators of all users,
+                            so CV-independent work such as skill extraction runs
+                            once per job instead of once per user
+            combined_skill_extraction: Extract must-have and nice-to-have skills
+                                       with one model call per job instead of two
+            cache_stats: Optional function getting the hits and misses of the model
+                         caches by name, reported for each run of run_complete_pipeline
         """
         self.logger: Callable[[str], None] = logger or print
         repository_factory = CVRepository if cv_repository_class is None else cv_repository_class
@@ -75,6 +125,21 @@ class JobAgentOrchestrator(IJobAgentOrchestrator):
         self.scrapper_manager: IScrapperClient = scrapper_manager
         self.filter_service: IFilterService = filter_service
         self.database_initializer: Callable[[], None] = database_initializer
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers: int = max_workers
+        self.run_ledger_factory: Optional[Callable[[], IPipelineRunRepository]] = run_ledger_factory
+        self.shared_results: Optional[SharedJobResults] = shared_results
+        self.combined_skill_extraction = combined_skill_extraction
+        self.cache_stats: Optional[Callable[[], Dict[str, CacheStats]]] = cache_stats
+        self.stage_timer = StageTimer()
+        self.job_writer = JobBatchWriter(
+            job_repository_factory,
+            batch_size=store_batch_size,
+            flush_interval_ms=store_flush_interval_ms,
+        )
+        self._session: Optional[JobProcessingSession] = None
+        self._session_lock = threading.Lock()
 
         # Delegate CV operations to CVManager
         self._cv_manager = CVManager(
@@ -174,6 +239,91 @@ class JobAgentOrchestrator(IJobAgentOrchestrator):
 
         return latest_updated_at
 
+    def start_run(
+        self,
+        user_id: int,
+        min_salary: Optional[int] = 4000,
+        employment_location: Optional[str] = "remote",
+        days: Optional[int] = None,
+    ) -> Optional[PipelineRun]:
+        """Start a checkpointed run, or resume the user's unfinished run.
+
+        An unfinished run for the same user and search parameters started within
+        RUN_RESUME_WINDOW is resumed: it keeps its original date cutoff, its jobs
+        that were not processed yet are available from get_pending_jobs, and jobs
+        it already recorded are not processed again.
+
+        Pass the returned run to the scrape, filter and process methods to record
+        progress, and to finish_run once every job has been processed.
+
+        Args:
+            user_id: User the run belongs to
+            min_salary: Minimum salary filter
+            employment_location: Employment type or location filter
+            days: Number of days to look back. If None, auto-calculates from latest
+                  job in repository (capped at MAX_AUTO_DAYS)
+
+        Returns:
+            The resumed or created run, or None if no run ledger is configured
+        """
+        if self.run_ledger_factory is None:
+            return None
+
+        ledger = self.run_ledger_factory()
+        search_key = json.dumps(
+            {
+                "min_salary": min_salary,
+                "employment_location": employment_location,
+                "days": days,
+            },
+            sort_keys=True,
+        )
+        started_after = datetime.now(timezone.utc) - RUN_RESUME_WINDOW
+
+        run = ledger.find_unfinished_run(user_id, search_key, started_after)
+        if run is not None:
+            self.logger(
+                f"Resuming run {run.id}: {run.total_processed}/{run.total_filtered} "
+                "jobs already processed"
+            )
+            return run
+
+        run = ledger.create_run(user_id, search_key, self._calculate_posted_after(days))
+        self.logger(f"Started run {run.id}")
+        return run
+
+    def get_pending_jobs(self, run: PipelineRun) -> list[JobDict]:
+        """Get the jobs of a run that passed filtering but were not processed yet.
+
+        Args:
+            run: Run returned by start_run
+
+        Returns:
+            Pending jobs in the order they were recorded
+        """
+        return self._run_ledger().get_pending_jobs(run.id)
+
+    def finish_run(self, run: PipelineRun) -> None:
+        """Mark a run as completed so it is not resumed.
+
+        Args:
+            run: Run returned by start_run
+        """
+        self._run_ledger().complete_run(run.id)
+        self.logger(f"Completed run {run.id}")
+
+    def _run_ledger(self) -> IPipelineRunRepository:
+        if self.run_ledger_factory is None:
+            raise ValueError("run_ledger_factory must be provided to track pipeline runs")
+        return self.run_ledger_factory()
+
+    @staticmethod
+    def _run_posted_after(run: PipelineRun) -> datetime:
+        """Return the run's date cutoff, normalizing timezone-naive values to UTC."""
+        if run.posted_after.tzinfo is None:
+            return run.posted_after.replace(tzinfo=timezone.utc)
+        return run.posted_after
+
     def scrape_jobs(
         self,
         min_salary: Optional[int] = 4000,
@@ -198,12 +348,13 @@ class JobAgentOrchestrator(IJobAgentOrchestrator):
         posted_after = self._calculate_posted_after(days)
         self.logger("Scraping jobs...")
         all_jobs = []
-        for batch_jobs in self.scrapper_manager.scrape_jobs_streaming(
+        batches = self.scrapper_manager.scrape_jobs_streaming(
             min_salary=min_salary,
             employment_location=employment_location,
             posted_after=posted_after,
             timeout=timeout,
-        ):
+        )
+        for batch_jobs in self.stage_timer.iterate(TimedStage.SCRAPE_WAIT, batches):
             all_jobs.extend(batch_jobs)
 
         self.logger(f"Scraped {len(all_jobs)} jobs")
@@ -215,6 +366,7 @@ class JobAgentOrchestrator(IJobAgentOrchestrator):
         employment_location: Optional[str] = "remote",
         days: Optional[int] = None,
         timeout: int = 30,
+        run: Optional[PipelineRun] = None,
     ) -> Iterator[tuple[list[JobDict], int]]:
         """Scrape jobs using the scrapper service, yielding batches as they arrive.
 
@@ -227,27 +379,78 @@ class JobAgentOrchestrator(IJobAgentOrchestrator):
             days: Number of days to look back. If None, auto-calculates from latest
                   job in repository (capped at MAX_AUTO_DAYS)
             timeout: Request timeout in seconds
+            run: Optional run from start_run. The run's date cutoff is used instead
+                 of days, nothing is scraped if the run already finished scraping,
+                 and the scrape is recorded as completed once all pages arrived.
 
         Yields:
             tuple[list[JobDict], int]: (batch_jobs, total_jobs_so_far)
         """
-        posted_after = self._calculate_posted_after(days)
+        if run is not None and run.scrape_completed:
+            self.logger(f"Run {run.id} already finished scraping")
+            return
+
+        if run is not None:
+            posted_after = self._run_posted_after(run)
+        else:
+            posted_after = self._calculate_posted_after(days)
         self.logger("Starting streaming job scrape...")
         total_jobs = 0
 
-        for batch_jobs in self.scrapper_manager.scrape_jobs_streaming(
+        batches = self.scrapper_manager.scrape_jobs_streaming(
             min_salary=min_salary,
             employment_location=employment_location,
             posted_after=posted_after,
             timeout=timeout,
-        ):
+        )
+        for batch_jobs in self.stage_timer.iterate(TimedStage.SCRAPE_WAIT, batches):
             total_jobs += len(batch_jobs)
             self.logger(f"Scraped batch: {len(batch_jobs)} jobs (total: {total_jobs})")
             yield batch_jobs, total_jobs
 
+        if run is not None:
+            self._run_ledger().mark_scrape_completed(run.id)
         self.logger(f"Completed scraping: {total_jobs} total jobs")
 
-    def filter_jobs_list(self, jobs: Sequence[JobDict]) -> list[JobDict]:
+    async def scrape_jobs_streaming_async(
+        self,
+        min_salary: Optional[int] = 4000,
+        employment_location: Optional[str] = "remote",
+        days: Optional[int] = None,
+        timeout: int = 30,
+        run: Optional[PipelineRun] = None,
+    ) -> AsyncGenerator[tuple[list[JobDict], int], None]:
+        """Async variant of scrape_jobs_streaming.
+
+        The scrapper client is blocking, so the whole scrape runs in one dedicated
+        thread that hands batches to the event loop, rather than one executor call
+        per batch. At most DEFAULT_QUEUE_SIZE batches are scraped ahead of the
+        consumer, and the scrape stops when the consumer stops iterating.
+
+        Args:
+            min_salary: Minimum salary filter
+            employment_location: Employment type or location filter
+            days: Number of days to look back. If None, auto-calculates from latest
+                  job in repository (capped at MAX_AUTO_DAYS)
+            timeout: Request timeout in seconds
+            run: Optional run from start_run (see scrape_jobs_streaming)
+
+        Yields:
+            tuple[list[JobDict], int]: (batch_jobs, total_jobs_so_far)
+        """
+        batches = iterate_in_thread(
+            lambda: self.scrape_jobs_streaming(
+                min_salary, employment_location, days, timeout, run=run
+            ),
+            thread_name="scrape-jobs",
+        )
+        async with aclosing(batches):
+            async for batch in batches:
+                yield batch
+
+    def filter_jobs_list(
+        self, jobs: Sequence[JobDict], run: Optional[PipelineRun] = None
+    ) -> list[JobDict]:
         """Filter jobs based on configuration and save rejected jobs.
 
         Uses filter_with_rejected to get both passed and rejected jobs.
@@ -256,12 +459,15 @@ class JobAgentOrchestrator(IJobAgentOrchestrator):
 
         Args:
             jobs: List of job dictionaries
+            run: Optional run from start_run. The batch and its passed jobs are
+                 recorded, and jobs the run already recorded are left out.
 
         Returns:
             Filtered list of jobs that passed all criteria
         """
         self.logger("Filtering jobs...")
-        passed_jobs, rejected_jobs = self.filter_service.filter_with_rejected(list(jobs))
+        with self.stage_timer.measure(TimedStage.FILTER):
+            passed_jobs, rejected_jobs = self.filter_service.filter_with_rejected(list(jobs))
         self.logger(f"Filtered jobs: {len(passed_jobs)}/{len(jobs)} jobs passed")
 
         # Save rejected jobs to repository with is_filtered=True
@@ -270,18 +476,53 @@ class JobAgentOrchestrator(IJobAgentOrchestrator):
             saved_count = repository.save_filtered_jobs(rejected_jobs)
             self.logger(f"Saved {saved_count} filtered jobs to repository")
 
+        if run is not None:
+            new_jobs = self._run_ledger().record_batch(run.id, len(jobs), passed_jobs)
+            if len(new_jobs) < len(passed_jobs):
+                self.logger(
+                    f"Skipped {len(passed_jobs) - len(new_jobs)} jobs already recorded "
+                    f"for run {run.id}"
+                )
+            return new_jobs
+
         return passed_jobs
 
+    async def filter_jobs_list_async(
+        self, jobs: Sequence[JobDict], run: Optional[PipelineRun] = None
+    ) -> list[JobDict]:
+        """Async variant of filter_jobs_list.
+
+        The job repository has no async API, so filtering and saving rejected jobs
+        run in a worker thread.
+
+        Args:
+            jobs: List of job dictionaries
+            run: Optional run from start_run (see filter_jobs_list)
+
+        Returns:
+            Filtered list of jobs that passed all criteria
+        """
+        return await asyncio.to_thread(self.filter_jobs_list, jobs, run)
+
     def process_job(
         self,
         job: JobDict,
         cv_content: str,
+        session: Optional[JobProcessingSession] = None,
+        is_relevant: Optional[bool] = None,
+        job_embedding: Optional[List[float]] = None,
     ) -> JobProcessingResult:
         """Process a single job with the workflows system.
 
         Args:
             job: Job dictionary to process
             cv_content: Cleaned CV content
+            session: Optional session to reuse the compiled workflow, models and CV
+                     embedding across jobs. If None, a one-off workflow run is used.
+            is_relevant: Relevance already decided by a batch check on the session.
+                         If None, the workflow decides relevance itself.
+            job_embedding: Job embedding computed by the same batch check, stored
+                           with the job instead of embedding it again.
 
         Returns:
             Dictionary containing processing results:
@@ -291,32 +532,333 @@ class JobAgentOrchestrator(IJobAgentOrchestrator):
             - status: Final workflow status
             - job: Original job dictionary
         """
-        result: AgentState = run_job_processing(
-            job,
-            cv_content,
-            job_repository_factory=self.job_repository_factory,
-        )
+        if session is not None:
+            result: AgentState = session.process(
+                job, is_relevant=is_relevant, job_embedding=job_embedding
+            )
+        else:
+            result = run_job_processing(
+                job,
+                cv_content,
+                job_repository_factory=self.job_repository_factory,
+            )
         return cast(JobProcessingResult, result)
 
     def process_jobs_iterator(
         self,
         jobs: Sequence[JobDict],
         cv_content: str,
+        max_workers: Optional[int] = None,
+        preserve_order: bool = False,
+        run: Optional[PipelineRun] = None,
     ) -> Iterator[tuple[int, int, JobProcessingResult]]:
-        """Process jobs one at a time, yielding results as they complete.
+        """Process jobs, yielding results as they complete.
 
-        Useful for progress reporting in interactive contexts.
+        Useful for progress reporting in interactive contexts. All jobs share one
+        JobProcessingSession, so the workflow is compiled and the CV embedded only
+        once, and relevance for the whole batch is decided up front with a single
+        embedding call. With more than one worker, job workflows run concurrently in a thread
+        pool so time spent waiting on model calls overlaps across jobs. Results are stored
+        in batches through job_writer, and every job is stored by the time the iterator
+        finishes.
 
         Args:
             jobs: List of job dictionaries to process
             cv_content: Cleaned CV content
+            max_workers: Number of jobs to process concurrently. If None, uses the
+                        orchestrator default.
+            preserve_order: If True, yield results in the original job order.
+                           Otherwise results are yielded in completion order.
+            run: Optional run from start_run. Jobs are marked processed in the run
+                 once their results are stored.
 
         Yields:
-            Tuple of (job_index, total_jobs, result_dict) for each processed job
+            Tuple of (job_index, total_jobs, result_dict) for each processed job.
+            job_index is the 1-based position of the job in the input sequence.
         """
-        for idx, job in enumerate(jobs, 1):
-            result = self.process_job(job, cv_content)
-            yield idx, len(jobs), result
+        if not jobs:
+            return
+
+        session = self._get_session(cv_content)
+        yield from self._process_jobs_with_session(
+            jobs, session, max_workers, preserve_order, run=run
+        )
+
+    async def process_jobs_async(
+        self,
+        jobs: Sequence[JobDict],
+        cv_content: str,
+        max_workers: Optional[int] = None,
+        preserve_order: bool = False,
+        run: Optional[PipelineRun] = None,
+    ) -> AsyncGenerator[tuple[int, int, JobProcessingResult], None]:
+        """Async variant of process_jobs_iterator.
+
+        Job workflows run as tasks on the event loop and await the models' async
+        APIs, so concurrent jobs do not each occupy a thread. Batch relevance is
+        decided up front with one async embedding call. If the consumer stops
+        iterating, jobs still in flight are cancelled.
+
+        Args:
+            jobs: List of job dictionaries to process
+            cv_content: Cleaned CV content
+            max_workers: Number of jobs to process concurrently. If None, uses the
+                        orchestrator default.
+            preserve_order: If True, yield results in the original job order.
+                           Otherwise results are yielded in completion order.
+            run: Optional run from start_run (see process_jobs_iterator)
+
+        Yields:
+            Tuple of (job_index, total_jobs, result_dict) for each processed job.
+            job_index is the 1-based position of the job in the input sequence.
+        """
+        total = len(jobs)
+        if total == 0:
+            return
+
+        session = self._get_session(cv_content)
+        relevance = await session.acheck_relevance(jobs)
+        limit = asyncio.Semaphore(max_workers or self.max_workers)
+        checkpoints: list[JobDict] = []
+
+        async def store_and_checkpoint() -> None:
+            batch = checkpoints[:]
+            checkpoints.clear()
+            await asyncio.to_thread(self._store_and_checkpoint, batch, run)
+
+        async def process(
+            idx: int,
+            job: JobDict,
+            is_relevant: Optional[bool],
+            job_embedding: Optional[List[float]],
+        ) -> tuple[int, JobProcessingResult]:
+            async with limit:
+                started = time.perf_counter()
+                result = await session.aprocess(
+                    job, is_relevant=is_relevant, job_embedding=job_embedding
+                )
+                self.stage_timer.record_job(time.perf_counter() - started)
+            if run is not None:
+                checkpoints.append(job)
+                if len(checkpoints) >= self.job_writer.batch_size:
+                    await store_and_checkpoint()
+            return idx, cast(JobProcessingResult, result)
+
+        tasks = [
+            asyncio.create_task(process(idx, job, check.is_relevant, check.job_embedding))
+            for idx, (job, check) in enumerate(zip(jobs, relevance), 1)
+        ]
+        try:
+            if preserve_order:
+                for task in tasks:
+                    idx, result = await task
+                    yield idx, total, result
+            else:
+                for next_done in asyncio.as_completed(tasks):
+                    idx, result = await next_done
+                    yield idx, total, result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await store_and_checkpoint()
+
+    def _get_session(self, cv_content: str) -> JobProcessingSession:
+        """Return the session for cv_content, reusing it across batches of one CV."""
+        with self._session_lock:
+            if self._session is None or self._session.cv_content != cv_content:
+                self._session = JobProcessingSession(
+                    cv_content,
+                    job_repository_factory=self.job_repository_factory,
+                    stage_timer=self.stage_timer,
+                    job_writer=self.job_writer,
+                    shared_results=self.shared_results,
+                    combined_skill_extraction=self.combined_skill_extraction,
+                )
+            return self._session
+
+    def _process_jobs_with_session(
+        self,
+        jobs: Sequence[JobDict],
+        session: JobProcessingSession,
+        max_workers: Optional[int] = None,
+        preserve_order: bool = False,
+        run: Optional[PipelineRun] = None,
+    ) -> Iterator[tuple[int, int, JobProcessingResult]]:
+        total = len(jobs)
+        if total == 0:
+            return
+
+        cv_content = session.cv_content
+        workers = min(max_workers or self.max_workers, total)
+        relevance = session.check_relevance(jobs)
+        checkpoints: list[JobDict] = []
+
+        def checkpoint(idx: int) -> None:
+            if run is not None:
+                checkpoints.append(jobs[idx - 1])
+                if len(checkpoints) >= self.job_writer.batch_size:
+                    self._store_and_checkpoint(checkpoints, run)
+                    checkpoints.clear()
+
+        try:
+            if workers <= 1:
+                for idx, (job, check) in enumerate(zip(jobs, relevance), 1):
+                    result = self._process_job_timed(
+                        job, cv_content, session, check.is_relevant, check.job_embedding
+                    )
+                    checkpoint(idx)
+                    yield idx, total, result
+                return
+
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job-processing")
+            try:
+                futures = {
+                    executor.submit(
+                        self._process_job_timed,
+                        job,
+                        cv_content,
+                        session,
+                        check.is_relevant,
+                        check.job_embedding,
+                    ): idx
+                    for idx, (job, check) in enumerate(zip(jobs, relevance), 1)
+                }
+                if preserve_order:
+                    for future, idx in futures.items():
+                        result = future.result()
+                        checkpoint(idx)
+                        yield idx, total, result
+                else:
+                    for future in as_completed(futures):
+                        idx = futures[future]
+                        result = future.result()
+                        checkpoint(idx)
+                        yield idx, total, result
+            finally:
+                # Drop queued jobs if the consumer stops early or a job fails
+                executor.shutdown(wait=True, cancel_futures=True)
+        finally:
+            self._store_and_checkpoint(checkpoints, run)
+
+    def _store_and_checkpoint(self, jobs: Sequence[JobDict], run: Optional[PipelineRun]) -> None:
+        """Store the buffered job results, then mark jobs processed in the run.
+
+        Jobs are only checkpointed once their results are stored, so an interrupted
+        run never skips a job whose result was still buffered. Jobs the writer could
+        not store stay pending, so a resumed run processes them again.
+
+        Args:
+            jobs: Processed jobs to mark in the run
+            run: Run to checkpoint, if any
+        """
+        self.job_writer.flush()
+        if run is not None and jobs:
+            failed = self.job_writer.pop_failed(jobs)
+            self._run_ledger().mark_jobs_processed(
+                run.id, [job for job in jobs if job not in failed]
+            )
+
+    def _process_job_timed(
+        self,
+        job: JobDict,
+        cv_content: str,
+        session: JobProcessingSession,
+        is_relevant: Optional[bool],
+        job_embedding: Optional[List[float]],
+    ) -> JobProcessingResult:
+        """Process a job and record its latency with the stage timer."""
+        started = time.perf_counter()
+        result = self.process_job(
+            job,
+            cv_content,
+            session=session,
+            is_relevant=is_relevant,
+            job_embedding=job_embedding,
+        )
+        self.stage_timer.record_job(time.perf_counter() - started)
+        return result
+
+    def get_pipeline_timings(self) -> PipelineTimings:
+        """Return the timings recorded by this orchestrator's stage timer.
+
+        Covers the current run of run_complete_pipeline, or everything since the
+        orchestrator was created when its stages are driven individually.
+
+        Returns:
+            Per-stage wall/CPU time, p50/p95 job latency and jobs per second
+        """
+        return self.stage_timer.summary()
+
+    def get_cache_stats(self) -> Dict[str, CacheStats]:
+        """Return the hits and misses counted so far by the caches this orchestrator uses.
+
+        Returns:
+            Hits and misses by cache name, empty when no cache is configured
+        """
+        stats: Dict[str, CacheStats] = {}
+        if self.shared_results is not None:
+            stats["shared_results"] = self.shared_results.stats()
+        if self.cache_stats is not None:
+            stats.update(self.cache_stats())
+        return stats
+
+    def create_pipeline(
+        self,
+        cv_content: str,
+        min_salary: Optional[int] = 4000,
+        employment_location: Optional[str] = "remote",
+        days: Optional[int] = None,
+        timeout: int = 30,
+        max_workers: Optional[int] = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        run: Optional[PipelineRun] = None,
+    ) -> JobPipeline:
+        """Create a staged scrape -> filter -> process pipeline.
+
+        Stages run concurrently and are connected by bounded queues, so memory
+        stays bounded regardless of how many jobs are scraped. All batches share
+        one JobProcessingSession. Queue depth can be observed through
+        JobPipeline.queue_depths() and is reported to the logger per batch.
+
+        Args:
+            cv_content: Cleaned CV content
+            min_salary: Minimum salary filter
+            employment_location: Employment type or location filter
+            days: Number of days to look back. If None, auto-calculates from latest
+                  job in repository (capped at MAX_AUTO_DAYS)
+            timeout: Request timeout in seconds
+            max_workers: Number of jobs to process concurrently. If None, uses the
+                        orchestrator default.
+            queue_size: Maximum number of batches waiting between stages
+            run: Optional run from start_run whose progress every stage records
+
+        Returns:
+            Pipeline ready to run
+        """
+        session = self._get_session(cv_content)
+
+        def scrape() -> Iterator[list[JobDict]]:
+            for batch_jobs, _ in self.scrape_jobs_streaming(
+                min_salary, employment_location, days, timeout, run=run
+            ):
+                yield batch_jobs
+
+        def filter_batch(batch_jobs: Sequence[JobDict]) -> list[JobDict]:
+            return self.filter_jobs_list(batch_jobs, run=run)
+
+        def process_batch(
+            batch_jobs: Sequence[JobDict],
+        ) -> Iterator[tuple[int, int, JobProcessingResult]]:
+            return self._process_jobs_with_session(batch_jobs, session, max_workers, run=run)
+
+        return JobPipeline(
+            scrape=scrape,
+            filter_batch=filter_batch,
+            process_batch=process_batch,
+            queue_size=queue_size,
+            logger=self.logger,
+        )
 
     def run_complete_pipeline(
         self,
@@ -325,16 +867,24 @@ class JobAgentOrchestrator(IJobAgentOrchestrator):
         employment_location: Optional[str] = "remote",
         days: Optional[int] = None,
         timeout: int = 30,
+        max_workers: Optional[int] = None,
     ) -> PipelineSummary:
         """Run the complete job processing pipeline.
 
         This is the main entry point that:
         1. Initializes database (creates tables if needed)
-        2. Scrapes jobs (automatically paginates until date cutoff)
-        3. Filters unsuitable jobs
-        4. Loads CV from repository (already PII-free)
+        2. Loads CV from repository (already PII-free)
+        3. Scrapes jobs (automatically paginates until date cutoff)
+        4. Filters unsuitable jobs
         5. Processes each job with workflows and stores relevant ones
 
+        Steps 3-5 run concurrently as a staged pipeline (see create_pipeline), so
+        jobs are processed while later pages are still being scraped.
+
+        With a run ledger configured, progress is checkpointed per job. A run that
+        was interrupted is resumed: its pending jobs are processed first and jobs it
+        already processed are not sent to the models again.
+
         Args:
             user_id: User identifier to load their CV
             min_salary: Minimum salary filter
@@ -342,6 +892,8 @@ class JobAgentOrchestrator(IJobAgentOrchestrator):
             days: Number of days to look back. If None, auto-calculates from latest
                   job in repository (capped at MAX_AUTO_DAYS)
             timeout: Request timeout in seconds
+            max_workers: Number of jobs to process concurrently. If None, uses the
+                        orchestrator default.
 
         Returns:
             Dictionary with pipeline results and statistics
@@ -349,6 +901,9 @@ class JobAgentOrchestrator(IJobAgentOrchestrator):
         Raises:
             ValueError: If user CV is not found or cannot be loaded
         """
+        self.stage_timer.reset()
+        caches_before = self.get_cache_stats()
+
         self.logger("Initializing database...")
         try:
             self.database_initializer()
@@ -357,23 +912,69 @@ class JobAgentOrchestrator(IJobAgentOrchestrator):
             self.logger(f"Warning: Database initialization failed: {e}")
             self.logger("Continuing without database storage...")
 
-        jobs = self.scrape_jobs(min_salary, employment_location, days, timeout)
+        cleaned_cv = self.load_cv(user_id)
 
-        filtered_jobs = self.filter_jobs_list(jobs)
+        run = self.start_run(user_id, min_salary, employment_location, days)
+        resumed_count = 0
+        if run is not None:
+            pending_jobs = self.get_pending_jobs(run)
+            if pending_jobs:
+                self.logger(f"Processing {len(pending_jobs)} pending jobs of run {run.id}...")
+                for idx, total, _ in self.process_jobs_iterator(
+                    pending_jobs, cleaned_cv, max_workers=max_workers, run=run
+                ):
+                    resumed_count += 1
+                    self.logger(f"\nProcessed pending job {idx}/{total}")
+
+        pipeline = self.create_pipeline(
+            cleaned_cv,
+            min_salary=min_salary,
+            employment_location=employment_location,
+            days=days,
+            timeout=timeout,
+            max_workers=max_workers,
+            run=run,
+        )
 
-        cleaned_cv = self.load_cv(user_id)
+        self.logger("Processing jobs with workflows system as they are scraped...")
 
-        self.logger(f"Processing {len(filtered_jobs)} jobs with workflows system...")
+        for idx, total, _ in pipeline.run():
+            self.logger(f"\nProcessed job {idx}/{total} of batch")
 
-        for idx, job in enumerate(filtered_jobs, 1):
-            self.logger(f"\nProcessing job {idx}/{len(filtered_jobs)}")
-            self.process_job(job, cleaned_cv)
+        if run is not None:
+            self.finish_run(run)
 
+        total_processed = pipeline.stats.total_processed + resumed_count
         results: PipelineSummary = {
-            "total_scraped": len(jobs),
-            "total_filtered": len(filtered_jobs),
-            "total_processed": len(filtered_jobs),
+            "total_scraped": pipeline.stats.total_scraped,
+            "total_filtered": pipeline.stats.total_filtered + resumed_count,
+            "total_processed": total_processed,
+            "timings": self.get_pipeline_timings(),
+            "caches": _cache_stats_since(caches_before, self.get_cache_stats()),
         }
 
-        self.logger(f"\nPipeline completed - Processed {len(filtered_jobs)} jobs")
+        self.logger(f"\nPipeline completed - Processed {total_processed} jobs")
+        if results["caches"]:
+            self.logger(_format_cache_stats(results["caches"]))
         return results
+
+
+def _cache_stats_since(
+    before: Dict[str, CacheStats], after: Dict[str, CacheStats]
+) -> Dict[str, CacheStats]:
+    """Get the hits and misses counted between two snapshots of the cache stats."""
+    since: Dict[str, CacheStats] = {}
+    for name, stats in after.items():
+        previous = before.get(name, {"hits": 0, "misses": 0})
+        since[name] = {
+            "hits": stats["hits"] - previous["hits"],
+            "misses": stats["misses"] - previous["misses"],
+        }
+    return since
+
+
+def _format_cache_stats(caches: Dict[str, CacheStats]) -> str:
+    return "Cache hits: " + ", ".join(
+        f"{name} {stats['hits']}/{stats['hits'] + stats['misses']}"
+        for name, stats in caches.items()
+    )
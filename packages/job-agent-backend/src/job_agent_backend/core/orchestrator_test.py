@@ -1,14 +1,29 @@
 """Tests for JobAgentOrchestrator."""
 
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
+import asyncio
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+from dependency_injector import providers
+
+from job_agent_platform_contracts import PipelineRunStatus
+from job_agent_backend.filter_service import ExistingJobFilter
+from job_agent_backend.messaging import SharedScrapeClient
+from job_agent_backend.workflows.job_processing.nodes.check_job_relevance import JobRelevance
 
 
 sys.modules["scrapper_service"] = MagicMock()
 
 
+def _no_batch_relevance(jobs):
+    """Leave relevance undecided so each job's workflow checks it."""
+    return [JobRelevance(is_relevant=None)] * len(jobs)
+
+
 class TestJobAgentOrchestrator:
     """Test suite for JobAgentOrchestrator class."""
 
@@ -288,15 +303,293 @@ class TestJobAgentOrchestrator:
             job_repository_factory=mock_factory,
         )
 
-    @patch("job_agent_backend.core.orchestrator.run_job_processing")
+    def test_orchestrator_rejects_non_positive_max_workers(self, app_container):
+        """Test orchestrator requires at least one worker."""
+        with pytest.raises(ValueError, match="max_workers"):
+            app_container.orchestrator(max_workers=0)
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    def test_process_jobs_iterator_sequential_yields_in_order(
+        self, mock_session_class, orchestrator, sample_cv_content
+    ):
+        """Test sequential processing yields (idx, total, result) in input order."""
+        mock_session_class.return_value.check_relevance.side_effect = _no_batch_relevance
+        jobs = [{"job_id": i, "title": f"Job {i}"} for i in range(3)]
+        mock_session_class.return_value.process.side_effect = (
+            lambda job, is_relevant=None, job_embedding=None: {"job": job}
+        )
+
+        results = list(orchestrator.process_jobs_iterator(jobs, sample_cv_content))
+
+        assert [(idx, total) for idx, total, _ in results] == [(1, 3), (2, 3), (3, 3)]
+        assert [result["job"]["job_id"] for _, _, result in results] == [0, 1, 2]
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    def test_process_jobs_iterator_shares_one_session(
+        self, mock_session_class, orchestrator, sample_cv_content
+    ):
+        """Test that all jobs in a batch are processed through a single session."""
+        mock_session_class.return_value.check_relevance.side_effect = _no_batch_relevance
+        jobs = [{"job_id": i} for i in range(3)]
+        mock_session_class.return_value.process.return_value = {"status": "completed"}
+
+        list(orchestrator.process_jobs_iterator(jobs, sample_cv_content, max_workers=2))
+
+        mock_session_class.assert_called_once_with(
+            sample_cv_content,
+            job_repository_factory=orchestrator.job_repository_factory,
+            stage_timer=orchestrator.stage_timer,
+            job_writer=orchestrator.job_writer,
+            shared_results=orchestrator.shared_results,
+            combined_skill_extraction=False,
+        )
+        assert mock_session_class.return_value.process.call_count == 3
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    def test_process_jobs_iterator_forwards_batch_relevance(
+        self, mock_session_class, orchestrator, sample_cv_content
+    ):
+        """Test that batch relevance decisions are passed to each job's workflow."""
+        jobs = [{"job_id": 1}, {"job_id": 2}]
+        session = mock_session_class.return_value
+        session.check_relevance.return_value = [
+            JobRelevance(True, [1.0, 0.0]),
+            JobRelevance(False, [0.0, 1.0]),
+        ]
+        session.process.return_value = {"status": "completed"}
+
+        list(orchestrator.process_jobs_iterator(jobs, sample_cv_content))
+
+        session.check_relevance.assert_called_once_with(jobs)
+        session.process.assert_any_call(jobs[0], is_relevant=True, job_embedding=[1.0, 0.0])
+        session.process.assert_any_call(jobs[1], is_relevant=False, job_embedding=[0.0, 1.0])
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    def test_process_jobs_iterator_concurrent_yields_in_completion_order(
+        self, mock_session_class, orchestrator, sample_cv_content
+    ):
+        """Test concurrent processing yields results as soon as each job finishes."""
+        mock_session_class.return_value.check_relevance.side_effect = _no_batch_relevance
+        jobs = [{"job_id": i} for i in range(3)]
+        first_job_release = threading.Event()
+
+        def run(job, is_relevant=None, job_embedding=None):
+            if job["job_id"] == 0:
+                assert first_job_release.wait(timeout=5)
+            return {"job": job}
+
+        mock_session_class.return_value.process.side_effect = run
+
+        iterator = orchestrator.process_jobs_iterator(jobs, sample_cv_content, max_workers=3)
+        seen = [next(iterator)[0], next(iterator)[0]]
+        first_job_release.set()
+        seen.extend(idx for idx, _, _ in iterator)
+
+        assert sorted(seen[:2]) == [2, 3]
+        assert seen[2] == 1
+        assert mock_session_class.return_value.process.call_count == 3
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    def test_process_jobs_iterator_concurrent_preserves_order(
+        self, mock_session_class, orchestrator, sample_cv_content
+    ):
+        """Test preserve_order yields results in input order despite completion order."""
+        mock_session_class.return_value.check_relevance.side_effect = _no_batch_relevance
+        jobs = [{"job_id": i} for i in range(4)]
+
+        def run(job, is_relevant=None, job_embedding=None):
+            time.sleep(0.05 * (len(jobs) - job["job_id"]))
+            return {"job": job}
+
+        mock_session_class.return_value.process.side_effect = run
+
+        results = list(
+            orchestrator.process_jobs_iterator(
+                jobs, sample_cv_content, max_workers=4, preserve_order=True
+            )
+        )
+
+        assert [idx for idx, _, _ in results] == [1, 2, 3, 4]
+        assert [result["job"]["job_id"] for _, _, result in results] == [0, 1, 2, 3]
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    def test_process_jobs_iterator_runs_jobs_concurrently(
+        self, mock_session_class, orchestrator, sample_cv_content
+    ):
+        """Test that jobs overlap when more than one worker is configured."""
+        mock_session_class.return_value.check_relevance.side_effect = _no_batch_relevance
+        barrier = threading.Barrier(2, timeout=5)
+
+        def run(job, is_relevant=None, job_embedding=None):
+            barrier.wait()
+            return {"job": job}
+
+        mock_session_class.return_value.process.side_effect = run
+
+        results = list(
+            orchestrator.process_jobs_iterator(
+                [{"job_id": 1}, {"job_id": 2}], sample_cv_content, max_workers=2
+            )
+        )
+
+        assert len(results) == 2
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    def test_process_jobs_iterator_propagates_job_errors(
+        self, mock_session_class, orchestrator, sample_cv_content
+    ):
+        """Test that a failing job surfaces its exception to the consumer."""
+        mock_session_class.return_value.check_relevance.side_effect = _no_batch_relevance
+        mock_session_class.return_value.process.side_effect = RuntimeError("workflow failed")
+
+        with pytest.raises(RuntimeError, match="workflow failed"):
+            list(
+                orchestrator.process_jobs_iterator(
+                    [{"job_id": 1}, {"job_id": 2}], sample_cv_content, max_workers=2
+                )
+            )
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    def test_process_jobs_iterator_reuses_session_for_same_cv(
+        self, mock_session_class, orchestrator, sample_cv_content
+    ):
+        """Test that consecutive batches for the same CV share one session."""
+        session = mock_session_class.return_value
+        session.cv_content = sample_cv_content
+        session.check_relevance.side_effect = _no_batch_relevance
+        session.process.return_value = {"status": "completed"}
+
+        list(orchestrator.process_jobs_iterator([{"job_id": 1}], sample_cv_content))
+        list(orchestrator.process_jobs_iterator([{"job_id": 2}], sample_cv_content))
+
+        mock_session_class.assert_called_once()
+        assert session.process.call_count == 2
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    async def test_process_jobs_async_yields_results_in_order(
+        self, mock_session_class, orchestrator, sample_cv_content
+    ):
+        """Test async processing awaits the session and yields (idx, total, result)."""
+        session = mock_session_class.return_value
+        session.acheck_relevance = AsyncMock(side_effect=_no_batch_relevance)
+        session.aprocess = AsyncMock(
+            side_effect=lambda job, is_relevant=None, job_embedding=None: {"job": job}
+        )
+        jobs = [{"job_id": i} for i in range(3)]
+
+        results = [
+            item
+            async for item in orchestrator.process_jobs_async(
+                jobs, sample_cv_content, preserve_order=True
+            )
+        ]
+
+        assert [(idx, total) for idx, total, _ in results] == [(1, 3), (2, 3), (3, 3)]
+        assert [result["job"]["job_id"] for _, _, result in results] == [0, 1, 2]
+        session.acheck_relevance.assert_awaited_once_with(jobs)
+        session.process.assert_not_called()
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    async def test_process_jobs_async_runs_jobs_concurrently(
+        self, mock_session_class, orchestrator, sample_cv_content
+    ):
+        """Test async jobs overlap on the event loop up to max_workers."""
+        both_started = asyncio.Event()
+        started = []
+
+        async def aprocess(job, is_relevant=None, job_embedding=None):
+            started.append(job["job_id"])
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=5)
+            return {"job": job}
+
+        session = mock_session_class.return_value
+        session.acheck_relevance = AsyncMock(side_effect=_no_batch_relevance)
+        session.aprocess = AsyncMock(side_effect=aprocess)
+
+        results = [
+            item
+            async for item in orchestrator.process_jobs_async(
+                [{"job_id": 1}, {"job_id": 2}], sample_cv_content, max_workers=2
+            )
+        ]
+
+        assert sorted(result["job"]["job_id"] for _, _, result in results) == [1, 2]
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    async def test_process_jobs_async_cancels_pending_jobs_when_closed(
+        self, mock_session_class, orchestrator, sample_cv_content
+    ):
+        """Test that closing the async generator cancels jobs still in flight."""
+        cancelled = []
+
+        async def aprocess(job, is_relevant=None, job_embedding=None):
+            if job["job_id"] == 2:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(job["job_id"])
+                    raise
+            return {"job": job}
+
+        session = mock_session_class.return_value
+        session.acheck_relevance = AsyncMock(side_effect=_no_batch_relevance)
+        session.aprocess = AsyncMock(side_effect=aprocess)
+
+        results = orchestrator.process_jobs_async(
+            [{"job_id": 1}, {"job_id": 2}], sample_cv_content, max_workers=2
+        )
+        first = await results.__anext__()
+        await results.aclose()
+
+        assert first[2]["job"]["job_id"] == 1
+        assert cancelled == [2]
+
+    async def test_scrape_jobs_streaming_async_yields_batches(
+        self, orchestrator, mock_scrapper_manager
+    ):
+        """Test async scraping yields every batch with a running total."""
+        orchestrator.scrapper_manager = mock_scrapper_manager
+        mock_scrapper_manager.scrape_jobs_streaming.return_value = iter(
+            [[{"job_id": 1}, {"job_id": 2}], [{"job_id": 3}]]
+        )
+
+        batches = [batch async for batch in orchestrator.scrape_jobs_streaming_async(days=1)]
+
+        assert [total for _, total in batches] == [2, 3]
+        assert [job["job_id"] for jobs, _ in batches for job in jobs] == [1, 2, 3]
+
+    async def test_scrape_jobs_streaming_async_propagates_errors(
+        self, orchestrator, mock_scrapper_manager
+    ):
+        """Test that scrapper failures surface in the async consumer."""
+        orchestrator.scrapper_manager = mock_scrapper_manager
+        mock_scrapper_manager.scrape_jobs_streaming.side_effect = TimeoutError("no response")
+
+        with pytest.raises(TimeoutError, match="no response"):
+            async for _ in orchestrator.scrape_jobs_streaming_async(days=1):
+                pass
+
+    async def test_filter_jobs_list_async(self, orchestrator, sample_jobs_list):
+        """Test async filtering returns the same jobs as filter_jobs_list."""
+        orchestrator.filter_service.configure({"max_months_of_experience": 36})
+
+        result = await orchestrator.filter_jobs_list_async(sample_jobs_list)
+
+        assert len(result) == 2
+        assert all(job["experience_months"] <= 36 for job in result)
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
     def test_run_complete_pipeline_integration(
         self,
-        mock_run_job_processing,
+        mock_session_class,
         mock_scrapper_manager,
         sample_cv_content,
         app_container,
     ):
         """Test complete pipeline integration."""
+        mock_session_class.return_value.check_relevance.side_effect = _no_batch_relevance
         user_id = 1000
 
         mock_repo_instance = MagicMock()
@@ -311,7 +604,7 @@ class TestJobAgentOrchestrator:
             database_initializer=mock_initializer,
         )
 
-        mock_run_job_processing.return_value = {
+        mock_session_class.return_value.process.return_value = {
             "is_relevant": True,
             "status": "completed",
         }
@@ -340,12 +633,97 @@ class TestJobAgentOrchestrator:
         mock_initializer.assert_called_once()
         mock_scrapper_manager.scrape_jobs_streaming.assert_called_once()
         mock_repo_instance.find.assert_called_once()
-        mock_run_job_processing.assert_called_once()
+        mock_session_class.return_value.process.assert_called_once()
 
         assert result["total_scraped"] == 1
         assert result["total_filtered"] == 1
         assert result["total_processed"] == 1
 
+        timings = result["timings"]
+        assert timings["stages"]["scrape_wait"]["calls"] == 2
+        assert timings["stages"]["filter"]["calls"] == 1
+        assert timings["job_latency_p50_seconds"] > 0
+        assert timings["jobs_per_second"] > 0
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    def test_run_complete_pipeline_streams_batches_through_one_session(
+        self,
+        mock_session_class,
+        mock_scrapper_manager,
+        sample_cv_content,
+        app_container,
+    ):
+        """Test pipeline processes every scraped batch using a single session."""
+        mock_session_class.return_value.check_relevance.side_effect = _no_batch_relevance
+        mock_session_class.return_value.process.return_value = {"status": "completed"}
+
+        mock_repo_instance = MagicMock()
+        mock_repo_instance.find.return_value = sample_cv_content
+        orchestrator = app_container.orchestrator(
+            cv_repository_class=MagicMock(return_value=mock_repo_instance),
+            scrapper_manager=mock_scrapper_manager,
+            database_initializer=lambda: None,
+        )
+        jobs = [
+            {
+                "job_id": job_id,
+                "title": f"Python Developer {job_id}",
+                "url": f"https://example.com/{job_id}",
+                "description": "Python dev position",
+                "company": {"name": "TechCo"},
+                "experience_months": 24.0,
+                "location": {"region": "Remote", "is_remote": True, "can_apply": True},
+            }
+            for job_id in range(1, 4)
+        ]
+        batches = [jobs[:1], jobs[1:]]
+        mock_scrapper_manager.scrape_jobs_streaming.return_value = iter(batches)
+
+        result = orchestrator.run_complete_pipeline(user_id=1, days=1)
+
+        mock_session_class.assert_called_once()
+        assert mock_session_class.return_value.check_relevance.call_count == 2
+        assert mock_session_class.return_value.process.call_count == 3
+        assert result["total_scraped"] == 3
+        assert result["total_filtered"] == 3
+        assert result["total_processed"] == 3
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    def test_run_complete_pipeline_reports_cache_lookups_of_the_run(
+        self,
+        mock_session_class,
+        mock_scrapper_manager,
+        sample_cv_content,
+        app_container,
+    ):
+        """Test the summary counts the cache hits and misses made during the run."""
+        mock_session_class.return_value.check_relevance.side_effect = _no_batch_relevance
+        mock_session_class.return_value.process.return_value = {"status": "completed"}
+        mock_scrapper_manager.scrape_jobs_streaming.return_value = iter([])
+        snapshots = iter(
+            [
+                {"response_cache": {"hits": 2, "misses": 5}},
+                {"response_cache": {"hits": 9, "misses": 6}},
+            ]
+        )
+        logger = MagicMock()
+
+        mock_repo_instance = MagicMock()
+        mock_repo_instance.find.return_value = sample_cv_content
+        orchestrator = app_container.orchestrator(
+            cv_repository_class=MagicMock(return_value=mock_repo_instance),
+            scrapper_manager=mock_scrapper_manager,
+            database_initializer=lambda: None,
+            shared_results=None,
+            cache_stats=lambda: next(snapshots),
+            logger=logger,
+        )
+
+        result = orchestrator.run_complete_pipeline(user_id=1, days=1)
+
+        assert result["caches"] == {"response_cache": {"hits": 7, "misses": 1}}
+        logger.assert_any_call("Cache hits: response_cache 7/8")
+
     @patch("job_agent_backend.core.orchestrator.CVRepository")
     def test_run_complete_pipeline_raises_when_no_cv(
         self,
@@ -364,14 +742,15 @@ class TestJobAgentOrchestrator:
         with pytest.raises(ValueError, match="CV not found"):
             orchestrator.run_complete_pipeline(user_id=user_id)
 
-    @patch("job_agent_backend.core.orchestrator.run_job_processing")
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
     def test_run_complete_pipeline_with_filtering(
         self,
-        mock_run_job_processing,
+        mock_session_class,
         sample_cv_content,
         app_container,
     ):
         """Test complete pipeline with job filtering."""
+        mock_session_class.return_value.check_relevance.side_effect = _no_batch_relevance
         user_id = 3000
 
         mock_scrapper = MagicMock()
@@ -415,7 +794,7 @@ class TestJobAgentOrchestrator:
 
         orchestrator.filter_service.configure({"max_months_of_experience": 24})
 
-        mock_run_job_processing.return_value = {"status": "completed"}
+        mock_session_class.return_value.process.return_value = {"status": "completed"}
 
         result = orchestrator.run_complete_pipeline(user_id=user_id)
 
@@ -574,11 +953,12 @@ class TestOrchestratorPipelineWithFilteredJobsStorage:
         """Use the shared app container fixture."""
         return app_container_with_stub_repository
 
-    @patch("job_agent_backend.core.orchestrator.run_job_processing")
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
     def test_pipeline_stores_filtered_jobs_before_processing(
-        self, mock_run_job_processing, app_container, stub_job_repository, sample_cv_content
+        self, mock_session_class, app_container, stub_job_repository, sample_cv_content
     ):
         """Test that filtered jobs are stored before workflow processing begins."""
+        mock_session_class.return_value.check_relevance.side_effect = _no_batch_relevance
         user_id = 5000
 
         mock_repo_instance = MagicMock()
@@ -617,7 +997,7 @@ class TestOrchestratorPipelineWithFilteredJobsStorage:
         )
         orchestrator.filter_service.configure({"max_months_of_experience": 60})
 
-        mock_run_job_processing.return_value = {"status": "completed"}
+        mock_session_class.return_value.process.return_value = {"status": "completed"}
 
         result = orchestrator.run_complete_pipeline(user_id=user_id)
 
@@ -626,7 +1006,7 @@ class TestOrchestratorPipelineWithFilteredJobsStorage:
         assert stub_job_repository.saved_filtered_jobs[0]["job_id"] == 2
 
         # Only the passing job should have been processed
-        assert mock_run_job_processing.call_count == 1
+        assert mock_session_class.return_value.process.call_count == 1
 
         # Pipeline summary should reflect correct counts
         assert result["total_scraped"] == 2
@@ -939,3 +1319,335 @@ class TestOrchestratorDateCalculation:
 
         assert posted_after is not None
         assert posted_after.tzinfo == timezone.utc, "posted_after should be in UTC"
+
+
+class TestOrchestratorRunCheckpointing:
+    """Tests for checkpointed, resumable pipeline runs."""
+
+    @pytest.fixture
+    def app_container(self, app_container_with_stub_repository, stub_run_ledger):
+        """Use the shared app container fixture with an in-memory run ledger."""
+        container = app_container_with_stub_repository
+        container.run_ledger_factory.override(providers.Object(lambda: stub_run_ledger))
+        return container
+
+    @pytest.fixture
+    def cv_repository_class(self, sample_cv_content):
+        """CV repository class returning the sample CV."""
+        mock_repo_instance = MagicMock()
+        mock_repo_instance.find.return_value = sample_cv_content
+        return MagicMock(return_value=mock_repo_instance)
+
+    @staticmethod
+    def _job(job_id):
+        return {
+            "job_id": job_id,
+            "title": f"Python Developer {job_id}",
+            "url": f"https://example.com/{job_id}",
+            "company": {"name": f"Company {job_id}"},
+            "date_posted": "2024-01-15T10:00:00Z",
+            "employment_type": "FULL_TIME",
+            "experience_months": 24.0,
+            "location": {"region": "Remote", "is_remote": True, "can_apply": True},
+        }
+
+    def test_start_run_without_ledger_returns_none(self, app_container_with_stub_repository):
+        """Runs are not checkpointed when no ledger is configured."""
+        app_container_with_stub_repository.run_ledger_factory.override(providers.Object(None))
+        orchestrator = app_container_with_stub_repository.orchestrator()
+
+        assert orchestrator.start_run(user_id=1) is None
+
+    def test_start_run_resumes_unfinished_run_for_same_search(self, app_container):
+        """The same user and search resume the unfinished run; other searches do not."""
+        orchestrator = app_container.orchestrator(logger=MagicMock())
+
+        first = orchestrator.start_run(user_id=1, min_salary=4000, days=1)
+        again = orchestrator.start_run(user_id=1, min_salary=4000, days=1)
+        other = orchestrator.start_run(user_id=1, min_salary=5000, days=1)
+
+        assert again.id == first.id
+        assert other.id != first.id
+
+    def test_finished_run_is_not_resumed(self, app_container):
+        """A completed run is never resumed."""
+        orchestrator = app_container.orchestrator(logger=MagicMock())
+
+        first = orchestrator.start_run(user_id=1, days=1)
+        orchestrator.finish_run(first)
+
+        assert orchestrator.start_run(user_id=1, days=1).id != first.id
+
+    def test_scrape_uses_run_cutoff_and_skips_completed_scrape(self, app_container):
+        """A run keeps its date cutoff and is not scraped again once completed."""
+        mock_scrapper = MagicMock()
+        mock_scrapper.scrape_jobs_streaming.return_value = iter([[self._job(1)]])
+        orchestrator = app_container.orchestrator(
+            scrapper_manager=mock_scrapper, logger=MagicMock()
+        )
+        run = orchestrator.start_run(user_id=1, days=1)
+
+        batches = list(orchestrator.scrape_jobs_streaming(days=7, run=run))
+
+        assert len(batches) == 1
+        call_kwargs = mock_scrapper.scrape_jobs_streaming.call_args.kwargs
+        assert call_kwargs["posted_after"] == run.posted_after
+
+        resumed = orchestrator.start_run(user_id=1, days=1)
+        assert resumed.scrape_completed is True
+        assert list(orchestrator.scrape_jobs_streaming(days=1, run=resumed)) == []
+        mock_scrapper.scrape_jobs_streaming.assert_called_once()
+
+    def test_filter_returns_only_jobs_new_to_the_run(self, app_container):
+        """Jobs the run already recorded are not returned for processing again."""
+        orchestrator = app_container.orchestrator(logger=MagicMock())
+        run = orchestrator.start_run(user_id=1, days=1)
+
+        first = orchestrator.filter_jobs_list([self._job(1), self._job(2)], run=run)
+        second = orchestrator.filter_jobs_list([self._job(2), self._job(3)], run=run)
+
+        assert [job["job_id"] for job in first] == [1, 2]
+        assert [job["job_id"] for job in second] == [3]
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    def test_interrupted_pipeline_resumes_from_pending_jobs(
+        self, mock_session_class, app_container, cv_repository_class, stub_run_ledger
+    ):
+        """A restarted run processes only the jobs the interrupted run did not finish."""
+        mock_session_class.return_value.check_relevance.side_effect = _no_batch_relevance
+        mock_session_class.return_value.process.side_effect = [
+            {"status": "completed"},
+            RuntimeError("worker restarted"),
+            {"status": "completed"},
+        ]
+        mock_scrapper = MagicMock()
+        mock_scrapper.scrape_jobs_streaming.side_effect = lambda **_: iter(
+            [[self._job(1), self._job(2)]]
+        )
+        orchestrator = app_container.orchestrator(
+            cv_repository_class=cv_repository_class,
+            scrapper_manager=mock_scrapper,
+            database_initializer=lambda: None,
+            logger=MagicMock(),
+        )
+
+        with pytest.raises(RuntimeError, match="worker restarted"):
+            orchestrator.run_complete_pipeline(user_id=1, days=1)
+
+        result = orchestrator.run_complete_pipeline(user_id=1, days=1)
+
+        processed_ids = [
+            call.args[0]["job_id"]
+            for call in mock_session_class.return_value.process.call_args_list
+        ]
+        assert processed_ids == [1, 2, 2]
+        assert result["total_processed"] == 1
+        run = stub_run_ledger.runs[1]
+        assert run.status == PipelineRunStatus.COMPLETED
+        assert run.total_processed == 2
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    async def test_process_jobs_async_marks_jobs_processed(
+        self, mock_session_class, app_container, sample_cv_content, stub_run_ledger
+    ):
+        """Each job is checkpointed as processed once its async workflow finishes."""
+        session = mock_session_class.return_value
+        session.cv_content = sample_cv_content
+        session.acheck_relevance = AsyncMock(return_value=[JobRelevance(None), JobRelevance(None)])
+        session.aprocess = AsyncMock(return_value={"status": "completed"})
+        orchestrator = app_container.orchestrator(logger=MagicMock())
+        run = orchestrator.start_run(user_id=1, days=1)
+        orchestrator.filter_jobs_list([self._job(1), self._job(2)], run=run)
+
+        results = [
+            result
+            async for result in orchestrator.process_jobs_async(
+                [self._job(1), self._job(2)], sample_cv_content, run=run
+            )
+        ]
+
+        assert len(results) == 2
+        assert orchestrator.get_pending_jobs(run) == []
+        assert stub_run_ledger.runs[run.id].total_processed == 2
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    def test_jobs_are_checkpointed_only_once_stored(
+        self,
+        mock_session_class,
+        app_container,
+        sample_cv_content,
+        stub_run_ledger,
+        stub_job_repository,
+    ):
+        """Jobs are stored in one batch before the run marks them processed."""
+        session = mock_session_class.return_value
+        session.cv_content = sample_cv_content
+        session.check_relevance.side_effect = _no_batch_relevance
+        orchestrator = app_container.orchestrator(logger=MagicMock())
+        session.process.side_effect = lambda job, is_relevant=None, job_embedding=None: (
+            orchestrator.job_writer.add(job) or {"status": "completed"}
+        )
+        stored_when_marked = []
+        mark_jobs_processed = stub_run_ledger.mark_jobs_processed
+
+        def record_mark(run_id, jobs):
+            stored_when_marked.extend(job in stub_job_repository.created_jobs for job in jobs)
+            return mark_jobs_processed(run_id, jobs)
+
+        stub_run_ledger.mark_jobs_processed = record_mark
+        run = orchestrator.start_run(user_id=1, days=1)
+        jobs = orchestrator.filter_jobs_list([self._job(1), self._job(2)], run=run)
+
+        list(orchestrator.process_jobs_iterator(jobs, sample_cv_content, run=run))
+
+        assert stub_job_repository.created_jobs == jobs
+        assert stored_when_marked == [True, True]
+        assert orchestrator.job_writer.pending_count == 0
+        assert orchestrator.get_pending_jobs(run) == []
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    def test_job_that_could_not_be_stored_stays_pending(
+        self,
+        mock_session_class,
+        app_container,
+        sample_cv_content,
+        stub_run_ledger,
+        stub_job_repository,
+    ):
+        """A job the writer failed to store is not checkpointed, so a resumed run retries it."""
+        session = mock_session_class.return_value
+        session.cv_content = sample_cv_content
+        session.check_relevance.side_effect = _no_batch_relevance
+        orchestrator = app_container.orchestrator(logger=MagicMock())
+        session.process.side_effect = lambda job, is_relevant=None, job_embedding=None: (
+            orchestrator.job_writer.add(job) or {"status": "completed"}
+        )
+
+        def create(job):
+            if job["job_id"] == 2:
+                raise RuntimeError("Bad job")
+            stub_job_repository.created_jobs.append(job)
+            return job
+
+        stub_job_repository.create_many = MagicMock(side_effect=RuntimeError("Database error"))
+        stub_job_repository.create = create
+        run = orchestrator.start_run(user_id=1, days=1)
+        jobs = orchestrator.filter_jobs_list([self._job(1), self._job(2)], run=run)
+
+        list(orchestrator.process_jobs_iterator(jobs, sample_cv_content, run=run))
+
+        assert stub_job_repository.created_jobs == [jobs[0]]
+        assert orchestrator.get_pending_jobs(run) == [jobs[1]]
+        assert stub_run_ledger.runs[run.id].total_processed == 1
+
+
+class TestOrchestratorSharedScrape:
+    """Tests for searches of several users sharing one scrape."""
+
+    class StoringJobRepository:
+        """Job repository stub reporting the jobs stored so far as existing."""
+
+        def __init__(self):
+            self.stored_ids: set[str] = set()
+
+        def create_many(self, jobs_data):
+            self.stored_ids.update(str(job["job_id"]) for job in jobs_data)
+            return list(jobs_data)
+
+        def get_by_external_id(self, external_id, source=None):
+            return {"external_id": external_id} if external_id in self.stored_ids else None
+
+        def has_active_job_with_title_and_company(self, title, company_name):
+            return False
+
+        def save_filtered_jobs(self, jobs):
+            return len(jobs)
+
+    @staticmethod
+    def _job(job_id):
+        return {
+            "job_id": job_id,
+            "title": f"Python Developer {job_id}",
+            "url": f"https://example.com/{job_id}",
+            "company": {"name": f"Company {job_id}"},
+            "experience_months": 24.0,
+            "location": {"region": "Remote", "is_remote": True, "can_apply": True},
+        }
+
+    @patch("job_agent_backend.core.orchestrator.JobProcessingSession")
+    def test_second_user_gets_relevance_for_jobs_the_first_user_stored(
+        self, mock_session_class, app_container_with_stub_repository
+    ):
+        """Jobs stored by the first search are still checked against the second CV."""
+        repository = self.StoringJobRepository()
+        container = app_container_with_stub_repository
+        container.job_repository_factory.override(providers.Object(lambda: repository))
+        stored_before = self._job(1)
+        repository.create_many([stored_before])
+        shared_jobs = [self._job(2), self._job(3)]
+        gate = threading.Event()
+
+        def scrape_jobs_streaming(**_):
+            gate.wait(timeout=5)
+            yield [stored_before, *shared_jobs]
+
+        scrapper = MagicMock()
+        scrapper.scrape_jobs_streaming.side_effect = scrape_jobs_streaming
+        client = SharedScrapeClient(scrapper, job_filter=ExistingJobFilter(lambda: repository))
+
+        sessions = {}
+
+        def create_session(cv_content, **_):
+            session = MagicMock()
+            session.cv_content = cv_content
+            session.check_relevance.side_effect = lambda jobs: (
+                [JobRelevance(is_relevant=True)] * len(jobs)
+            )
+            # The workflow's store_job node stores each processed job
+            session.process.side_effect = lambda job, **__: (
+                repository.create_many([job]) and {"is_relevant": True}
+            )
+            sessions[cv_content] = session
+            return session
+
+        def wait_for_followers(count):
+            deadline = time.monotonic() + 5
+            while sum(len(scrape.positions) for scrape in list(client._scrapes.values())) < count:
+                assert time.monotonic() < deadline, "searches never joined the scrape"
+                time.sleep(0.001)
+
+        mock_session_class.side_effect = create_session
+        first, second = (
+            container.orchestrator(scrapper_manager=client, logger=MagicMock()) for _ in range(2)
+        )
+        posted_after = first._calculate_posted_after(1)
+        scrapes = [first.scrape_jobs_streaming(days=1), second.scrape_jobs_streaming(days=1)]
+
+        with (
+            patch.object(first, "_calculate_posted_after", return_value=posted_after),
+            patch.object(second, "_calculate_posted_after", return_value=posted_after),
+            ThreadPoolExecutor(max_workers=2) as executor,
+        ):
+            first_batch = executor.submit(next, scrapes[0])
+            wait_for_followers(1)
+            second_batch = executor.submit(next, scrapes[1])
+            wait_for_followers(2)
+            gate.set()
+            batches = [first_batch.result(timeout=5)[0], second_batch.result(timeout=5)[0]]
+
+        first_results = list(
+            first.process_jobs_iterator(first.filter_jobs_list(batches[0]), "First CV")
+        )
+        second_results = list(
+            second.process_jobs_iterator(second.filter_jobs_list(batches[1]), "Second CV")
+        )
+        for scrape in scrapes:
+            scrape.close()
+
+        assert scrapper.scrape_jobs_streaming.call_count == 1
+        assert batches == [shared_jobs, shared_jobs]
+        assert repository.stored_ids == {"1", "2", "3"}
+        assert len(first_results) == 2
+        assert len(second_results) == 2
+        sessions["Second CV"].check_relevance.assert_called_once_with(shared_jobs)
+        assert all(result["is_relevant"] for _, _, result in second_results)
@@ -0,0 +1,193 @@
+"""Staged job pipeline connecting scraping, filtering and processing.
+
+Each stage runs concurrently and hands batches to the next one through a bounded
+queue. Scraping keeps going while earlier batches are filtered and processed, and
+a slow downstream stage applies backpressure instead of letting scraped jobs pile
+up in memory.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Union
+
+from job_scrapper_contracts import JobDict
+from job_agent_platform_contracts import JobProcessingResult
+from job_agent_backend.core.stream_markers import POLL_INTERVAL_SECONDS, EndOfStream, StageFailure
+
+
+# Default number of batches each queue holds before the upstream stage blocks
+DEFAULT_QUEUE_SIZE = 2
+
+
+ScrapeStage = Callable[[], Iterable[list[JobDict]]]
+FilterStage = Callable[[list[JobDict]], list[JobDict]]
+ProcessStage = Callable[[Sequence[JobDict]], Iterable[tuple[int, int, JobProcessingResult]]]
+
+
+class PipelineStage(StrEnum):
+    """Queues feeding each downstream pipeline stage."""
+
+    FILTER = "filter"
+    PROCESS = "process"
+
+
+@dataclass
+class PipelineStats:
+    """Running counters for a pipeline run."""
+
+    total_scraped: int = 0
+    total_filtered: int = 0
+    total_processed: int = 0
+
+
+_QueueItem = Union[list[JobDict], EndOfStream, StageFailure]
+
+
+class _PipelineStopped(Exception):
+    """Raised inside a stage thread when the pipeline is stopped early."""
+
+
+class JobPipeline:
+    """Runs scrape, filter and process stages concurrently over bounded queues.
+
+    Scraping and filtering run in background threads; processing runs in the
+    thread consuming run(), so results are yielded as soon as each job finishes.
+    Memory stays bounded by the queue sizes rather than the number of jobs scraped.
+    """
+
+    def __init__(
+        self,
+        scrape: ScrapeStage,
+        filter_batch: FilterStage,
+        process_batch: ProcessStage,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        logger: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            scrape: Callable returning an iterable of scraped job batches
+            filter_batch: Callable returning the jobs of a batch that pass filtering
+            process_batch: Callable processing a filtered batch, yielding
+                           (job_index, batch_size, result) for each job
+            queue_size: Maximum number of batches waiting in each queue
+            logger: Optional logging function for queue depth reports
+        """
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+        self._scrape = scrape
+        self._filter_batch = filter_batch
+        self._process_batch = process_batch
+        self._logger = logger
+        self._queues: dict[PipelineStage, "queue.Queue[_QueueItem]"] = {
+            stage: queue.Queue(maxsize=queue_size) for stage in PipelineStage
+        }
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self.stats = PipelineStats()
+
+    def queue_depths(self) -> dict[str, int]:
+        """Return the number of batches currently waiting for each stage."""
+        return {stage.value: stage_queue.qsize() for stage, stage_queue in self._queues.items()}
+
+    def run(self) -> Iterator[tuple[int, int, JobProcessingResult]]:
+        """Run all stages, yielding processing results as jobs complete.
+
+        Yields:
+            Tuple of (job_index, batch_size, result) for each processed job,
+            with job_index relative to its filtered batch.
+
+        Raises:
+            Exception: Any exception raised by a stage is re-raised here
+        """
+        threads = [
+            threading.Thread(target=self._run_scrape_stage, name="pipeline-scrape", daemon=True),
+            threading.Thread(target=self._run_filter_stage, name="pipeline-filter", daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = self._get(PipelineStage.PROCESS)
+                if isinstance(item, EndOfStream):
+                    return
+                if isinstance(item, StageFailure):
+                    raise item.error
+
+                self._report_queue_depths()
+                for idx, total, result in self._process_batch(item):
+                    with self._lock:
+                        self.stats.total_processed += 1
+                    yield idx, total, result
+        finally:
+            # Stage threads notice the stop on their next queue operation and exit;
+            # they are not joined so a consumer stopping early never waits on a
+            # scrape request that is still in flight.
+            self._stop.set()
+
+    def _run_scrape_stage(self) -> None:
+        output = PipelineStage.FILTER
+        try:
+            for batch in self._scrape():
+                with self._lock:
+                    self.stats.total_scraped += len(batch)
+                self._put(output, batch)
+            self._put(output, EndOfStream())
+        except _PipelineStopped:
+            return
+        except Exception as e:
+            self._put_failure(output, e)
+
+    def _run_filter_stage(self) -> None:
+        output = PipelineStage.PROCESS
+        try:
+            while True:
+                item = self._get(PipelineStage.FILTER)
+                if isinstance(item, (EndOfStream, StageFailure)):
+                    self._put(output, item)
+                    return
+
+                passed = self._filter_batch(item)
+                with self._lock:
+                    self.stats.total_filtered += len(passed)
+                if passed:
+                    self._put(output, passed)
+        except _PipelineStopped:
+            return
+        except Exception as e:
+            self._put_failure(output, e)
+
+    def _put(self, stage: PipelineStage, item: _QueueItem) -> None:
+        while True:
+            if self._stop.is_set():
+                raise _PipelineStopped()
+            try:
+                self._queues[stage].put(item, timeout=POLL_INTERVAL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def _put_failure(self, stage: PipelineStage, error: Exception) -> None:
+        try:
+            self._put(stage, StageFailure(error))
+        except _PipelineStopped:
+            pass
+
+    def _get(self, stage: PipelineStage) -> _QueueItem:
+        while True:
+            if self._stop.is_set():
+                raise _PipelineStopped()
+            try:
+                return self._queues[stage].get(timeout=POLL_INTERVAL_SECONDS)
+            except queue.Empty:
+                continue
+
+    def _report_queue_depths(self) -> None:
+        if self._logger is None:
+            return
+        depths = ", ".join(f"{stage}: {depth}" for stage, depth in self.queue_depths().items())
+        self._logger(f"Pipeline queue depth - {depths}")
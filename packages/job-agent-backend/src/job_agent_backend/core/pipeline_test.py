@@ -0,0 +1,172 @@
+"""Tests for the staged job pipeline."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from job_agent_backend.core.pipeline import JobPipeline
+
+
+def _batches(count: int, size: int = 2) -> list[list[dict]]:
+    return [[{"job_id": b * size + i} for i in range(size)] for b in range(count)]
+
+
+def _pass_all(batch):
+    return list(batch)
+
+
+def _process(batch):
+    for idx, job in enumerate(batch, 1):
+        yield idx, len(batch), {"job": job, "status": "completed"}
+
+
+class TestJobPipeline:
+    """Test suite for JobPipeline."""
+
+    def test_rejects_non_positive_queue_size(self):
+        """Pipeline requires room for at least one batch per queue."""
+        with pytest.raises(ValueError, match="queue_size"):
+            JobPipeline(lambda: [], _pass_all, _process, queue_size=0)
+
+    def test_processes_all_jobs_and_counts_stages(self):
+        """Every scraped batch is filtered and processed, with stats per stage."""
+        pipeline = JobPipeline(
+            scrape=lambda: _batches(3),
+            filter_batch=lambda batch: [job for job in batch if job["job_id"] % 2 == 0],
+            process_batch=_process,
+        )
+
+        results = list(pipeline.run())
+
+        assert [result["job"]["job_id"] for _, _, result in results] == [0, 2, 4]
+        assert pipeline.stats.total_scraped == 6
+        assert pipeline.stats.total_filtered == 3
+        assert pipeline.stats.total_processed == 3
+
+    def test_skips_batches_with_no_passing_jobs(self):
+        """Batches emptied by filtering never reach the process stage."""
+        process_batch = MagicMock(side_effect=_process)
+        pipeline = JobPipeline(
+            scrape=lambda: _batches(2),
+            filter_batch=lambda batch: [],
+            process_batch=process_batch,
+        )
+
+        assert list(pipeline.run()) == []
+        process_batch.assert_not_called()
+        assert pipeline.stats.total_scraped == 4
+
+    def test_yields_results_while_scraping_continues(self):
+        """The first result arrives before the scrape stage has finished."""
+        first_result_seen = threading.Event()
+
+        def scrape():
+            yield [{"job_id": 1}]
+            assert first_result_seen.wait(timeout=5)
+            yield [{"job_id": 2}]
+
+        pipeline = JobPipeline(scrape=scrape, filter_batch=_pass_all, process_batch=_process)
+
+        results = pipeline.run()
+        first = next(results)
+        first_result_seen.set()
+        rest = list(results)
+
+        assert first[2]["job"]["job_id"] == 1
+        assert [result["job"]["job_id"] for _, _, result in rest] == [2]
+
+    def test_bounded_queues_limit_scraping_ahead(self):
+        """A slow process stage applies backpressure to the scrape stage."""
+        scraped = []
+        lag = []
+        processed_batches = []
+
+        def scrape():
+            for batch in _batches(10, size=1):
+                scraped.append(batch)
+                yield batch
+
+        def process_batch(batch):
+            lag.append(len(scraped) - len(processed_batches))
+            processed_batches.append(batch)
+            time.sleep(0.02)
+            yield from _process(batch)
+
+        pipeline = JobPipeline(
+            scrape=scrape, filter_batch=_pass_all, process_batch=process_batch, queue_size=1
+        )
+
+        list(pipeline.run())
+
+        # At most one batch in each queue, one in the filter stage and one being
+        # handed over by the scrape stage may exist ahead of the process stage.
+        assert max(lag) <= 5
+        assert pipeline.stats.total_processed == 10
+
+    def test_queue_depths_are_reported(self):
+        """Queue depth for each stage is exposed and reported to the logger."""
+        logger = MagicMock()
+        pipeline = JobPipeline(
+            scrape=lambda: _batches(1),
+            filter_batch=_pass_all,
+            process_batch=_process,
+            logger=logger,
+        )
+
+        assert pipeline.queue_depths() == {"filter": 0, "process": 0}
+
+        list(pipeline.run())
+
+        logger.assert_called_once()
+        assert "filter" in logger.call_args.args[0]
+        assert "process" in logger.call_args.args[0]
+
+    def test_scrape_failure_is_raised_to_consumer(self):
+        """Exceptions from the scrape stage surface in run()."""
+
+        def scrape():
+            yield [{"job_id": 1}]
+            raise TimeoutError("scrapper timed out")
+
+        pipeline = JobPipeline(scrape=scrape, filter_batch=_pass_all, process_batch=_process)
+
+        with pytest.raises(TimeoutError, match="scrapper timed out"):
+            list(pipeline.run())
+        assert pipeline.stats.total_processed == 1
+
+    def test_filter_failure_is_raised_to_consumer(self):
+        """Exceptions from the filter stage surface in run()."""
+
+        def failing_filter(batch):
+            raise RuntimeError("filter failed")
+
+        pipeline = JobPipeline(
+            scrape=lambda: _batches(1), filter_batch=failing_filter, process_batch=_process
+        )
+
+        with pytest.raises(RuntimeError, match="filter failed"):
+            list(pipeline.run())
+
+    def test_closing_run_stops_scraping(self):
+        """Stopping the consumer early stops the scrape stage at its next batch."""
+        scrape_stopped = threading.Event()
+
+        def scrape():
+            try:
+                for batch in _batches(100, size=1):
+                    yield batch
+            finally:
+                scrape_stopped.set()
+
+        pipeline = JobPipeline(
+            scrape=scrape, filter_batch=_pass_all, process_batch=_process, queue_size=1
+        )
+
+        results = pipeline.run()
+        next(results)
+        results.close()
+
+        assert scrape_stopped.wait(timeout=5)
+        assert pipeline.stats.total_scraped < 100
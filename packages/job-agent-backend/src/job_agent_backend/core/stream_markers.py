@@ -0,0 +1,19 @@
+"""Markers passed between the threads of a stream alongside its items.
+
+Shared by the staged pipeline and the async bridge, which both hand items from a
+producer thread to a consumer through a bounded queue.
+"""
+
+# How often blocked producers re-check whether the consumer has stopped
+POLL_INTERVAL_SECONDS = 0.1
+
+
+class EndOfStream:
+    """Marker placed on a queue when the producer has finished."""
+
+
+class StageFailure:
+    """Carries a producer exception to the consumer."""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
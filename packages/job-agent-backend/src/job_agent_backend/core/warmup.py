@@ -0,0 +1,107 @@
+"""Warm-up of the models, database pool and message broker before serving requests.
+
+Without it the first search after a deploy pays for loading the embedding model,
+for the first database connections and for Ollama loading its model. Warm-up
+steps run concurrently, each timed, and a failed step is reported rather than
+raised: a service can still start without its broker or database and connect on
+first use as before.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, List, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+WARMUP_TEXT = "Python developer"
+WARMUP_PROMPT = "Reply with one word: ready"
+
+
+@dataclass(frozen=True)
+class WarmupStep:
+    """Outcome of one warm-up step.
+
+    Attributes:
+        name: Name of the step
+        seconds: Wall-clock duration of the step, or the time waited for it on timeout
+        error: Description of the failure, None if the step succeeded
+    """
+
+    name: str
+    seconds: float
+    error: Optional[str] = None
+
+
+def run_warmup(
+    steps: Mapping[str, Callable[[], Any]], timeout: Optional[float] = None
+) -> List[WarmupStep]:
+    """Run warm-up steps concurrently and time each of them.
+
+    Args:
+        steps: Warm-up callables by step name
+        timeout: Seconds to wait for all steps. Steps still running afterwards are
+                 reported as timed out and left to finish in the background.
+
+    Returns:
+        Outcome of every step, in the order of steps
+    """
+    if not steps:
+        return []
+
+    started = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=len(steps), thread_name_prefix="warmup")
+    try:
+        futures = {name: executor.submit(_run_step, name, step) for name, step in steps.items()}
+        wait(futures.values(), timeout=timeout)
+    finally:
+        executor.shutdown(wait=False)
+
+    results = [
+        future.result()
+        if future.done()
+        else WarmupStep(name, time.perf_counter() - started, "timed out")
+        for name, future in futures.items()
+    ]
+    for result in results:
+        if result.error is None:
+            logger.info("Warm-up step %s took %.2fs", result.name, result.seconds)
+        else:
+            logger.warning(
+                "Warm-up step %s failed after %.2fs: %s", result.name, result.seconds, result.error
+            )
+    return results
+
+
+def warm_up_model(model: Any) -> None:
+    """Run one tiny call through a model so its weights and kernels are loaded.
+
+    Cached models are unwrapped so the call reaches the model itself. Models that
+    neither embed nor chat, such as pipelines, are loaded by creating them.
+    """
+    from langchain_core.embeddings import Embeddings
+    from langchain_core.language_models import BaseChatModel
+
+    from job_agent_backend.model_providers import (
+        CachedChatModel,
+        CachedEmbeddings,
+        LimitedChatModel,
+    )
+
+    while isinstance(model, (CachedChatModel, CachedEmbeddings)):
+        model = model.model
+
+    if isinstance(model, Embeddings):
+        model.embed_query(WARMUP_TEXT)
+    elif isinstance(model, (BaseChatModel, LimitedChatModel)):
+        model.invoke(WARMUP_PROMPT)
+
+
+def _run_step(name: str, step: Callable[[], Any]) -> WarmupStep:
+    started = time.perf_counter()
+    try:
+        step()
+    except Exception as e:
+        return WarmupStep(name, time.perf_counter() - started, f"{type(e).__name__}: {e}")
+    return WarmupStep(name, time.perf_counter() - started)
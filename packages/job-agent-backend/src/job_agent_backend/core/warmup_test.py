@@ -0,0 +1,70 @@
+"""Tests for the startup warm-up."""
+
+import threading
+from unittest.mock import MagicMock
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from job_agent_backend.core.warmup import WARMUP_TEXT, run_warmup, warm_up_model
+from job_agent_backend.model_providers import EmbeddingCache, ResponseCache
+
+
+class TestRunWarmup:
+    """Tests for run_warmup."""
+
+    def test_steps_run_concurrently(self) -> None:
+        barrier = threading.Barrier(3, timeout=5)
+
+        results = run_warmup({name: barrier.wait for name in ("models", "database", "broker")})
+
+        assert [result.name for result in results] == ["models", "database", "broker"]
+        assert all(result.error is None for result in results)
+        assert all(result.seconds >= 0 for result in results)
+
+    def test_failed_step_is_reported_not_raised(self) -> None:
+        def fail() -> None:
+            raise ConnectionError("broker unreachable")
+
+        results = run_warmup({"broker": fail, "database": lambda: None})
+
+        assert results[0].error == "ConnectionError: broker unreachable"
+        assert results[1].error is None
+
+    def test_steps_beyond_timeout_are_reported(self) -> None:
+        release = threading.Event()
+
+        results = run_warmup({"slow": release.wait}, timeout=0.01)
+        release.set()
+
+        assert results[0].error == "timed out"
+
+
+class TestWarmUpModel:
+    """Tests for warm_up_model."""
+
+    def test_embedding_call_bypasses_the_cache(self) -> None:
+        inner = MagicMock(spec=Embeddings)
+        inner.embed_query.return_value = [0.1]
+        cached = EmbeddingCache().wrap(inner, "model")
+        cached.embed_query(WARMUP_TEXT)
+
+        warm_up_model(cached)
+
+        assert inner.embed_query.call_count == 2
+
+    def test_chat_call_bypasses_the_cache(self) -> None:
+        model = FakeListChatModel(responses=["ready", "ready", "ready"])
+        cached = ResponseCache().wrap(model, "chat")
+
+        warm_up_model(cached)
+        warm_up_model(cached)
+
+        assert model.i == 2
+
+    def test_other_models_are_not_called(self) -> None:
+        pipeline = MagicMock(spec=["__call__"])
+
+        warm_up_model(pipeline)
+
+        pipeline.assert_not_called()
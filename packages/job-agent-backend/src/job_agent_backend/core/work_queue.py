@@ -0,0 +1,225 @@
+"""Bounded background work queue with priorities.
+
+Background work such as essay embeddings and keyword extraction runs on a fixed
+number of worker threads fed by a bounded queue, instead of a new thread per
+task. Interactive work is picked up before backfill work, and backfill may only
+fill part of the queue, so a large backfill neither starves nor crowds out the
+work users wait for. A full queue blocks or rejects producers rather than growing
+without bound.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_MAX_SIZE = 100
+
+# Window over which the processing rate is measured
+RATE_WINDOW_SECONDS = 60.0
+
+
+class WorkPriority(IntEnum):
+    """Priority of queued work, lower values are picked up first."""
+
+    INTERACTIVE = 0
+    BACKFILL = 1
+
+
+@dataclass(frozen=True)
+class WorkQueueStats:
+    """Snapshot of the depth and throughput of a work queue."""
+
+    depth: int
+    in_flight: int
+    processed: int
+    failed: int
+    rejected: int
+    rate_per_second: float
+
+
+_Entry = Tuple[int, int, "Future[Any]", Callable[[], Any], str]
+
+
+class WorkQueue:
+    """Runs submitted tasks on a fixed pool of worker threads.
+
+    Tasks wait in a bounded priority queue. Backfill tasks may fill at most half
+    of it, so interactive tasks still find room while a backfill is running.
+    Workers are started on the first submit and stop once drain() has let them
+    finish the queued work.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_size: int = DEFAULT_MAX_SIZE,
+        name: str = "work-queue",
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            max_workers: Number of worker threads
+            max_size: Most tasks waiting to be picked up
+            name: Name used for the worker threads and in log messages
+
+        Raises:
+            ValueError: If max_workers or max_size is not positive
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        self.name = name
+        self._max_workers = max_workers
+        self._limits = {
+            WorkPriority.INTERACTIVE: max_size,
+            WorkPriority.BACKFILL: max(1, max_size // 2),
+        }
+        self._heap: List[_Entry] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._closed = False
+        self._in_flight = 0
+        self._processed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._started = time.monotonic()
+        self._completions: Deque[float] = deque()
+
+    def submit(
+        self,
+        task: Callable[[], Any],
+        priority: WorkPriority = WorkPriority.INTERACTIVE,
+        timeout: Optional[float] = None,
+        description: str = "task",
+    ) -> "Optional[Future[Any]]":
+        """Queue a task, waiting for room while the queue is full.
+
+        Args:
+            task: Callable run without arguments on a worker thread
+            priority: Priority of the task
+            timeout: Seconds to wait for room, None waits indefinitely and 0 does
+                     not wait
+            description: Description of the task used in log messages
+
+        Returns:
+            Future of the task's result, or None if the queue stayed full or was
+            drained
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while not self._closed and len(self._heap) >= self._limits[priority]:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            if self._closed or len(self._heap) >= self._limits[priority]:
+                self._rejected += 1
+                logger.warning("%s rejected %s: queue is full or drained", self.name, description)
+                return None
+            future: "Future[Any]" = Future()
+            heapq.heappush(
+                self._heap, (int(priority), next(self._sequence), future, task, description)
+            )
+            self._start_workers()
+            self._condition.notify_all()
+        return future
+
+    def stats(self) -> WorkQueueStats:
+        """Get the current depth and the processing rate of the queue."""
+        with self._condition:
+            now = time.monotonic()
+            self._forget_completions(now)
+            window = min(RATE_WINDOW_SECONDS, now - self._started)
+            return WorkQueueStats(
+                depth=len(self._heap),
+                in_flight=self._in_flight,
+                processed=self._processed,
+                failed=self._failed,
+                rejected=self._rejected,
+                rate_per_second=len(self._completions) / window if window > 0 else 0.0,
+            )
+
+    def drain(self, timeout: Optional[float] = None) -> int:
+        """Stop accepting tasks and wait for the queued and running ones to finish.
+
+        Args:
+            timeout: Seconds to wait, None waits until the queue is empty
+
+        Returns:
+            Number of tasks left unfinished
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            workers = list(self._workers)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in workers:
+            worker.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        stats = self.stats()
+        unfinished = stats.depth + stats.in_flight
+        logger.info(
+            "%s drained: %d processed, %d failed, %d rejected, %d unfinished",
+            self.name,
+            stats.processed,
+            stats.failed,
+            stats.rejected,
+            unfinished,
+        )
+        return unfinished
+
+    def _start_workers(self) -> None:
+        # Called with the condition held
+        if self._workers:
+            return
+        for index in range(self._max_workers):
+            worker = threading.Thread(target=self._run, name=f"{self.name}-{index}", daemon=True)
+            self._workers.append(worker)
+            worker.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._heap:
+                    if self._closed:
+                        return
+                    self._condition.wait()
+                _, _, future, task, description = heapq.heappop(self._heap)
+                # Room freed for producers waiting on a full queue
+                self._condition.notify_all()
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._in_flight += 1
+            try:
+                result = task()
+            except Exception as e:
+                logger.warning("%s failed %s: %s", self.name, description, e)
+                future.set_exception(e)
+                succeeded = False
+            else:
+                future.set_result(result)
+                succeeded = True
+            with self._condition:
+                self._in_flight -= 1
+                if succeeded:
+                    self._processed += 1
+                else:
+                    self._failed += 1
+                now = time.monotonic()
+                self._completions.append(now)
+                self._forget_completions(now)
+
+    def _forget_completions(self, now: float) -> None:
+        while self._completions and self._completions[0] < now - RATE_WINDOW_SECONDS:
+            self._completions.popleft()
@@ -0,0 +1,137 @@
+"""Tests for the bounded background work queue."""
+
+import threading
+from typing import Callable, List
+
+import pytest
+
+from job_agent_backend.core.work_queue import WorkPriority, WorkQueue
+
+
+def _occupy_worker(work_queue: WorkQueue) -> threading.Event:
+    """Keep the only worker of work_queue busy until the returned event is set."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def block() -> None:
+        started.set()
+        release.wait(5)
+
+    work_queue.submit(block)
+    assert started.wait(5)
+    return release
+
+
+def _record(order: List[str], name: str) -> Callable[[], None]:
+    return lambda: order.append(name)
+
+
+class TestWorkQueue:
+    """Tests for WorkQueue."""
+
+    def test_task_result_is_returned_through_future(self) -> None:
+        work_queue = WorkQueue(max_workers=2)
+
+        future = work_queue.submit(lambda: 42)
+
+        assert future is not None
+        assert future.result(timeout=5) == 42
+        work_queue.drain(timeout=5)
+
+    def test_interactive_work_is_picked_up_before_backfill(self) -> None:
+        work_queue = WorkQueue(max_workers=1)
+        release = _occupy_worker(work_queue)
+        order: List[str] = []
+
+        work_queue.submit(_record(order, "backfill"), priority=WorkPriority.BACKFILL)
+        work_queue.submit(_record(order, "interactive"))
+        release.set()
+        work_queue.drain(timeout=5)
+
+        assert order == ["interactive", "backfill"]
+
+    def test_backfill_fills_at_most_half_of_the_queue(self) -> None:
+        work_queue = WorkQueue(max_workers=1, max_size=4)
+        release = _occupy_worker(work_queue)
+
+        backfill = [
+            work_queue.submit(lambda: None, priority=WorkPriority.BACKFILL, timeout=0)
+            for _ in range(3)
+        ]
+        interactive = [work_queue.submit(lambda: None, timeout=0) for _ in range(3)]
+        release.set()
+        work_queue.drain(timeout=5)
+
+        assert [future is not None for future in backfill] == [True, True, False]
+        assert [future is not None for future in interactive] == [True, True, False]
+        assert work_queue.stats().rejected == 2
+
+    def test_full_queue_blocks_until_room_is_freed(self) -> None:
+        work_queue = WorkQueue(max_workers=1, max_size=1)
+        release = _occupy_worker(work_queue)
+        work_queue.submit(lambda: None)
+        threading.Timer(0.05, release.set).start()
+
+        future = work_queue.submit(lambda: "done", timeout=5)
+
+        assert future is not None
+        assert future.result(timeout=5) == "done"
+        work_queue.drain(timeout=5)
+
+    def test_failed_task_is_counted_and_raised_through_future(self) -> None:
+        work_queue = WorkQueue(max_workers=1)
+
+        def fail() -> None:
+            raise RuntimeError("model unavailable")
+
+        future = work_queue.submit(fail)
+        work_queue.drain(timeout=5)
+
+        assert future is not None
+        with pytest.raises(RuntimeError, match="model unavailable"):
+            future.result()
+        assert work_queue.stats().failed == 1
+        assert work_queue.stats().processed == 0
+
+    def test_drain_finishes_queued_work_and_rejects_new_work(self) -> None:
+        work_queue = WorkQueue(max_workers=1)
+        release = _occupy_worker(work_queue)
+        order: List[str] = []
+        work_queue.submit(_record(order, "queued"))
+        release.set()
+
+        unfinished = work_queue.drain(timeout=5)
+
+        assert unfinished == 0
+        assert order == ["queued"]
+        assert work_queue.submit(lambda: None) is None
+
+    def test_drain_reports_work_left_after_timeout(self) -> None:
+        work_queue = WorkQueue(max_workers=1)
+        release = _occupy_worker(work_queue)
+        work_queue.submit(lambda: None)
+
+        unfinished = work_queue.drain(timeout=0.01)
+        release.set()
+
+        assert unfinished == 2
+
+    def test_stats_report_depth_and_processing_rate(self) -> None:
+        work_queue = WorkQueue(max_workers=1)
+        release = _occupy_worker(work_queue)
+        work_queue.submit(lambda: None)
+
+        busy = work_queue.stats()
+        release.set()
+        work_queue.drain(timeout=5)
+        done = work_queue.stats()
+
+        assert (busy.depth, busy.in_flight) == (1, 1)
+        assert (done.depth, done.in_flight, done.processed) == (0, 0, 2)
+        assert done.rate_per_second > 0
+
+    def test_invalid_settings_are_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            WorkQueue(max_workers=0)
+        with pytest.raises(ValueError):
+            WorkQueue(max_size=0)
@@ -4,9 +4,10 @@ This service filters unsuitable job posts from the scrapper service
 before passing them to the workflows system.
 """
 
+from .existing_jobs import ExistingJobFilter
 from .filter import FilterService
 from .filter_config import FilterConfig
 from ..contracts.filter_service_interface import IFilterService
 
-__all__ = ["FilterService", "FilterConfig", "IFilterService"]
+__all__ = ["ExistingJobFilter", "FilterService", "FilterConfig", "IFilterService"]
 __version__ = "0.1.0"
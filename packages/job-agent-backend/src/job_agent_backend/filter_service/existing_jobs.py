@@ -0,0 +1,81 @@
+"""Detection of job posts that are already stored in the job repository.
+
+Jobs are stored once for all users, so whether a scraped job is new must be decided
+once per scrape rather than by each search consuming it: a search sharing a scrape
+would otherwise drop every job the first search already stored.
+"""
+
+from typing import Callable, List, Optional, Sequence
+
+from job_scrapper_contracts import JobDict
+from job_agent_platform_contracts import IJobRepository
+
+
+class ExistingJobFilter:
+    """Drops jobs already stored, matched by external id or by title and company.
+
+    Args:
+        job_repository_factory: Factory for creating job repository instances
+    """
+
+    def __init__(self, job_repository_factory: Callable[[], IJobRepository]) -> None:
+        self._job_repository_factory = job_repository_factory
+
+    def __call__(self, jobs: Sequence[JobDict]) -> List[JobDict]:
+        """
+        Return the jobs that are not stored yet.
+
+        Args:
+            jobs: List of job dictionaries from the scrapper service.
+
+        Returns:
+            Jobs not found in the repository, in their original order.
+        """
+        if not jobs:
+            return []
+
+        repository = self._job_repository_factory()
+        return [job for job in jobs if not is_existing_job(repository, job)]
+
+
+def is_existing_job(repository: IJobRepository, job: JobDict) -> bool:
+    """Check whether job is stored, by external id or as an active job of its company."""
+    external_id = _extract_external_id(job)
+    source = job.get("source")
+
+    if external_id and repository.get_by_external_id(external_id, source):
+        return True
+
+    title = job.get("title")
+    company_name = _extract_company_name(job)
+
+    if not title or not company_name:
+        return False
+
+    return repository.has_active_job_with_title_and_company(title, company_name)
+
+
+def _extract_external_id(job: JobDict) -> Optional[str]:
+    job_id = job.get("job_id")
+    if job_id is not None:
+        return str(job_id)
+
+    external_id = job.get("external_id")
+    if external_id is not None:
+        return str(external_id)
+
+    return None
+
+
+def _extract_company_name(job: JobDict) -> Optional[str]:
+    company = job.get("company")
+    if isinstance(company, dict):
+        name = company.get("name")
+        if name:
+            return str(name)
+
+    company_name = job.get("company_name")
+    if company_name:
+        return str(company_name)
+
+    return None
@@ -0,0 +1,34 @@
+"""Tests for dropping jobs already stored in the job repository."""
+
+from typing import List, cast
+
+from job_scrapper_contracts import JobDict
+
+from .existing_jobs import ExistingJobFilter
+
+
+class TestExistingJobFilter:
+    """Test suite for ExistingJobFilter."""
+
+    def test_drops_jobs_stored_by_external_id_or_title_and_company(
+        self, stub_job_repository_factory
+    ) -> None:
+        repo = stub_job_repository_factory(
+            external_ids={"100"},
+            active_pairs={("Duplicate Title", "Company A")},
+        )
+        jobs = [
+            {"job_id": 50, "title": "First Job", "company": {"name": "Company X"}},
+            {"job_id": 100, "title": "Duplicate External", "company": {"name": "Company Y"}},
+            {"job_id": 200, "title": "Duplicate Title", "company_name": "Company A"},
+        ]
+
+        result = ExistingJobFilter(lambda: repo)(cast(List[JobDict], jobs))
+
+        assert [job["job_id"] for job in result] == [50]
+
+    def test_empty_batch_does_not_open_a_repository(self) -> None:
+        def failing_factory():
+            raise AssertionError("repository should not be created")
+
+        assert ExistingJobFilter(failing_factory)([]) == []
@@ -9,6 +9,7 @@ from typing import Callable, List, Optional, Tuple
 from job_scrapper_contracts import JobDict
 from job_agent_platform_contracts import IJobRepository
 
+from .existing_jobs import is_existing_job
 from .filter_config import FilterConfig
 from ..contracts import IFilterService
 
@@ -20,6 +21,9 @@ class FilterService(IFilterService):
     Args:
         config: Optional configuration for filtering criteria. When omitted,
             a default policy limits experience and requires applications to be allowed.
+        job_repository_factory: Optional factory for the job repository. When given,
+            jobs already stored are dropped as well. Leave it unset when the scrapes
+            are already passed through an ExistingJobFilter.
     """
 
     def __init__(
@@ -57,7 +61,7 @@ class FilterService(IFilterService):
             if not self._passes_location(job):
                 continue
 
-            if repository and self._is_existing_job(repository, job):
+            if repository and is_existing_job(repository, job):
                 continue
 
             filtered_jobs.append(job)
@@ -83,7 +87,7 @@ class FilterService(IFilterService):
 
         for job in jobs:
             # Skip jobs that already exist in the repository
-            if repository and self._is_existing_job(repository, job):
+            if repository and is_existing_job(repository, job):
                 continue
 
             # Check filter criteria
@@ -101,45 +105,6 @@ class FilterService(IFilterService):
 
         return self._job_repository_factory()
 
-    def _is_existing_job(self, repository: IJobRepository, job: JobDict) -> bool:
-        external_id = self._extract_external_id(job)
-        source = job.get("source")
-
-        if external_id and repository.get_by_external_id(external_id, source):
-            return True
-
-        title = job.get("title")
-        company_name = self._extract_company_name(job)
-
-        if not title or not company_name:
-            return False
-
-        return repository.has_active_job_with_title_and_company(title, company_name)
-
-    def _extract_external_id(self, job: JobDict) -> Optional[str]:
-        job_id = job.get("job_id")
-        if job_id is not None:
-            return str(job_id)
-
-        external_id = job.get("external_id")
-        if external_id is not None:
-            return str(external_id)
-
-        return None
-
-    def _extract_company_name(self, job: JobDict) -> Optional[str]:
-        company = job.get("company")
-        if isinstance(company, dict):
-            name = company.get("name")
-            if name:
-                return str(name)
-
-        company_name = job.get("company_name")
-        if company_name:
-            return str(company_name)
-
-        return None
-
     def _passes_experience(self, job: JobDict) -> bool:
         if "max_months_of_experience" not in self.config:
             return True
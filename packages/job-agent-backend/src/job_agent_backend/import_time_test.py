@@ -0,0 +1,22 @@
+"""Import-time regression tests based on `python -X importtime` output."""
+
+import pytest
+
+from job_agent_backend.conftest import import_times, imported_heavy_modules
+
+
+class TestContainerImportTime:
+    """The container defers heavy modules until its providers are first resolved."""
+
+    def test_heavy_modules_are_not_imported(self) -> None:
+        times = import_times("job_agent_backend.container")
+
+        assert imported_heavy_modules(times) == []
+
+    @pytest.mark.benchmark
+    def test_reports_import_time(self) -> None:
+        times = import_times("job_agent_backend.container")
+
+        print(
+            f"\njob_agent_backend.container imported in {times['job_agent_backend.container']:.3f}s"
+        )
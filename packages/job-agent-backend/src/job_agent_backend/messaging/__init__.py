@@ -3,5 +3,6 @@
 from job_agent_backend.messaging.connection import RabbitMQConnection
 from job_agent_backend.contracts.scrapper_client_interface import IScrapperClient
 from job_agent_backend.messaging.scrapper_client import ScrapperClient
+from job_agent_backend.messaging.shared_scrape import SharedScrapeClient
 
-__all__ = ["RabbitMQConnection", "IScrapperClient", "ScrapperClient"]
+__all__ = ["RabbitMQConnection", "IScrapperClient", "ScrapperClient", "SharedScrapeClient"]
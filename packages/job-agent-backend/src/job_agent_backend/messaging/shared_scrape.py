@@ -0,0 +1,267 @@
+"""Scrape streams shared between concurrent searches.
+
+Searches with the same filters started around the same time receive the same jobs
+from the scrapper. SharedScrapeClient sends one scrapper request for all of them:
+the first search starts the scrape, and searches that join while it is running are
+fanned out the same batches, starting with the ones received before they joined.
+
+Jobs are stored once for all users, so jobs stored before the scrape are dropped
+from each batch once, before it is fanned out. Searches following the scrape must
+not drop stored jobs again: that would drop the jobs the first search just stored.
+
+Batches are buffered only until every search following the scrape has taken them,
+and the scrape waits while the slowest search is max_lag batches behind, so memory
+stays bounded by max_lag batches per scrape rather than by the jobs scraped. Once
+a batch was dropped a search can no longer replay the scrape from its start, so it
+starts a scrape of its own instead of joining.
+"""
+
+import itertools
+import logging
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Callable, Deque, Hashable, Iterator, Optional
+
+from job_scrapper_contracts import JobDict
+
+from job_agent_backend.contracts.scrapper_client_interface import IScrapperClient
+
+logger = logging.getLogger(__name__)
+
+# Date cutoffs are rounded down to this granularity before searches are matched
+CUTOFF_GRANULARITY = timedelta(minutes=15)
+
+# Most batches a scrape may run ahead of the slowest search following it
+DEFAULT_MAX_LAG = 4
+
+
+class _SharedScrape:
+    """A scrape in flight and the batches not yet taken by every search following it."""
+
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self.batches: Deque[list[JobDict]] = deque()
+        # Index in the scrape of batches[0]
+        self.first = 0
+        # Index of the next batch of each search following the scrape
+        self.positions: dict[int, int] = {}
+        self.done = False
+        self.cancelled = False
+        self.error: Optional[Exception] = None
+
+    @property
+    def end(self) -> int:
+        """Index of the next batch the scrape will deliver."""
+        return self.first + len(self.batches)
+
+    def lag(self) -> int:
+        """Number of batches the slowest search has not taken yet."""
+        return self.end - min(self.positions.values(), default=self.end)
+
+    def drop_taken(self) -> None:
+        """Drop the batches every search has taken. Called with the condition held."""
+        oldest = min(self.positions.values(), default=self.end)
+        while self.first < oldest:
+            self.batches.popleft()
+            self.first += 1
+        self.condition.notify_all()
+
+
+class SharedScrapeClient(IScrapperClient):
+    """Scrapper client fanning one scrape out to every search with the same key.
+
+    Searches share a scrape when their filters match after normalization, their
+    date cutoffs round to the same CUTOFF_GRANULARITY step, and the running scrape
+    still holds its first batch. That is, a search joins a scrape only until every
+    search following it has taken the first batch. The scrape runs in its own
+    thread, waits while the slowest search is max_lag batches behind, and is
+    stopped once every search following it has stopped iterating. Finished scrapes
+    are not kept, so later searches start a new one.
+    """
+
+    def __init__(
+        self,
+        client: IScrapperClient,
+        shared: bool = True,
+        max_lag: int = DEFAULT_MAX_LAG,
+        job_filter: Optional[Callable[[list[JobDict]], list[JobDict]]] = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            client: Scrapper client performing the actual scrapes
+            shared: Whether searches share scrapes. If False, every search scrapes
+                    on its own.
+            max_lag: Most batches a scrape may run ahead of the slowest search
+            job_filter: Optional filter applied once to each scraped batch before
+                        it is fanned out, such as an ExistingJobFilter
+
+        Raises:
+            ValueError: If max_lag is not positive
+        """
+        if max_lag < 1:
+            raise ValueError("max_lag must be at least 1")
+        self._client = client
+        self._shared = shared
+        self._max_lag = max_lag
+        self._job_filter = job_filter
+        self._subscriber_ids = itertools.count()
+        self._scrapes: dict[Hashable, _SharedScrape] = {}
+        self._lock = threading.Lock()
+
+    def scrape_jobs_streaming(
+        self,
+        min_salary: Optional[int] = 4000,
+        employment_location: Optional[str] = "remote",
+        posted_after: Optional[datetime] = None,
+        timeout: int = 30,
+    ) -> Iterator[list[JobDict]]:
+        """Scrape jobs, joining a running scrape with the same key if there is one.
+
+        Args:
+            min_salary: Minimum salary requirement
+            employment_location: Employment type or location
+            posted_after: Only include jobs posted after this date
+            timeout: Request timeout in seconds
+
+        Yields:
+            list[JobDict]: Batch of jobs for each batch
+
+        Raises:
+            TimeoutError: If no response is received
+            Exception: If scraping fails
+        """
+        if not self._shared:
+            for batch in self._client.scrape_jobs_streaming(
+                min_salary=min_salary,
+                employment_location=employment_location,
+                posted_after=posted_after,
+                timeout=timeout,
+            ):
+                yield self._filter(batch)
+            return
+
+        key = self._scrape_key(min_salary, employment_location, posted_after)
+        subscriber = next(self._subscriber_ids)
+        with self._lock:
+            scrape = self._scrapes.get(key)
+            is_new = scrape is None or not self._subscribe(scrape, subscriber)
+            if is_new:
+                # A scrape that dropped batches is left to its searches
+                scrape = _SharedScrape()
+                scrape.positions[subscriber] = 0
+                self._scrapes[key] = scrape
+            assert scrape is not None
+
+        if is_new:
+            threading.Thread(
+                target=self._produce,
+                args=(key, scrape, min_salary, employment_location, posted_after, timeout),
+                name="shared-scrape",
+                daemon=True,
+            ).start()
+        else:
+            logger.info("Joining running scrape %s", key)
+
+        try:
+            yield from self._follow(scrape, subscriber)
+        finally:
+            self._unsubscribe(key, scrape, subscriber)
+
+    def _scrape_key(
+        self,
+        min_salary: Optional[int],
+        employment_location: Optional[str],
+        posted_after: Optional[datetime],
+    ) -> Hashable:
+        location = employment_location.strip().lower() if employment_location else None
+        window = (
+            int(posted_after.timestamp() // CUTOFF_GRANULARITY.total_seconds())
+            if posted_after is not None
+            else None
+        )
+        return (min_salary, location, window)
+
+    def _produce(
+        self,
+        key: Hashable,
+        scrape: _SharedScrape,
+        min_salary: Optional[int],
+        employment_location: Optional[str],
+        posted_after: Optional[datetime],
+        timeout: int,
+    ) -> None:
+        error: Optional[Exception] = None
+        batches: Optional[Iterator[list[JobDict]]] = None
+        try:
+            batches = self._client.scrape_jobs_streaming(
+                min_salary=min_salary,
+                employment_location=employment_location,
+                posted_after=posted_after,
+                timeout=timeout,
+            )
+            for batch in batches:
+                batch = self._filter(batch)
+                with scrape.condition:
+                    # Backpressure: wait for the slowest search to catch up
+                    while not scrape.cancelled and scrape.lag() >= self._max_lag:
+                        scrape.condition.wait()
+                    if scrape.cancelled:
+                        break
+                    scrape.batches.append(batch)
+                    scrape.condition.notify_all()
+        except Exception as e:
+            error = e
+        finally:
+            close = getattr(batches, "close", None)
+            if close is not None:
+                close()
+            with self._lock:
+                if self._scrapes.get(key) is scrape:
+                    del self._scrapes[key]
+            with scrape.condition:
+                scrape.done = True
+                scrape.error = error
+                scrape.condition.notify_all()
+
+    def _filter(self, batch: list[JobDict]) -> list[JobDict]:
+        return self._job_filter(batch) if self._job_filter is not None else batch
+
+    @staticmethod
+    def _subscribe(scrape: _SharedScrape, subscriber: int) -> bool:
+        """Follow scrape from its first batch, if it still holds it."""
+        with scrape.condition:
+            if scrape.first > 0 or scrape.done:
+                return False
+            scrape.positions[subscriber] = 0
+            return True
+
+    @staticmethod
+    def _follow(scrape: _SharedScrape, subscriber: int) -> Iterator[list[JobDict]]:
+        while True:
+            with scrape.condition:
+                position = scrape.positions[subscriber]
+                while position >= scrape.end and not scrape.done:
+                    scrape.condition.wait()
+                if position < scrape.end:
+                    batch = scrape.batches[position - scrape.first]
+                    scrape.positions[subscriber] = position + 1
+                    scrape.drop_taken()
+                elif scrape.error is not None:
+                    raise scrape.error
+                else:
+                    return
+            yield list(batch)
+
+    def _unsubscribe(self, key: Hashable, scrape: _SharedScrape, subscriber: int) -> None:
+        with self._lock:
+            with scrape.condition:
+                del scrape.positions[subscriber]
+                scrape.drop_taken()
+                if scrape.positions or scrape.done:
+                    return
+                # Nobody follows the scrape any more: stop it and let new searches start over
+                scrape.cancelled = True
+            if self._scrapes.get(key) is scrape:
+                del self._scrapes[key]
@@ -0,0 +1,195 @@
+"""Tests for SharedScrapeClient."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from job_agent_backend.messaging.shared_scrape import SharedScrapeClient
+
+
+POSTED_AFTER = datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc)
+
+
+def _followers(client: SharedScrapeClient) -> int:
+    """Number of searches following the scrapes of client."""
+    return sum(len(scrape.positions) for scrape in list(client._scrapes.values()))
+
+
+def _wait_for(condition, timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition was never met"
+        time.sleep(0.001)
+
+
+class GatedScrapper:
+    """Scrapper client releasing one batch each time the test opens the gate."""
+
+    def __init__(self, batches):
+        self.batches = batches
+        self.calls = []
+        self.gate = threading.Semaphore(0)
+        self.closed = threading.Event()
+
+    def scrape_jobs_streaming(self, **kwargs):
+        self.calls.append(kwargs)
+        try:
+            for batch in self.batches:
+                if not self.gate.acquire(timeout=5):
+                    raise TimeoutError("gate was never opened")
+                yield batch
+        finally:
+            self.closed.set()
+
+    def release(self, count=1):
+        for _ in range(count):
+            self.gate.release()
+
+
+class TestSharedScrapeClient:
+    """Tests for SharedScrapeClient.scrape_jobs_streaming()."""
+
+    def test_concurrent_searches_share_one_scrape(self):
+        """Searches started together share one scrape and receive every batch."""
+        scrapper = GatedScrapper([[{"job_id": 1}], [{"job_id": 2}]])
+        client = SharedScrapeClient(scrapper)
+        first = client.scrape_jobs_streaming(posted_after=POSTED_AFTER)
+        second = client.scrape_jobs_streaming(
+            employment_location=" Remote ", posted_after=POSTED_AFTER + timedelta(minutes=1)
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first_batch = executor.submit(next, first)
+            _wait_for(lambda: _followers(client) == 1)
+            second_batch = executor.submit(next, second)
+            _wait_for(lambda: _followers(client) == 2)
+            scrapper.release(2)
+
+            assert first_batch.result(timeout=5) == [{"job_id": 1}]
+            assert second_batch.result(timeout=5) == [{"job_id": 1}]
+        assert list(first) == [[{"job_id": 2}]]
+        assert list(second) == [[{"job_id": 2}]]
+        assert len(scrapper.calls) == 1
+
+    def test_search_starts_own_scrape_once_batches_were_dropped(self):
+        """Batches taken by every search are dropped, so later searches cannot join."""
+        scrapper = GatedScrapper([[{"job_id": 1}], [{"job_id": 2}]])
+        client = SharedScrapeClient(scrapper)
+
+        first = client.scrape_jobs_streaming(posted_after=POSTED_AFTER)
+        scrapper.release()
+        assert next(first) == [{"job_id": 1}]
+
+        second = client.scrape_jobs_streaming(posted_after=POSTED_AFTER)
+        scrapper.release(3)
+
+        assert list(second) == [[{"job_id": 1}], [{"job_id": 2}]]
+        assert list(first) == [[{"job_id": 2}]]
+        assert len(scrapper.calls) == 2
+
+    def test_buffered_batches_are_bounded_by_max_lag(self):
+        """A slow search applies backpressure instead of the scrape being buffered."""
+        produced = []
+        lag = []
+
+        def scrape_jobs_streaming(**_):
+            for job_id in range(20):
+                produced.append(job_id)
+                yield [{"job_id": job_id}]
+
+        scrapper = MagicMock()
+        scrapper.scrape_jobs_streaming.side_effect = scrape_jobs_streaming
+        client = SharedScrapeClient(scrapper, max_lag=2)
+
+        received = []
+        for batch in client.scrape_jobs_streaming(posted_after=POSTED_AFTER):
+            received.append(batch)
+            time.sleep(0.005)
+            lag.append(len(produced) - len(received))
+
+        # max_lag batches buffered and one pulled from the scrapper, waiting for room
+        assert max(lag) <= 3
+        assert [batch[0]["job_id"] for batch in received] == list(range(20))
+
+    def test_rejects_non_positive_max_lag(self):
+        """At least one batch must be allowed ahead of the searches."""
+        with pytest.raises(ValueError):
+            SharedScrapeClient(MagicMock(), max_lag=0)
+
+    def test_different_filters_scrape_separately(self):
+        """Searches with different filters do not share a scrape."""
+        scrapper = MagicMock()
+        scrapper.scrape_jobs_streaming.side_effect = lambda **_: iter([[{"job_id": 1}]])
+        client = SharedScrapeClient(scrapper)
+
+        list(client.scrape_jobs_streaming(min_salary=4000, posted_after=POSTED_AFTER))
+        list(client.scrape_jobs_streaming(min_salary=5000, posted_after=POSTED_AFTER))
+
+        assert scrapper.scrape_jobs_streaming.call_count == 2
+
+    def test_finished_scrape_is_not_reused(self):
+        """A search started after a scrape finished triggers a new scrape."""
+        scrapper = MagicMock()
+        scrapper.scrape_jobs_streaming.side_effect = lambda **_: iter([[{"job_id": 1}]])
+        client = SharedScrapeClient(scrapper)
+
+        assert list(client.scrape_jobs_streaming(posted_after=POSTED_AFTER)) == [[{"job_id": 1}]]
+        assert list(client.scrape_jobs_streaming(posted_after=POSTED_AFTER)) == [[{"job_id": 1}]]
+
+        assert scrapper.scrape_jobs_streaming.call_count == 2
+
+    def test_scrape_errors_reach_every_search(self):
+        """An error from the scrapper is raised to the searches following the scrape."""
+        scrapper = MagicMock()
+        scrapper.scrape_jobs_streaming.side_effect = TimeoutError("no response")
+        client = SharedScrapeClient(scrapper)
+
+        with pytest.raises(TimeoutError):
+            list(client.scrape_jobs_streaming(posted_after=POSTED_AFTER))
+
+    def test_scrape_stops_when_last_search_stops(self):
+        """The scrape is stopped once nobody follows it any more."""
+        scrapper = GatedScrapper([[{"job_id": 1}], [{"job_id": 2}], [{"job_id": 3}]])
+        client = SharedScrapeClient(scrapper)
+
+        search = client.scrape_jobs_streaming(posted_after=POSTED_AFTER)
+        scrapper.release()
+        next(search)
+        search.close()
+        scrapper.release(2)
+
+        assert scrapper.closed.wait(timeout=5)
+
+    def test_job_filter_runs_once_per_shared_batch(self):
+        """Every search gets the batch as filtered once, before the fan-out."""
+        scrapper = GatedScrapper([[{"job_id": 1}, {"job_id": 2}]])
+        job_filter = MagicMock(side_effect=lambda batch: batch[1:])
+        client = SharedScrapeClient(scrapper, job_filter=job_filter)
+        first = client.scrape_jobs_streaming(posted_after=POSTED_AFTER)
+        second = client.scrape_jobs_streaming(posted_after=POSTED_AFTER)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first_batches = executor.submit(list, first)
+            _wait_for(lambda: _followers(client) == 1)
+            second_batches = executor.submit(list, second)
+            _wait_for(lambda: _followers(client) == 2)
+            scrapper.release()
+
+            assert first_batches.result(timeout=5) == [[{"job_id": 2}]]
+            assert second_batches.result(timeout=5) == [[{"job_id": 2}]]
+        job_filter.assert_called_once_with([{"job_id": 1}, {"job_id": 2}])
+
+    def test_sharing_can_be_disabled(self):
+        """With sharing disabled every search scrapes directly."""
+        scrapper = MagicMock()
+        scrapper.scrape_jobs_streaming.return_value = iter([[{"job_id": 1}]])
+        client = SharedScrapeClient(scrapper, shared=False)
+
+        assert list(client.scrape_jobs_streaming(posted_after=POSTED_AFTER)) == [[{"job_id": 1}]]
+        scrapper.scrape_jobs_streaming.assert_called_once_with(
+            min_salary=4000, employment_location="remote", posted_after=POSTED_AFTER, timeout=30
+        )
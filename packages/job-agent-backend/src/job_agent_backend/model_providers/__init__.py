@@ -17,20 +17,42 @@ Example usage:
     model = factory.get_model(model_id="skill-extraction")
 """
 
+from .concurrency import AdaptiveConcurrencyLimiter, LimitedChatModel, LimitedEmbeddings
+from .embedding_batcher import BatchedEmbeddings, EmbeddingBatcher
+from .embedding_cache import CachedEmbeddings, EmbeddingCache
+from .embedding_store import SQLiteEmbeddingStore
 from .factory import ModelFactory
+from .response_cache import CachedChatModel, ResponseCache
+from .response_store import SQLiteResponseStore
 from ..contracts.model_factory_interface import IModelFactory
 from .providers import (
     BaseModelProvider,
     OpenAIProvider,
     TransformersProvider,
+    OnnxEmbeddingProvider,
     OllamaProvider,
 )
 from .contracts.provider_interface import IModelProvider
 from .registry import ModelRegistry
 from .contracts.registry_interface import IModelRegistry
+from .contracts.embedding_store_interface import IEmbeddingStore
+from .contracts.response_store_interface import IResponseStore
 
 __all__ = [
     "ModelFactory",
+    "AdaptiveConcurrencyLimiter",
+    "LimitedChatModel",
+    "LimitedEmbeddings",
+    "EmbeddingBatcher",
+    "BatchedEmbeddings",
+    "EmbeddingCache",
+    "CachedEmbeddings",
+    "IEmbeddingStore",
+    "SQLiteEmbeddingStore",
+    "ResponseCache",
+    "CachedChatModel",
+    "IResponseStore",
+    "SQLiteResponseStore",
     "IModelFactory",
     "IModelProvider",
     "IModelRegistry",
@@ -38,5 +60,6 @@ __all__ = [
     "BaseModelProvider",
     "OpenAIProvider",
     "TransformersProvider",
+    "OnnxEmbeddingProvider",
     "OllamaProvider",
 ]
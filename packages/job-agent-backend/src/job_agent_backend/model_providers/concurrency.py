@@ -0,0 +1,271 @@
+"""Adaptive concurrency limits for model calls.
+
+A single Ollama instance serves every chat model, and its latency collapses once
+it gets more concurrent requests than it can batch. AdaptiveConcurrencyLimiter
+caps the calls in flight to one model and adapts the cap AIMD-style: it grows by
+one call per round of calls completing near the best latency seen, and shrinks
+multiplicatively when latency climbs or calls fail. Callers beyond the cap wait
+in FIFO order, so throughput stays near the provider's best point instead of
+turning into timeouts.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, List, Optional, Tuple, TypeVar, Union
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from langchain_core.runnables import Runnable, RunnableConfig
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Calls slower than this multiple of the baseline latency count as congestion
+DEFAULT_LATENCY_TOLERANCE = 2.0
+# Limit multipliers applied on congestion and on failed calls
+DEFAULT_LATENCY_BACKOFF = 0.9
+DEFAULT_ERROR_BACKOFF = 0.5
+# Weight with which slower calls raise the baseline latency
+_BASELINE_DRIFT = 0.05
+
+_AsyncWaiter = Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]
+
+
+class AdaptiveConcurrencyLimiter:
+    """Thread- and asyncio-safe AIMD limit on the calls in flight to one model."""
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+        latency_backoff: float = DEFAULT_LATENCY_BACKOFF,
+        error_backoff: float = DEFAULT_ERROR_BACKOFF,
+        name: str = "model",
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_limit: Most calls ever allowed in flight at once
+            min_limit: Fewest calls allowed in flight at once after backing off
+            initial_limit: Calls allowed in flight before any latency was observed.
+                           Defaults to max_limit.
+            latency_tolerance: Calls slower than this multiple of the baseline
+                               latency shrink the limit
+            latency_backoff: Multiplier applied to the limit on slow calls
+            error_backoff: Multiplier applied to the limit on failed calls
+            name: Name used in log messages
+
+        Raises:
+            ValueError: If the limits are not 1 <= min_limit <= max_limit
+        """
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= max_limit")
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self._limit = float(min(max(initial_limit or max_limit, min_limit), max_limit))
+        self._latency_tolerance = latency_tolerance
+        self._latency_backoff = latency_backoff
+        self._error_backoff = error_backoff
+        self._name = name
+        self._baseline: Optional[float] = None
+        self._in_flight = 0
+        self._waiters: Deque[Union[threading.Event, _AsyncWaiter]] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """Calls currently allowed in flight at once."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently in flight."""
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Wait for a free slot, blocking the calling thread."""
+        with self._lock:
+            if self._try_acquire():
+                return
+            event = threading.Event()
+            self._waiters.append(event)
+        # The releasing caller counts the slot as ours before setting the event
+        event.wait()
+
+    async def aacquire(self) -> None:
+        """Wait for a free slot without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._try_acquire():
+                return
+            waiter: _AsyncWaiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            # The slot was handed over as we were cancelled - pass it on
+            self._return_slot()
+            raise
+
+    def release(self, latency: float, failed: bool = False) -> None:
+        """Free a slot and adapt the limit to how the call went.
+
+        Args:
+            latency: Duration of the call in seconds
+            failed: Whether the call raised
+        """
+        with self._lock:
+            self._in_flight -= 1
+            self._adapt(latency, failed)
+            self._wake_waiters()
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Run fn in a slot, timing it to adapt the limit."""
+        self.acquire()
+        started = time.perf_counter()
+        try:
+            result = fn()
+        except Exception:
+            self.release(time.perf_counter() - started, failed=True)
+            raise
+        except BaseException:
+            self._return_slot()
+            raise
+        self.release(time.perf_counter() - started)
+        return result
+
+    async def acall(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn in a slot, timing it to adapt the limit."""
+        await self.aacquire()
+        started = time.perf_counter()
+        try:
+            result = await fn()
+        except Exception:
+            self.release(time.perf_counter() - started, failed=True)
+            raise
+        except BaseException:
+            # Cancelled calls say nothing about the model
+            self._return_slot()
+            raise
+        self.release(time.perf_counter() - started)
+        return result
+
+    def wrap_chat_model(self, model: BaseChatModel) -> "LimitedChatModel":
+        """Return model with its calls going through this limiter."""
+        return LimitedChatModel(model, self)
+
+    def wrap_embeddings(self, model: Embeddings) -> "LimitedEmbeddings":
+        """Return model with its calls going through this limiter."""
+        return LimitedEmbeddings(model, self)
+
+    def _try_acquire(self) -> bool:
+        if self._waiters or self._in_flight >= self.limit:
+            return False
+        self._in_flight += 1
+        return True
+
+    def _return_slot(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._wake_waiters()
+
+    def _adapt(self, latency: float, failed: bool) -> None:
+        previous = self.limit
+        if failed:
+            self._limit = max(self.min_limit, self._limit * self._error_backoff)
+        elif self._baseline is None or latency <= self._baseline:
+            self._baseline = latency
+            self._increase()
+        else:
+            congested = latency > self._baseline * self._latency_tolerance
+            # Let the baseline follow lasting slowdowns, e.g. longer prompts
+            self._baseline += (latency - self._baseline) * _BASELINE_DRIFT
+            if congested:
+                self._limit = max(self.min_limit, self._limit * self._latency_backoff)
+            else:
+                self._increase()
+        if self.limit != previous:
+            logger.debug("Concurrency limit for %s: %d -> %d", self._name, previous, self.limit)
+
+    def _increase(self) -> None:
+        # One more call per round of calls at the current limit
+        self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            self._in_flight += 1
+            if isinstance(waiter, threading.Event):
+                waiter.set()
+            else:
+                loop, future = waiter
+                loop.call_soon_threadsafe(self._resolve, future)
+
+    @staticmethod
+    def _resolve(future: "asyncio.Future[None]") -> None:
+        # A waiter cancelled after the handover returns the slot itself
+        if not future.done():
+            future.set_result(None)
+
+
+class _LimitedRunnable(Runnable[LanguageModelInput, Any]):
+    """Runnable calling an inner runnable through an AdaptiveConcurrencyLimiter."""
+
+    def __init__(
+        self, runnable: Runnable[LanguageModelInput, Any], limiter: AdaptiveConcurrencyLimiter
+    ) -> None:
+        self._runnable = runnable
+        self._limiter = limiter
+
+    def invoke(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        return self._limiter.call(lambda: self._runnable.invoke(input, config, **kwargs))
+
+    async def ainvoke(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        return await self._limiter.acall(lambda: self._runnable.ainvoke(input, config, **kwargs))
+
+
+class LimitedChatModel(_LimitedRunnable):
+    """Chat model whose calls, structured or not, share one concurrency limit."""
+
+    def __init__(self, model: BaseChatModel, limiter: AdaptiveConcurrencyLimiter) -> None:
+        super().__init__(model, limiter)
+        self.model = model
+
+    def with_structured_output(
+        self, schema: Any, **kwargs: Any
+    ) -> Runnable[LanguageModelInput, Any]:
+        return _LimitedRunnable(self.model.with_structured_output(schema, **kwargs), self._limiter)
+
+
+class LimitedEmbeddings(Embeddings):
+    """Embedding model whose calls share one concurrency limit."""
+
+    def __init__(self, model: Embeddings, limiter: AdaptiveConcurrencyLimiter) -> None:
+        self.model = model
+        self._limiter = limiter
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._limiter.call(lambda: self.model.embed_documents(texts))
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._limiter.call(lambda: self.model.embed_query(text))
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self._limiter.acall(lambda: self.model.aembed_documents(texts))
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self._limiter.acall(lambda: self.model.aembed_query(text))
@@ -0,0 +1,220 @@
+"""Tests for adaptive concurrency limits on model calls."""
+
+import asyncio
+import threading
+import time
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from job_agent_backend.model_providers.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    LimitedChatModel,
+    LimitedEmbeddings,
+)
+from job_agent_backend.model_providers.factory import ModelFactory
+from job_agent_backend.model_providers.response_cache import CachedChatModel, ResponseCache
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for AdaptiveConcurrencyLimiter."""
+
+    def test_limit_grows_additively_while_latency_holds(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(max_limit=4, initial_limit=1)
+
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(latency=0.1)
+
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
+
+    def test_limit_never_exceeds_max(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(max_limit=2, initial_limit=1)
+
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release(latency=0.1)
+
+        assert limiter.limit == 2
+
+    def test_slow_calls_shrink_the_limit(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, latency_backoff=0.5)
+        limiter.acquire()
+        limiter.release(latency=0.1)
+
+        limiter.acquire()
+        limiter.release(latency=1.0)
+
+        assert limiter.limit == 4
+
+    def test_failed_calls_halve_the_limit_down_to_min(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, min_limit=2)
+
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                limiter.call(_fail)
+
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
+
+    def test_callers_beyond_the_limit_wait_their_turn(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(max_limit=2)
+        peak: List[int] = []
+        lock = threading.Lock()
+
+        def work() -> None:
+            with lock:
+                peak.append(limiter.in_flight)
+            time.sleep(0.01)
+
+        threads = [threading.Thread(target=limiter.call, args=(work,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(peak) == 8
+        assert max(peak) <= 2
+        assert limiter.in_flight == 0
+
+    def test_async_callers_beyond_the_limit_wait_their_turn(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(max_limit=2)
+        peak: List[int] = []
+
+        async def work() -> int:
+            peak.append(limiter.in_flight)
+            await asyncio.sleep(0.01)
+            return 1
+
+        async def run() -> List[int]:
+            return await asyncio.gather(*(limiter.acall(work) for _ in range(8)))
+
+        assert asyncio.run(run()) == [1] * 8
+        assert max(peak) <= 2
+        assert limiter.in_flight == 0
+
+    def test_cancelled_waiters_give_up_their_place(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(max_limit=1)
+
+        async def run() -> None:
+            await limiter.aacquire()
+            waiter = asyncio.create_task(limiter.aacquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            limiter.release(latency=0.1)
+
+        asyncio.run(run())
+
+        assert limiter.in_flight == 0
+
+    def test_waiter_cancelled_after_handover_returns_the_slot_once(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(max_limit=1)
+
+        async def run() -> None:
+            await limiter.aacquire()
+            waiter = asyncio.create_task(limiter.aacquire())
+            await asyncio.sleep(0)
+            # Hand the slot over from another thread, then cancel the waiter
+            # before the handover reaches the event loop
+            releaser = threading.Thread(target=limiter.release, args=(0.1,))
+            releaser.start()
+            releaser.join()
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+
+        assert limiter.in_flight == 0
+        limiter.acquire()
+        assert limiter.in_flight == 1
+
+    def test_rejects_invalid_limits(self) -> None:
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(max_limit=0)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(max_limit=2, min_limit=3)
+
+
+class TestLimitedModels:
+    """Tests for models calling through a limiter."""
+
+    def test_chat_model_calls_go_through_the_limiter(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(max_limit=2, initial_limit=1)
+        model = limiter.wrap_chat_model(FakeListChatModel(responses=["a", "b", "c"]))
+
+        assert model.invoke("hi").content == "a"
+        assert asyncio.run(model.ainvoke("hi")).content == "b"
+        assert limiter.in_flight == 0
+
+    def test_embedding_calls_go_through_the_limiter(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(max_limit=2)
+        inner = MagicMock()
+        inner.embed_query.return_value = [0.1, 0.2]
+
+        assert limiter.wrap_embeddings(inner).embed_query("python") == [0.1, 0.2]
+        assert limiter.in_flight == 0
+
+
+class TestModelFactoryConcurrency:
+    """ModelFactory limits registered models configured in the registry."""
+
+    def _factory(self, model: object, max_concurrency: object, **kwargs) -> ModelFactory:
+        provider = MagicMock()
+        provider.model_name = "phi3:mini"
+        provider.concurrency_key = "OllamaProvider:phi3:mini@http://localhost:11434"
+        provider.temperature = 0.0
+        provider.get_model.return_value = model
+        registry = MagicMock()
+        registry.get.return_value = provider
+        registry.get_max_concurrency.return_value = max_concurrency
+        return ModelFactory(registry=registry, provider_map={}, **kwargs)
+
+    def test_limited_chat_model_is_wrapped(self) -> None:
+        model = FakeListChatModel(responses=["a"])
+
+        limited = self._factory(model, 3).get_model(model_id="skill-extraction")
+
+        assert isinstance(limited, LimitedChatModel)
+        assert limited.model is model
+
+    def test_cache_wraps_the_limited_model(self) -> None:
+        model = FakeListChatModel(responses=["a"])
+        factory = self._factory(model, 3, response_cache=ResponseCache())
+
+        cached = factory.get_model(model_id="skill-extraction")
+
+        assert isinstance(cached, CachedChatModel)
+        assert isinstance(cached.model, LimitedChatModel)
+
+    def test_limited_embedding_model_is_wrapped(self) -> None:
+        model = MagicMock()
+
+        limited = self._factory(model, 2).get_model(model_id="embedding")
+
+        assert isinstance(limited, LimitedEmbeddings)
+
+    def test_models_served_by_the_same_backend_share_a_limiter(self) -> None:
+        factory = self._factory(FakeListChatModel(responses=["a"]), 3)
+
+        skills = factory.get_model(model_id="skill-extraction")
+        keywords = factory.get_model(model_id="keyword-extraction")
+
+        assert isinstance(skills, LimitedChatModel)
+        assert isinstance(keywords, LimitedChatModel)
+        assert skills._limiter is keywords._limiter
+
+    def test_unlimited_model_is_not_wrapped(self) -> None:
+        model = FakeListChatModel(responses=["a"])
+
+        assert self._factory(model, None).get_model(model_id="chat") is model
+
+
+def _fail() -> None:
+    raise RuntimeError("model unavailable")
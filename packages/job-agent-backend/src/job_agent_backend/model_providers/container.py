@@ -1,15 +1,89 @@
 """Local dependency injection container for model providers."""
 
-from typing import Any, Callable, Dict
+import os
+from typing import Any, Callable, Dict, Optional
 
 from dependency_injector import containers, providers
 
+from job_agent_platform_contracts import CacheStats
+
+from .contracts.embedding_store_interface import IEmbeddingStore
+from .contracts.response_store_interface import IResponseStore
+from .embedding_batcher import EmbeddingBatcher
+from .embedding_cache import EmbeddingCache
+from .embedding_store import SQLiteEmbeddingStore
+from .response_cache import ResponseCache
+from .response_store import SQLiteResponseStore
 from .factory import ModelFactory
 from ..contracts.model_factory_interface import IModelFactory
 from .mappers import MODEL_PROVIDER_MAP, PROVIDER_MAP
-from .providers import OllamaProvider, TransformersProvider
+from .providers import OllamaProvider, OnnxEmbeddingProvider, TransformersProvider
 from .registry import ModelRegistry
 from .contracts.registry_interface import IModelRegistry
+from .contracts.provider_interface import IModelProvider
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/distiluse-base-multilingual-cased-v2"
+
+
+def _get_embedding_cache_size() -> int:
+    """Read the number of embeddings cached in memory from the environment."""
+    return int(os.getenv("EMBEDDING_CACHE_SIZE", "20000"))
+
+
+def _get_embedding_store() -> Optional[IEmbeddingStore]:
+    """Create the persistent embedding store configured in the environment, if any."""
+    path = os.getenv("EMBEDDING_CACHE_PATH", "").strip()
+    return SQLiteEmbeddingStore(path) if path else None
+
+
+def _get_embedding_batcher() -> Optional[EmbeddingBatcher]:
+    """Create the embedding request batcher configured in the environment, if any.
+
+    Batching is off by default: a single caller would otherwise wait out
+    EMBEDDING_BATCH_WAIT_MS on every embed_query with no one to share the batch.
+    """
+    max_wait_ms = float(os.getenv("EMBEDDING_BATCH_WAIT_MS", "0"))
+    if max_wait_ms <= 0:
+        return None
+    max_batch_size = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+    return EmbeddingBatcher(max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+
+
+def _get_response_store() -> Optional[IResponseStore]:
+    """Create the persistent model response store configured in the environment, if any."""
+    path = os.getenv("LLM_CACHE_PATH", "").strip()
+    if not path:
+        return None
+    max_bytes = int(float(os.getenv("LLM_CACHE_MAX_MB", "64")) * 1024 * 1024)
+    return SQLiteResponseStore(path, max_bytes=max_bytes)
+
+
+def _get_model_max_concurrency() -> Dict[str, int]:
+    """Read the most concurrent calls allowed per local chat model from the environment.
+
+    The limit applies per backend: registrations served by the same model share it.
+    """
+    max_concurrency = int(os.getenv("MODEL_MAX_CONCURRENCY", "4"))
+    return {
+        model_id: max_concurrency
+        for model_id in ("skill-extraction", "pii-removal", "keyword-extraction")
+    }
+
+
+def _create_embedding_provider() -> IModelProvider:
+    """Create the embedding provider of the backend selected in the environment.
+
+    EMBEDDING_BACKEND is "transformers" (PyTorch, the default), "onnx" or
+    "onnx-int8" (onnxruntime with full-precision or int8-quantized weights).
+    """
+    backend = os.getenv("EMBEDDING_BACKEND", "transformers").strip().lower()
+    if backend in ("onnx", "onnx-int8"):
+        return OnnxEmbeddingProvider(
+            model_name=EMBEDDING_MODEL_NAME, quantize=backend == "onnx-int8"
+        )
+    if backend != "transformers":
+        raise ValueError(f"Unknown EMBEDDING_BACKEND '{backend}'")
+    return TransformersProvider(model_name=EMBEDDING_MODEL_NAME, task="embedding")
 
 
 class ModelProvidersContainer(containers.DeclarativeContainer):
@@ -39,14 +113,22 @@ class ModelProvidersContainer(containers.DeclarativeContainer):
                 "keyword-extraction",
                 OllamaProvider(model_name="phi3:mini", temperature=0.0),
             ),
-            (
-                "embedding",
-                TransformersProvider(
-                    model_name="sentence-transformers/distiluse-base-multilingual-cased-v2",
-                    task="embedding",
-                ),
-            ),
+            ("embedding", _create_embedding_provider()),
         ],
+        max_concurrency=providers.Callable(_get_model_max_concurrency),
+    )
+
+    # Embeddings by content hash, shared by every user of the embedding model
+    embedding_cache = providers.Singleton(
+        EmbeddingCache,
+        max_entries=providers.Callable(_get_embedding_cache_size),
+        store=providers.Callable(_get_embedding_store),
+    )
+
+    # Responses of deterministic chat models by model, prompt and output schema
+    response_cache = providers.Singleton(
+        ResponseCache,
+        store=providers.Callable(_get_response_store),
     )
 
     # Model factory singleton - maintains model cache
@@ -55,6 +137,9 @@ class ModelProvidersContainer(containers.DeclarativeContainer):
         registry=model_registry,
         provider_map=provider_map,
         model_provider_map=model_provider_map,
+        embedding_cache=embedding_cache,
+        response_cache=response_cache,
+        embedding_batcher=providers.Callable(_get_embedding_batcher),
     )
 
 
@@ -71,6 +156,14 @@ def get_model_registry() -> IModelRegistry:
     return container.model_registry()
 
 
+def get_cache_stats() -> Dict[str, CacheStats]:
+    """Get the hits and misses of the model response and embedding caches."""
+    return {
+        "response_cache": container.response_cache().stats(),
+        "embedding_cache": container.embedding_cache().stats(),
+    }
+
+
 # Type-safe dependency resolution mapping
 _DEPENDENCY_MAP: Dict[type, Callable[[], Any]] = {
     IModelFactory: get_model_factory,
@@ -3,10 +3,14 @@
 This module contains interfaces that are used only within the model_providers service.
 """
 
+from .embedding_store_interface import IEmbeddingStore
 from .provider_interface import IModelProvider
 from .registry_interface import IModelRegistry
+from .response_store_interface import IResponseStore
 
 __all__ = [
+    "IEmbeddingStore",
     "IModelProvider",
     "IModelRegistry",
+    "IResponseStore",
 ]
@@ -0,0 +1,32 @@
+"""Abstract interface for persistent embedding stores."""
+
+from typing import Dict, List, Mapping, Protocol, Sequence
+
+
+class IEmbeddingStore(Protocol):
+    """Protocol for stores persisting embeddings by model namespace and text hash.
+
+    Used as the persistent tier of EmbeddingCache, so embeddings computed by
+    earlier processes are reused instead of being recomputed.
+    """
+
+    def get_many(self, namespace: str, keys: Sequence[str]) -> Dict[str, List[float]]:
+        """Get the stored embeddings for the given keys.
+
+        Args:
+            namespace: Namespace of the embedding model the keys belong to
+            keys: Content hashes of the embedded texts
+
+        Returns:
+            Embeddings found in the store, by key. Missing keys are left out.
+        """
+        ...
+
+    def put_many(self, namespace: str, embeddings: Mapping[str, List[float]]) -> None:
+        """Store embeddings, replacing existing ones with the same key.
+
+        Args:
+            namespace: Namespace of the embedding model the embeddings belong to
+            embeddings: Embeddings to store, by content hash of the embedded text
+        """
+        ...
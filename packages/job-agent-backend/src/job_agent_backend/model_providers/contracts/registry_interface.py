@@ -37,6 +37,17 @@ class IModelRegistry(Protocol):
         """
         ...
 
+    def get_max_concurrency(self, model_id: str) -> Optional[int]:
+        """Get the most concurrent calls allowed for a model ID.
+
+        Args:
+            model_id: The identifier of the model
+
+        Returns:
+            The configured maximum, or None if calls to the model are not limited
+        """
+        ...
+
     def list_models(self) -> List[str]:
         """List all registered model IDs.
 
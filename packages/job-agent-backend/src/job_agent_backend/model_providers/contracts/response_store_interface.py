@@ -0,0 +1,31 @@
+"""Abstract interface for persistent model response stores."""
+
+from typing import Optional, Protocol
+
+
+class IResponseStore(Protocol):
+    """Protocol for stores persisting serialized model responses by cache key.
+
+    Used as the persistent tier of ResponseCache, so responses computed by
+    earlier processes are reused instead of calling the model again.
+    """
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the stored response for a key.
+
+        Args:
+            key: Hash of the model, rendered messages and output schema
+
+        Returns:
+            The serialized response, or None if the key is not stored
+        """
+        ...
+
+    def put(self, key: str, value: str) -> None:
+        """Store a response, replacing an existing one with the same key.
+
+        Args:
+            key: Hash of the model, rendered messages and output schema
+            value: Serialized response
+        """
+        ...
@@ -0,0 +1,144 @@
+"""Cross-thread micro-batching for embedding models.
+
+Essay searches, their background embedding threads and job relevance checks each
+embed a single text at a time from their own thread, so under concurrent load the
+encoder runs many batches of one. BatchedEmbeddings queues single-text requests
+from all threads and encodes up to max_batch_size of them in one call, waiting at
+most max_wait_ms after the oldest request for others to arrive. Each caller gets
+its embedding back through a future.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Deque, List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_WAIT_MS = 5.0
+
+_Request = Tuple[str, "Future[List[float]]", float]
+
+
+class EmbeddingBatcher:
+    """Settings for micro-batching single-text requests to embedding models."""
+
+    def __init__(
+        self, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_wait_ms: float = DEFAULT_MAX_WAIT_MS
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            max_batch_size: Most texts encoded in one call
+            max_wait_ms: Longest time a request waits for others to join its batch
+
+        Raises:
+            ValueError: If max_batch_size is not positive or max_wait_ms is negative
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be positive")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative")
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+    def wrap(self, model: Embeddings) -> "BatchedEmbeddings":
+        """Return model with its single-text requests micro-batched."""
+        return BatchedEmbeddings(model, self.max_batch_size, self.max_wait_ms)
+
+
+class BatchedEmbeddings(Embeddings):
+    """Embedding model encoding concurrent embed_query calls in shared batches.
+
+    Batched queries are encoded with embed_documents, so this suits models that
+    embed queries and documents alike. Document lists are already batches and go
+    straight to the wrapped model.
+    """
+
+    def __init__(
+        self,
+        model: Embeddings,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ) -> None:
+        self.model = model
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._pending: Deque[_Request] = deque()
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.model.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._submit(text).result()
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.model.aembed_documents(texts)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await asyncio.wrap_future(self._submit(text))
+
+    def close(self) -> None:
+        """Stop the batching thread once the queued requests are encoded."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def _submit(self, text: str) -> "Future[List[float]]":
+        future: "Future[List[float]]" = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Embedding batcher is closed")
+            self._pending.append((text, future, time.monotonic()))
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="embedding-batcher", daemon=True
+                )
+                self._worker.start()
+            self._condition.notify()
+        return future
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._encode(batch)
+
+    def _next_batch(self) -> Optional[List[_Request]]:
+        with self._condition:
+            while not self._pending:
+                if self._closed:
+                    return None
+                self._condition.wait()
+            # The oldest request bounds how long the batch keeps filling
+            deadline = self._pending[0][2] + self._max_wait
+            while len(self._pending) < self._max_batch_size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            count = min(len(self._pending), self._max_batch_size)
+            batch = [self._pending.popleft() for _ in range(count)]
+        # Requests cancelled while queued are dropped
+        return [request for request in batch if request[1].set_running_or_notify_cancel()]
+
+    def _encode(self, batch: List[_Request]) -> None:
+        if not batch:
+            return
+        # Identical texts, such as a CV embedded by concurrent searches, are encoded once
+        texts = list(dict.fromkeys(text for text, _, _ in batch))
+        try:
+            embeddings = dict(zip(texts, self.model.embed_documents(texts)))
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+        for text, future, _ in batch:
+            future.set_result(embeddings[text])
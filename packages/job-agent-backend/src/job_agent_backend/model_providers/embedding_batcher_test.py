@@ -0,0 +1,135 @@
+"""Tests for cross-thread micro-batching of embedding requests."""
+
+import asyncio
+import threading
+import time
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from job_agent_backend.model_providers.embedding_batcher import BatchedEmbeddings, EmbeddingBatcher
+from job_agent_backend.model_providers.embedding_cache import CachedEmbeddings, EmbeddingCache
+from job_agent_backend.model_providers.factory import ModelFactory
+
+
+class RecordingEmbeddings(Embeddings):
+    """Embedding model recording the batches it encodes."""
+
+    def __init__(self) -> None:
+        self.batches: List[List[str]] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.batches.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+class TestBatchedEmbeddings:
+    """Tests for BatchedEmbeddings."""
+
+    def test_concurrent_queries_share_one_encode(self) -> None:
+        model = RecordingEmbeddings()
+        batched = BatchedEmbeddings(model, max_batch_size=8, max_wait_ms=200)
+        texts = ["a" * length for length in range(1, 9)]
+        results: dict = {}
+
+        def embed(text: str) -> None:
+            results[text] = batched.embed_query(text)
+
+        threads = [threading.Thread(target=embed, args=(text,)) for text in texts]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(model.batches) == 1
+        assert sorted(model.batches[0]) == sorted(texts)
+        assert all(results[text] == [float(len(text))] for text in texts)
+
+    def test_single_query_waits_at_most_the_window(self) -> None:
+        batched = BatchedEmbeddings(RecordingEmbeddings(), max_batch_size=8, max_wait_ms=20)
+
+        started = time.perf_counter()
+        assert batched.embed_query("python") == [6.0]
+
+        assert time.perf_counter() - started < 1.0
+
+    def test_batches_are_capped_at_max_size(self) -> None:
+        model = RecordingEmbeddings()
+        batched = BatchedEmbeddings(model, max_batch_size=2, max_wait_ms=200)
+
+        async def run() -> List[List[float]]:
+            return await asyncio.gather(*(batched.aembed_query(str(i) * 3) for i in range(5)))
+
+        results = asyncio.run(run())
+
+        assert results == [[3.0]] * 5
+        assert [len(batch) for batch in model.batches] == [2, 2, 1]
+
+    def test_identical_texts_are_encoded_once(self) -> None:
+        model = RecordingEmbeddings()
+        batched = BatchedEmbeddings(model, max_batch_size=4, max_wait_ms=200)
+
+        async def run() -> List[List[float]]:
+            return await asyncio.gather(*(batched.aembed_query("cv") for _ in range(4)))
+
+        assert asyncio.run(run()) == [[2.0]] * 4
+        assert model.batches == [["cv"]]
+
+    def test_encode_errors_reach_every_caller(self) -> None:
+        model = MagicMock(spec=Embeddings)
+        model.embed_documents.side_effect = RuntimeError("encoder failed")
+        batched = BatchedEmbeddings(model, max_wait_ms=1)
+
+        with pytest.raises(RuntimeError, match="encoder failed"):
+            batched.embed_query("python")
+
+    def test_documents_go_straight_to_the_model(self) -> None:
+        model = RecordingEmbeddings()
+        batched = BatchedEmbeddings(model)
+
+        assert batched.embed_documents(["a", "bb"]) == [[1.0], [2.0]]
+        assert model.batches == [["a", "bb"]]
+
+    def test_closed_batcher_rejects_requests(self) -> None:
+        batched = BatchedEmbeddings(RecordingEmbeddings())
+        batched.close()
+
+        with pytest.raises(RuntimeError):
+            batched.embed_query("python")
+
+
+class TestEmbeddingBatcher:
+    """Tests for EmbeddingBatcher settings."""
+
+    def test_rejects_invalid_settings(self) -> None:
+        with pytest.raises(ValueError):
+            EmbeddingBatcher(max_batch_size=0)
+        with pytest.raises(ValueError):
+            EmbeddingBatcher(max_wait_ms=-1)
+
+    def test_factory_batches_below_the_cache(self) -> None:
+        model = RecordingEmbeddings()
+        provider = MagicMock()
+        provider.model_name = "embedding-model"
+        provider.cache_namespace = "embedding-model"
+        provider.get_model.return_value = model
+        registry = MagicMock()
+        registry.get.return_value = provider
+        registry.get_max_concurrency.return_value = None
+        factory = ModelFactory(
+            registry=registry,
+            provider_map={},
+            embedding_cache=EmbeddingCache(),
+            embedding_batcher=EmbeddingBatcher(),
+        )
+
+        cached = factory.get_model(model_id="embedding")
+
+        assert isinstance(cached, CachedEmbeddings)
+        assert isinstance(cached.model, BatchedEmbeddings)
+        assert cached.model.model is model
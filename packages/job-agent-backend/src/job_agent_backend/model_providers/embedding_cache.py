@@ -0,0 +1,207 @@
+"""Content-addressed cache for embedding models.
+
+Embedding the same text with the same model always gives the same vector, yet
+job texts are re-embedded on every search that scrapes them and essay queries on
+every repeated search. EmbeddingCache remembers embeddings by a hash of the
+embedded text, in an in-memory LRU tier and optionally in a persistent store, so
+repeated texts skip the encoder entirely. Entries are namespaced by the provider's
+cache_namespace, its model name plus the runtime where that changes the vectors, so
+switching models or backends never returns vectors of the previous one.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from langchain_core.embeddings import Embeddings
+
+from job_agent_platform_contracts import CacheStats
+
+from .contracts.embedding_store_interface import IEmbeddingStore
+
+logger = logging.getLogger(__name__)
+
+# Number of embeddings kept in memory before the least recently used ones are dropped
+DEFAULT_MAX_ENTRIES = 20_000
+
+
+class EmbeddingCache:
+    """Thread-safe two-tier embedding cache shared by wrapped embedding models."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        store: Optional[IEmbeddingStore] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Number of embeddings kept in memory before the least
+                         recently used ones are dropped
+            store: Optional persistent store backing the in-memory tier
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._store = store
+        self._entries: OrderedDict[tuple[str, str], List[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> CacheStats:
+        """Get the number of hits and misses counted so far."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def wrap(self, model: Embeddings, namespace: str) -> "CachedEmbeddings":
+        """Return model embedding through this cache.
+
+        Args:
+            model: Embedding model computing cache misses
+            namespace: Name of the model and backend, keeping its entries apart from others'
+        """
+        return CachedEmbeddings(model, self, namespace)
+
+    def lookup(self, namespace: str, keys: Sequence[str]) -> Dict[str, List[float]]:
+        """Get the cached embeddings for keys, reading the store for memory misses."""
+        found = self._lookup_memory(namespace, keys)
+        missing = [key for key in keys if key not in found]
+        if missing and self._store is not None:
+            found.update(self._lookup_store(namespace, missing))
+        self._count(len(found), len(keys) - len(found))
+        return found
+
+    async def alookup(self, namespace: str, keys: Sequence[str]) -> Dict[str, List[float]]:
+        """Async variant of lookup, reading the store in a worker thread."""
+        found = self._lookup_memory(namespace, keys)
+        missing = [key for key in keys if key not in found]
+        if missing and self._store is not None:
+            found.update(await asyncio.to_thread(self._lookup_store, namespace, missing))
+        self._count(len(found), len(keys) - len(found))
+        return found
+
+    def record(self, namespace: str, embeddings: Mapping[str, List[float]]) -> None:
+        """Cache freshly computed embeddings in memory and in the store."""
+        self._remember(namespace, embeddings)
+        self._persist(namespace, embeddings)
+
+    async def arecord(self, namespace: str, embeddings: Mapping[str, List[float]]) -> None:
+        """Async variant of record, writing the store in a worker thread."""
+        self._remember(namespace, embeddings)
+        if self._store is not None:
+            await asyncio.to_thread(self._persist, namespace, embeddings)
+
+    def _lookup_memory(self, namespace: str, keys: Sequence[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get((namespace, key))
+                if vector is not None:
+                    self._entries.move_to_end((namespace, key))
+                    found[key] = vector
+        return found
+
+    def _lookup_store(self, namespace: str, keys: Sequence[str]) -> Dict[str, List[float]]:
+        assert self._store is not None
+        try:
+            found = self._store.get_many(namespace, keys)
+        except Exception as e:
+            logger.warning("Reading cached embeddings failed - %s", e)
+            return {}
+        self._remember(namespace, found)
+        return found
+
+    def _remember(self, namespace: str, embeddings: Mapping[str, List[float]]) -> None:
+        with self._lock:
+            for key, vector in embeddings.items():
+                self._entries[(namespace, key)] = vector
+                self._entries.move_to_end((namespace, key))
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _persist(self, namespace: str, embeddings: Mapping[str, List[float]]) -> None:
+        if self._store is None or not embeddings:
+            return
+        try:
+            self._store.put_many(namespace, embeddings)
+        except Exception as e:
+            logger.warning("Storing %d embeddings failed - %s", len(embeddings), e)
+
+    def _count(self, hits: int, misses: int) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+
+class CachedEmbeddings(Embeddings):
+    """Embedding model answering repeated texts from an EmbeddingCache.
+
+    Query and document embeddings are cached apart, since models may embed them
+    differently. Only texts missing from the cache reach the wrapped model, in a
+    single call per request.
+    """
+
+    def __init__(self, model: Embeddings, cache: EmbeddingCache, namespace: str) -> None:
+        self.model = model
+        self._cache = cache
+        self._query_namespace = f"{namespace}:query"
+        self._document_namespace = f"{namespace}:document"
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [_content_key(text) for text in texts]
+        found = self._cache.lookup(self._document_namespace, _unique(keys))
+        missing = _missing_texts(texts, keys, found)
+        if missing:
+            computed = dict(zip(missing, self.model.embed_documents(list(missing.values()))))
+            self._cache.record(self._document_namespace, computed)
+            found.update(computed)
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        key = _content_key(text)
+        found = self._cache.lookup(self._query_namespace, [key])
+        if key not in found:
+            found[key] = self.model.embed_query(text)
+            self._cache.record(self._query_namespace, {key: found[key]})
+        return found[key]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [_content_key(text) for text in texts]
+        found = await self._cache.alookup(self._document_namespace, _unique(keys))
+        missing = _missing_texts(texts, keys, found)
+        if missing:
+            vectors = await self.model.aembed_documents(list(missing.values()))
+            computed = dict(zip(missing, vectors))
+            await self._cache.arecord(self._document_namespace, computed)
+            found.update(computed)
+        return [found[key] for key in keys]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        key = _content_key(text)
+        found = await self._cache.alookup(self._query_namespace, [key])
+        if key not in found:
+            found[key] = await self.model.aembed_query(text)
+            await self._cache.arecord(self._query_namespace, {key: found[key]})
+        return found[key]
+
+
+def _content_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _unique(keys: Sequence[str]) -> List[str]:
+    return list(dict.fromkeys(keys))
+
+
+def _missing_texts(
+    texts: Sequence[str], keys: Sequence[str], found: Mapping[str, List[float]]
+) -> Dict[str, str]:
+    """Return the texts missing from found by key, each distinct text once."""
+    return {key: text for key, text in zip(keys, texts) if key not in found}
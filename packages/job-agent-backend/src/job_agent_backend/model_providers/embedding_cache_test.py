@@ -0,0 +1,185 @@
+"""Tests for the content-addressed embedding cache."""
+
+import asyncio
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+from job_agent_backend.model_providers.embedding_cache import CachedEmbeddings, EmbeddingCache
+from job_agent_backend.model_providers.embedding_store import SQLiteEmbeddingStore
+from job_agent_backend.model_providers.factory import ModelFactory
+from job_agent_backend.model_providers.providers.onnx import OnnxEmbeddingProvider
+from job_agent_backend.model_providers.providers.transformers import TransformersProvider
+
+
+class CountingEmbeddings(Embeddings):
+    """Embedding model recording every text it embeds."""
+
+    def __init__(self, scale: float = 1.0) -> None:
+        self.scale = scale
+        self.embedded: List[str] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.embedded.extend(texts)
+        return [[len(text) * self.scale, 0.5] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        self.embedded.append(text)
+        return [len(text) * self.scale, 0.25]
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache and CachedEmbeddings."""
+
+    def test_repeated_texts_skip_the_model(self) -> None:
+        model = CountingEmbeddings()
+        cached = EmbeddingCache().wrap(model, "test-model")
+
+        first = cached.embed_documents(["python job", "java job"])
+        second = cached.embed_documents(["java job", "go job", "python job"])
+
+        assert model.embedded == ["python job", "java job", "go job"]
+        assert second == [first[1], [6.0, 0.5], first[0]]
+
+    def test_duplicate_texts_in_one_call_are_embedded_once(self) -> None:
+        model = CountingEmbeddings()
+        cached = EmbeddingCache().wrap(model, "test-model")
+
+        vectors = cached.embed_documents(["same", "same", "other"])
+
+        assert model.embedded == ["same", "other"]
+        assert vectors[0] == vectors[1]
+
+    def test_queries_and_documents_are_cached_apart(self) -> None:
+        model = CountingEmbeddings()
+        cached = EmbeddingCache().wrap(model, "test-model")
+
+        assert cached.embed_query("text") == [4.0, 0.25]
+        assert cached.embed_query("text") == [4.0, 0.25]
+        assert cached.embed_documents(["text"]) == [[4.0, 0.5]]
+        assert model.embedded == ["text", "text"]
+
+    def test_entries_are_namespaced_by_model(self) -> None:
+        cache = EmbeddingCache()
+        old_model = CountingEmbeddings(scale=1.0)
+        new_model = CountingEmbeddings(scale=2.0)
+
+        cache.wrap(old_model, "old-model").embed_query("text")
+        vector = cache.wrap(new_model, "new-model").embed_query("text")
+
+        assert vector == [8.0, 0.25]
+        assert new_model.embedded == ["text"]
+
+    def test_least_recently_used_entries_are_dropped(self) -> None:
+        model = CountingEmbeddings()
+        cached = EmbeddingCache(max_entries=2).wrap(model, "test-model")
+
+        cached.embed_query("a")
+        cached.embed_query("b")
+        cached.embed_query("a")
+        cached.embed_query("c")
+        cached.embed_query("a")
+        cached.embed_query("b")
+
+        assert model.embedded == ["a", "b", "c", "b"]
+
+    def test_store_serves_embeddings_across_caches(self, tmp_path) -> None:
+        path = tmp_path / "cache" / "embeddings.sqlite3"
+        first_model = CountingEmbeddings()
+        first_store = SQLiteEmbeddingStore(path)
+        expected = (
+            EmbeddingCache(store=first_store).wrap(first_model, "m").embed_documents(["one", "two"])
+        )
+        first_store.close()
+
+        second_model = CountingEmbeddings()
+        cache = EmbeddingCache(store=SQLiteEmbeddingStore(path))
+        vectors = cache.wrap(second_model, "m").embed_documents(["two", "one"])
+
+        assert vectors == [expected[1], expected[0]]
+        assert second_model.embedded == []
+        assert (cache.hits, cache.misses) == (2, 0)
+        assert cache.stats() == {"hits": 2, "misses": 0}
+
+    def test_store_failures_fall_back_to_the_model(self) -> None:
+        store = MagicMock()
+        store.get_many.side_effect = RuntimeError("disk full")
+        store.put_many.side_effect = RuntimeError("disk full")
+        model = CountingEmbeddings()
+        cached = EmbeddingCache(store=store).wrap(model, "test-model")
+
+        assert cached.embed_query("text") == [4.0, 0.25]
+        assert cached.embed_query("text") == [4.0, 0.25]
+        assert model.embedded == ["text"]
+
+    def test_async_embedding_uses_the_cache(self, tmp_path) -> None:
+        model = CountingEmbeddings()
+        cache = EmbeddingCache(store=SQLiteEmbeddingStore(tmp_path / "embeddings.sqlite3"))
+        cached = cache.wrap(model, "test-model")
+
+        async def embed() -> tuple[List[List[float]], List[float]]:
+            await cached.aembed_documents(["a", "bb"])
+            return await cached.aembed_documents(["bb", "a"]), await cached.aembed_query("a")
+
+        documents, query = asyncio.run(embed())
+
+        assert documents == [[2.0, 0.5], [1.0, 0.5]]
+        assert query == [1.0, 0.25]
+        assert model.embedded == ["a", "bb", "a"]
+
+    def test_rejects_non_positive_size(self) -> None:
+        with pytest.raises(ValueError, match="max_entries"):
+            EmbeddingCache(max_entries=0)
+
+
+class TestModelFactoryEmbeddingCache:
+    """ModelFactory wraps the registered embedding model with the cache."""
+
+    def _factory(self, model_id: str, model: object, cache: EmbeddingCache) -> ModelFactory:
+        provider = MagicMock()
+        provider.model_name = "sentence-model"
+        provider.cache_namespace = "sentence-model"
+        provider.get_model.return_value = model
+        registry = MagicMock()
+        registry.get.side_effect = lambda requested: provider if requested == model_id else None
+        return ModelFactory(registry=registry, provider_map={}, embedding_cache=cache)
+
+    def test_embedding_model_goes_through_the_cache(self) -> None:
+        model = CountingEmbeddings()
+        factory = self._factory("embedding", model, EmbeddingCache())
+
+        embedding_model = factory.get_model(model_id="embedding")
+        embedding_model.embed_query("text")
+        factory.get_model(model_id="embedding").embed_query("text")
+
+        assert isinstance(embedding_model, CachedEmbeddings)
+        assert embedding_model.model is model
+        assert model.embedded == ["text"]
+
+    def test_other_models_are_not_wrapped(self) -> None:
+        model = MagicMock()
+        factory = self._factory("skill-extraction", model, EmbeddingCache())
+
+        assert factory.get_model(model_id="skill-extraction") is model
+
+    def test_switching_backends_misses_the_cache(self) -> None:
+        cache = EmbeddingCache()
+        backends = [
+            TransformersProvider(model_name="sentence-model", task="embedding"),
+            OnnxEmbeddingProvider(model_name="sentence-model"),
+            OnnxEmbeddingProvider(model_name="sentence-model", quantize=True),
+        ]
+
+        models = []
+        for provider in backends:
+            model = CountingEmbeddings()
+            registry = MagicMock()
+            registry.get.return_value = provider
+            factory = ModelFactory(registry=registry, provider_map={}, embedding_cache=cache)
+            with patch.object(type(provider), "get_model", return_value=model):
+                factory.get_model(model_id="embedding").embed_query("text")
+            models.append(model)
+
+        assert [model.embedded for model in models] == [["text"], ["text"], ["text"]]
@@ -0,0 +1,82 @@
+"""Local file store for embeddings."""
+
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+from .contracts.embedding_store_interface import IEmbeddingStore
+
+# Number of keys looked up per query, below SQLite's bound parameter limit
+_LOOKUP_CHUNK_SIZE = 500
+
+
+class SQLiteEmbeddingStore(IEmbeddingStore):
+    """Embedding store backed by a local SQLite file.
+
+    Vectors are stored as packed doubles, so they are returned exactly as they
+    were computed. The database is opened on first use and shared by all threads.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Initialize the store.
+
+        Args:
+            path: Path of the SQLite file. Missing parent directories are created.
+        """
+        self._path = Path(path).expanduser()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def get_many(self, namespace: str, keys: Sequence[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            connection = self._connect()
+            for start in range(0, len(keys), _LOOKUP_CHUNK_SIZE):
+                chunk = list(keys[start : start + _LOOKUP_CHUNK_SIZE])
+                placeholders = ", ".join("?" * len(chunk))
+                rows = connection.execute(
+                    "SELECT text_hash, vector FROM embeddings "
+                    f"WHERE namespace = ? AND text_hash IN ({placeholders})",
+                    [namespace, *chunk],
+                )
+                for key, vector in rows:
+                    found[key] = array("d", vector).tolist()
+        return found
+
+    def put_many(self, namespace: str, embeddings: Mapping[str, List[float]]) -> None:
+        if not embeddings:
+            return
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (namespace, text_hash, vector) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (namespace, key, array("d", vector).tobytes())
+                        for key, vector in embeddings.items()
+                    ],
+                )
+
+    def close(self) -> None:
+        """Close the database connection. The store reopens it on next use."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._path, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "namespace TEXT NOT NULL, "
+                "text_hash TEXT NOT NULL, "
+                "vector BLOB NOT NULL, "
+                "PRIMARY KEY (namespace, text_hash))"
+            )
+            self._connection = connection
+        return self._connection
@@ -1,6 +1,7 @@
 """Factory class for creating AI model instances."""
 
-from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Type, overload
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Type, cast, overload
 
 from ..contracts.model_factory_interface import IModelFactory
 from .mappers import MODEL_PROVIDER_MAP
@@ -12,6 +13,14 @@ if TYPE_CHECKING:
     from langchain_core.embeddings import Embeddings
     from langchain_core.language_models import BaseChatModel
 
+    from .concurrency import AdaptiveConcurrencyLimiter
+    from .embedding_batcher import EmbeddingBatcher
+    from .embedding_cache import EmbeddingCache
+    from .response_cache import ResponseCache
+
+# Registered model whose embeddings go through the embedding cache
+_CACHED_EMBEDDING_MODEL_ID = "embedding"
+
 
 class ModelFactory(IModelFactory):
     """Factory class for creating and caching AI model instances."""
@@ -21,6 +30,9 @@ class ModelFactory(IModelFactory):
         registry: IModelRegistry,
         provider_map: Dict[str, Type[BaseModelProvider]],
         model_provider_map: Optional[Dict[str, str]] = None,
+        embedding_cache: Optional["EmbeddingCache"] = None,
+        response_cache: Optional["ResponseCache"] = None,
+        embedding_batcher: Optional["EmbeddingBatcher"] = None,
     ) -> None:
         """Initialize the model factory with injected dependencies.
 
@@ -29,13 +41,27 @@ class ModelFactory(IModelFactory):
             provider_map: Mapping of provider names to provider classes
             model_provider_map: Optional mapping of model names to provider names
                               for auto-detection. Defaults to MODEL_PROVIDER_MAP.
+            embedding_cache: Optional cache the registered "embedding" model is
+                             wrapped with, so repeated texts are not re-embedded
+            response_cache: Optional cache registered chat models running at
+                            temperature 0 are wrapped with, so repeated prompts
+                            are answered without calling the model
+            embedding_batcher: Optional batcher the registered "embedding" model is
+                               wrapped with, so concurrent single-text requests
+                               share encoder calls
         """
         self._registry = registry
         self._provider_map = provider_map
         self._model_provider_map = (
             model_provider_map if model_provider_map is not None else MODEL_PROVIDER_MAP
         )
+        self._embedding_cache = embedding_cache
+        self._response_cache = response_cache
+        self._embedding_batcher = embedding_batcher
         self._model_cache: Dict[str, ModelInstance] = {}
+        self._limiters: Dict[str, "AdaptiveConcurrencyLimiter"] = {}
+        # Guards model creation so concurrent workflows share a single instance
+        self._cache_lock = threading.RLock()
 
     def _generate_cache_key(
         self, provider: str, model_name: str, temperature: float, kwargs: dict
@@ -100,9 +126,13 @@ class ModelFactory(IModelFactory):
                 )
             # Cache key for registered models
             cache_key = f"registered:{model_id}"
-            if cache_key not in self._model_cache:
-                self._model_cache[cache_key] = provider_instance.get_model()
-            return self._model_cache[cache_key]
+            with self._cache_lock:
+                if cache_key not in self._model_cache:
+                    model = self._wrap_registered(
+                        model_id, provider_instance, provider_instance.get_model()
+                    )
+                    self._model_cache[cache_key] = model
+                return self._model_cache[cache_key]
 
         # Create provider on-the-fly
         if not model_name:
@@ -126,18 +156,75 @@ class ModelFactory(IModelFactory):
         final_temperature = temperature if temperature is not None else 0.0
 
         cache_key = self._generate_cache_key(provider, model_name, final_temperature, kwargs)
-        if cache_key in self._model_cache:
-            return self._model_cache[cache_key]
+        with self._cache_lock:
+            if cache_key in self._model_cache:
+                return self._model_cache[cache_key]
+
+            provider_instance = provider_class(
+                model_name=model_name, temperature=final_temperature, **kwargs
+            )
+            model = provider_instance.get_model()
+            self._model_cache[cache_key] = model
+            return model
+
+    def _wrap_registered(
+        self, model_id: str, provider_instance: Any, model: ModelInstance
+    ) -> ModelInstance:
+        """Wrap a registered model with its concurrency limit and cache, if any.
 
-        provider_instance = provider_class(
-            model_name=model_name, temperature=final_temperature, **kwargs
+        The cache wraps the limited model, so cache hits do not wait for a slot.
+        """
+        from langchain_core.language_models import BaseChatModel
+
+        model_name = getattr(provider_instance, "model_name", model_id)
+        limiter = self._get_limiter(
+            model_id, getattr(provider_instance, "concurrency_key", model_id)
         )
-        model = provider_instance.get_model()
-        self._model_cache[cache_key] = model
-        return model
+
+        if model_id == _CACHED_EMBEDDING_MODEL_ID:
+            embeddings = cast("Embeddings", model)
+            if limiter is not None:
+                embeddings = limiter.wrap_embeddings(embeddings)
+            if self._embedding_batcher is not None:
+                embeddings = self._embedding_batcher.wrap(embeddings)
+            if self._embedding_cache is not None:
+                namespace = getattr(provider_instance, "cache_namespace", model_name)
+                embeddings = self._embedding_cache.wrap(embeddings, namespace)
+            return embeddings
+
+        if not isinstance(model, BaseChatModel):
+            return model
+        chat_model: Any = limiter.wrap_chat_model(model) if limiter is not None else model
+        # Only deterministic chat models give the same answer to the same prompt
+        if (
+            self._response_cache is not None
+            and getattr(provider_instance, "temperature", None) == 0
+        ):
+            return self._response_cache.wrap(chat_model, f"{model_id}:{model_name}")
+        return chat_model
+
+    def _get_limiter(
+        self, model_id: str, backend_key: str
+    ) -> Optional["AdaptiveConcurrencyLimiter"]:
+        """Get the concurrency limiter of a registered model, if the registry limits it.
+
+        Limiters are shared by backend_key, so registered models served by the same
+        backend share one limit, set by the first of them to be created.
+        """
+        max_concurrency = self._registry.get_max_concurrency(model_id)
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            return None
+        if backend_key not in self._limiters:
+            from .concurrency import AdaptiveConcurrencyLimiter
+
+            self._limiters[backend_key] = AdaptiveConcurrencyLimiter(
+                max_limit=max_concurrency, name=backend_key
+            )
+        return self._limiters[backend_key]
 
     def clear_cache(self) -> None:
-        self._model_cache.clear()
+        with self._cache_lock:
+            self._model_cache.clear()
 
     def get_cache_size(self) -> int:
         return len(self._model_cache)
@@ -3,10 +3,11 @@
 This mapping allows looking up provider classes by their string identifiers.
 """
 
-from ..providers import OpenAIProvider, OllamaProvider, TransformersProvider
+from ..providers import OnnxEmbeddingProvider, OpenAIProvider, OllamaProvider, TransformersProvider
 
 PROVIDER_MAP = {
     "openai": OpenAIProvider,
     "ollama": OllamaProvider,
     "transformers": TransformersProvider,
+    "onnx": OnnxEmbeddingProvider,
 }
@@ -0,0 +1,96 @@
+"""Benchmark of the ONNX Runtime embedding backend against PyTorch.
+
+Encodes the same job-like texts with HuggingFaceEmbeddings and with
+OnnxEmbeddings in full precision and int8, each backend in a fresh interpreter,
+and compares encode throughput, peak resident memory and how close the
+embeddings are to the PyTorch ones. Needs the backend's "onnx" extra and the
+embedding model, so it is skipped where they are not installed.
+
+Run with: pytest -m benchmark -s
+"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import Dict
+
+import numpy as np
+import pytest
+
+from job_agent_backend.model_providers.container import EMBEDDING_MODEL_NAME
+from job_agent_backend.model_providers.providers import OnnxEmbeddingProvider
+
+pytestmark = pytest.mark.benchmark
+
+TEXT_COUNT = 256
+BACKENDS = ("transformers", "onnx", "onnx-int8")
+
+_MEASURE_SCRIPT = """
+import json, resource, sys, time
+from job_agent_backend.model_providers.providers import OnnxEmbeddingProvider, TransformersProvider
+
+backend, model_name, count = sys.argv[1], sys.argv[2], int(sys.argv[3])
+if backend == "transformers":
+    provider = TransformersProvider(model_name=model_name, task="embedding")
+else:
+    provider = OnnxEmbeddingProvider(model_name=model_name, quantize=backend == "onnx-int8")
+model = provider.get_model()
+texts = [
+    f"Senior Python developer #{i}: Django, FastAPI, PostgreSQL, Docker and Kubernetes. "
+    * (1 + i % 4)
+    for i in range(count)
+]
+model.embed_documents(texts[:8])
+started = time.perf_counter()
+embeddings = model.embed_documents(texts)
+elapsed = time.perf_counter() - started
+print(json.dumps({
+    "texts_per_second": count / elapsed,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "embeddings": embeddings[:16],
+}))
+"""
+
+
+def _measure(backend: str) -> Dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _MEASURE_SCRIPT, backend, EMBEDDING_MODEL_NAME, str(TEXT_COUNT)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _min_cosine(first: list, second: list) -> float:
+    a, b = np.asarray(first), np.asarray(second)
+    cosines = (a * b).sum(axis=1) / (np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1))
+    return float(cosines.min())
+
+
+def test_onnx_backend_against_pytorch() -> None:
+    """The ONNX backends match PyTorch embeddings with less memory."""
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("sentence_transformers")
+    pytest.importorskip("langchain_huggingface")
+
+    # Export up front, so the measured processes only load the cached artifacts
+    for quantize in (False, True):
+        OnnxEmbeddingProvider(model_name=EMBEDDING_MODEL_NAME, quantize=quantize).get_model()
+
+    results = {backend: _measure(backend) for backend in BACKENDS}
+
+    baseline = results["transformers"]
+    print()
+    for backend, result in results.items():
+        print(
+            f"{backend:>12}: {result['texts_per_second']:8.1f} texts/s, "
+            f"peak RSS {result['peak_rss_mb']:7.1f} MB, min cosine to PyTorch "
+            f"{_min_cosine(result['embeddings'], baseline['embeddings']):.4f}"
+        )
+
+    assert _min_cosine(results["onnx"]["embeddings"], baseline["embeddings"]) > 0.999
+    assert _min_cosine(results["onnx-int8"]["embeddings"], baseline["embeddings"]) > 0.95
+    assert results["onnx-int8"]["peak_rss_mb"] < baseline["peak_rss_mb"]
@@ -0,0 +1,203 @@
+"""ONNX Runtime backend for sentence-transformer embedding models.
+
+HuggingFaceEmbeddings runs the encoder in full-precision PyTorch, which keeps the
+whole of torch in memory and leaves CPU throughput on the table. This module
+exports a sentence-transformer once to ONNX, optionally quantizing its weights to
+int8, caches the artifact on disk and serves embeddings through onnxruntime with
+a configurable number of intra-op threads.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional, Sequence
+
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "job-agent" / "onnx"
+DEFAULT_BATCH_SIZE = 32
+
+MODEL_FILE = "model.onnx"
+CONFIG_FILE = "embedding_config.json"
+_INPUT_NAMES = ("input_ids", "attention_mask")
+_OPSET_VERSION = 17
+
+
+def artifact_dir(cache_dir: Path, model_name: str, quantize: bool) -> Path:
+    """Get the directory holding the exported artifact of a model."""
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "--", model_name)
+    return Path(cache_dir) / (f"{slug}-int8" if quantize else slug)
+
+
+def export_sentence_transformer(model_name: str, cache_dir: Path, quantize: bool = False) -> Path:
+    """Export a sentence-transformer to ONNX unless its artifact is already cached.
+
+    The exported graph covers the whole sentence-transformer, pooling and dense
+    layers included, and maps token ids and attention mask to sentence embeddings.
+    The tokenizer is saved next to it, so serving needs neither torch nor
+    sentence-transformers.
+
+    Args:
+        model_name: Sentence-transformer model identifier
+        cache_dir: Directory where exported artifacts are cached
+        quantize: Whether to quantize the weights to int8 with dynamic quantization
+
+    Returns:
+        Directory holding the model, its tokenizer and its embedding config
+    """
+    target = artifact_dir(cache_dir, model_name, quantize)
+    if (target / MODEL_FILE).exists() and (target / CONFIG_FILE).exists():
+        return target
+
+    try:
+        import torch
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError(
+            "torch and sentence-transformers are needed to export the ONNX model. "
+            "Install them with: pip install torch sentence-transformers"
+        )
+
+    logger.info("Exporting %s to ONNX (int8: %s) in %s", model_name, quantize, target)
+    target.mkdir(parents=True, exist_ok=True)
+    sentence_model = SentenceTransformer(model_name, device="cpu").eval()
+
+    class SentenceEmbedding(torch.nn.Module):
+        def __init__(self) -> None:
+            super().__init__()
+            self.model = sentence_model
+
+        def forward(self, input_ids: Any, attention_mask: Any) -> Any:
+            features = {"input_ids": input_ids, "attention_mask": attention_mask}
+            return self.model(features)["sentence_embedding"]
+
+    dummy = sentence_model.tokenizer(["warm-up"], return_tensors="pt")
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in _INPUT_NAMES}
+    dynamic_axes["sentence_embedding"] = {0: "batch"}
+
+    with tempfile.TemporaryDirectory(dir=target) as work_dir:
+        exported = Path(work_dir) / MODEL_FILE
+        with torch.no_grad():
+            torch.onnx.export(
+                SentenceEmbedding(),
+                tuple(dummy[name] for name in _INPUT_NAMES),
+                str(exported),
+                input_names=list(_INPUT_NAMES),
+                output_names=["sentence_embedding"],
+                dynamic_axes=dynamic_axes,
+                opset_version=_OPSET_VERSION,
+                dynamo=False,
+            )
+        if quantize:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            quantized = Path(work_dir) / f"int8-{MODEL_FILE}"
+            quantize_dynamic(str(exported), str(quantized), weight_type=QuantType.QInt8)
+            exported = quantized
+
+        sentence_model.tokenizer.save_pretrained(str(target))
+        config = {"model_name": model_name, "max_length": sentence_model.max_seq_length}
+        (target / CONFIG_FILE).write_text(json.dumps(config))
+        # Written last and atomically, so an interrupted export is redone next time
+        os.replace(exported, target / MODEL_FILE)
+
+    return target
+
+
+class OnnxEmbeddings(Embeddings):
+    """Sentence-transformer embeddings served by onnxruntime.
+
+    Texts are encoded in batches of similar length, so short texts are not padded
+    to the length of the longest text of the call.
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        tokenizer: Any,
+        max_length: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialize the embeddings.
+
+        Args:
+            session: onnxruntime InferenceSession of an exported model
+            tokenizer: Tokenizer of the exported model
+            max_length: Tokens kept per text, longer texts are truncated
+            batch_size: Texts encoded per inference call
+
+        Raises:
+            ValueError: If batch_size is not positive
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self.session = session
+        self.tokenizer = tokenizer
+        self.max_length = max_length
+        self.batch_size = batch_size
+        self._input_names = {model_input.name for model_input in session.get_inputs()}
+
+    @classmethod
+    def from_artifact(
+        cls,
+        model_dir: Path,
+        intra_op_threads: int = 0,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> "OnnxEmbeddings":
+        """Load embeddings from an artifact written by export_sentence_transformer.
+
+        Args:
+            model_dir: Directory holding the exported model
+            intra_op_threads: Threads used within one inference call, 0 lets
+                              onnxruntime decide
+            batch_size: Texts encoded per inference call
+        """
+        import onnxruntime
+        from transformers import AutoTokenizer
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = intra_op_threads
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session = onnxruntime.InferenceSession(
+            str(Path(model_dir) / MODEL_FILE),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        config = json.loads((Path(model_dir) / CONFIG_FILE).read_text())
+        tokenizer = AutoTokenizer.from_pretrained(str(model_dir))
+        return cls(session, tokenizer, max_length=config.get("max_length"), batch_size=batch_size)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, returning their embeddings in the order of texts."""
+        order = sorted(range(len(texts)), key=lambda index: len(texts[index]))
+        embeddings: List[List[float]] = [[] for _ in texts]
+        for start in range(0, len(order), self.batch_size):
+            batch = order[start : start + self.batch_size]
+            for index, embedding in zip(batch, self._encode([texts[i] for i in batch])):
+                embeddings[index] = embedding
+        return embeddings
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single text."""
+        return self._encode([text])[0]
+
+    def _encode(self, texts: Sequence[str]) -> List[List[float]]:
+        encoded = self.tokenizer(
+            list(texts),
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="np",
+        )
+        inputs = {
+            name: encoded[name].astype("int64")
+            for name in _INPUT_NAMES
+            if name in self._input_names
+        }
+        (embeddings,) = self.session.run(None, inputs)
+        return embeddings.tolist()
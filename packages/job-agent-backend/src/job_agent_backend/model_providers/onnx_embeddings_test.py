@@ -0,0 +1,107 @@
+"""Tests for the ONNX Runtime embedding backend."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from job_agent_backend.model_providers.onnx_embeddings import (
+    CONFIG_FILE,
+    MODEL_FILE,
+    OnnxEmbeddings,
+    artifact_dir,
+    export_sentence_transformer,
+)
+
+
+class FakeTokenizer:
+    """Tokenizer mapping every word to id 1, padding to the longest text."""
+
+    def __init__(self) -> None:
+        self.batches: List[List[str]] = []
+
+    def __call__(self, texts: List[str], **kwargs: Any) -> Dict[str, np.ndarray]:
+        self.batches.append(texts)
+        lengths = [len(text.split()) for text in texts]
+        width = max(lengths)
+        mask = np.array([[1] * n + [0] * (width - n) for n in lengths], dtype=np.int32)
+        return {"input_ids": mask.copy(), "attention_mask": mask, "token_type_ids": mask * 0}
+
+
+class FakeSession:
+    """Session embedding a text as [word count, padded width]."""
+
+    def __init__(self) -> None:
+        self.feeds: List[Dict[str, np.ndarray]] = []
+
+    def get_inputs(self) -> List[SimpleNamespace]:
+        return [SimpleNamespace(name="input_ids"), SimpleNamespace(name="attention_mask")]
+
+    def run(self, output_names: Any, feed: Dict[str, np.ndarray]) -> List[np.ndarray]:
+        self.feeds.append(feed)
+        mask = feed["attention_mask"]
+        width = np.full(mask.shape[0], mask.shape[1])
+        return [np.stack([mask.sum(axis=1), width], axis=1).astype(np.float32)]
+
+
+class TestOnnxEmbeddings:
+    """Tests for OnnxEmbeddings."""
+
+    def test_embeddings_keep_the_order_of_texts(self) -> None:
+        embeddings = OnnxEmbeddings(FakeSession(), FakeTokenizer(), batch_size=2)
+
+        result = embeddings.embed_documents(["a b c", "a", "a b c d", "a b"])
+
+        assert [vector[0] for vector in result] == [3.0, 1.0, 4.0, 2.0]
+
+    def test_texts_are_batched_by_length(self) -> None:
+        tokenizer = FakeTokenizer()
+        embeddings = OnnxEmbeddings(FakeSession(), tokenizer, batch_size=2)
+
+        result = embeddings.embed_documents(["a b c", "a", "a b c d", "a b"])
+
+        assert tokenizer.batches == [["a", "a b"], ["a b c", "a b c d"]]
+        # Short texts are padded only to the longest text of their batch
+        assert result[1] == [1.0, 2.0]
+
+    def test_only_model_inputs_are_fed(self) -> None:
+        session = FakeSession()
+
+        OnnxEmbeddings(session, FakeTokenizer()).embed_query("python developer")
+
+        assert set(session.feeds[0]) == {"input_ids", "attention_mask"}
+        assert session.feeds[0]["input_ids"].dtype == np.int64
+
+    def test_embed_query_returns_one_vector(self) -> None:
+        embeddings = OnnxEmbeddings(FakeSession(), FakeTokenizer())
+
+        assert embeddings.embed_query("python developer") == [2.0, 2.0]
+
+    def test_rejects_non_positive_batch_size(self) -> None:
+        with pytest.raises(ValueError):
+            OnnxEmbeddings(FakeSession(), FakeTokenizer(), batch_size=0)
+
+
+class TestExportSentenceTransformer:
+    """Tests for export_sentence_transformer."""
+
+    def test_artifacts_are_kept_apart_by_model_and_quantization(self, tmp_path: Path) -> None:
+        full = artifact_dir(tmp_path, "sentence-transformers/model", quantize=False)
+        int8 = artifact_dir(tmp_path, "sentence-transformers/model", quantize=True)
+
+        assert full.parent == int8.parent == tmp_path
+        assert full != int8
+        assert "/" not in full.name
+
+    def test_cached_artifact_is_reused(self, tmp_path: Path) -> None:
+        target = artifact_dir(tmp_path, "model", quantize=True)
+        target.mkdir(parents=True)
+        (target / MODEL_FILE).write_bytes(b"onnx")
+        (target / CONFIG_FILE).write_text("{}")
+
+        # Exporting would need torch, so a cache hit must not import it
+        with patch.dict("sys.modules", {"torch": None, "sentence_transformers": None}):
+            assert export_sentence_transformer("model", tmp_path, quantize=True) == target
@@ -5,6 +5,7 @@ from .base import BaseModelProvider
 from .openai import OpenAIProvider
 from .ollama import OllamaProvider
 from .transformers import TransformersProvider
+from .onnx import OnnxEmbeddingProvider
 
 __all__ = [
     "IModelProvider",
@@ -12,4 +13,5 @@ __all__ = [
     "OpenAIProvider",
     "OllamaProvider",
     "TransformersProvider",
+    "OnnxEmbeddingProvider",
 ]
@@ -36,5 +36,24 @@ class BaseModelProvider(IModelProvider):
         """
         pass
 
+    @property
+    def cache_namespace(self) -> str:
+        """Name keeping cached outputs of this provider apart from other providers'.
+
+        Defaults to the model name. Providers serving the same model in ways that
+        produce different outputs include what sets them apart.
+        """
+        return self.model_name
+
+    @property
+    def concurrency_key(self) -> str:
+        """Name of the backend that serves this provider's calls.
+
+        Registered models with the same key share one concurrency limit, so a
+        backend serving several registrations is not sent more calls than one
+        limit allows. Defaults to the provider class and model name.
+        """
+        return f"{self.__class__.__name__}:{self.model_name}"
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(model={self.model_name}, temp={self.temperature})"
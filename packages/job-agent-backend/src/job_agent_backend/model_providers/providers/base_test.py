@@ -40,6 +40,16 @@ class TestBaseModelProvider:
 
         assert provider.kwargs == {}
 
+    def test_cache_namespace_defaults_to_model_name(self) -> None:
+        provider = ConcreteProvider(model_name="test-model")
+
+        assert provider.cache_namespace == "test-model"
+
+    def test_concurrency_key_names_provider_and_model(self) -> None:
+        provider = ConcreteProvider(model_name="test-model")
+
+        assert provider.concurrency_key == "ConcreteProvider:test-model"
+
     def test_repr_returns_formatted_string(self) -> None:
         provider = ConcreteProvider(model_name="test-model", temperature=0.5)
 
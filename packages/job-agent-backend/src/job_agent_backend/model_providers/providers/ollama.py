@@ -28,6 +28,11 @@ class OllamaProvider(BaseModelProvider):
         super().__init__(model_name, temperature, **kwargs)
         self.base_url = base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 
+    @property
+    def concurrency_key(self) -> str:
+        """Provider, model name and server, since each Ollama server queues its own calls."""
+        return f"{super().concurrency_key}@{self.base_url}"
+
     def get_model(self) -> ModelInstance:
         """Get ChatOllama model instance."""
         try:
@@ -29,6 +29,15 @@ class TestOllamaProviderInit:
 
         assert provider.base_url == "http://param:9090"
 
+    def test_concurrency_key_includes_base_url(self) -> None:
+        first = OllamaProvider(model_name="phi3:mini", base_url="http://one:11434")
+        same = OllamaProvider(model_name="phi3:mini", temperature=0.5, base_url="http://one:11434")
+        other = OllamaProvider(model_name="phi3:mini", base_url="http://two:11434")
+
+        assert first.concurrency_key == "OllamaProvider:phi3:mini@http://one:11434"
+        assert same.concurrency_key == first.concurrency_key
+        assert other.concurrency_key != first.concurrency_key
+
     def test_stores_model_name(self) -> None:
         provider = OllamaProvider(model_name="phi3:mini")
 
@@ -0,0 +1,72 @@
+"""ONNX Runtime provider for sentence-transformer embeddings."""
+
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from .base import BaseModelProvider
+from ..contracts.provider_interface import ModelInstance
+
+
+class OnnxEmbeddingProvider(BaseModelProvider):
+    """Embedding provider serving a sentence-transformer through onnxruntime.
+
+    The model is exported to ONNX on first use and the artifact is cached on disk,
+    so later processes load it without torch. Embeddings implement the same
+    interface as HuggingFaceEmbeddings.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        temperature: float = 0.0,
+        quantize: bool = False,
+        cache_dir: Optional[str] = None,
+        intra_op_threads: Optional[int] = None,
+        batch_size: int = 32,
+        **kwargs: Any,
+    ):
+        """Initialize ONNX embedding provider.
+
+        Args:
+            model_name: Sentence-transformer model identifier
+            temperature: Unused, embeddings are deterministic
+            quantize: Whether to quantize the weights to int8 with dynamic quantization
+            cache_dir: Directory for exported models (defaults to ONNX_CACHE_DIR env var
+                       or ~/.cache/job-agent/onnx)
+            intra_op_threads: Threads used within one inference call (defaults to
+                              ONNX_INTRA_OP_THREADS env var or 0, letting onnxruntime decide)
+            batch_size: Texts encoded per inference call
+            **kwargs: Additional provider-specific parameters
+        """
+        from ..onnx_embeddings import DEFAULT_CACHE_DIR
+
+        super().__init__(model_name, temperature, **kwargs)
+        self.quantize = quantize
+        self.cache_dir = Path(cache_dir or os.getenv("ONNX_CACHE_DIR", "") or DEFAULT_CACHE_DIR)
+        self.intra_op_threads = (
+            intra_op_threads
+            if intra_op_threads is not None
+            else int(os.getenv("ONNX_INTRA_OP_THREADS", "0"))
+        )
+        self.batch_size = batch_size
+
+    @property
+    def cache_namespace(self) -> str:
+        """Model name and runtime, since ONNX and int8 vectors differ from PyTorch's."""
+        return f"{self.model_name}:{'onnx-int8' if self.quantize else 'onnx'}"
+
+    def get_model(self) -> ModelInstance:
+        """Get OnnxEmbeddings instance, exporting the model first if needed."""
+        try:
+            import onnxruntime  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "onnxruntime not installed. Install it with: pip install onnxruntime onnx"
+            )
+        from ..onnx_embeddings import OnnxEmbeddings, export_sentence_transformer
+
+        model_dir = export_sentence_transformer(self.model_name, self.cache_dir, self.quantize)
+        return OnnxEmbeddings.from_artifact(
+            model_dir, intra_op_threads=self.intra_op_threads, batch_size=self.batch_size
+        )
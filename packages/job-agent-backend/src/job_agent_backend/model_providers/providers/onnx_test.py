@@ -0,0 +1,80 @@
+"""Tests for OnnxEmbeddingProvider class."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from job_agent_backend.model_providers.providers.onnx import OnnxEmbeddingProvider
+
+
+class TestOnnxEmbeddingProviderInit:
+    """Tests for OnnxEmbeddingProvider initialization."""
+
+    def test_uses_full_precision_by_default(self) -> None:
+        provider = OnnxEmbeddingProvider(model_name="sentence-transformers/all-MiniLM-L6-v2")
+
+        assert provider.quantize is False
+
+    def test_uses_cache_dir_from_environment(self) -> None:
+        with patch.dict(os.environ, {"ONNX_CACHE_DIR": "/tmp/onnx"}):
+            provider = OnnxEmbeddingProvider(model_name="model")
+
+        assert provider.cache_dir == Path("/tmp/onnx")
+
+    def test_uses_intra_op_threads_from_environment(self) -> None:
+        with patch.dict(os.environ, {"ONNX_INTRA_OP_THREADS": "4"}):
+            provider = OnnxEmbeddingProvider(model_name="model")
+
+        assert provider.intra_op_threads == 4
+
+    def test_parameters_override_environment(self) -> None:
+        with patch.dict(os.environ, {"ONNX_CACHE_DIR": "/tmp/env", "ONNX_INTRA_OP_THREADS": "4"}):
+            provider = OnnxEmbeddingProvider(
+                model_name="model", cache_dir="/tmp/param", intra_op_threads=2
+            )
+
+        assert provider.cache_dir == Path("/tmp/param")
+        assert provider.intra_op_threads == 2
+
+    def test_cache_namespace_names_the_runtime(self) -> None:
+        assert OnnxEmbeddingProvider(model_name="model").cache_namespace == "model:onnx"
+        assert (
+            OnnxEmbeddingProvider(model_name="model", quantize=True).cache_namespace
+            == "model:onnx-int8"
+        )
+
+
+class TestOnnxEmbeddingProviderGetModel:
+    """Tests for OnnxEmbeddingProvider.get_model."""
+
+    def test_loads_exported_artifact(self) -> None:
+        provider = OnnxEmbeddingProvider(
+            model_name="model", quantize=True, cache_dir="/tmp/onnx", intra_op_threads=2
+        )
+
+        with (
+            patch.dict("sys.modules", {"onnxruntime": MagicMock()}),
+            patch(
+                "job_agent_backend.model_providers.onnx_embeddings.export_sentence_transformer",
+                return_value=Path("/tmp/onnx/model-int8"),
+            ) as mock_export,
+            patch(
+                "job_agent_backend.model_providers.onnx_embeddings.OnnxEmbeddings.from_artifact"
+            ) as mock_load,
+        ):
+            result = provider.get_model()
+
+        mock_export.assert_called_once_with("model", Path("/tmp/onnx"), True)
+        mock_load.assert_called_once_with(
+            Path("/tmp/onnx/model-int8"), intra_op_threads=2, batch_size=32
+        )
+        assert result == mock_load.return_value
+
+    def test_raises_when_onnxruntime_is_missing(self) -> None:
+        provider = OnnxEmbeddingProvider(model_name="model")
+
+        with patch.dict("sys.modules", {"onnxruntime": None}):
+            with pytest.raises(ImportError, match="onnxruntime"):
+                provider.get_model()
@@ -9,11 +9,22 @@ from .contracts.registry_interface import IModelRegistry
 class ModelRegistry(IModelRegistry):
     """Registry for pre-configured model providers."""
 
-    def __init__(self, providers: List[tuple[str, IModelProvider]]) -> None:
-        """Initialize registry with list of (model_id, provider) tuples."""
+    def __init__(
+        self,
+        providers: List[tuple[str, IModelProvider]],
+        max_concurrency: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """Initialize registry with list of (model_id, provider) tuples.
+
+        Args:
+            providers: Pre-configured (model_id, provider) pairs
+            max_concurrency: Optional most concurrent calls allowed per model ID.
+                             Models left out are not limited.
+        """
         self._providers: Dict[str, IModelProvider] = {
             model_id: provider for model_id, provider in providers
         }
+        self._max_concurrency: Dict[str, int] = dict(max_concurrency or {})
 
     def get(self, model_id: str) -> Optional[IModelProvider]:
         """Get a provider by model ID."""
@@ -26,6 +37,10 @@ class ModelRegistry(IModelRegistry):
             raise ValueError(f"Model '{model_id}' not found")
         return provider.get_model()
 
+    def get_max_concurrency(self, model_id: str) -> Optional[int]:
+        """Get the most concurrent calls allowed for a model ID, if limited."""
+        return self._max_concurrency.get(model_id)
+
     def list_models(self) -> List[str]:
         """List all registered model IDs."""
         return list(self._providers.keys())
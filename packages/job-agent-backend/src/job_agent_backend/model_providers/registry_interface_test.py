@@ -65,3 +65,15 @@ class TestModelRegistryBehavior:
         result = registry.list_models()
 
         assert set(result) == {"model1", "model2"}
+
+    def test_model_registry_get_max_concurrency(self) -> None:
+        """ModelRegistry.get_max_concurrency() returns configured limits only."""
+        from job_agent_backend.model_providers.registry import ModelRegistry
+
+        registry = ModelRegistry(
+            [("model1", MagicMock()), ("model2", MagicMock())],
+            max_concurrency={"model1": 4},
+        )
+
+        assert registry.get_max_concurrency("model1") == 4
+        assert registry.get_max_concurrency("model2") is None
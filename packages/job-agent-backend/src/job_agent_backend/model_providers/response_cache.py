@@ -0,0 +1,274 @@
+"""Cache for responses of deterministic chat models.
+
+Skill extraction, keyword extraction and PII removal run at temperature 0, yet
+re-posted jobs and searches re-run after a failure send the exact same prompts
+again. ResponseCache remembers parsed responses by a hash of the model, the
+rendered messages and the structured-output schema, in an in-memory LRU tier and
+optionally in a persistent store, so repeated prompts skip the model entirely.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
+
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from langchain_core.messages import (
+    BaseMessage,
+    HumanMessage,
+    convert_to_messages,
+    message_to_dict,
+    messages_from_dict,
+    messages_to_dict,
+)
+from langchain_core.prompt_values import PromptValue
+from langchain_core.runnables import Runnable, RunnableConfig
+from pydantic import BaseModel
+
+from job_agent_platform_contracts import CacheStats
+
+if TYPE_CHECKING:
+    from .concurrency import LimitedChatModel
+
+from .contracts.response_store_interface import IResponseStore
+
+logger = logging.getLogger(__name__)
+
+# Number of responses kept in memory before the least recently used ones are dropped
+DEFAULT_MAX_ENTRIES = 1_000
+
+
+class ResponseCache:
+    """Thread-safe two-tier cache of serialized model responses."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        store: Optional[IResponseStore] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Number of responses kept in memory before the least
+                         recently used ones are dropped
+            store: Optional persistent store backing the in-memory tier
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._store = store
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> CacheStats:
+        """Get the number of hits and misses counted so far."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def wrap(
+        self, model: Union[BaseChatModel, "LimitedChatModel"], namespace: str
+    ) -> "CachedChatModel":
+        """Return model answering repeated prompts through this cache.
+
+        Args:
+            model: Chat model computing cache misses. It must be deterministic.
+            namespace: Name of the model, keeping its entries apart from other models'
+        """
+        return CachedChatModel(model, self, namespace)
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Get the cached response for key, reading the store on a memory miss."""
+        value = self._lookup_memory(key)
+        if value is None and self._store is not None:
+            value = self._lookup_store(key)
+        self._count(value is not None)
+        return value
+
+    async def alookup(self, key: str) -> Optional[str]:
+        """Async variant of lookup, reading the store in a worker thread."""
+        value = self._lookup_memory(key)
+        if value is None and self._store is not None:
+            value = await asyncio.to_thread(self._lookup_store, key)
+        self._count(value is not None)
+        return value
+
+    def record(self, key: str, value: str) -> None:
+        """Cache a fresh response in memory and in the store."""
+        self._remember(key, value)
+        self._persist(key, value)
+
+    async def arecord(self, key: str, value: str) -> None:
+        """Async variant of record, writing the store in a worker thread."""
+        self._remember(key, value)
+        if self._store is not None:
+            await asyncio.to_thread(self._persist, key, value)
+
+    def _lookup_memory(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _lookup_store(self, key: str) -> Optional[str]:
+        assert self._store is not None
+        try:
+            value = self._store.get(key)
+        except Exception as e:
+            logger.warning("Reading cached model response failed - %s", e)
+            return None
+        if value is not None:
+            self._remember(key, value)
+        return value
+
+    def _remember(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _persist(self, key: str, value: str) -> None:
+        if self._store is None:
+            return
+        try:
+            self._store.put(key, value)
+        except Exception as e:
+            logger.warning("Storing model response failed - %s", e)
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+class _CachedRunnable(Runnable[LanguageModelInput, Any]):
+    """Runnable answering repeated prompts of an inner runnable from a ResponseCache."""
+
+    def __init__(
+        self,
+        runnable: Runnable[LanguageModelInput, Any],
+        cache: ResponseCache,
+        namespace: str,
+        dump: Callable[[Any], Optional[str]],
+        load: Callable[[str], Any],
+    ) -> None:
+        self._runnable = runnable
+        self._cache = cache
+        self._namespace = namespace
+        self._dump = dump
+        self._load = load
+
+    def invoke(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        key = _response_key(self._namespace, input)
+        cached = self._cache.lookup(key)
+        if cached is not None:
+            return self._load(cached)
+        result = self._runnable.invoke(input, config, **kwargs)
+        value = self._dump(result)
+        if value is not None:
+            self._cache.record(key, value)
+        return result
+
+    async def ainvoke(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> Any:
+        key = _response_key(self._namespace, input)
+        cached = await self._cache.alookup(key)
+        if cached is not None:
+            return self._load(cached)
+        result = await self._runnable.ainvoke(input, config, **kwargs)
+        value = self._dump(result)
+        if value is not None:
+            await self._cache.arecord(key, value)
+        return result
+
+
+class CachedChatModel(_CachedRunnable):
+    """Chat model answering repeated prompts from a ResponseCache.
+
+    Plain calls cache the returned message. Structured-output calls cache the
+    parsed result, keyed additionally by the output schema, so changing a schema
+    never returns results parsed for the previous one.
+    """
+
+    def __init__(
+        self,
+        model: Union[BaseChatModel, "LimitedChatModel"],
+        cache: ResponseCache,
+        namespace: str,
+    ) -> None:
+        super().__init__(model, cache, namespace, _dump_message, _load_message)
+        self.model = model
+
+    def with_structured_output(
+        self, schema: Any, **kwargs: Any
+    ) -> Runnable[LanguageModelInput, Any]:
+        structured = self.model.with_structured_output(schema, **kwargs)
+        if kwargs.get("include_raw"):
+            # Raw messages come with parsing errors, not worth replaying
+            return structured
+        namespace = f"{self._namespace}:{_schema_key(schema, kwargs)}"
+        return _CachedRunnable(
+            structured, self._cache, namespace, _dump_result, _result_loader(schema)
+        )
+
+
+def _response_key(namespace: str, input: LanguageModelInput) -> str:
+    if isinstance(input, PromptValue):
+        messages = input.to_messages()
+    elif isinstance(input, str):
+        messages = [HumanMessage(content=input)]
+    else:
+        messages = convert_to_messages(input)
+    rendered = json.dumps(messages_to_dict(messages), sort_keys=True, default=str)
+    return hashlib.sha256(f"{namespace}\n{rendered}".encode("utf-8")).hexdigest()
+
+
+def _schema_key(schema: Any, kwargs: Dict[str, Any]) -> str:
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        description: Any = schema.model_json_schema()
+    else:
+        description = schema
+    rendered = json.dumps([description, kwargs], sort_keys=True, default=repr)
+    return hashlib.sha256(rendered.encode("utf-8")).hexdigest()
+
+
+def _dump_message(message: Any) -> Optional[str]:
+    if not isinstance(message, BaseMessage):
+        return None
+    return json.dumps(message_to_dict(message))
+
+
+def _load_message(value: str) -> BaseMessage:
+    return messages_from_dict([json.loads(value)])[0]
+
+
+def _dump_result(result: Any) -> Optional[str]:
+    # None means the model output could not be parsed - ask again next time
+    if result is None:
+        return None
+    if isinstance(result, BaseModel):
+        return result.model_dump_json()
+    try:
+        return json.dumps(result)
+    except (TypeError, ValueError):
+        return None
+
+
+def _result_loader(schema: Any) -> Callable[[str], Any]:
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        return schema.model_validate_json
+    return json.loads
@@ -0,0 +1,207 @@
+"""Tests for the model response cache."""
+
+import asyncio
+from typing import Any, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import BaseModel
+
+from job_agent_backend.model_providers.factory import ModelFactory
+from job_agent_backend.model_providers.response_cache import CachedChatModel, ResponseCache
+from job_agent_backend.model_providers.response_store import SQLiteResponseStore
+
+PROMPT = ChatPromptTemplate.from_messages([("system", "Extract skills"), ("human", "{text}")])
+
+
+class Skills(BaseModel):
+    skills: List[str]
+
+
+class Keywords(BaseModel):
+    keywords: List[str]
+
+
+class StructuredFakeChatModel(FakeListChatModel):
+    """Fake chat model whose structured output lists the words of the last message."""
+
+    structured_calls: int = 0
+
+    def with_structured_output(self, schema: Any, **kwargs: Any) -> Runnable[Any, Any]:
+        def parse(prompt: Any) -> Any:
+            self.structured_calls += 1
+            words = str(prompt.to_messages()[-1].content).split()
+            return schema(**{next(iter(schema.model_fields)): words})
+
+        return RunnableLambda(parse)
+
+
+def _model(responses: Optional[List[str]] = None) -> StructuredFakeChatModel:
+    return StructuredFakeChatModel(responses=responses or ["first", "second", "third"])
+
+
+class TestResponseCache:
+    """Tests for ResponseCache and CachedChatModel."""
+
+    def test_repeated_prompts_skip_the_model(self) -> None:
+        model = _model()
+        cache = ResponseCache()
+        structured = cache.wrap(model, "skills").with_structured_output(Skills)
+
+        first = structured.invoke(PROMPT.invoke({"text": "python django"}))
+        second = structured.invoke(PROMPT.invoke({"text": "python django"}))
+        other = structured.invoke(PROMPT.invoke({"text": "go"}))
+
+        assert first == second == Skills(skills=["python", "django"])
+        assert other == Skills(skills=["go"])
+        assert model.structured_calls == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert cache.stats() == {"hits": 1, "misses": 2}
+
+    def test_entries_are_keyed_by_schema(self) -> None:
+        model = _model()
+        cached = ResponseCache().wrap(model, "skills")
+        prompt = PROMPT.invoke({"text": "python"})
+
+        skills = cached.with_structured_output(Skills).invoke(prompt)
+        keywords = cached.with_structured_output(Keywords).invoke(prompt)
+
+        assert skills == Skills(skills=["python"])
+        assert keywords == Keywords(keywords=["python"])
+        assert model.structured_calls == 2
+
+    def test_entries_are_keyed_by_model(self) -> None:
+        cache = ResponseCache()
+        prompt = PROMPT.invoke({"text": "python"})
+        old_model, new_model = _model(), _model()
+
+        cache.wrap(old_model, "old").with_structured_output(Skills).invoke(prompt)
+        cache.wrap(new_model, "new").with_structured_output(Skills).invoke(prompt)
+
+        assert new_model.structured_calls == 1
+
+    def test_plain_responses_are_cached_as_messages(self) -> None:
+        model = _model(["anonymized"])
+        cached = ResponseCache().wrap(model, "pii")
+        messages = PROMPT.format_messages(text="John Smith")
+
+        first = cached.invoke(messages)
+        second = cached.invoke(messages)
+
+        assert isinstance(second, AIMessage)
+        assert second.content == first.content == "anonymized"
+
+    def test_unparsed_results_are_not_cached(self) -> None:
+        model = MagicMock(spec=BaseChatModel)
+        structured = model.with_structured_output.return_value
+        structured.invoke.return_value = None
+        cached = ResponseCache().wrap(model, "skills").with_structured_output(Skills)
+
+        cached.invoke("python")
+        cached.invoke("python")
+
+        assert structured.invoke.call_count == 2
+
+    def test_store_serves_responses_across_caches(self, tmp_path) -> None:
+        path = tmp_path / "cache" / "responses.sqlite3"
+        prompt = PROMPT.invoke({"text": "python"})
+        first_store = SQLiteResponseStore(path)
+        ResponseCache(store=first_store).wrap(_model(), "m").with_structured_output(Skills).invoke(
+            prompt
+        )
+        first_store.close()
+
+        model = _model()
+        cache = ResponseCache(store=SQLiteResponseStore(path))
+        result = cache.wrap(model, "m").with_structured_output(Skills).invoke(prompt)
+
+        assert result == Skills(skills=["python"])
+        assert model.structured_calls == 0
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_store_failures_fall_back_to_the_model(self) -> None:
+        store = MagicMock()
+        store.get.side_effect = RuntimeError("disk full")
+        store.put.side_effect = RuntimeError("disk full")
+        model = _model()
+        structured = ResponseCache(store=store).wrap(model, "m").with_structured_output(Skills)
+
+        structured.invoke(PROMPT.invoke({"text": "python"}))
+        structured.invoke(PROMPT.invoke({"text": "python"}))
+
+        assert model.structured_calls == 1
+
+    def test_async_invocation_uses_the_cache(self) -> None:
+        model = _model()
+        cache = ResponseCache()
+        structured = cache.wrap(model, "m").with_structured_output(Skills)
+        prompt = PROMPT.invoke({"text": "python"})
+
+        async def extract() -> tuple[Any, Any]:
+            return await structured.ainvoke(prompt), await structured.ainvoke(prompt)
+
+        first, second = asyncio.run(extract())
+
+        assert first == second == Skills(skills=["python"])
+        assert model.structured_calls == 1
+
+    def test_rejects_non_positive_size(self) -> None:
+        with pytest.raises(ValueError, match="max_entries"):
+            ResponseCache(max_entries=0)
+
+
+class TestSQLiteResponseStore:
+    """Tests for SQLiteResponseStore."""
+
+    def test_evicts_least_recently_used_responses_beyond_size(self, tmp_path) -> None:
+        store = SQLiteResponseStore(tmp_path / "responses.sqlite3", max_bytes=10)
+
+        store.put("a", "aaaa")
+        store.put("b", "bbbb")
+        assert store.get("a") == "aaaa"
+        store.put("c", "cccc")
+
+        assert store.get("b") is None
+        assert store.get("a") == "aaaa"
+        assert store.get("c") == "cccc"
+
+    def test_replacing_a_response_counts_its_new_size(self, tmp_path) -> None:
+        store = SQLiteResponseStore(tmp_path / "responses.sqlite3", max_bytes=10)
+
+        store.put("a", "aaaa")
+        store.put("a", "aaaaa")
+        store.put("b", "bbbbb")
+
+        assert store.get("a") == "aaaaa"
+        assert store.get("b") == "bbbbb"
+
+
+class TestModelFactoryResponseCache:
+    """ModelFactory wraps deterministic registered chat models with the cache."""
+
+    def _factory(self, model: object, temperature: float) -> ModelFactory:
+        provider = MagicMock()
+        provider.model_name = "phi3:mini"
+        provider.temperature = temperature
+        provider.get_model.return_value = model
+        registry = MagicMock()
+        registry.get.return_value = provider
+        return ModelFactory(registry=registry, provider_map={}, response_cache=ResponseCache())
+
+    def test_deterministic_chat_model_goes_through_the_cache(self) -> None:
+        model = _model()
+
+        cached = self._factory(model, temperature=0.0).get_model(model_id="skill-extraction")
+
+        assert isinstance(cached, CachedChatModel)
+        assert cached.model is model
+
+    def test_sampling_chat_model_is_not_wrapped(self) -> None:
+        model = _model()
+
+        assert self._factory(model, temperature=0.7).get_model(model_id="chat") is model
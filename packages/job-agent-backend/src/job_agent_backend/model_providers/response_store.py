@@ -0,0 +1,109 @@
+"""Local file store for model responses."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from .contracts.response_store_interface import IResponseStore
+
+# Size of the stored responses before the least recently used ones are evicted
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class SQLiteResponseStore(IResponseStore):
+    """Response store backed by a local SQLite file with size-based eviction.
+
+    Once the stored responses exceed max_bytes, the least recently used ones are
+    deleted until the rest fit again. The database is opened on first use and
+    shared by all threads.
+    """
+
+    def __init__(self, path: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Initialize the store.
+
+        Args:
+            path: Path of the SQLite file. Missing parent directories are created.
+            max_bytes: Total size of the stored responses kept before eviction
+
+        Raises:
+            ValueError: If max_bytes is not positive
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self._path = Path(path).expanduser()
+        self._max_bytes = max_bytes
+        self._connection: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            with connection:
+                connection.execute(
+                    "UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key)
+                )
+            return str(row[0])
+
+    def put(self, key: str, value: str) -> None:
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                row = connection.execute(
+                    "SELECT size FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, size, used_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, value, size, time.time()),
+                )
+                self._total_bytes += size - (row[0] if row else 0)
+                if self._total_bytes > self._max_bytes:
+                    self._evict(connection)
+
+    def close(self) -> None:
+        """Close the database connection. The store reopens it on next use."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete the least recently used responses not fitting in max_bytes."""
+        connection.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM ("
+            "SELECT key, SUM(size) OVER (ORDER BY used_at DESC, key) AS kept FROM responses"
+            ") WHERE kept > ?)",
+            (self._max_bytes,),
+        )
+        self._total_bytes = self._stored_bytes(connection)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._path, check_same_thread=False)
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, "
+                    "value TEXT NOT NULL, "
+                    "size INTEGER NOT NULL, "
+                    "used_at REAL NOT NULL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS ix_responses_used_at ON responses (used_at)"
+                )
+            self._total_bytes = self._stored_bytes(connection)
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def _stored_bytes(connection: sqlite3.Connection) -> int:
+        return int(connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0])
@@ -4,8 +4,9 @@ This module provides the EssaySearchService class that wraps repository operatio
 and adds automatic embedding generation for hybrid search functionality.
 """
 
+import functools
 import logging
-import threading
+from concurrent.futures import wait
 from typing import List, Optional, Tuple
 
 from job_agent_platform_contracts.essay_repository import (
@@ -17,9 +18,13 @@ from job_agent_platform_contracts.essay_repository import (
 )
 
 from job_agent_backend.contracts import IModelFactory, IKeywordGenerator, IEssaySearchService
+from job_agent_backend.core.work_queue import WorkPriority, WorkQueue
 
 logger = logging.getLogger(__name__)
 
+# Pending essays embedded with one model call and written with one update
+BACKFILL_PAGE_SIZE = 64
+
 
 class EssaySearchService(IEssaySearchService):
     """Service that provides hybrid search and auto-embedding for essays.
@@ -34,6 +39,7 @@ class EssaySearchService(IEssaySearchService):
         repository: IEssayRepository,
         model_factory: IModelFactory,
         keyword_generator: IKeywordGenerator,
+        work_queue: Optional[WorkQueue] = None,
     ):
         """Initialize the search service.
 
@@ -42,10 +48,13 @@ class EssaySearchService(IEssaySearchService):
             model_factory: Factory for retrieving embedding model
             keyword_generator: Optional keyword generator for automatic
                 keyword extraction on essay creation
+            work_queue: Queue running embedding and keyword generation, shared
+                between service instances (defaults to a queue of this instance)
         """
         self._repository = repository
         self._model_factory = model_factory
         self._keyword_generator = keyword_generator
+        self._work_queue = work_queue or WorkQueue(name="essay-work")
 
     def search(
         self,
@@ -87,9 +96,9 @@ class EssaySearchService(IEssaySearchService):
     def create(self, essay_data: EssayCreate) -> Essay:
         """Create a new essay with auto-generated embedding.
 
-        The embedding is generated asynchronously in a background thread,
-        allowing the method to return immediately. Also spawns background
-        keyword generation if a keyword generator is configured.
+        The embedding is generated asynchronously on the background work queue,
+        allowing the method to return immediately. Also queues keyword
+        generation if a keyword generator is configured.
 
         Args:
             essay_data: Essay data including question, answer, keywords
@@ -100,16 +109,17 @@ class EssaySearchService(IEssaySearchService):
         # Create the essay first
         essay = self._repository.create(essay_data)
 
-        # Spawn background embedding generation
-        self._spawn_embedding_generation(
+        # Queue background embedding generation
+        self._schedule_embedding_generation(
             essay_id=essay.id,
+            content_version=essay.content_version,
             question=essay_data.get("question"),
             answer=essay_data.get("answer"),
             keywords=essay_data.get("keywords"),
         )
 
-        # Spawn background keyword generation
-        self._spawn_keyword_generation(essay.id, essay.question, essay.answer)
+        # Queue background keyword generation
+        self._schedule_keyword_generation(essay.id, essay.question, essay.answer)
 
         return essay
 
@@ -120,8 +130,8 @@ class EssaySearchService(IEssaySearchService):
     ) -> Optional[Essay]:
         """Update an essay and regenerate its embedding.
 
-        The embedding is regenerated asynchronously in a background thread,
-        allowing the method to return immediately. Keywords are NOT
+        The embedding is regenerated asynchronously on the background work
+        queue, allowing the method to return immediately. Keywords are NOT
         regenerated on update - only on creation.
 
         Args:
@@ -137,9 +147,10 @@ class EssaySearchService(IEssaySearchService):
         if essay is None:
             return None
 
-        # Spawn background embedding regeneration
-        self._spawn_embedding_generation(
+        # Queue background embedding regeneration
+        self._schedule_embedding_generation(
             essay_id=essay.id,
+            content_version=essay.content_version,
             question=essay.question,
             answer=essay.answer,
             keywords=essay.keywords,
@@ -170,38 +181,47 @@ class EssaySearchService(IEssaySearchService):
         """
         return self._repository.delete(essay_id)
 
-    def backfill_embeddings(self) -> int:
-        """Generate embeddings for all essays without one.
+    def backfill_embeddings(self, page_size: int = BACKFILL_PAGE_SIZE) -> int:
+        """Generate embeddings for all essays whose embedding is missing or stale.
+
+        Pending essays are read in pages of page_size. Each page is embedded with
+        one batched model call and written back with one bulk update, queued
+        behind interactive work. The next page is read while earlier ones are
+        embedded, and the call waits for all of them. Essays of a page that fails
+        stay pending for the next backfill.
+
+        Args:
+            page_size: Essays embedded and written per batch
 
         Returns:
             Number of essays updated
         """
-        # Get all essays and filter to those without embeddings
-        essays = self._repository.get_all()
-        updated_count = 0
-
-        for essay in essays:
-            try:
-                text = self._build_embedding_text(
-                    question=essay.question,
-                    answer=essay.answer,
-                    keywords=essay.keywords,
-                )
-                embedding = self._get_embedding(text)
-                if self._repository.update_embedding(essay.id, embedding):
-                    updated_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to backfill embedding for essay {essay.id}: {e}")
-
-        return updated_count
-
-    def _spawn_keyword_generation(
+        futures = []
+        after_id = 0
+        while True:
+            page = self._repository.get_pending_embeddings(limit=page_size, after_id=after_id)
+            if not page:
+                break
+            after_id = page[-1].id
+            future = self._work_queue.submit(
+                functools.partial(self._generate_embeddings, page),
+                priority=WorkPriority.BACKFILL,
+                description=f"embedding backfill for essays {page[0].id}-{after_id}",
+            )
+            if future is None:
+                break
+            futures.append(future)
+
+        wait(futures)
+        return sum(future.result() for future in futures if future.exception() is None)
+
+    def _schedule_keyword_generation(
         self,
         essay_id: int,
         question: Optional[str],
         answer: Optional[str],
     ) -> None:
-        """Spawn a background thread for keyword generation.
+        """Queue keyword generation for an essay.
 
         Args:
             essay_id: ID of the essay
@@ -211,20 +231,20 @@ class EssaySearchService(IEssaySearchService):
         if self._keyword_generator is None:
             return
 
-        thread = threading.Thread(
-            target=self._generate_keywords_background,
-            args=(essay_id, question, answer),
-            daemon=True,
+        self._work_queue.submit(
+            functools.partial(self._generate_keywords, essay_id, question, answer),
+            priority=WorkPriority.INTERACTIVE,
+            timeout=0,
+            description=f"keywords for essay {essay_id}",
         )
-        thread.start()
 
-    def _generate_keywords_background(
+    def _generate_keywords(
         self,
         essay_id: int,
         question: Optional[str],
         answer: Optional[str],
     ) -> None:
-        """Background method to generate keywords.
+        """Generate and persist keywords on a worker thread.
 
         Args:
             essay_id: ID of the essay
@@ -234,62 +254,96 @@ class EssaySearchService(IEssaySearchService):
         if self._keyword_generator is None:
             return
 
-        try:
-            self._keyword_generator.generate_keywords(
-                essay_id=essay_id,
-                question=question,
-                answer=answer,
-            )
-        except Exception as e:
-            logger.warning(f"Failed to generate keywords for essay {essay_id}: {e}")
+        self._keyword_generator.generate_keywords(
+            essay_id=essay_id,
+            question=question,
+            answer=answer,
+        )
 
-    def _spawn_embedding_generation(
+    def _schedule_embedding_generation(
         self,
         essay_id: int,
+        content_version: int,
         question: Optional[str],
         answer: Optional[str],
         keywords: Optional[List[str]],
     ) -> None:
-        """Spawn a background thread for embedding generation.
+        """Queue embedding generation for an essay.
+
+        The caller does not wait for room in the queue. Work that is rejected,
+        fails or is cut short by a shutdown leaves the essay pending, so the next
+        backfill retries it.
 
         Args:
             essay_id: ID of the essay
+            content_version: Content version of the essay the fields were read at
             question: Essay question
             answer: Essay answer
             keywords: Essay keywords
         """
-        thread = threading.Thread(
-            target=self._generate_embedding_background,
-            args=(essay_id, question, answer, keywords),
-            daemon=True,
+        self._work_queue.submit(
+            functools.partial(
+                self._generate_embedding, essay_id, content_version, question, answer, keywords
+            ),
+            priority=WorkPriority.INTERACTIVE,
+            timeout=0,
+            description=f"embedding for essay {essay_id}",
         )
-        thread.start()
 
-    def _generate_embedding_background(
+    def _generate_embedding(
         self,
         essay_id: int,
+        content_version: int,
         question: Optional[str],
         answer: Optional[str],
         keywords: Optional[List[str]],
-    ) -> None:
-        """Background method to generate and persist embedding.
+    ) -> bool:
+        """Generate and persist an embedding on a worker thread.
 
         Args:
             essay_id: ID of the essay
+            content_version: Content version of the essay the fields were read at
             question: Essay question
             answer: Essay answer
             keywords: Essay keywords
+
+        Returns:
+            True if the embedding was stored, False if the essay no longer exists
+            or was edited since, in which case the edit's own task embeds it
         """
-        try:
-            text = self._build_embedding_text(
-                question=question,
-                answer=answer,
-                keywords=keywords,
+        text = self._build_embedding_text(
+            question=question,
+            answer=answer,
+            keywords=keywords,
+        )
+        embedding = self._get_embedding(text)
+        return self._repository.update_embedding(essay_id, embedding, content_version)
+
+    def _generate_embeddings(self, essays: List[Essay]) -> int:
+        """Generate and persist the embeddings of a page of essays on a worker thread.
+
+        Args:
+            essays: Essays to embed
+
+        Returns:
+            Number of essays updated, which leaves out essays edited since the page was read
+        """
+        texts = [
+            self._build_embedding_text(
+                question=essay.question,
+                answer=essay.answer,
+                keywords=essay.keywords,
             )
-            embedding = self._get_embedding(text)
-            self._repository.update_embedding(essay_id, embedding)
-        except Exception as e:
-            logger.warning(f"Failed to generate embedding for essay {essay_id}: {e}")
+            for essay in essays
+        ]
+        model = self._model_factory.get_model(model_id="embedding")
+        embeddings = model.embed_documents(texts)
+        return self._repository.update_embeddings(
+            {
+                essay.id: (essay.content_version, embedding)
+                for essay, embedding in zip(essays, embeddings)
+            }
+        )
 
     def _build_embedding_text(
         self,
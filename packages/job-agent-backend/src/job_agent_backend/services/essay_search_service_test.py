@@ -3,16 +3,16 @@
 These tests verify:
 1. Keyword generation triggers on essay creation (existing behavior)
 2. Keyword generation does NOT trigger on essay updates (existing behavior)
-3. Embedding generation runs asynchronously in background threads
-4. Background embedding handles failures gracefully
+3. Embedding generation runs asynchronously on the shared background work queue
+4. Background embedding failures leave the essay pending for the next backfill
 5. Essays are immediately searchable after creation (before embedding completes)
 """
 
-import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from job_agent_backend.core.work_queue import WorkPriority, WorkQueue
 from job_agent_backend.services.essay_search_service import EssaySearchService
 
 
@@ -24,12 +24,14 @@ def _create_mock_repository() -> MagicMock:
         question="Test question?",
         answer="Test answer.",
         keywords=None,
+        content_version=0,
     )
     mock_repository.update.return_value = MagicMock(
         id=1,
         question="Updated question?",
         answer="Updated answer.",
         keywords=["existing"],
+        content_version=1,
     )
     mock_repository.update_embedding.return_value = True
     return mock_repository
@@ -51,19 +53,26 @@ def _create_mock_keyword_generator() -> MagicMock:
     return mock_generator
 
 
+def _create_mock_work_queue() -> MagicMock:
+    """Create a mock work queue that records submitted tasks without running them."""
+    return MagicMock(spec=WorkQueue)
+
+
 class TestEssaySearchServiceCreateTriggersKeywordGeneration:
     """Tests for keyword generation trigger on create()."""
 
-    def test_create_spawns_background_keyword_generation(self):
-        """Service create() spawns a background thread for keyword generation."""
+    def test_create_queues_background_keyword_generation(self):
+        """Service create() queues keyword generation on the work queue."""
         mock_repository = _create_mock_repository()
         mock_factory = _create_mock_model_factory()
         mock_keyword_generator = _create_mock_keyword_generator()
+        mock_work_queue = _create_mock_work_queue()
 
         service = EssaySearchService(
             repository=mock_repository,
             model_factory=mock_factory,
             keyword_generator=mock_keyword_generator,
+            work_queue=mock_work_queue,
         )
 
         essay_data = {
@@ -71,17 +80,14 @@ class TestEssaySearchServiceCreateTriggersKeywordGeneration:
             "answer": "I have Python experience.",
         }
 
-        # Isolate keyword thread by patching embedding generation
-        with patch.object(service, "_spawn_embedding_generation"):
-            with patch.object(threading, "Thread") as mock_thread_class:
-                mock_thread = MagicMock()
-                mock_thread_class.return_value = mock_thread
-
-                service.create(essay_data)
+        # Isolate keyword generation by patching embedding generation
+        with patch.object(service, "_schedule_embedding_generation"):
+            service.create(essay_data)
 
-                # Verify thread was created and started for keyword generation
-                mock_thread_class.assert_called_once()
-                mock_thread.start.assert_called_once()
+        mock_work_queue.submit.assert_called_once()
+        task = mock_work_queue.submit.call_args.args[0]
+        task()
+        mock_keyword_generator.generate_keywords.assert_called_once()
 
     def test_create_passes_essay_data_to_keyword_generator(self):
         """Service create() passes essay ID, question, and answer to generator."""
@@ -91,6 +97,7 @@ class TestEssaySearchServiceCreateTriggersKeywordGeneration:
             question="What are your skills?",
             answer="I know Python and Django.",
             keywords=None,
+            content_version=0,
         )
         mock_repository.create.return_value = created_essay
 
@@ -108,8 +115,8 @@ class TestEssaySearchServiceCreateTriggersKeywordGeneration:
             "answer": "I know Python and Django.",
         }
 
-        # Run without actually spawning a thread
-        with patch.object(service, "_spawn_keyword_generation") as mock_spawn:
+        # Run without actually queueing the work
+        with patch.object(service, "_schedule_keyword_generation") as mock_spawn:
             service.create(essay_data)
 
             mock_spawn.assert_called_once_with(
@@ -124,48 +131,42 @@ class TestEssaySearchServiceCreateTriggersKeywordGeneration:
         mock_factory = _create_mock_model_factory()
         mock_keyword_generator = _create_mock_keyword_generator()
 
+        essay_data = {"answer": "Test answer"}
+
         service = EssaySearchService(
             repository=mock_repository,
             model_factory=mock_factory,
             keyword_generator=mock_keyword_generator,
+            work_queue=_create_mock_work_queue(),
         )
 
-        essay_data = {"answer": "Test answer"}
+        result = service.create(essay_data)
 
-        with patch.object(threading, "Thread") as mock_thread_class:
-            mock_thread = MagicMock()
-            mock_thread_class.return_value = mock_thread
+        # Essay should be returned, and it should have keywords=None
+        # (since keywords are generated async)
+        assert result is not None
+        assert result.keywords is None
 
-            result = service.create(essay_data)
-
-            # Essay should be returned, and it should have keywords=None
-            # (since keywords are generated async)
-            assert result is not None
-            assert result.keywords is None
-
-    def test_create_spawns_daemon_thread(self):
-        """Service create() spawns a daemon thread so it doesn't block shutdown."""
+    def test_create_does_not_wait_for_room_in_the_queue(self):
+        """Service create() does not block when the work queue is full."""
         mock_repository = _create_mock_repository()
         mock_factory = _create_mock_model_factory()
         mock_keyword_generator = _create_mock_keyword_generator()
+        mock_work_queue = _create_mock_work_queue()
 
         service = EssaySearchService(
             repository=mock_repository,
             model_factory=mock_factory,
             keyword_generator=mock_keyword_generator,
+            work_queue=mock_work_queue,
         )
 
-        essay_data = {"answer": "Test answer"}
-
-        with patch.object(threading, "Thread") as mock_thread_class:
-            mock_thread = MagicMock()
-            mock_thread_class.return_value = mock_thread
+        service.create({"answer": "Test answer"})
 
-            service.create(essay_data)
-
-            # Verify daemon=True was passed
-            call_kwargs = mock_thread_class.call_args.kwargs
-            assert call_kwargs.get("daemon") is True
+        assert mock_work_queue.submit.call_count == 2
+        for call in mock_work_queue.submit.call_args_list:
+            assert call.kwargs["timeout"] == 0
+            assert call.kwargs["priority"] == WorkPriority.INTERACTIVE
 
 
 class TestEssaySearchServiceUpdateDoesNotTriggerKeywordGeneration:
@@ -185,7 +186,7 @@ class TestEssaySearchServiceUpdateDoesNotTriggerKeywordGeneration:
 
         essay_update = {"answer": "Updated answer"}
 
-        with patch.object(service, "_spawn_keyword_generation") as mock_spawn:
+        with patch.object(service, "_schedule_keyword_generation") as mock_spawn:
             service.update(1, essay_update)
 
             mock_spawn.assert_not_called()
@@ -213,16 +214,19 @@ class TestEssaySearchServiceUpdateDoesNotTriggerKeywordGeneration:
         mock_repository = _create_mock_repository()
         mock_factory = _create_mock_model_factory()
         mock_keyword_generator = _create_mock_keyword_generator()
+        work_queue = WorkQueue()
 
         service = EssaySearchService(
             repository=mock_repository,
             model_factory=mock_factory,
             keyword_generator=mock_keyword_generator,
+            work_queue=work_queue,
         )
 
         essay_update = {"answer": "Updated answer"}
 
         service.update(1, essay_update)
+        work_queue.drain(timeout=5)
 
         # Verify embedding is still generated
         mock_factory.get_model.assert_called_with(model_id="embedding")
@@ -251,8 +255,8 @@ class TestEssaySearchServiceKeywordGeneratorInjection:
 class TestEssaySearchServiceBackgroundKeywordGenerationBehavior:
     """Tests for the background keyword generation behavior."""
 
-    def test_background_thread_calls_keyword_generator(self):
-        """Background thread invokes keyword generator with correct arguments."""
+    def test_background_task_calls_keyword_generator(self):
+        """Background task invokes keyword generator with correct arguments."""
         mock_repository = _create_mock_repository()
         mock_factory = _create_mock_model_factory()
         mock_keyword_generator = _create_mock_keyword_generator()
@@ -264,7 +268,7 @@ class TestEssaySearchServiceBackgroundKeywordGenerationBehavior:
         )
 
         # Call the private method directly to test behavior
-        service._generate_keywords_background(
+        service._generate_keywords(
             essay_id=42,
             question="What is your experience?",
             answer="I have Python experience.",
@@ -276,32 +280,33 @@ class TestEssaySearchServiceBackgroundKeywordGenerationBehavior:
             answer="I have Python experience.",
         )
 
-    def test_background_method_handles_generator_exception(self):
-        """Background method catches and logs generator exceptions."""
+    def test_generator_exception_is_recorded_by_the_work_queue(self):
+        """Generator exceptions are counted by the work queue, not raised to create()."""
         mock_repository = _create_mock_repository()
         mock_factory = _create_mock_model_factory()
         mock_keyword_generator = MagicMock()
         mock_keyword_generator.generate_keywords.side_effect = Exception("Generator error")
+        work_queue = WorkQueue()
 
         service = EssaySearchService(
             repository=mock_repository,
             model_factory=mock_factory,
             keyword_generator=mock_keyword_generator,
+            work_queue=work_queue,
         )
 
         # Should not raise
-        service._generate_keywords_background(
-            essay_id=1,
-            question="Question",
-            answer="Answer",
-        )
+        service.create({"question": "Question", "answer": "Answer"})
+        work_queue.drain(timeout=5)
+
+        assert work_queue.stats().failed == 1
 
 
 class TestEssaySearchServiceAsyncEmbeddingOnCreate:
     """Tests for async embedding generation on essay creation."""
 
-    def test_create_spawns_background_embedding_generation(self):
-        """Service create() spawns a background thread for embedding generation."""
+    def test_create_queues_background_embedding_generation(self):
+        """Service create() queues embedding generation on the work queue."""
         mock_repository = _create_mock_repository()
         mock_factory = _create_mock_model_factory()
         mock_keyword_generator = _create_mock_keyword_generator()
@@ -317,7 +322,7 @@ class TestEssaySearchServiceAsyncEmbeddingOnCreate:
             "answer": "I have Python experience.",
         }
 
-        with patch.object(service, "_spawn_embedding_generation") as mock_spawn:
+        with patch.object(service, "_schedule_embedding_generation") as mock_spawn:
             service.create(essay_data)
 
             mock_spawn.assert_called_once()
@@ -330,6 +335,7 @@ class TestEssaySearchServiceAsyncEmbeddingOnCreate:
             question="What are your skills?",
             answer="I know Python and Django.",
             keywords=None,
+            content_version=0,
         )
         mock_repository.create.return_value = created_essay
 
@@ -347,11 +353,12 @@ class TestEssaySearchServiceAsyncEmbeddingOnCreate:
             "answer": "I know Python and Django.",
         }
 
-        with patch.object(service, "_spawn_embedding_generation") as mock_spawn:
+        with patch.object(service, "_schedule_embedding_generation") as mock_spawn:
             service.create(essay_data)
 
             mock_spawn.assert_called_once_with(
                 essay_id=42,
+                content_version=created_essay.content_version,
                 question="What are your skills?",
                 answer="I know Python and Django.",
                 keywords=None,
@@ -371,7 +378,7 @@ class TestEssaySearchServiceAsyncEmbeddingOnCreate:
 
         essay_data = {"answer": "Test answer"}
 
-        with patch.object(service, "_spawn_embedding_generation"):
+        with patch.object(service, "_schedule_embedding_generation"):
             result = service.create(essay_data)
 
             # Essay should be returned immediately
@@ -379,44 +386,31 @@ class TestEssaySearchServiceAsyncEmbeddingOnCreate:
             # Repository update_embedding should NOT have been called synchronously
             mock_repository.update_embedding.assert_not_called()
 
-    def test_create_spawns_embedding_thread_with_daemon_true(self):
-        """Service create() spawns embedding thread as daemon."""
+    def test_create_queues_embedding_as_interactive_work(self):
+        """Service create() queues its embedding ahead of backfill work."""
         mock_repository = _create_mock_repository()
         mock_factory = _create_mock_model_factory()
         mock_keyword_generator = _create_mock_keyword_generator()
+        mock_work_queue = _create_mock_work_queue()
 
         service = EssaySearchService(
             repository=mock_repository,
             model_factory=mock_factory,
             keyword_generator=mock_keyword_generator,
+            work_queue=mock_work_queue,
         )
 
         essay_data = {"answer": "Test answer"}
 
-        # We need to patch Thread to capture the daemon parameter
-        # The spawn method should create a Thread with daemon=True
-        with patch.object(threading, "Thread") as mock_thread_class:
-            mock_thread = MagicMock()
-            mock_thread_class.return_value = mock_thread
-
-            # Patch to isolate embedding thread from keyword thread
-            with patch.object(service, "_spawn_keyword_generation"):
-                service.create(essay_data)
-
-            # Find the call for embedding generation (should have target containing
-            # "embedding")
-            embedding_call = None
-            for call in mock_thread_class.call_args_list:
-                if "embedding" in str(call.kwargs.get("target", "")):
-                    embedding_call = call
-                    break
+        # Patch to isolate embedding generation from keyword generation
+        with patch.object(service, "_schedule_keyword_generation"):
+            service.create(essay_data)
 
-            # Verify daemon=True was passed
-            assert embedding_call is not None, "No embedding thread was spawned"
-            assert embedding_call.kwargs.get("daemon") is True
+        mock_work_queue.submit.assert_called_once()
+        assert mock_work_queue.submit.call_args.kwargs["priority"] == WorkPriority.INTERACTIVE
 
-    def test_create_persists_essay_before_spawning_embedding_thread(self):
-        """Service create() persists essay to DB before spawning embedding thread."""
+    def test_create_persists_essay_before_queueing_embedding(self):
+        """Service create() persists essay to DB before queueing its embedding."""
         mock_repository = _create_mock_repository()
         mock_factory = _create_mock_model_factory()
         mock_keyword_generator = _create_mock_keyword_generator()
@@ -440,8 +434,8 @@ class TestEssaySearchServiceAsyncEmbeddingOnCreate:
 
         mock_repository.create.side_effect = track_create
 
-        with patch.object(service, "_spawn_embedding_generation", side_effect=track_spawn):
-            with patch.object(service, "_spawn_keyword_generation"):
+        with patch.object(service, "_schedule_embedding_generation", side_effect=track_spawn):
+            with patch.object(service, "_schedule_keyword_generation"):
                 service.create(essay_data)
 
         assert call_order == ["create", "spawn_embedding"]
@@ -450,8 +444,8 @@ class TestEssaySearchServiceAsyncEmbeddingOnCreate:
 class TestEssaySearchServiceAsyncEmbeddingOnUpdate:
     """Tests for async embedding generation on essay update."""
 
-    def test_update_spawns_background_embedding_generation(self):
-        """Service update() spawns a background thread for embedding regeneration."""
+    def test_update_queues_background_embedding_generation(self):
+        """Service update() queues embedding regeneration on the work queue."""
         mock_repository = _create_mock_repository()
         mock_factory = _create_mock_model_factory()
         mock_keyword_generator = _create_mock_keyword_generator()
@@ -464,7 +458,7 @@ class TestEssaySearchServiceAsyncEmbeddingOnUpdate:
 
         essay_update = {"answer": "Updated answer"}
 
-        with patch.object(service, "_spawn_embedding_generation") as mock_spawn:
+        with patch.object(service, "_schedule_embedding_generation") as mock_spawn:
             service.update(1, essay_update)
 
             mock_spawn.assert_called_once()
@@ -477,6 +471,7 @@ class TestEssaySearchServiceAsyncEmbeddingOnUpdate:
             question="Updated question?",
             answer="Updated answer.",
             keywords=["existing", "keywords"],
+            content_version=2,
         )
         mock_repository.update.return_value = updated_essay
 
@@ -491,11 +486,12 @@ class TestEssaySearchServiceAsyncEmbeddingOnUpdate:
 
         essay_update = {"answer": "Updated answer."}
 
-        with patch.object(service, "_spawn_embedding_generation") as mock_spawn:
+        with patch.object(service, "_schedule_embedding_generation") as mock_spawn:
             service.update(42, essay_update)
 
             mock_spawn.assert_called_once_with(
                 essay_id=42,
+                content_version=updated_essay.content_version,
                 question="Updated question?",
                 answer="Updated answer.",
                 keywords=["existing", "keywords"],
@@ -515,7 +511,7 @@ class TestEssaySearchServiceAsyncEmbeddingOnUpdate:
 
         essay_update = {"answer": "Updated answer"}
 
-        with patch.object(service, "_spawn_embedding_generation"):
+        with patch.object(service, "_schedule_embedding_generation"):
             result = service.update(1, essay_update)
 
             # Essay should be returned immediately
@@ -523,32 +519,30 @@ class TestEssaySearchServiceAsyncEmbeddingOnUpdate:
             # Repository update_embedding should NOT have been called synchronously
             mock_repository.update_embedding.assert_not_called()
 
-    def test_update_spawns_embedding_thread_with_daemon_true(self):
-        """Service update() spawns embedding thread as daemon."""
+    def test_update_queues_embedding_as_interactive_work(self):
+        """Service update() queues its embedding ahead of backfill work."""
         mock_repository = _create_mock_repository()
         mock_factory = _create_mock_model_factory()
         mock_keyword_generator = _create_mock_keyword_generator()
+        mock_work_queue = _create_mock_work_queue()
 
         service = EssaySearchService(
             repository=mock_repository,
             model_factory=mock_factory,
             keyword_generator=mock_keyword_generator,
+            work_queue=mock_work_queue,
         )
 
         essay_update = {"answer": "Updated answer"}
 
-        with patch.object(threading, "Thread") as mock_thread_class:
-            mock_thread = MagicMock()
-            mock_thread_class.return_value = mock_thread
-
-            service.update(1, essay_update)
+        service.update(1, essay_update)
 
-            # Verify daemon=True was passed
-            call_kwargs = mock_thread_class.call_args.kwargs
-            assert call_kwargs.get("daemon") is True
+        mock_work_queue.submit.assert_called_once()
+        assert mock_work_queue.submit.call_args.kwargs["priority"] == WorkPriority.INTERACTIVE
+        assert mock_work_queue.submit.call_args.kwargs["timeout"] == 0
 
-    def test_update_does_not_spawn_embedding_when_essay_not_found(self):
-        """Service update() does not spawn embedding thread when essay not found."""
+    def test_update_does_not_queue_embedding_when_essay_not_found(self):
+        """Service update() does not queue embedding generation when essay not found."""
         mock_repository = _create_mock_repository()
         mock_repository.update.return_value = None
 
@@ -563,7 +557,7 @@ class TestEssaySearchServiceAsyncEmbeddingOnUpdate:
 
         essay_update = {"answer": "Updated answer"}
 
-        with patch.object(service, "_spawn_embedding_generation") as mock_spawn:
+        with patch.object(service, "_schedule_embedding_generation") as mock_spawn:
             result = service.update(999, essay_update)
 
             assert result is None
@@ -585,8 +579,9 @@ class TestEssaySearchServiceBackgroundEmbeddingGeneration:
             keyword_generator=mock_keyword_generator,
         )
 
-        service._generate_embedding_background(
+        service._generate_embedding(
             essay_id=42,
+            content_version=3,
             question="What is your experience?",
             answer="I have Python experience.",
             keywords=["Python", "experience"],
@@ -607,8 +602,9 @@ class TestEssaySearchServiceBackgroundEmbeddingGeneration:
             keyword_generator=mock_keyword_generator,
         )
 
-        service._generate_embedding_background(
+        service._generate_embedding(
             essay_id=42,
+            content_version=3,
             question="What is your experience?",
             answer="I have Python experience.",
             keywords=["Python", "experience"],
@@ -635,41 +631,66 @@ class TestEssaySearchServiceBackgroundEmbeddingGeneration:
             keyword_generator=mock_keyword_generator,
         )
 
-        service._generate_embedding_background(
+        service._generate_embedding(
             essay_id=42,
+            content_version=3,
             question="Question",
             answer="Answer",
             keywords=None,
         )
 
-        mock_repository.update_embedding.assert_called_once_with(42, [0.1, 0.2, 0.3])
+        mock_repository.update_embedding.assert_called_once_with(42, [0.1, 0.2, 0.3], 3)
 
-    def test_background_embedding_handles_model_factory_exception(self):
-        """Background embedding catches and logs model factory exceptions."""
+    def test_background_embedding_is_stored_only_for_the_version_read(self):
+        """The content version read with the essay reaches update_embedding."""
         mock_repository = _create_mock_repository()
-        mock_factory = MagicMock()
-        mock_factory.get_model.side_effect = Exception("Model unavailable")
-        mock_keyword_generator = _create_mock_keyword_generator()
+        mock_repository.update_embedding.return_value = False
+        mock_factory = _create_mock_model_factory()
 
         service = EssaySearchService(
             repository=mock_repository,
             model_factory=mock_factory,
-            keyword_generator=mock_keyword_generator,
+            keyword_generator=_create_mock_keyword_generator(),
         )
 
-        # Should not raise
-        service._generate_embedding_background(
-            essay_id=1,
+        stored = service._generate_embedding(
+            essay_id=42,
+            content_version=7,
             question="Question",
             answer="Answer",
             keywords=None,
         )
 
-        # Repository should not be called if model fails
+        assert stored is False
+        assert mock_repository.update_embedding.call_args.args[2] == 7
+
+    def test_background_embedding_raises_model_factory_exception(self):
+        """Background embedding leaves model factory exceptions to the work queue."""
+        mock_repository = _create_mock_repository()
+        mock_factory = MagicMock()
+        mock_factory.get_model.side_effect = Exception("Model unavailable")
+        mock_keyword_generator = _create_mock_keyword_generator()
+
+        service = EssaySearchService(
+            repository=mock_repository,
+            model_factory=mock_factory,
+            keyword_generator=mock_keyword_generator,
+        )
+
+        with pytest.raises(Exception):
+            service._generate_embedding(
+                essay_id=1,
+                content_version=3,
+                question="Question",
+                answer="Answer",
+                keywords=None,
+            )
+
+        # Repository should not be called if model fails, so the essay stays pending
         mock_repository.update_embedding.assert_not_called()
 
-    def test_background_embedding_handles_embed_query_exception(self):
-        """Background embedding catches and logs embedding generation exceptions."""
+    def test_background_embedding_raises_embed_query_exception(self):
+        """Background embedding leaves embedding generation exceptions to the work queue."""
         mock_repository = _create_mock_repository()
         mock_factory = _create_mock_model_factory()
         mock_model = mock_factory.get_model.return_value
@@ -682,37 +703,38 @@ class TestEssaySearchServiceBackgroundEmbeddingGeneration:
             keyword_generator=mock_keyword_generator,
         )
 
-        # Should not raise
-        service._generate_embedding_background(
-            essay_id=1,
-            question="Question",
-            answer="Answer",
-            keywords=None,
-        )
+        with pytest.raises(Exception):
+            service._generate_embedding(
+                essay_id=1,
+                content_version=3,
+                question="Question",
+                answer="Answer",
+                keywords=None,
+            )
 
-        # Repository should not be called if embedding fails
+        # Repository should not be called if embedding fails, so the essay stays pending
         mock_repository.update_embedding.assert_not_called()
 
-    def test_background_embedding_handles_repository_exception(self):
-        """Background embedding catches and logs repository exceptions."""
+    def test_background_embedding_failure_is_recorded_by_the_work_queue(self):
+        """Repository exceptions are counted by the work queue, not raised to update()."""
         mock_repository = _create_mock_repository()
         mock_repository.update_embedding.side_effect = Exception("DB connection failed")
         mock_factory = _create_mock_model_factory()
         mock_keyword_generator = _create_mock_keyword_generator()
+        work_queue = WorkQueue()
 
         service = EssaySearchService(
             repository=mock_repository,
             model_factory=mock_factory,
             keyword_generator=mock_keyword_generator,
+            work_queue=work_queue,
         )
 
         # Should not raise
-        service._generate_embedding_background(
-            essay_id=1,
-            question="Question",
-            answer="Answer",
-            keywords=None,
-        )
+        service.update(1, {"answer": "Updated answer"})
+        work_queue.drain(timeout=5)
+
+        assert work_queue.stats().failed == 1
 
     def test_background_embedding_does_not_propagate_exception(self):
         """Background embedding does not propagate exceptions to caller."""
@@ -720,128 +742,201 @@ class TestEssaySearchServiceBackgroundEmbeddingGeneration:
         mock_factory = MagicMock()
         mock_factory.get_model.side_effect = RuntimeError("Unexpected error")
         mock_keyword_generator = _create_mock_keyword_generator()
+        work_queue = WorkQueue()
 
         service = EssaySearchService(
             repository=mock_repository,
             model_factory=mock_factory,
             keyword_generator=mock_keyword_generator,
+            work_queue=work_queue,
         )
 
         # Should not raise any exception
-        service._generate_embedding_background(
-            essay_id=1,
-            question="Question",
-            answer="Answer",
-            keywords=None,
-        )
+        service.create({"question": "Question", "answer": "Answer"})
+        work_queue.drain(timeout=5)
 
 
-class TestEssaySearchServiceSpawnEmbeddingGeneration:
-    """Tests for the _spawn_embedding_generation method."""
+class TestEssaySearchServiceScheduleEmbeddingGeneration:
+    """Tests for the _schedule_embedding_generation method."""
 
-    def test_spawn_creates_thread_with_correct_target(self):
-        """Spawn method creates thread with _generate_embedding_background as target."""
+    def test_schedule_submits_embedding_task_with_correct_args(self):
+        """Schedule method submits _generate_embedding bound to the essay content."""
         mock_repository = _create_mock_repository()
         mock_factory = _create_mock_model_factory()
         mock_keyword_generator = _create_mock_keyword_generator()
+        mock_work_queue = _create_mock_work_queue()
 
         service = EssaySearchService(
             repository=mock_repository,
             model_factory=mock_factory,
             keyword_generator=mock_keyword_generator,
+            work_queue=mock_work_queue,
+        )
+
+        service._schedule_embedding_generation(
+            essay_id=42,
+            content_version=3,
+            question="Test question",
+            answer="Test answer",
+            keywords=["Python", "Django"],
         )
 
-        with patch.object(threading, "Thread") as mock_thread_class:
-            mock_thread = MagicMock()
-            mock_thread_class.return_value = mock_thread
+        task = mock_work_queue.submit.call_args.args[0]
+        assert task.func == service._generate_embedding
+        assert task.args == (42, 3, "Test question", "Test answer", ["Python", "Django"])
+
+    def test_schedule_does_not_start_a_thread(self):
+        """Schedule method hands the work to the queue instead of a new thread."""
+        mock_repository = _create_mock_repository()
+        mock_factory = _create_mock_model_factory()
+        mock_keyword_generator = _create_mock_keyword_generator()
+        mock_work_queue = _create_mock_work_queue()
+
+        service = EssaySearchService(
+            repository=mock_repository,
+            model_factory=mock_factory,
+            keyword_generator=mock_keyword_generator,
+            work_queue=mock_work_queue,
+        )
 
-            service._spawn_embedding_generation(
+        with patch("threading.Thread") as mock_thread_class:
+            service._schedule_embedding_generation(
                 essay_id=42,
+                content_version=3,
                 question="Question",
                 answer="Answer",
-                keywords=["keyword"],
+                keywords=None,
             )
 
-            mock_thread_class.assert_called_once()
-            call_kwargs = mock_thread_class.call_args.kwargs
-            assert call_kwargs["target"] == service._generate_embedding_background
+        mock_thread_class.assert_not_called()
+        mock_work_queue.submit.assert_called_once()
 
-    def test_spawn_creates_thread_with_correct_args(self):
-        """Spawn method creates thread with correct arguments."""
+    def test_rejected_work_does_not_raise(self):
+        """Work rejected by a full queue is left for the next backfill."""
         mock_repository = _create_mock_repository()
         mock_factory = _create_mock_model_factory()
         mock_keyword_generator = _create_mock_keyword_generator()
+        mock_work_queue = _create_mock_work_queue()
+        mock_work_queue.submit.return_value = None
 
         service = EssaySearchService(
             repository=mock_repository,
             model_factory=mock_factory,
             keyword_generator=mock_keyword_generator,
+            work_queue=mock_work_queue,
         )
 
-        with patch.object(threading, "Thread") as mock_thread_class:
-            mock_thread = MagicMock()
-            mock_thread_class.return_value = mock_thread
+        result = service.create({"answer": "Test answer"})
+
+        assert result is not None
+        mock_repository.update_embedding.assert_not_called()
 
-            service._spawn_embedding_generation(
-                essay_id=42,
-                question="Test question",
-                answer="Test answer",
-                keywords=["Python", "Django"],
-            )
 
-            call_kwargs = mock_thread_class.call_args.kwargs
-            assert call_kwargs["args"] == (42, "Test question", "Test answer", ["Python", "Django"])
+class TestEssaySearchServiceBackfillEmbeddings:
+    """Tests for EssaySearchService.backfill_embeddings."""
 
-    def test_spawn_creates_daemon_thread(self):
-        """Spawn method creates daemon thread that does not block shutdown."""
+    def test_backfill_embeds_each_page_with_one_call_and_one_write(self):
+        """Every page of pending essays is embedded and written in one batch."""
         mock_repository = _create_mock_repository()
+        first_page = [
+            MagicMock(id=1, content_version=1, question="Q1", answer="A1", keywords=None),
+            MagicMock(id=2, content_version=2, question=None, answer="A2", keywords=["k"]),
+        ]
+        second_page = [
+            MagicMock(id=5, content_version=5, question="Q5", answer="A5", keywords=None)
+        ]
+        mock_repository.get_pending_embeddings.side_effect = [first_page, second_page, []]
+        mock_repository.update_embeddings.side_effect = len
         mock_factory = _create_mock_model_factory()
-        mock_keyword_generator = _create_mock_keyword_generator()
+        mock_model = mock_factory.get_model.return_value
+        mock_model.embed_documents.side_effect = lambda texts: [[0.5]] * len(texts)
 
         service = EssaySearchService(
             repository=mock_repository,
             model_factory=mock_factory,
-            keyword_generator=mock_keyword_generator,
+            keyword_generator=_create_mock_keyword_generator(),
+            work_queue=WorkQueue(max_workers=1),
         )
 
-        with patch.object(threading, "Thread") as mock_thread_class:
-            mock_thread = MagicMock()
-            mock_thread_class.return_value = mock_thread
+        updated = service.backfill_embeddings(page_size=2)
+
+        assert updated == 3
+        assert [call.kwargs for call in mock_repository.get_pending_embeddings.call_args_list] == [
+            {"limit": 2, "after_id": 0},
+            {"limit": 2, "after_id": 2},
+            {"limit": 2, "after_id": 5},
+        ]
+        assert mock_model.embed_documents.call_args_list[0].args[0] == ["Q1 A1", "A2 k"]
+        mock_model.embed_query.assert_not_called()
+        assert [call.args[0] for call in mock_repository.update_embeddings.call_args_list] == [
+            {1: (1, [0.5]), 2: (2, [0.5])},
+            {5: (5, [0.5])},
+        ]
+
+    def test_backfill_does_not_count_failed_pages(self):
+        """Essays of a page that fails are not counted and stay pending."""
+        mock_repository = _create_mock_repository()
+        mock_repository.get_pending_embeddings.side_effect = [
+            [MagicMock(id=1, content_version=1, question="Q1", answer="A1", keywords=None)],
+            [MagicMock(id=2, content_version=2, question="Q2", answer="A2", keywords=None)],
+            [],
+        ]
+        mock_repository.update_embeddings.side_effect = [1, Exception("DB error")]
+        mock_factory = _create_mock_model_factory()
+        mock_factory.get_model.return_value.embed_documents.return_value = [[0.5]]
 
-            service._spawn_embedding_generation(
-                essay_id=42,
-                question="Question",
-                answer="Answer",
-                keywords=None,
-            )
+        service = EssaySearchService(
+            repository=mock_repository,
+            model_factory=mock_factory,
+            keyword_generator=_create_mock_keyword_generator(),
+            work_queue=WorkQueue(max_workers=1),
+        )
 
-            call_kwargs = mock_thread_class.call_args.kwargs
-            assert call_kwargs["daemon"] is True
+        assert service.backfill_embeddings(page_size=1) == 1
 
-    def test_spawn_starts_the_thread(self):
-        """Spawn method starts the created thread."""
+    def test_backfill_does_not_count_essays_edited_since_the_page_was_read(self):
+        """Essays the repository skipped for a newer content version are not counted."""
         mock_repository = _create_mock_repository()
+        mock_repository.get_pending_embeddings.side_effect = [
+            [
+                MagicMock(id=1, content_version=1, question="Q1", answer="A1", keywords=None),
+                MagicMock(id=2, content_version=2, question="Q2", answer="A2", keywords=None),
+            ],
+            [],
+        ]
+        mock_repository.update_embeddings.return_value = 1
         mock_factory = _create_mock_model_factory()
-        mock_keyword_generator = _create_mock_keyword_generator()
+        mock_factory.get_model.return_value.embed_documents.return_value = [[0.5], [0.5]]
 
         service = EssaySearchService(
             repository=mock_repository,
             model_factory=mock_factory,
-            keyword_generator=mock_keyword_generator,
+            keyword_generator=_create_mock_keyword_generator(),
+            work_queue=WorkQueue(max_workers=1),
         )
 
-        with patch.object(threading, "Thread") as mock_thread_class:
-            mock_thread = MagicMock()
-            mock_thread_class.return_value = mock_thread
+        assert service.backfill_embeddings(page_size=2) == 1
 
-            service._spawn_embedding_generation(
-                essay_id=42,
-                question="Question",
-                answer="Answer",
-                keywords=None,
-            )
+    def test_backfill_queues_work_at_backfill_priority(self):
+        """Backfill work waits behind interactive work and stops when rejected."""
+        mock_repository = _create_mock_repository()
+        mock_repository.get_pending_embeddings.side_effect = [
+            [MagicMock(id=1, content_version=1, question="Q1", answer="A1", keywords=None)],
+            [],
+        ]
+        mock_work_queue = _create_mock_work_queue()
+        mock_work_queue.submit.return_value = None
+
+        service = EssaySearchService(
+            repository=mock_repository,
+            model_factory=_create_mock_model_factory(),
+            keyword_generator=_create_mock_keyword_generator(),
+            work_queue=mock_work_queue,
+        )
 
-            mock_thread.start.assert_called_once()
+        assert service.backfill_embeddings() == 0
+        mock_work_queue.submit.assert_called_once()
+        assert mock_work_queue.submit.call_args.kwargs["priority"] == WorkPriority.BACKFILL
 
 
 class TestEssaySearchServiceImmediateSearchability:
@@ -861,8 +956,8 @@ class TestEssaySearchServiceImmediateSearchability:
 
         essay_data = {"question": "Question", "answer": "Answer"}
 
-        with patch.object(service, "_spawn_embedding_generation"):
-            with patch.object(service, "_spawn_keyword_generation"):
+        with patch.object(service, "_schedule_embedding_generation"):
+            with patch.object(service, "_schedule_keyword_generation"):
                 service.create(essay_data)
 
         # Repository create was called
@@ -893,8 +988,8 @@ class TestEssaySearchServiceImmediateSearchability:
 
         essay_data = {"question": "Test question?", "answer": "Test answer."}
 
-        with patch.object(service, "_spawn_embedding_generation"):
-            with patch.object(service, "_spawn_keyword_generation"):
+        with patch.object(service, "_schedule_embedding_generation"):
+            with patch.object(service, "_schedule_keyword_generation"):
                 result = service.create(essay_data)
 
         # Essay is returned with embedding=None
@@ -1,5 +1,6 @@
 """Utility functions for job-agent-backend."""
 
-from job_agent_backend.utils.similarity import cosine_similarity
+from job_agent_backend.utils.similarity import cosine_similarities, cosine_similarity
+from job_agent_backend.utils.timing import StageTimer, TimedStage
 
-__all__ = ["cosine_similarity"]
+__all__ = ["cosine_similarity", "cosine_similarities", "StageTimer", "TimedStage"]
@@ -19,3 +19,27 @@ def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
     a_array = np.asarray(a)
     b_array = np.asarray(b)
     return float(np.dot(a_array, b_array) / (np.linalg.norm(a_array) * np.linalg.norm(b_array)))
+
+
+def cosine_similarities(matrix: Sequence[Sequence[float]], vector: Sequence[float]) -> np.ndarray:
+    """
+    Calculate cosine similarity between each row of a matrix and a vector.
+
+    Scores all rows with a single matrix-vector product instead of one
+    cosine_similarity call per row.
+
+    Args:
+        matrix: Vectors to score, one per row
+        vector: Vector to compare every row against
+
+    Returns:
+        Array of cosine similarity scores, one per row
+    """
+    matrix_array = np.asarray(matrix, dtype=float)
+    vector_array = np.asarray(vector, dtype=float)
+    if matrix_array.size == 0:
+        return np.zeros(len(matrix_array))
+
+    norms = np.linalg.norm(matrix_array, axis=1) * np.linalg.norm(vector_array)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (matrix_array @ vector_array) / norms
@@ -0,0 +1,34 @@
+"""Tests for similarity utilities."""
+
+import numpy as np
+import pytest
+
+from job_agent_backend.utils import cosine_similarities, cosine_similarity
+
+
+class TestCosineSimilarities:
+    """Tests for cosine_similarities function."""
+
+    def test_matches_pairwise_cosine_similarity(self):
+        """Each score equals the pairwise cosine similarity for that row."""
+        vector = [1.0, 2.0, 0.5]
+        matrix = [[1.0, 0.0, 0.0], [0.2, 0.4, 0.1], [-1.0, 3.0, 2.0]]
+
+        scores = cosine_similarities(matrix, vector)
+
+        expected = [cosine_similarity(row, vector) for row in matrix]
+        assert scores == pytest.approx(expected)
+
+    def test_returns_empty_array_for_empty_matrix(self):
+        """An empty matrix yields no scores."""
+        scores = cosine_similarities([], [1.0, 0.0])
+
+        assert len(scores) == 0
+
+    def test_zero_vector_row_is_not_similar(self):
+        """A zero row produces a score that never passes a threshold."""
+        scores = cosine_similarities([[0.0, 0.0], [1.0, 0.0]], [1.0, 0.0])
+
+        assert not scores[0] >= 0.4
+        assert scores[1] == pytest.approx(1.0)
+        assert isinstance(scores, np.ndarray)
@@ -0,0 +1,168 @@
+"""Lightweight stage timers for pipeline runs.
+
+A StageTimer accumulates wall-clock and CPU time per named stage and keeps the
+latency of every processed job, so a run can report where its time went. Timers
+are shared between the orchestrator, its worker threads and the workflow nodes,
+so recording is thread-safe.
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, Awaitable, Callable, Iterable, Iterator, TypeVar, cast
+
+import numpy as np
+
+from job_agent_platform_contracts import PipelineTimings, StageTimings
+
+
+T = TypeVar("T")
+
+_EXHAUSTED = object()
+
+
+class TimedStage(StrEnum):
+    """Stages timed outside the job processing workflow.
+
+    Workflow nodes are timed under their JobProcessingNode name.
+    """
+
+    SCRAPE_WAIT = "scrape_wait"
+    FILTER = "filter"
+    EMBEDDING = "embedding"
+
+
+@dataclass
+class _StageTotals:
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    calls: int = 0
+
+
+class StageTimer:
+    """Thread-safe accumulator of per-stage timings and per-job latencies.
+
+    CPU time is measured with the calling thread's CPU clock. For stages awaited on
+    an event loop it also includes other tasks run by the loop in the meantime, so
+    it is an upper bound there.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stages: dict[str, _StageTotals] = {}
+        self._job_latencies: list[float] = []
+        self._started_at = time.perf_counter()
+
+    def reset(self) -> None:
+        """Discard everything recorded so far and restart the elapsed clock."""
+        with self._lock:
+            self._stages.clear()
+            self._job_latencies.clear()
+            self._started_at = time.perf_counter()
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as one call of stage.
+
+        Args:
+            stage: Stage name to record the timing under
+        """
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.record(
+                stage,
+                time.perf_counter() - wall_start,
+                time.thread_time() - cpu_start,
+            )
+
+    def record(self, stage: str, wall_seconds: float, cpu_seconds: float = 0.0) -> None:
+        """Add one call of stage with the given durations.
+
+        Args:
+            stage: Stage name to record the timing under
+            wall_seconds: Wall-clock duration of the call
+            cpu_seconds: CPU time spent by the call
+        """
+        with self._lock:
+            totals = self._stages.setdefault(stage, _StageTotals())
+            totals.wall_seconds += wall_seconds
+            totals.cpu_seconds += cpu_seconds
+            totals.calls += 1
+
+    def record_job(self, latency_seconds: float) -> None:
+        """Record the end-to-end processing latency of one job.
+
+        Args:
+            latency_seconds: Time from starting the job's workflow to its result
+        """
+        with self._lock:
+            self._job_latencies.append(latency_seconds)
+
+    def iterate(self, stage: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Yield the items of iterable, timing each wait for the next item as stage."""
+        iterator = iter(iterable)
+        while True:
+            with self.measure(stage):
+                item = next(iterator, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                return
+            yield cast(T, item)
+
+    def wrap(self, stage: str, fn: Callable[..., T]) -> Callable[..., T]:
+        """Return fn timed as stage on every call."""
+
+        @functools.wraps(fn)
+        def timed(*args: Any, **kwargs: Any) -> T:
+            with self.measure(stage):
+                return fn(*args, **kwargs)
+
+        return timed
+
+    def wrap_async(
+        self, stage: str, afn: Callable[..., Awaitable[T]]
+    ) -> Callable[..., Awaitable[T]]:
+        """Return coroutine function afn timed as stage on every call."""
+
+        @functools.wraps(afn)
+        async def timed(*args: Any, **kwargs: Any) -> T:
+            with self.measure(stage):
+                return await afn(*args, **kwargs)
+
+        return timed
+
+    def summary(self) -> PipelineTimings:
+        """Return the timings recorded since creation or the last reset().
+
+        Returns:
+            Elapsed time, throughput, p50/p95 job latency and per-stage totals
+        """
+        with self._lock:
+            elapsed = time.perf_counter() - self._started_at
+            latencies = list(self._job_latencies)
+            stages: dict[str, StageTimings] = {
+                stage: {
+                    "wall_seconds": totals.wall_seconds,
+                    "cpu_seconds": totals.cpu_seconds,
+                    "calls": totals.calls,
+                }
+                for stage, totals in self._stages.items()
+            }
+
+        if latencies:
+            p50, p95 = (float(value) for value in np.percentile(latencies, [50, 95]))
+        else:
+            p50 = p95 = 0.0
+
+        return {
+            "elapsed_seconds": elapsed,
+            "jobs_per_second": len(latencies) / elapsed if elapsed > 0 else 0.0,
+            "job_latency_p50_seconds": p50,
+            "job_latency_p95_seconds": p95,
+            "stages": stages,
+        }
@@ -0,0 +1,106 @@
+"""Tests for the pipeline stage timer."""
+
+import time
+
+import pytest
+
+from job_agent_backend.utils.timing import StageTimer
+
+
+class TestStageTimer:
+    """Test suite for StageTimer."""
+
+    def test_measure_accumulates_calls_per_stage(self):
+        """Each measured block adds one call and its duration to its stage."""
+        timer = StageTimer()
+
+        for _ in range(2):
+            with timer.measure("filter"):
+                time.sleep(0.01)
+        with timer.measure("store_job"):
+            pass
+
+        stages = timer.summary()["stages"]
+        assert stages["filter"]["calls"] == 2
+        assert stages["filter"]["wall_seconds"] >= 0.02
+        assert stages["store_job"]["calls"] == 1
+
+    def test_measure_records_failed_calls(self):
+        """A block that raises is still timed."""
+        timer = StageTimer()
+
+        with pytest.raises(RuntimeError):
+            with timer.measure("store_job"):
+                raise RuntimeError("db down")
+
+        assert timer.summary()["stages"]["store_job"]["calls"] == 1
+
+    def test_iterate_times_each_wait_for_an_item(self):
+        """Waiting for every item, and for the end of the stream, is timed."""
+        timer = StageTimer()
+
+        def batches():
+            for batch in ([1], [2]):
+                time.sleep(0.01)
+                yield batch
+
+        assert list(timer.iterate("scrape_wait", batches())) == [[1], [2]]
+
+        stage = timer.summary()["stages"]["scrape_wait"]
+        assert stage["calls"] == 3
+        assert stage["wall_seconds"] >= 0.02
+
+    def test_wrapped_functions_keep_their_name(self):
+        """Wrapping preserves the function name used for graph node names."""
+        timer = StageTimer()
+
+        def check_job_relevance(state):
+            return state
+
+        wrapped = timer.wrap("check_job_relevance", check_job_relevance)
+
+        assert wrapped.__name__ == "check_job_relevance"
+        assert wrapped({"job": 1}) == {"job": 1}
+        assert timer.summary()["stages"]["check_job_relevance"]["calls"] == 1
+
+    async def test_wrap_async_times_coroutines(self):
+        """Async functions are timed across their awaits."""
+        timer = StageTimer()
+
+        async def extract(state):
+            return state
+
+        assert await timer.wrap_async("extract", extract)({"job": 1}) == {"job": 1}
+        assert timer.summary()["stages"]["extract"]["calls"] == 1
+
+    def test_summary_reports_latency_percentiles_and_throughput(self):
+        """Job latencies yield p50/p95 and jobs per second."""
+        timer = StageTimer()
+
+        for latency in range(1, 101):
+            timer.record_job(latency / 100)
+
+        summary = timer.summary()
+        assert summary["job_latency_p50_seconds"] == pytest.approx(0.505)
+        assert summary["job_latency_p95_seconds"] == pytest.approx(0.9505)
+        assert summary["jobs_per_second"] == pytest.approx(100 / summary["elapsed_seconds"])
+
+    def test_summary_without_jobs_is_zero(self):
+        """An empty timer reports zeros instead of failing."""
+        summary = StageTimer().summary()
+
+        assert summary["job_latency_p50_seconds"] == 0.0
+        assert summary["jobs_per_second"] == 0.0
+        assert summary["stages"] == {}
+
+    def test_reset_discards_recorded_timings(self):
+        """reset() starts a fresh measurement window."""
+        timer = StageTimer()
+        timer.record("filter", 1.0, 0.5)
+        timer.record_job(1.0)
+
+        timer.reset()
+
+        summary = timer.summary()
+        assert summary["stages"] == {}
+        assert summary["job_latency_p95_seconds"] == 0.0
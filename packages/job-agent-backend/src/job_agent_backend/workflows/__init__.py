@@ -3,12 +3,42 @@
 This package provides workflows for:
 - Job processing: relevance checking, skill extraction, and job analysis
 - PII removal: cleaning personally identifiable information from CVs
+
+Workflow modules import LangGraph and LangChain, so each of them is imported on
+first use of its exports rather than with this package.
 """
 
-from .job_processing.agent import run_job_processing
-from .pii_removal.agent import run_pii_removal
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .job_processing.agent import run_job_processing
+    from .job_processing.nodes import JobBatchWriter
+    from .job_processing.session import JobProcessingSession
+    from .job_processing.shared_results import SharedJobResults
+    from .pii_removal.agent import run_pii_removal
+
+_EXPORT_MODULES = {
+    "run_job_processing": ".job_processing.agent",
+    "JobBatchWriter": ".job_processing.nodes",
+    "JobProcessingSession": ".job_processing.session",
+    "SharedJobResults": ".job_processing.shared_results",
+    "run_pii_removal": ".pii_removal.agent",
+}
 
 __all__ = [
     "run_job_processing",
+    "JobBatchWriter",
+    "JobProcessingSession",
+    "SharedJobResults",
     "run_pii_removal",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
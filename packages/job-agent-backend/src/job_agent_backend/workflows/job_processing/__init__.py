@@ -1,7 +1,13 @@
 """Job processing workflow package."""
 
 from .agent import run_job_processing
+from .nodes import JobBatchWriter
+from .session import JobProcessingSession
+from .shared_results import SharedJobResults
 
 __all__ = [
     "run_job_processing",
+    "JobBatchWriter",
+    "JobProcessingSession",
+    "SharedJobResults",
 ]
@@ -5,16 +5,14 @@ This module provides the public API for running the workflows system.
 
 import logging
 import os
-from typing import Callable, Optional, cast
-
-from langchain_core.runnables import RunnableConfig
+from typing import Callable, Optional
 
 from job_agent_platform_contracts import IJobRepository
 
 from job_scrapper_contracts import JobDict
 
 from job_agent_backend.contracts import IModelFactory
-from .job_processing import create_workflow
+from .session import JobProcessingSession
 from .state import AgentState
 
 logger = logging.getLogger(__name__)
@@ -32,6 +30,10 @@ def run_job_processing(
     This is the main entry point for the workflows system. It accepts a single
     job dictionary and processes it through the langgraph workflow.
 
+    When processing many jobs against the same CV, create a JobProcessingSession
+    once and call its process() method instead, so the workflow and CV embedding
+    are reused across jobs.
+
     Args:
         job: A single job dictionary to process
         cv_content: The CV content to match against the job
@@ -64,36 +66,9 @@ def run_job_processing(
         logger.info("LangSmith tracing enabled - Project: %s", project_name)
         logger.info("View traces at: https://smith.langchain.com/")
 
-    if not cv_content:
-        raise ValueError("CV content is required but was not provided")
-
-    if not callable(job_repository_factory):
-        raise ValueError("job_repository_factory must be callable")
-
-    # Resolve model_factory from container if not provided
-    resolved_model_factory = model_factory
-    if resolved_model_factory is None:
-        from job_agent_backend.container import container
-
-        resolved_model_factory = container.model_factory()
-
-    workflow_config: RunnableConfig = {
-        "configurable": {
-            "job_repository_factory": job_repository_factory,
-            "model_factory": resolved_model_factory,
-        }
-    }
-
-    workflow = create_workflow(workflow_config)
-
-    initial_state: AgentState = {
-        "job": job,
-        "status": "started",
-        "cv_context": cv_content,
-    }
-
-    final_state = cast(AgentState, workflow.invoke(initial_state))
-
-    logger.info("Workflow completed with status: %s", final_state["status"])
-
-    return final_state
+    session = JobProcessingSession(
+        cv_content,
+        job_repository_factory=job_repository_factory,
+        model_factory=model_factory,
+    )
+    return session.process(job)
@@ -4,7 +4,7 @@ This module defines the graph structure and builds the complete workflow.
 """
 
 from collections.abc import Mapping
-from typing import Callable, Tuple, TypeGuard
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, Type, TypeGuard, TypeVar
 
 from job_agent_platform_contracts import IJobRepository
 from langgraph.graph import StateGraph, END
@@ -12,18 +12,30 @@ from langgraph.graph.state import CompiledStateGraph
 from langchain_core.runnables import RunnableConfig
 
 from job_agent_backend.contracts import IModelFactory
+from job_agent_backend.utils.timing import StageTimer
 from job_agent_backend.workflows.job_processing.node_names import JobProcessingNode
 from job_agent_backend.workflows.job_processing.nodes import (
     create_check_job_relevance_node,
+    create_extract_must_have_skills_async_node,
     create_extract_must_have_skills_node,
+    create_extract_nice_to_have_skills_async_node,
     create_extract_nice_to_have_skills_node,
+    create_extract_skills_async_node,
+    create_extract_skills_node,
     print_jobs_node,
+    create_reuse_duplicate_skills_node,
     create_store_job_node,
+    JobBatchWriter,
 )
 from job_agent_backend.workflows.job_processing.nodes.check_job_relevance import (
     route_after_relevance_check,
+    route_after_relevance_check_combined,
 )
-from job_agent_backend.workflows.job_processing.state import AgentState, as_node
+from job_agent_backend.workflows.job_processing.shared_results import SharedJobResults
+from job_agent_backend.workflows.job_processing.state import AgentState, as_dual_node, as_node
+
+
+T = TypeVar("T")
 
 
 def _is_job_repository_factory(val: object) -> TypeGuard[Callable[[], IJobRepository]]:
@@ -42,20 +54,31 @@ def create_workflow(config: RunnableConfig) -> CompiledStateGraph:
 
     The workflow processes a single job at a time and consists of:
     1. check_job_relevance - Checks if the job is relevant to the candidate's CV
-       - If relevant: continues to skill extraction
+    2. reuse_duplicate_skills - Copies the skills of a stored near-duplicate of a
+       relevant job, e.g. a vacancy re-posted under a new job ID
+       - If relevant and not a duplicate: continues to skill extraction
+       - If a duplicate: skips to store_job with the reused skills
        - If irrelevant: skips to store_job (stored with is_relevant=False)
-    2. extract_must_have_skills & extract_nice_to_have_skills - Run in parallel
+    3. extract_must_have_skills & extract_nice_to_have_skills - Run in parallel
        to extract both types of skills from job description using OpenAI
        (only for relevant jobs)
-    3. store_job - Stores all jobs to the database with is_relevant flag
+    4. store_job - Stores all jobs to the database with is_relevant flag and the
+       job embedding
        - Relevant jobs: stored with extracted skills and is_relevant=True
        - Irrelevant jobs: stored without skills and is_relevant=False
-    4. process_jobs - Receives and prints the single job with extracted skills
-    5. END - Terminates the workflow
+    5. process_jobs - Receives and prints the single job with extracted skills
+    6. END - Terminates the workflow
 
     Note: PII removal should be performed once before running this workflow
     on multiple jobs. See pii_graph.py for the PII removal workflow.
 
+    If the configuration provides a stage_timer, every node is timed under its
+    JobProcessingNode name. If it provides a job_writer, store_job hands jobs to
+    it to be stored in batches. If it provides shared_results, the CV-independent
+    skill extraction nodes share their results with other sessions using it. If
+    combined_skill_extraction is True, step 3 is a single extract_skills node that
+    fills both skill lists with one model call.
+
     Args:
         config: Runnable configuration providing dependency overrides
 
@@ -63,48 +86,110 @@ def create_workflow(config: RunnableConfig) -> CompiledStateGraph:
         Configured StateGraph ready for execution
     """
     job_repository_factory, model_factory = _resolve_dependencies(config)
+    stage_timer = _resolve_optional(config, "stage_timer", StageTimer)
+    job_writer = _resolve_optional(config, "job_writer", JobBatchWriter)
+    shared_results = _resolve_optional(config, "shared_results", SharedJobResults)
+    combined_skill_extraction = bool(_resolve_optional(config, "combined_skill_extraction", bool))
+
+    def timed(node: JobProcessingNode, fn: Callable[[AgentState], Any]) -> Any:
+        return stage_timer.wrap(node.value, fn) if stage_timer is not None else fn
+
+    def atimed(
+        node: JobProcessingNode, afn: Callable[[AgentState], Awaitable[Any]]
+    ) -> Callable[[AgentState], Awaitable[Any]]:
+        return stage_timer.wrap_async(node.value, afn) if stage_timer is not None else afn
+
+    def shared(node: JobProcessingNode) -> Optional[Callable[[Callable[[AgentState], T]], Any]]:
+        if shared_results is None:
+            return None
+        return lambda fn: shared_results.wrap(node.value, fn)
+
+    def ashared(
+        node: JobProcessingNode,
+    ) -> Optional[Callable[[Callable[[AgentState], Awaitable[T]]], Any]]:
+        if shared_results is None:
+            return None
+        return lambda afn: shared_results.wrap_async(node.value, afn)
 
     workflow = StateGraph(AgentState)
 
     check_job_relevance_node = create_check_job_relevance_node(model_factory)
-    workflow.add_node(JobProcessingNode.CHECK_JOB_RELEVANCE, as_node(check_job_relevance_node))
-
-    extract_must_have_skills_node = create_extract_must_have_skills_node(model_factory)
     workflow.add_node(
-        JobProcessingNode.EXTRACT_MUST_HAVE_SKILLS, as_node(extract_must_have_skills_node)
+        JobProcessingNode.CHECK_JOB_RELEVANCE,
+        as_node(timed(JobProcessingNode.CHECK_JOB_RELEVANCE, check_job_relevance_node)),
     )
 
-    extract_nice_to_have_skills_node = create_extract_nice_to_have_skills_node(model_factory)
+    reuse_duplicate_skills_node = create_reuse_duplicate_skills_node(job_repository_factory)
     workflow.add_node(
-        JobProcessingNode.EXTRACT_NICE_TO_HAVE_SKILLS,
-        as_node(extract_nice_to_have_skills_node),
+        JobProcessingNode.REUSE_DUPLICATE_SKILLS,
+        as_node(timed(JobProcessingNode.REUSE_DUPLICATE_SKILLS, reuse_duplicate_skills_node)),
     )
 
-    store_job_node = create_store_job_node(job_repository_factory)
-    workflow.add_node(JobProcessingNode.STORE_JOB, as_node(store_job_node))
+    def add_extraction_node(
+        node: JobProcessingNode,
+        create_node: Callable[..., Callable[[AgentState], Any]],
+        create_async_node: Callable[..., Callable[[AgentState], Awaitable[Any]]],
+    ) -> None:
+        # Model-bound nodes also get a native async implementation used by ainvoke()
+        workflow.add_node(
+            node,
+            as_dual_node(
+                # Only the model call is shared, so a failed call is never reused
+                timed(node, create_node(model_factory, share=shared(node))),
+                atimed(node, create_async_node(model_factory, share=ashared(node))),
+            ),
+        )
+
+    route_after_relevance: Callable[[AgentState], str | List[str]]
+    if combined_skill_extraction:
+        add_extraction_node(
+            JobProcessingNode.EXTRACT_SKILLS,
+            create_extract_skills_node,
+            create_extract_skills_async_node,
+        )
+        extraction_nodes = [JobProcessingNode.EXTRACT_SKILLS]
+        route_after_relevance = route_after_relevance_check_combined
+    else:
+        add_extraction_node(
+            JobProcessingNode.EXTRACT_MUST_HAVE_SKILLS,
+            create_extract_must_have_skills_node,
+            create_extract_must_have_skills_async_node,
+        )
+        add_extraction_node(
+            JobProcessingNode.EXTRACT_NICE_TO_HAVE_SKILLS,
+            create_extract_nice_to_have_skills_node,
+            create_extract_nice_to_have_skills_async_node,
+        )
+        extraction_nodes = [
+            JobProcessingNode.EXTRACT_MUST_HAVE_SKILLS,
+            JobProcessingNode.EXTRACT_NICE_TO_HAVE_SKILLS,
+        ]
+        route_after_relevance = route_after_relevance_check
+
+    store_job_node = create_store_job_node(job_repository_factory, job_writer, model_factory)
+    workflow.add_node(
+        JobProcessingNode.STORE_JOB, as_node(timed(JobProcessingNode.STORE_JOB, store_job_node))
+    )
 
     workflow.add_node(JobProcessingNode.PROCESS_JOBS, as_node(print_jobs_node))
 
     workflow.set_entry_point(JobProcessingNode.CHECK_JOB_RELEVANCE)
 
+    workflow.add_edge(
+        JobProcessingNode.CHECK_JOB_RELEVANCE, JobProcessingNode.REUSE_DUPLICATE_SKILLS
+    )
+
     workflow.add_conditional_edges(
-        JobProcessingNode.CHECK_JOB_RELEVANCE,
-        route_after_relevance_check,
+        JobProcessingNode.REUSE_DUPLICATE_SKILLS,
+        route_after_relevance,
         {
-            JobProcessingNode.EXTRACT_MUST_HAVE_SKILLS: JobProcessingNode.EXTRACT_MUST_HAVE_SKILLS,
-            JobProcessingNode.EXTRACT_NICE_TO_HAVE_SKILLS: JobProcessingNode.EXTRACT_NICE_TO_HAVE_SKILLS,
+            **{node: node for node in extraction_nodes},
             JobProcessingNode.STORE_JOB: JobProcessingNode.STORE_JOB,
         },
     )
 
-    workflow.add_edge(
-        JobProcessingNode.EXTRACT_MUST_HAVE_SKILLS,
-        JobProcessingNode.STORE_JOB,
-    )
-    workflow.add_edge(
-        JobProcessingNode.EXTRACT_NICE_TO_HAVE_SKILLS,
-        JobProcessingNode.STORE_JOB,
-    )
+    for node in extraction_nodes:
+        workflow.add_edge(node, JobProcessingNode.STORE_JOB)
 
     workflow.add_edge(JobProcessingNode.STORE_JOB, JobProcessingNode.PROCESS_JOBS)
     workflow.add_edge(JobProcessingNode.PROCESS_JOBS, END)
@@ -145,3 +230,13 @@ def _resolve_dependencies(
         return (job_repository_factory, model_factory)
 
     raise ValueError("Configuration is not a valid Mapping")
+
+
+def _resolve_optional(config: RunnableConfig, name: str, expected_type: Type[T]) -> Optional[T]:
+    """Return the optional dependency name from the RunnableConfig, if one is configured."""
+    configurable = config.get("configurable") if isinstance(config, Mapping) else None
+    if isinstance(configurable, Mapping):
+        value = configurable.get(name)
+        if isinstance(value, expected_type):
+            return value
+    return None
@@ -401,6 +401,7 @@ class TestJobProcessingWorkflow:
 
         mock_repository = MagicMock()
         mock_repository.create.return_value = MagicMock(id=42)
+        mock_repository.find_near_duplicate.return_value = None
         job_repository_factory = MagicMock(return_value=mock_repository)
 
         result = run_job_processing(
@@ -410,7 +411,9 @@ class TestJobProcessingWorkflow:
             model_factory=mock_factory,
         )
 
-        job_repository_factory.assert_called_once()
+        # Once for the near-duplicate lookup and once to store the job
+        assert job_repository_factory.call_count == 2
+        mock_repository.find_near_duplicate.assert_called_once_with(sample_job_dict["description"])
         mock_repository.create.assert_called_once()
         created_job = mock_repository.create.call_args[0][0]
         # Both skill extraction nodes use same model_id, so they extract same skills
@@ -419,6 +422,40 @@ class TestJobProcessingWorkflow:
         assert created_job["nice_to_have_skills"] == [["Python"], ["Django"]]
         assert result["status"] == "completed"
 
+    def test_near_duplicate_job_reuses_stored_skills(
+        self,
+        sample_job_dict,
+        sample_cv_content,
+        mock_embedding_model_factory,
+    ):
+        """Test that a re-posted job copies the skills of its stored near-duplicate."""
+        embedding_model = mock_embedding_model_factory(similarity_score=0.8)
+        skills_model = MagicMock()
+        mock_factory = MagicMock()
+        mock_factory.get_model.side_effect = lambda **kwargs: (
+            embedding_model if kwargs.get("model_id") == "embedding" else skills_model
+        )
+
+        mock_repository = MagicMock()
+        mock_repository.find_near_duplicate.return_value = MagicMock(
+            id=7, must_have_skills=[["Python"]], nice_to_have_skills=[["Docker"]]
+        )
+
+        result = run_job_processing(
+            sample_job_dict,
+            sample_cv_content,
+            job_repository_factory=lambda: mock_repository,
+            model_factory=mock_factory,
+        )
+
+        assert result["duplicate_job_id"] == 7
+        assert result["extracted_must_have_skills"] == [["Python"]]
+        assert result["extracted_nice_to_have_skills"] == [["Docker"]]
+        skills_model.with_structured_output.assert_not_called()
+        created_job = mock_repository.create.call_args[0][0]
+        assert created_job["must_have_skills"] == [["Python"]]
+        assert created_job["nice_to_have_skills"] == [["Docker"]]
+
     def test_workflow_continues_after_store_job_error(
         self,
         sample_job_dict,
@@ -1,10 +1,11 @@
+import threading
 from collections.abc import Mapping
 from typing import Any, cast
 
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph.state import CompiledStateGraph
 
-from job_agent_backend.container import container
+from job_agent_backend.container import container, warm_up
 from job_agent_backend.workflows.job_processing.job_processing import create_workflow
 
 
@@ -35,6 +36,27 @@ def _prepare_config(config: RunnableConfig | None) -> RunnableConfig:
     return cast(RunnableConfig, prepared)
 
 
+_warmup_lock = threading.Lock()
+_warmup_started = False
+
+
+def _start_warm_up() -> None:
+    """Warm up models and the database pool in the background, once per process.
+
+    The LangGraph server does not scrape, so the broker is left alone.
+    """
+    global _warmup_started
+    with _warmup_lock:
+        if _warmup_started:
+            return
+        _warmup_started = True
+    threading.Thread(
+        target=warm_up, kwargs={"message_broker": False}, name="warmup", daemon=True
+    ).start()
+
+
 def create_workflow_with_dependencies(config: RunnableConfig | None = None) -> CompiledStateGraph:
+    # The server builds the graph when it loads it, so models warm up while it starts
+    _start_warm_up()
     resolved_config = _prepare_config(config)
     return create_workflow(resolved_config)
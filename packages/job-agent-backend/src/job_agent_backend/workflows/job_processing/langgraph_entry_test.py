@@ -0,0 +1,23 @@
+"""Tests for the LangGraph server entry point."""
+
+from unittest.mock import MagicMock, patch
+
+from job_agent_backend.workflows.job_processing import langgraph_entry
+
+
+class TestStartWarmUp:
+    """Tests for the warm-up started by the LangGraph entry point."""
+
+    def test_warm_up_starts_once_without_the_broker(self, monkeypatch):
+        """The first graph build warms up models and database, later builds do not."""
+        monkeypatch.setattr(langgraph_entry, "_warmup_started", False)
+        thread = MagicMock()
+
+        with patch.object(langgraph_entry.threading, "Thread", thread):
+            langgraph_entry._start_warm_up()
+            langgraph_entry._start_warm_up()
+
+        thread.assert_called_once()
+        assert thread.call_args.kwargs["target"] is langgraph_entry.warm_up
+        assert thread.call_args.kwargs["kwargs"] == {"message_broker": False}
+        thread.return_value.start.assert_called_once()
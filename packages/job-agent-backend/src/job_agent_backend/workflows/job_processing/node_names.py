@@ -5,7 +5,9 @@ from enum import StrEnum
 
 class JobProcessingNode(StrEnum):
     CHECK_JOB_RELEVANCE = "check_job_relevance"
+    REUSE_DUPLICATE_SKILLS = "reuse_duplicate_skills"
     EXTRACT_MUST_HAVE_SKILLS = "extract_must_have_skills"
     EXTRACT_NICE_TO_HAVE_SKILLS = "extract_nice_to_have_skills"
+    EXTRACT_SKILLS = "extract_skills"
     STORE_JOB = "store_job"
     PROCESS_JOBS = "process_jobs"
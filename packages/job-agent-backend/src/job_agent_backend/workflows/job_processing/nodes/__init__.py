@@ -1,15 +1,29 @@
 """Job processing nodes package."""
 
 from .check_job_relevance import create_check_job_relevance_node
-from .extract_must_have_skills import create_extract_must_have_skills_node
-from .extract_nice_to_have_skills import create_extract_nice_to_have_skills_node
+from .extract_must_have_skills import (
+    create_extract_must_have_skills_async_node,
+    create_extract_must_have_skills_node,
+)
+from .extract_nice_to_have_skills import (
+    create_extract_nice_to_have_skills_async_node,
+    create_extract_nice_to_have_skills_node,
+)
+from .extract_skills import create_extract_skills_async_node, create_extract_skills_node
 from .print_jobs import print_jobs_node
-from .store_job import create_store_job_node
+from .reuse_duplicate_skills import create_reuse_duplicate_skills_node
+from .store_job import JobBatchWriter, create_store_job_node
 
 __all__ = [
     "create_check_job_relevance_node",
     "create_extract_must_have_skills_node",
+    "create_extract_must_have_skills_async_node",
     "create_extract_nice_to_have_skills_node",
+    "create_extract_nice_to_have_skills_async_node",
+    "create_extract_skills_node",
+    "create_extract_skills_async_node",
     "print_jobs_node",
+    "create_reuse_duplicate_skills_node",
     "create_store_job_node",
+    "JobBatchWriter",
 ]
@@ -3,7 +3,16 @@
 This node determines if a job is relevant to the candidate based on their CV.
 """
 
-from .node import create_check_job_relevance_node
-from .routing import route_after_relevance_check
+from .batch import JobRelevance, acheck_jobs_relevance, check_jobs_relevance
+from .node import RELEVANCE_THRESHOLD, create_check_job_relevance_node
+from .routing import route_after_relevance_check, route_after_relevance_check_combined
 
-__all__ = ["create_check_job_relevance_node", "route_after_relevance_check"]
+__all__ = [
+    "JobRelevance",
+    "RELEVANCE_THRESHOLD",
+    "acheck_jobs_relevance",
+    "check_jobs_relevance",
+    "create_check_job_relevance_node",
+    "route_after_relevance_check",
+    "route_after_relevance_check_combined",
+]
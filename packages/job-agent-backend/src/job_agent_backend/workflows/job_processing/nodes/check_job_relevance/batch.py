@@ -0,0 +1,110 @@
+"""Batch relevance check for a group of jobs.
+
+Scores every job of a scrape batch against the CV with a single embedding call
+and one matrix-vector product, so the per-job workflow can skip its own
+relevance computation. The job embeddings are returned with the flags, so
+store_job stores them instead of embedding the jobs again.
+"""
+
+import logging
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence, Tuple
+
+from job_scrapper_contracts import JobDict
+
+from job_agent_backend.utils import cosine_similarities
+from .node import RELEVANCE_THRESHOLD, build_job_text
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+
+class JobRelevance(NamedTuple):
+    """Relevance of a job and the embedding it was decided with."""
+
+    is_relevant: Optional[bool]
+    job_embedding: Optional[List[float]] = None
+
+
+def check_jobs_relevance(
+    jobs: Sequence[JobDict],
+    cv_embedding: Sequence[float],
+    embedding_model: "Embeddings",
+) -> List[JobRelevance]:
+    """
+    Decide relevance for a batch of jobs against a precomputed CV embedding.
+
+    Jobs without a description are treated as relevant without an embedding,
+    matching the per-job check_job_relevance_node behaviour.
+
+    Args:
+        jobs: Jobs to score
+        cv_embedding: Embedding of the candidate's CV
+        embedding_model: Model used to embed the job texts
+
+    Returns:
+        Relevance flag and job embedding for each job, in input order
+    """
+    relevance, scored_indexes = _prepare(jobs)
+    if not scored_indexes:
+        return relevance
+
+    job_embeddings = embedding_model.embed_documents(
+        [build_job_text(jobs[idx]) for idx in scored_indexes]
+    )
+    return _score(jobs, relevance, scored_indexes, job_embeddings, cv_embedding)
+
+
+async def acheck_jobs_relevance(
+    jobs: Sequence[JobDict],
+    cv_embedding: Sequence[float],
+    embedding_model: "Embeddings",
+) -> List[JobRelevance]:
+    """
+    Async variant of check_jobs_relevance using the model's aembed_documents().
+
+    Args:
+        jobs: Jobs to score
+        cv_embedding: Embedding of the candidate's CV
+        embedding_model: Model used to embed the job texts
+
+    Returns:
+        Relevance flag and job embedding for each job, in input order
+    """
+    relevance, scored_indexes = _prepare(jobs)
+    if not scored_indexes:
+        return relevance
+
+    job_embeddings = await embedding_model.aembed_documents(
+        [build_job_text(jobs[idx]) for idx in scored_indexes]
+    )
+    return _score(jobs, relevance, scored_indexes, job_embeddings, cv_embedding)
+
+
+def _prepare(jobs: Sequence[JobDict]) -> Tuple[List[JobRelevance], List[int]]:
+    relevance = [JobRelevance(is_relevant=True)] * len(jobs)
+    scored_indexes = [idx for idx, job in enumerate(jobs) if job.get("description")]
+    return relevance, scored_indexes
+
+
+def _score(
+    jobs: Sequence[JobDict],
+    relevance: List[JobRelevance],
+    scored_indexes: List[int],
+    job_embeddings: List[List[float]],
+    cv_embedding: Sequence[float],
+) -> List[JobRelevance]:
+    similarities = cosine_similarities(job_embeddings, cv_embedding)
+
+    for idx, job_embedding, similarity in zip(scored_indexes, job_embeddings, similarities):
+        is_relevant = bool(similarity >= RELEVANCE_THRESHOLD)
+        relevance[idx] = JobRelevance(is_relevant, list(job_embedding))
+        logger.info(
+            "Job (ID: %s): %s (Similarity: %.4f)",
+            jobs[idx].get("job_id"),
+            "RELEVANT" if is_relevant else "IRRELEVANT",
+            similarity,
+        )
+
+    return relevance
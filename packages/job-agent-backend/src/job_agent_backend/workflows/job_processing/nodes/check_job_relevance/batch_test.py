@@ -0,0 +1,110 @@
+"""Tests for batch relevance check."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from .batch import JobRelevance, acheck_jobs_relevance, check_jobs_relevance
+
+
+def _create_embedding_model(job_embeddings: list[list[float]]) -> MagicMock:
+    """Create a mock embedding model returning the given job embeddings."""
+    mock_model = MagicMock()
+    mock_model.embed_documents.return_value = job_embeddings
+    return mock_model
+
+
+class TestCheckJobsRelevance:
+    """Tests for check_jobs_relevance function."""
+
+    def test_embeds_all_jobs_in_one_call(self):
+        """All job texts are embedded with a single embed_documents call."""
+        jobs = [
+            {"job_id": 1, "title": "Python Dev", "description": "Python"},
+            {"job_id": 2, "title": "Java Dev", "description": "Java"},
+        ]
+        mock_model = _create_embedding_model([[1.0, 0.0], [0.0, 1.0]])
+
+        check_jobs_relevance(jobs, [1.0, 0.0], mock_model)
+
+        mock_model.embed_documents.assert_called_once_with(
+            ["Python Dev\n\nPython", "Java Dev\n\nJava"]
+        )
+        mock_model.embed_query.assert_not_called()
+
+    def test_applies_relevance_threshold(self):
+        """Jobs at or above the threshold are relevant, jobs below it are not."""
+        jobs = [{"job_id": i, "title": "Dev", "description": "desc"} for i in range(3)]
+        mock_model = _create_embedding_model([[0.8, 0.6], [0.4, 0.9165], [0.3, 0.9539]])
+
+        result = check_jobs_relevance(jobs, [1.0, 0.0], mock_model)
+
+        assert [relevance.is_relevant for relevance in result] == [True, True, False]
+
+    def test_jobs_without_description_are_relevant_and_not_embedded(self):
+        """Jobs without a description are relevant and skipped by the embedding call."""
+        jobs = [
+            {"job_id": 1, "title": "Dev"},
+            {"job_id": 2, "title": "Java Dev", "description": "Java"},
+        ]
+        mock_model = _create_embedding_model([[0.0, 1.0]])
+
+        result = check_jobs_relevance(jobs, [1.0, 0.0], mock_model)
+
+        assert result == [JobRelevance(True), JobRelevance(False, [0.0, 1.0])]
+        mock_model.embed_documents.assert_called_once_with(["Java Dev\n\nJava"])
+
+    def test_returns_job_embeddings_with_flags(self):
+        """Each scored job carries the embedding its relevance was decided with."""
+        jobs = [
+            {"job_id": 1, "title": "Python Dev", "description": "Python"},
+            {"job_id": 2, "title": "Java Dev", "description": "Java"},
+        ]
+        mock_model = _create_embedding_model([[1.0, 0.0], [0.0, 1.0]])
+
+        result = check_jobs_relevance(jobs, [1.0, 0.0], mock_model)
+
+        assert [relevance.job_embedding for relevance in result] == [[1.0, 0.0], [0.0, 1.0]]
+
+    def test_returns_empty_list_for_no_jobs(self):
+        """No jobs means no embedding call."""
+        mock_model = _create_embedding_model([])
+
+        assert check_jobs_relevance([], [1.0, 0.0], mock_model) == []
+        mock_model.embed_documents.assert_not_called()
+
+    def test_propagates_embedding_errors(self):
+        """Embedding failures are raised so callers can fall back to per-job checks."""
+        mock_model = MagicMock()
+        mock_model.embed_documents.side_effect = Exception("Model unavailable")
+
+        with pytest.raises(Exception, match="Model unavailable"):
+            check_jobs_relevance(
+                [{"job_id": 1, "title": "Dev", "description": "Python"}], [1.0, 0.0], mock_model
+            )
+
+
+class TestAcheckJobsRelevance:
+    """Tests for acheck_jobs_relevance function."""
+
+    async def test_embeds_all_jobs_with_one_async_call(self):
+        """The async variant awaits a single aembed_documents call."""
+        jobs = [
+            {"job_id": 1, "title": "Python Dev", "description": "Python"},
+            {"job_id": 2, "title": "Java Dev", "description": "Java"},
+            {"job_id": 3, "title": "No description"},
+        ]
+        mock_model = MagicMock()
+        mock_model.aembed_documents = AsyncMock(return_value=[[1.0, 0.0], [0.0, 1.0]])
+
+        result = await acheck_jobs_relevance(jobs, [1.0, 0.0], mock_model)
+
+        assert result == [
+            JobRelevance(True, [1.0, 0.0]),
+            JobRelevance(False, [0.0, 1.0]),
+            JobRelevance(True),
+        ]
+        mock_model.aembed_documents.assert_awaited_once_with(
+            ["Python Dev\n\nPython", "Java Dev\n\nJava"]
+        )
+        mock_model.embed_documents.assert_not_called()
@@ -1,15 +1,31 @@
 """Check job relevance node implementation."""
 
 import logging
-from typing import Callable
+from functools import cache
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+from job_scrapper_contracts import JobDict
 
 from job_agent_backend.contracts import IModelFactory
 from job_agent_backend.utils import cosine_similarity
 from ...state import AgentState
 from .result import CheckRelevanceResult
 
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+
 logger = logging.getLogger(__name__)
 
+# Threshold for relevance
+# 0.4 is a reasonable starting point for multilingual-cased-v2
+# It allows for some semantic overlap without requiring exact matches
+RELEVANCE_THRESHOLD = 0.4
+
+
+def build_job_text(job: JobDict) -> str:
+    """Build the text embedded for a job, combining its title and description."""
+    return f"{job.get('title', 'Unknown')}\n\n{job.get('description', '')}"
+
 
 def create_check_job_relevance_node(
     model_factory: IModelFactory,
@@ -24,6 +40,11 @@ def create_check_job_relevance_node(
         Configured check_job_relevance_node function
     """
 
+    @cache
+    def get_embedding_model() -> "Embeddings":
+        """Resolve the embedding model once and reuse it across jobs."""
+        return model_factory.get_model(model_id="embedding")
+
     def check_job_relevance_node(state: AgentState) -> CheckRelevanceResult:
         """
         Check if a job is relevant to the candidate based on their CV.
@@ -32,49 +53,60 @@ def create_check_job_relevance_node(
         posting against the candidate's CV. It's configured to be lenient and
         default to marking jobs as relevant unless they're clearly mismatched.
 
+        If the state carries a precomputed cv_embedding, it is reused instead of
+        embedding the CV again for every job. If is_relevant was already decided by
+        a batch relevance check, it is passed through unchanged.
+
         Args:
-            state: Current agent state containing job and cv_context
+            state: Current agent state containing job, cv_context and optionally cv_embedding
 
         Returns:
-            State update containing the "is_relevant" flag based on the LLM decision
+            State update containing the "is_relevant" flag based on the LLM decision,
+            and the job embedding when one was computed so the job is stored with it
         """
         job = state["job"]
         job_id = job.get("job_id")
         cv_context = state.get("cv_context", "")
 
+        precomputed_relevance = state.get("is_relevant")
+        if precomputed_relevance is not None:
+            logger.info(
+                "Job (ID: %s): Relevance precomputed in batch (%s)",
+                job_id,
+                "RELEVANT" if precomputed_relevance else "IRRELEVANT",
+            )
+            return {"is_relevant": precomputed_relevance}
+
         logger.info("Checking relevance for job ID %s", job_id)
 
         if not cv_context:
             logger.info("Job (ID: %s): No CV context available, assuming relevant", job_id)
             return {"is_relevant": True}
 
-        job_title = job.get("title", "Unknown")
         job_description = job.get("description", "")
 
         if not job_description:
             logger.info("Job (ID: %s): No description available, assuming relevant", job_id)
             return {"is_relevant": True}
 
+        job_embedding: Optional[List[float]] = None
         try:
-            model = model_factory.get_model(model_id="embedding")
+            model = get_embedding_model()
 
             # Prepare texts for embedding
             # We combine title and description for the job representation
-            job_text = f"{job_title}\n\n{job_description}"
+            job_text = build_job_text(job)
 
-            # Embed both texts
-            cv_embedding = model.embed_query(cv_context)
+            # Embed both texts, reusing the CV embedding when it was precomputed
+            cv_embedding = state.get("cv_embedding")
+            if cv_embedding is None:
+                cv_embedding = model.embed_query(cv_context)
             job_embedding = model.embed_query(job_text)
 
             # Calculate cosine similarity
             similarity = cosine_similarity(cv_embedding, job_embedding)
 
-            # Threshold for relevance
-            # 0.4 is a reasonable starting point for multilingual-cased-v2
-            # It allows for some semantic overlap without requiring exact matches
-            THRESHOLD = 0.4
-
-            is_relevant = bool(similarity >= THRESHOLD)
+            is_relevant = bool(similarity >= RELEVANCE_THRESHOLD)
             relevance_status = "RELEVANT" if is_relevant else "IRRELEVANT"
 
             logger.info("Job (ID: %s): %s (Similarity: %.4f)", job_id, relevance_status, similarity)
@@ -89,6 +121,8 @@ def create_check_job_relevance_node(
 
         logger.info("Finished checking relevance for job ID %s", job_id)
 
-        return {"is_relevant": is_relevant}
+        if job_embedding is None:
+            return {"is_relevant": is_relevant}
+        return {"is_relevant": is_relevant, "job_embedding": list(job_embedding)}
 
     return check_job_relevance_node
@@ -137,3 +137,73 @@ class TestCheckJobRelevanceNode:
         result = node(state)
 
         assert result["is_relevant"] is False
+
+    def test_uses_precomputed_cv_embedding_from_state(self):
+        """Node embeds only the job text when the state carries a CV embedding."""
+        mock_model = MagicMock()
+        mock_model.embed_query.return_value = [1.0, 0.0, 0.0]
+        mock_factory = _create_mock_factory_with_model(mock_model)
+        node = create_check_job_relevance_node(mock_factory)
+
+        state = {
+            "job": {"job_id": 1, "title": "Developer", "description": "Python developer"},
+            "status": "started",
+            "cv_context": "Python developer with 5 years experience",
+            "cv_embedding": [1.0, 0.0, 0.0],
+        }
+
+        result = node(state)
+
+        assert result["is_relevant"] is True
+        mock_model.embed_query.assert_called_once_with("Developer\n\nPython developer")
+
+    def test_resolves_embedding_model_once_across_jobs(self):
+        """Node resolves the embedding model on first use and reuses it."""
+        mock_model = MagicMock()
+        mock_model.embed_query.return_value = [1.0, 0.0, 0.0]
+        mock_factory = _create_mock_factory_with_model(mock_model)
+        node = create_check_job_relevance_node(mock_factory)
+
+        for job_id in range(3):
+            node(
+                {
+                    "job": {"job_id": job_id, "title": "Dev", "description": "Python"},
+                    "status": "started",
+                    "cv_context": "Python developer",
+                }
+            )
+
+        mock_factory.get_model.assert_called_once_with(model_id="embedding")
+
+    def test_passes_through_precomputed_relevance(self):
+        """Node keeps is_relevant decided by a batch check without embedding anything."""
+        mock_factory = MagicMock()
+        node = create_check_job_relevance_node(mock_factory)
+
+        state = {
+            "job": {"job_id": 1, "title": "Developer", "description": "Java developer"},
+            "status": "started",
+            "cv_context": "Python developer with 5 years experience",
+            "is_relevant": False,
+        }
+
+        result = node(state)
+
+        assert result["is_relevant"] is False
+        mock_factory.get_model.assert_not_called()
+
+    def test_returns_job_embedding_for_storage(self):
+        """Node passes on the job embedding it computed so the job is stored with it."""
+        mock_model = MagicMock()
+        mock_model.embed_query.side_effect = [[1.0, 0.0], [0.8, 0.6]]
+        node = create_check_job_relevance_node(_create_mock_factory_with_model(mock_model))
+
+        state = {
+            "job": {"job_id": 1, "title": "Developer", "description": "Python developer"},
+            "status": "started",
+            "cv_context": "Python developer with 5 years experience",
+        }
+
+        result = node(state)
+
+        assert result == {"is_relevant": True, "job_embedding": [0.8, 0.6]}
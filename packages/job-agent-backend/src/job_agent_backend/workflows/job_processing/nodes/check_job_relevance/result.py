@@ -1,9 +1,12 @@
 """Result type for check_job_relevance node."""
 
-from typing_extensions import TypedDict
+from typing import List
+
+from typing_extensions import NotRequired, TypedDict
 
 
 class CheckRelevanceResult(TypedDict):
     """Result from check_job_relevance node."""
 
     is_relevant: bool
+    job_embedding: NotRequired[List[float]]
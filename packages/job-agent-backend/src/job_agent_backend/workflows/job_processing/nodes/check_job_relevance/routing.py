@@ -14,12 +14,30 @@ def route_after_relevance_check(state: AgentState) -> str | List[str]:
 
     Returns:
         List of node names to execute in parallel if relevant,
-        STORE_JOB if irrelevant (to store with is_relevant=False)
+        STORE_JOB if irrelevant (to store with is_relevant=False) or if the
+        skills of a near-duplicate job were reused
     """
     is_relevant = state.get("is_relevant", True)
-    if not is_relevant:
+    if not is_relevant or "duplicate_job_id" in state:
         return JobProcessingNode.STORE_JOB
     return [
         JobProcessingNode.EXTRACT_MUST_HAVE_SKILLS,
         JobProcessingNode.EXTRACT_NICE_TO_HAVE_SKILLS,
     ]
+
+
+def route_after_relevance_check_combined(state: AgentState) -> str:
+    """
+    Route to the combined skill extraction node based on job relevance.
+
+    Args:
+        state: Current agent state
+
+    Returns:
+        EXTRACT_SKILLS if relevant, STORE_JOB if irrelevant (to store with
+        is_relevant=False) or if the skills of a near-duplicate job were reused
+    """
+    is_relevant = state.get("is_relevant", True)
+    if not is_relevant or "duplicate_job_id" in state:
+        return JobProcessingNode.STORE_JOB
+    return JobProcessingNode.EXTRACT_SKILLS
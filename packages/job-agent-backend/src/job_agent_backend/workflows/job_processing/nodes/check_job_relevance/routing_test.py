@@ -54,3 +54,19 @@ class TestRouteAfterRelevanceCheck:
             JobProcessingNode.EXTRACT_MUST_HAVE_SKILLS,
             JobProcessingNode.EXTRACT_NICE_TO_HAVE_SKILLS,
         ]
+
+    def test_returns_store_job_when_duplicate_skills_reused(self):
+        """Routing skips extraction when a near-duplicate's skills were reused."""
+        state = {
+            "job": {"job_id": 1},
+            "status": "started",
+            "cv_context": "Some CV",
+            "is_relevant": True,
+            "duplicate_job_id": 7,
+            "extracted_must_have_skills": [["Python"]],
+            "extracted_nice_to_have_skills": [],
+        }
+
+        result = route_after_relevance_check(state)
+
+        assert result == JobProcessingNode.STORE_JOB
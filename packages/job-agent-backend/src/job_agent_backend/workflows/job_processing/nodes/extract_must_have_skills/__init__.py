@@ -3,6 +3,12 @@
 This node extracts must-have skills from a single job description using OpenAI.
 """
 
-from .node import create_extract_must_have_skills_node
+from .node import (
+    create_extract_must_have_skills_async_node,
+    create_extract_must_have_skills_node,
+)
 
-__all__ = ["create_extract_must_have_skills_node"]
+__all__ = [
+    "create_extract_must_have_skills_async_node",
+    "create_extract_must_have_skills_node",
+]
@@ -1,8 +1,8 @@
 """Tests for extract_must_have_skills node."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
-from .node import create_extract_must_have_skills_node
+from .node import create_extract_must_have_skills_async_node, create_extract_must_have_skills_node
 from .schemas import SkillsExtraction
 
 
@@ -292,3 +292,62 @@ class TestExtractMustHaveSkillsNodeWith2DSkillStructure:
         assert len(skills) > 0
         assert isinstance(skills[0], list)
         assert isinstance(skills[0][0], str)
+
+    def test_reuses_structured_model_across_jobs(self):
+        """Node builds the structured-output wrapper once and reuses it for later jobs."""
+        mock_model = _create_mock_model([["Python"]])
+        mock_factory = _create_mock_factory(mock_model)
+        node = create_extract_must_have_skills_node(mock_factory)
+
+        for job_id in range(3):
+            node(
+                {
+                    "job": {"job_id": job_id, "title": "Dev", "description": "Python developer"},
+                    "status": "started",
+                    "cv_context": "Developer",
+                }
+            )
+
+        mock_factory.get_model.assert_called_once_with(model_id="skill-extraction")
+        mock_model.with_structured_output.assert_called_once_with(SkillsExtraction)
+        assert mock_model.with_structured_output.return_value.invoke.call_count == 3
+
+
+class TestExtractMustHaveSkillsAsyncNode:
+    """Tests for the async variant of extract_must_have_skills_node."""
+
+    async def test_awaits_async_model_api(self):
+        """Async node awaits ainvoke and never calls the blocking invoke."""
+        mock_model = _create_mock_model([])
+        mock_structured = mock_model.with_structured_output.return_value
+        mock_structured.ainvoke = AsyncMock(return_value=SkillsExtraction(skills=[["Python"]]))
+        node = create_extract_must_have_skills_async_node(_create_mock_factory(mock_model))
+
+        result = await node(
+            {
+                "job": {"job_id": 1, "title": "Dev", "description": "Python developer"},
+                "status": "started",
+                "cv_context": "Developer",
+            }
+        )
+
+        assert result["extracted_must_have_skills"] == [["Python"]]
+        mock_structured.ainvoke.assert_awaited_once()
+        mock_structured.invoke.assert_not_called()
+
+    async def test_returns_empty_list_on_model_exception(self):
+        """Async node returns empty skills list when the model call fails."""
+        mock_model = _create_mock_model([])
+        mock_structured = mock_model.with_structured_output.return_value
+        mock_structured.ainvoke = AsyncMock(side_effect=Exception("Model unavailable"))
+        node = create_extract_must_have_skills_async_node(_create_mock_factory(mock_model))
+
+        result = await node(
+            {
+                "job": {"job_id": 1, "title": "Dev", "description": "Python developer"},
+                "status": "started",
+                "cv_context": "Developer",
+            }
+        )
+
+        assert result["extracted_must_have_skills"] == []
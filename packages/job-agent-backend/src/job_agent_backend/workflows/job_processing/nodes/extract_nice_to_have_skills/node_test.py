@@ -292,3 +292,22 @@ class TestExtractNiceToHaveSkillsNodeWith2DSkillStructure:
         assert len(skills) > 0
         assert isinstance(skills[0], list)
         assert isinstance(skills[0][0], str)
+
+    def test_reuses_structured_model_across_jobs(self):
+        """Node builds the structured-output wrapper once and reuses it for later jobs."""
+        mock_model = _create_mock_model([["Docker"]])
+        mock_factory = _create_mock_factory(mock_model)
+        node = create_extract_nice_to_have_skills_node(mock_factory)
+
+        for job_id in range(3):
+            node(
+                {
+                    "job": {"job_id": job_id, "title": "Dev", "description": "Docker nice to have"},
+                    "status": "started",
+                    "cv_context": "Developer",
+                }
+            )
+
+        mock_factory.get_model.assert_called_once_with(model_id="skill-extraction")
+        mock_model.with_structured_output.assert_called_once_with(SkillsExtraction)
+        assert mock_model.with_structured_output.return_value.invoke.call_count == 3
@@ -0,0 +1,12 @@
+"""Combined skill extraction node for the workflows workflow.
+
+This node extracts must-have and nice-to-have skills from a single job
+description with one model call.
+"""
+
+from .node import create_extract_skills_async_node, create_extract_skills_node
+
+__all__ = [
+    "create_extract_skills_async_node",
+    "create_extract_skills_node",
+]
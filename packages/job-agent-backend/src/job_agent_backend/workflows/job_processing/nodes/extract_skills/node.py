@@ -0,0 +1,71 @@
+"""Extract skills node implementation.
+
+Extracts must-have and nice-to-have skills with a single structured-output call,
+so the job description is evaluated by the model once instead of once per list.
+"""
+
+from typing import Awaitable, Callable, Optional
+
+from .....model_providers import IModelFactory
+from ...state import AgentState
+from ..skill_extraction import SkillExtraction
+from .schemas import CombinedSkillsExtraction
+from .prompts import EXTRACT_SKILLS_PROMPT
+from .result import ExtractSkillsResult
+
+
+_EXTRACTION: SkillExtraction[ExtractSkillsResult] = SkillExtraction(
+    name="extract_skills_node",
+    label="must-have and nice-to-have skills",
+    run_name="Extract Skills",
+    prompt=EXTRACT_SKILLS_PROMPT,
+    schema=CombinedSkillsExtraction,
+    result_fields={
+        "extracted_must_have_skills": "must_have_skills",
+        "extracted_nice_to_have_skills": "nice_to_have_skills",
+    },
+)
+
+
+def create_extract_skills_node(
+    model_factory: IModelFactory,
+    share: Optional[
+        Callable[
+            [Callable[[AgentState], ExtractSkillsResult]],
+            Callable[[AgentState], ExtractSkillsResult],
+        ]
+    ] = None,
+) -> Callable[[AgentState], ExtractSkillsResult]:
+    """
+    Factory function to create an extract_skills_node with injected dependencies.
+
+    Args:
+        model_factory: Factory used to create model instances
+        share: Optional wrapper around the model call, such as SharedJobResults.wrap
+
+    Returns:
+        Configured extract_skills_node function
+    """
+    return _EXTRACTION.create_node(model_factory, share)
+
+
+def create_extract_skills_async_node(
+    model_factory: IModelFactory,
+    share: Optional[
+        Callable[
+            [Callable[[AgentState], Awaitable[ExtractSkillsResult]]],
+            Callable[[AgentState], Awaitable[ExtractSkillsResult]],
+        ]
+    ] = None,
+) -> Callable[[AgentState], Awaitable[ExtractSkillsResult]]:
+    """
+    Factory function to create the async variant of extract_skills_node.
+
+    Args:
+        model_factory: Factory used to create model instances
+        share: Optional wrapper around the model call, such as SharedJobResults.wrap
+
+    Returns:
+        Configured coroutine function with the same behaviour as the sync node
+    """
+    return _EXTRACTION.create_async_node(model_factory, share)
@@ -0,0 +1,128 @@
+"""Tests for extract_skills node."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from .node import create_extract_skills_async_node, create_extract_skills_node
+from .schemas import CombinedSkillsExtraction
+
+
+def _create_mock_model(
+    must_have_skills: list[list[str]], nice_to_have_skills: list[list[str]]
+) -> MagicMock:
+    """Create a mock model that returns a CombinedSkillsExtraction with the given skills."""
+    mock_model = MagicMock()
+    mock_structured = MagicMock()
+    mock_structured.invoke.return_value = CombinedSkillsExtraction(
+        must_have_skills=must_have_skills, nice_to_have_skills=nice_to_have_skills
+    )
+    mock_model.with_structured_output.return_value = mock_structured
+    return mock_model
+
+
+def _create_mock_factory(mock_model: MagicMock) -> MagicMock:
+    """Create a mock model factory that returns the given model."""
+    mock_factory = MagicMock()
+    mock_factory.get_model.return_value = mock_model
+    return mock_factory
+
+
+def _state(description: str = "Python developer needed") -> dict:
+    return {
+        "job": {"job_id": 1, "title": "Developer", "description": description},
+        "status": "started",
+        "cv_context": "Python developer",
+    }
+
+
+class TestExtractSkillsNode:
+    """Tests for extract_skills_node function."""
+
+    def test_extracts_both_skill_lists_with_one_call(self):
+        """Node fills must-have and nice-to-have skills from a single model call."""
+        mock_model = _create_mock_model([["Python"], ["Django", "Flask"]], [["Docker"]])
+        node = create_extract_skills_node(_create_mock_factory(mock_model))
+
+        result = node(_state())
+
+        assert result == {
+            "extracted_must_have_skills": [["Python"], ["Django", "Flask"]],
+            "extracted_nice_to_have_skills": [["Docker"]],
+        }
+        assert mock_model.with_structured_output.return_value.invoke.call_count == 1
+
+    def test_returns_empty_lists_when_description_empty(self):
+        """Node skips the model when the job has no description."""
+        mock_factory = MagicMock()
+        node = create_extract_skills_node(mock_factory)
+
+        result = node(_state(description=""))
+
+        assert result == {"extracted_must_have_skills": [], "extracted_nice_to_have_skills": []}
+        mock_factory.get_model.assert_not_called()
+
+    def test_returns_empty_lists_on_model_exception(self):
+        """Node returns empty skill lists when the model raises."""
+        mock_factory = MagicMock()
+        mock_factory.get_model.side_effect = Exception("Model unavailable")
+        node = create_extract_skills_node(mock_factory)
+
+        result = node(_state())
+
+        assert result == {"extracted_must_have_skills": [], "extracted_nice_to_have_skills": []}
+
+    def test_handles_unexpected_result_type(self):
+        """Node treats a result that is not a CombinedSkillsExtraction as no skills."""
+        mock_model = MagicMock()
+        mock_model.with_structured_output.return_value.invoke.return_value = MagicMock(spec=[])
+        node = create_extract_skills_node(_create_mock_factory(mock_model))
+
+        result = node(_state())
+
+        assert result == {"extracted_must_have_skills": [], "extracted_nice_to_have_skills": []}
+
+    def test_reuses_structured_model_across_jobs(self):
+        """Node builds the structured-output wrapper once and reuses it for later jobs."""
+        mock_model = _create_mock_model([["Python"]], [])
+        mock_factory = _create_mock_factory(mock_model)
+        node = create_extract_skills_node(mock_factory)
+
+        for _ in range(3):
+            node(_state())
+
+        mock_factory.get_model.assert_called_once_with(model_id="skill-extraction")
+        mock_model.with_structured_output.assert_called_once_with(CombinedSkillsExtraction)
+
+
+class TestExtractSkillsAsyncNode:
+    """Tests for the async variant of extract_skills_node."""
+
+    async def test_awaits_async_model_api(self):
+        """Async node awaits ainvoke and never calls the blocking invoke."""
+        mock_model = _create_mock_model([], [])
+        mock_structured = mock_model.with_structured_output.return_value
+        mock_structured.ainvoke = AsyncMock(
+            return_value=CombinedSkillsExtraction(
+                must_have_skills=[["Python"]], nice_to_have_skills=[["Go"]]
+            )
+        )
+        node = create_extract_skills_async_node(_create_mock_factory(mock_model))
+
+        result = await node(_state())
+
+        assert result == {
+            "extracted_must_have_skills": [["Python"]],
+            "extracted_nice_to_have_skills": [["Go"]],
+        }
+        mock_structured.ainvoke.assert_awaited_once()
+        mock_structured.invoke.assert_not_called()
+
+    async def test_returns_empty_lists_on_model_exception(self):
+        """Async node returns empty skill lists when the model call fails."""
+        mock_model = _create_mock_model([], [])
+        mock_structured = mock_model.with_structured_output.return_value
+        mock_structured.ainvoke = AsyncMock(side_effect=Exception("Model unavailable"))
+        node = create_extract_skills_async_node(_create_mock_factory(mock_model))
+
+        result = await node(_state())
+
+        assert result == {"extracted_must_have_skills": [], "extracted_nice_to_have_skills": []}
@@ -0,0 +1,74 @@
+"""Prompt for extracting must-have and nice-to-have skills from job descriptions."""
+
+from langchain_core.prompts import ChatPromptTemplate
+
+
+SYSTEM_MESSAGE = """You are an expert at analyzing job descriptions and extracting technical skills.
+
+Your job:
+- Extract the hard technical skills of the description and sort each into one of two lists:
+  - must_have_skills: must-have / required skills explicitly or unambiguously implied by the description (e.g., "must", "required", "strong experience with", "proficient in").
+  - nice_to_have_skills: nice-to-have / preferred / bonus skills (e.g., "nice to have", "preferred", "bonus", "plus", "would be great", "advantageous", "desirable").
+- Put every skill into at most one list. When in doubt, a skill is must-have.
+- Exclude soft skills (communication, leadership, problem-solving), responsibilities, certifications unless demanded or preferred, and generic terms (e.g., "software development", "best practices").
+- Return canonical, atomic skill names (technologies, languages, frameworks, libraries, tools, platforms, cloud services, databases, build/CI tools).
+- Normalize synonyms and variants to common names:
+  - "JS" → "JavaScript"; "TS" → "TypeScript"; "Node" → "Node.js"; "Postgres" → "PostgreSQL"
+  - Keep vendor+product when it's the skill (e.g., "AWS Lambda", "Google BigQuery").
+- Keep items concise (no versions unless strictly required, e.g., "Python 3.10+" in requirements).
+- Deduplicate; preserve meaningful specificity (e.g., "AWS", "EC2", "S3" may all appear if each is mentioned).
+- Prefer English canonical names when obvious; otherwise keep the job's name (e.g., "1C", "Бітрікс24").
+- If a list has no skills, return it empty.
+
+OUTPUT FORMAT:
+Each list is a 2D list where:
+- The outer list represents AND relationships (all groups are required/preferred)
+- Inner lists represent OR relationships (alternatives within a group)
+- Solo skills should be wrapped in single-item inner lists
+
+Detect explicit OR patterns in the text:
+- "X or Y" patterns
+- "X/Y" patterns ONLY when skills are truly interchangeable alternatives (e.g., "React/Vue" - both frontend frameworks, "PostgreSQL/MySQL" - both databases)
+- "either X or Y" patterns
+Group alternative skills together in the same inner list.
+
+IMPORTANT: The slash pattern does NOT always mean OR. Treat as separate skills when:
+- Different categories (language vs framework): "Python/FastAPI" → [["Python"], ["FastAPI"]]
+- Parent/child relationship: "AWS/Lambda" → [["AWS"], ["Lambda"]]
+- Complementary skills: "HTML/CSS" → [["HTML"], ["CSS"]]
+Only group as alternatives when skills serve the same role and are mutually exclusive.
+
+Output must validate against:
+  class CombinedSkillsExtraction(BaseModel):
+      must_have_skills: List[List[str]]
+      nice_to_have_skills: List[List[str]]
+
+Example 1:
+Input excerpt: "Must have: Python, Django, PostgreSQL. Nice to have: Redis, AWS."
+Output: {{"must_have_skills": [["Python"], ["Django"], ["PostgreSQL"]], "nice_to_have_skills": [["Redis"], ["AWS"]]}}
+
+Example 2:
+Input excerpt (UA): "Обов'язково: React, TypeScript, Next.js; буде плюсом: GraphQL."
+Output: {{"must_have_skills": [["React"], ["TypeScript"], ["Next.js"]], "nice_to_have_skills": [["GraphQL"]]}}
+
+Example 3:
+Input excerpt: "We expect strong experience with CI/CD (GitHub Actions) and Docker; familiarity with Kubernetes is a plus."
+Output: {{"must_have_skills": [["CI/CD"], ["GitHub Actions"], ["Docker"]], "nice_to_have_skills": [["Kubernetes"]]}}
+
+Example 4 (OR alternatives):
+Input excerpt: "Required: JavaScript or Python, React or Vue. Would be nice: Redis or Memcached."
+Output: {{"must_have_skills": [["JavaScript", "Python"], ["React", "Vue"]], "nice_to_have_skills": [["Redis", "Memcached"]]}}
+
+Example 5 (slash notation):
+Input excerpt: "Must have: Python/FastAPI and PostgreSQL/MySQL. Bonus: Terraform/Ansible."
+Output: {{"must_have_skills": [["Python"], ["FastAPI"], ["PostgreSQL", "MySQL"]], "nice_to_have_skills": [["Terraform", "Ansible"]]}}"""
+
+
+HUMAN_MESSAGE = """<Job Description>
+{job_description}
+</Job Description>"""
+
+
+EXTRACT_SKILLS_PROMPT = ChatPromptTemplate.from_messages(
+    [("system", SYSTEM_MESSAGE), ("human", HUMAN_MESSAGE)]
+)
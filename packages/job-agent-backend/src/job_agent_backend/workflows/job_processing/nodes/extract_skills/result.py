@@ -0,0 +1,17 @@
+"""Result type for extract_skills node."""
+
+from typing import List
+from typing_extensions import TypedDict
+
+
+class ExtractSkillsResult(TypedDict):
+    """Result from extract_skills node.
+
+    Fills the same state keys as the separate must-have and nice-to-have nodes.
+    The extracted skills use a 2D list format where:
+    - The outer list represents AND relationships (all groups are required/preferred)
+    - Inner lists represent OR relationships (alternatives within a group)
+    """
+
+    extracted_must_have_skills: List[List[str]]
+    extracted_nice_to_have_skills: List[List[str]]
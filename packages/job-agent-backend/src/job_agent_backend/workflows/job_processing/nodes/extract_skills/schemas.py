@@ -0,0 +1,36 @@
+"""Pydantic schemas for extract_skills node."""
+
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class CombinedSkillsExtraction(BaseModel):
+    """Schema for extracting must-have and nice-to-have skills in one pass.
+
+    Both skill lists use the 2D format of SkillsExtraction:
+    - The outer list represents AND relationships (all groups are required/preferred)
+    - Inner lists represent OR relationships (alternatives within a group)
+
+    Attributes:
+        must_have_skills: 2D list of required skill groups
+        nice_to_have_skills: 2D list of preferred skill groups
+    """
+
+    must_have_skills: List[List[str]] = Field(
+        description=(
+            "2D list of must-have / required skill groups. "
+            "Each inner list contains alternative skills (OR relationship), "
+            "and all groups in the outer list are required (AND relationship). "
+            "Solo skills should be wrapped in single-item inner lists. "
+            "Example: [['JavaScript', 'Python'], ['React']]"
+        ),
+        default_factory=list,
+    )
+    nice_to_have_skills: List[List[str]] = Field(
+        description=(
+            "2D list of nice-to-have / preferred skill groups, in the same format as "
+            "must_have_skills. A skill appears in at most one of the two lists. "
+            "Example: [['Redis', 'Memcached'], ['GraphQL']]"
+        ),
+        default_factory=list,
+    )
@@ -0,0 +1,9 @@
+"""Reuse duplicate skills node for the job processing workflow.
+
+This node copies the skills of a stored near-duplicate of the job, so re-posted
+vacancies skip skill extraction.
+"""
+
+from .node import create_reuse_duplicate_skills_node
+
+__all__ = ["create_reuse_duplicate_skills_node"]
@@ -0,0 +1,76 @@
+"""Reuse duplicate skills node implementation."""
+
+import logging
+from typing import Any, Callable, List, Optional
+
+from job_agent_platform_contracts import IJobRepository
+
+from ...state import AgentState
+from .result import ReuseDuplicateSkillsResult
+
+logger = logging.getLogger(__name__)
+
+
+def _stored_skills(job: Any, field: str) -> Optional[List[List[str]]]:
+    skills = getattr(job, field, None)
+    return skills if isinstance(skills, list) else None
+
+
+def create_reuse_duplicate_skills_node(
+    job_repository_factory: Callable[[], IJobRepository],
+) -> Callable[[AgentState], ReuseDuplicateSkillsResult]:
+    """
+    Factory function to create a reuse_duplicate_skills_node with injected dependencies.
+
+    Args:
+        job_repository_factory: Factory used to create job repository instances
+
+    Returns:
+        Configured reuse_duplicate_skills_node function
+    """
+
+    def reuse_duplicate_skills_node(state: AgentState) -> ReuseDuplicateSkillsResult:
+        """
+        Copy the skills of a stored job whose description nearly matches this one.
+
+        Companies re-post vacancies with a new job ID and small edits, so the
+        skills extracted for the earlier posting still apply. Irrelevant jobs and
+        jobs without a description are left alone.
+
+        Args:
+            state: Current agent state containing job information
+
+        Returns:
+            The duplicate's ID and skills if one was found, otherwise an empty update
+        """
+        job = state["job"]
+        job_id = job.get("job_id")
+        description = job.get("description")
+        if not state.get("is_relevant", True) or not description:
+            return {}
+
+        try:
+            duplicate = job_repository_factory().find_near_duplicate(description)
+        except Exception as e:
+            logger.warning("Near-duplicate lookup failed for job (ID: %s): %s", job_id, e)
+            return {}
+        if duplicate is None:
+            return {}
+
+        must_have_skills = _stored_skills(duplicate, "must_have_skills")
+        nice_to_have_skills = _stored_skills(duplicate, "nice_to_have_skills")
+        if must_have_skills is None and nice_to_have_skills is None:
+            return {}
+
+        logger.info(
+            "Job (ID: %s) nearly duplicates stored job %s, reusing its skills",
+            job_id,
+            duplicate.id,
+        )
+        return {
+            "duplicate_job_id": duplicate.id,
+            "extracted_must_have_skills": must_have_skills or [],
+            "extracted_nice_to_have_skills": nice_to_have_skills or [],
+        }
+
+    return reuse_duplicate_skills_node
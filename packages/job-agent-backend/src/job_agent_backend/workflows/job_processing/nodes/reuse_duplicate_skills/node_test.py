@@ -0,0 +1,79 @@
+"""Tests for reuse_duplicate_skills node."""
+
+from unittest.mock import MagicMock
+
+from .node import create_reuse_duplicate_skills_node
+
+
+def _state(**overrides) -> dict:
+    return {
+        "job": {"job_id": 1, "title": "Developer", "description": "Python developer needed"},
+        "status": "started",
+        "cv_context": "Python developer",
+        "is_relevant": True,
+        **overrides,
+    }
+
+
+def _repository_factory(duplicate=None, error=None) -> MagicMock:
+    repository = MagicMock()
+    repository.find_near_duplicate.return_value = duplicate
+    if error is not None:
+        repository.find_near_duplicate.side_effect = error
+    return MagicMock(return_value=repository)
+
+
+class TestReuseDuplicateSkillsNode:
+    """Tests for reuse_duplicate_skills_node function."""
+
+    def test_copies_skills_of_duplicate(self):
+        """Node returns the skills stored for the near-duplicate job."""
+        duplicate = MagicMock(id=7, must_have_skills=[["Python"]], nice_to_have_skills=None)
+        factory = _repository_factory(duplicate)
+        node = create_reuse_duplicate_skills_node(factory)
+
+        result = node(_state())
+
+        assert result == {
+            "duplicate_job_id": 7,
+            "extracted_must_have_skills": [["Python"]],
+            "extracted_nice_to_have_skills": [],
+        }
+        factory.return_value.find_near_duplicate.assert_called_once_with("Python developer needed")
+
+    def test_returns_empty_update_without_duplicate(self):
+        """Node leaves the state unchanged when no near-duplicate is stored."""
+        node = create_reuse_duplicate_skills_node(_repository_factory())
+
+        assert node(_state()) == {}
+
+    def test_skips_irrelevant_jobs(self):
+        """Node does not look up duplicates of jobs that skip skill extraction."""
+        factory = _repository_factory()
+        node = create_reuse_duplicate_skills_node(factory)
+
+        assert node(_state(is_relevant=False)) == {}
+        factory.assert_not_called()
+
+    def test_skips_jobs_without_description(self):
+        """Node does not look up jobs without a description."""
+        factory = _repository_factory()
+        node = create_reuse_duplicate_skills_node(factory)
+
+        assert node(_state(job={"job_id": 1, "title": "Developer"})) == {}
+        factory.assert_not_called()
+
+    def test_ignores_duplicate_without_skills(self):
+        """Node falls back to extraction when the duplicate has no stored skills."""
+        duplicate = MagicMock(id=7, must_have_skills=None, nice_to_have_skills=None)
+        node = create_reuse_duplicate_skills_node(_repository_factory(duplicate))
+
+        assert node(_state()) == {}
+
+    def test_returns_empty_update_on_lookup_error(self):
+        """Node falls back to extraction when the lookup fails."""
+        node = create_reuse_duplicate_skills_node(
+            _repository_factory(error=RuntimeError("DB unavailable"))
+        )
+
+        assert node(_state()) == {}
@@ -0,0 +1,13 @@
+"""Result type for reuse_duplicate_skills node."""
+
+from typing import List
+
+from typing_extensions import NotRequired, TypedDict
+
+
+class ReuseDuplicateSkillsResult(TypedDict):
+    """Result from reuse_duplicate_skills node. Empty when no duplicate was found."""
+
+    duplicate_job_id: NotRequired[int]
+    extracted_must_have_skills: NotRequired[List[List[str]]]
+    extracted_nice_to_have_skills: NotRequired[List[List[str]]]
@@ -0,0 +1,211 @@
+"""Shared implementation of the skill extraction nodes.
+
+The must-have, nice-to-have and combined skill extraction nodes differ only in
+their prompt, output schema and the state keys they fill. Each node module
+describes itself with a SkillExtraction and builds its sync and async nodes from it.
+"""
+
+from dataclasses import dataclass
+from functools import cache
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from langchain_core.prompt_values import PromptValue
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable, RunnableConfig
+from pydantic import BaseModel
+
+from ....model_providers import IModelFactory
+from ..state import AgentState
+
+ResultT = TypeVar("ResultT")
+
+
+@dataclass(frozen=True)
+class SkillExtraction(Generic[ResultT]):
+    """Description of a skill extraction node.
+
+    Attributes:
+        name: Name of the created node functions (e.g. "extract_must_have_skills_node")
+        label: What the node extracts, used in its log lines (e.g. "must-have skills")
+        run_name: Name of the model call in traces
+        prompt: Prompt filled with the job description
+        schema: Structured output schema the model answers with
+        result_fields: Schema field holding the 2D skill list, by state key it fills
+    """
+
+    name: str
+    label: str
+    run_name: str
+    prompt: ChatPromptTemplate
+    schema: Type[BaseModel]
+    result_fields: Mapping[str, str]
+
+    def create_node(
+        self,
+        model_factory: IModelFactory,
+        share: Optional[
+            Callable[[Callable[[AgentState], ResultT]], Callable[[AgentState], ResultT]]
+        ] = None,
+    ) -> Callable[[AgentState], ResultT]:
+        """Create the node calling the model synchronously.
+
+        Args:
+            model_factory: Factory used to create model instances
+            share: Optional wrapper around the model call, such as SharedJobResults.wrap.
+                   Model errors propagate through it, so it never sees a failed result.
+
+        Returns:
+            Node function returning the extracted skills, or empty lists on errors
+        """
+        get_structured_model = self._structured_model_resolver(model_factory)
+
+        def extract(state: AgentState) -> ResultT:
+            # Raises on model errors, so shared_results never keeps a failure
+            job_id, description = self._start(state)
+            if not description:
+                return self._skip(job_id)
+
+            raw_result = get_structured_model().invoke(
+                self._build_messages(description), config=self._run_config
+            )
+            return self._finish(job_id, self._parse_skills(raw_result, job_id))
+
+        shared_extract = share(extract) if share is not None else extract
+
+        def node(state: AgentState) -> ResultT:
+            try:
+                return shared_extract(state)
+            except Exception as e:
+                return self._fail(state, e)
+
+        node.__name__ = node.__qualname__ = self.name
+        return node
+
+    def create_async_node(
+        self,
+        model_factory: IModelFactory,
+        share: Optional[
+            Callable[
+                [Callable[[AgentState], Awaitable[ResultT]]],
+                Callable[[AgentState], Awaitable[ResultT]],
+            ]
+        ] = None,
+    ) -> Callable[[AgentState], Awaitable[ResultT]]:
+        """Create the node awaiting the model's native async API.
+
+        Concurrent jobs wait on the model without holding a thread each.
+
+        Args:
+            model_factory: Factory used to create model instances
+            share: Optional wrapper around the model call, such as SharedJobResults.wrap.
+                   Model errors propagate through it, so it never sees a failed result.
+
+        Returns:
+            Coroutine function with the same behaviour as the sync node
+        """
+        get_structured_model = self._structured_model_resolver(model_factory)
+
+        async def extract(state: AgentState) -> ResultT:
+            # Raises on model errors, so shared_results never keeps a failure
+            job_id, description = self._start(state)
+            if not description:
+                return self._skip(job_id)
+
+            raw_result = await get_structured_model().ainvoke(
+                self._build_messages(description), config=self._run_config
+            )
+            return self._finish(job_id, self._parse_skills(raw_result, job_id))
+
+        shared_extract = share(extract) if share is not None else extract
+
+        async def node(state: AgentState) -> ResultT:
+            try:
+                return await shared_extract(state)
+            except Exception as e:
+                return self._fail(state, e)
+
+        node.__name__ = node.__qualname__ = self.name
+        return node
+
+    @property
+    def _run_config(self) -> RunnableConfig:
+        return {"run_name": self.run_name}
+
+    def _structured_model_resolver(
+        self, model_factory: IModelFactory
+    ) -> Callable[[], Runnable[Any, Any]]:
+        @cache
+        def get_structured_model() -> Runnable[Any, Any]:
+            """Resolve the structured-output model once and reuse it across jobs."""
+            base_model = model_factory.get_model(model_id="skill-extraction")
+            return base_model.with_structured_output(self.schema)
+
+        return get_structured_model
+
+    def _start(self, state: AgentState) -> tuple[Any, str]:
+        job = state["job"]
+        job_id = job.get("job_id")
+
+        print("\n" + "=" * 60)
+        print(f"Extracting {self.label} for job ID {job_id}...")
+        print("=" * 60 + "\n")
+
+        return job_id, job.get("description", "")
+
+    def _build_messages(self, description: str) -> PromptValue:
+        return self.prompt.invoke({"job_description": description})
+
+    def _parse_skills(self, raw_result: Any, job_id: Any) -> Dict[str, List[List[str]]]:
+        result = raw_result if isinstance(raw_result, self.schema) else None
+
+        extracted: Dict[str, List[List[str]]] = {}
+        for key, field in self.result_fields.items():
+            skills = (getattr(result, field) or []) if result is not None else []
+            extracted[key] = skills
+
+            # Count total individual skills across all groups for logging
+            total_skills = sum(len(group) for group in skills)
+            print(
+                f"  Job (ID: {job_id}): Extracted {total_skills} skills in {len(skills)} groups"
+                f" into {key}"
+            )
+            if skills:
+                print(f"    Skills: {_format(skills)}\n")
+
+        return extracted
+
+    def _finish(self, job_id: Any, extracted: Dict[str, List[List[str]]]) -> ResultT:
+        print("=" * 60)
+        print(f"Finished extracting {self.label} for job ID {job_id}")
+        print("=" * 60 + "\n")
+
+        return cast(ResultT, extracted)
+
+    def _skip(self, job_id: Any) -> ResultT:
+        print(f"  Job (ID: {job_id}): No description available, skipping...")
+        print("=" * 60 + "\n")
+        return cast(ResultT, {key: [] for key in self.result_fields})
+
+    def _fail(self, state: AgentState, error: Exception) -> ResultT:
+        job_id = state["job"].get("job_id")
+        print(f"  Job (ID: {job_id}): Error extracting {self.label} - {error}")
+        return self._finish(job_id, {key: [] for key in self.result_fields})
+
+
+def _format(skills: List[List[str]]) -> str:
+    # Format 2D skills: show OR groups with " or " and AND groups with ", "
+    return ", ".join(
+        " or ".join(group) if len(group) > 1 else group[0] for group in skills if group
+    )
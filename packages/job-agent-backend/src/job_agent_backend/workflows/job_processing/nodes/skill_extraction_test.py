@@ -0,0 +1,44 @@
+"""Tests for the shared skill extraction node implementation."""
+
+from unittest.mock import MagicMock
+
+from .extract_skills.prompts import EXTRACT_SKILLS_PROMPT
+from .extract_skills.schemas import CombinedSkillsExtraction
+from .skill_extraction import SkillExtraction
+
+
+def _extraction() -> SkillExtraction[dict]:
+    return SkillExtraction(
+        name="extract_test_skills_node",
+        label="test skills",
+        run_name="Extract Test Skills",
+        prompt=EXTRACT_SKILLS_PROMPT,
+        schema=CombinedSkillsExtraction,
+        result_fields={"first": "must_have_skills", "second": "nice_to_have_skills"},
+    )
+
+
+class TestSkillExtraction:
+    """Tests for SkillExtraction."""
+
+    def test_nodes_are_named_after_the_extraction(self):
+        """Sync and async nodes carry the configured name, which traces show."""
+        extraction = _extraction()
+
+        assert extraction.create_node(MagicMock()).__name__ == "extract_test_skills_node"
+        assert extraction.create_async_node(MagicMock()).__name__ == "extract_test_skills_node"
+
+    def test_fills_every_result_field_from_the_schema(self):
+        """Each state key gets the skill list of its schema field."""
+        mock_factory = MagicMock()
+        structured = mock_factory.get_model.return_value.with_structured_output.return_value
+        structured.invoke.return_value = CombinedSkillsExtraction(
+            must_have_skills=[["Python"]], nice_to_have_skills=[["Redis", "Memcached"]]
+        )
+        node = _extraction().create_node(mock_factory)
+
+        result = node({"job": {"job_id": 1, "description": "Python developer"}})
+
+        assert result == {"first": [["Python"]], "second": [["Redis", "Memcached"]]}
+        structured.invoke.assert_called_once()
+        assert structured.invoke.call_args.kwargs["config"] == {"run_name": "Extract Test Skills"}
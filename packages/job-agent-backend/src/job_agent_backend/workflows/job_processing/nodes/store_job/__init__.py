@@ -1,5 +1,6 @@
 """Store job node exports."""
 
+from .batch_writer import JobBatchWriter
 from .node import create_store_job_node
 
-__all__ = ["create_store_job_node"]
+__all__ = ["JobBatchWriter", "create_store_job_node"]
@@ -0,0 +1,174 @@
+"""Batching writer for processed jobs.
+
+Instead of opening a transaction per job, the store_job node can hand its job to a
+JobBatchWriter. The writer buffers jobs and stores them with a single
+IJobRepository.create_many call once batch_size jobs are buffered or the oldest
+buffered job has waited flush_interval_ms, so the database round trips of a write
+are shared by the whole batch.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Set, TypeVar
+
+from job_agent_platform_contracts import IJobRepository
+from job_agent_platform_contracts.job_repository.exceptions import JobAlreadyExistsError
+from job_agent_platform_contracts.job_repository.schemas import JobCreate
+
+logger = logging.getLogger(__name__)
+
+# Number of buffered jobs that triggers a write
+DEFAULT_BATCH_SIZE = 50
+
+# Longest time a buffered job waits before it is written
+DEFAULT_FLUSH_INTERVAL_MS = 5000
+
+JobT = TypeVar("JobT", bound=Mapping[str, Any])
+
+
+def _failure_key(job: Mapping[str, Any]) -> Any:
+    # Identifies a job by its source job ID, falling back to its URL
+    job_id = job.get("job_id")
+    return job_id if job_id is not None else job.get("url")
+
+
+class JobBatchWriter:
+    """Thread-safe buffer that stores processed jobs in batches.
+
+    Writes never raise: if a batch cannot be written it is retried one job at a
+    time, so a single bad job does not lose the rest of its batch, and jobs that
+    still fail are logged, counted in failed_count and reported by pop_failed.
+    """
+
+    def __init__(
+        self,
+        job_repository_factory: Callable[[], IJobRepository],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            job_repository_factory: Factory used to create job repository instances
+            batch_size: Number of buffered jobs that triggers a write
+            flush_interval_ms: Longest time in milliseconds a buffered job waits
+                               before it is written
+
+        Raises:
+            ValueError: If batch_size or flush_interval_ms is not positive
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if flush_interval_ms <= 0:
+            raise ValueError("flush_interval_ms must be positive")
+
+        self._job_repository_factory = job_repository_factory
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self.stored_count = 0
+        self.failed_count = 0
+        self._buffer: List[JobCreate] = []
+        # Jobs whose write failed, kept until a caller asks about them
+        self._failed_keys: Set[Any] = set()
+        self._timer: Optional[threading.Timer] = None
+        # Guards the buffer, timer and counters
+        self._lock = threading.Lock()
+        # Serializes writes, so flush() returns only once earlier jobs are written
+        self._flush_lock = threading.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of jobs buffered and not written yet."""
+        with self._lock:
+            return len(self._buffer)
+
+    def add(self, job: JobCreate) -> None:
+        """Buffer a job, writing the buffer if it reached batch_size.
+
+        Args:
+            job: Job to store
+        """
+        with self._lock:
+            self._buffer.append(job)
+            is_full = len(self._buffer) >= self.batch_size
+            if not is_full and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval_ms / 1000, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if is_full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write every buffered job.
+
+        Returns:
+            Number of jobs newly stored by this call
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+
+            if not batch:
+                return 0
+
+            stored = self._write(batch)
+            logger.info("Stored %d of %d buffered jobs", stored, len(batch))
+            return stored
+
+    def pop_failed(self, jobs: Iterable[JobT]) -> List[JobT]:
+        """Return the given jobs whose write failed, forgetting those failures.
+
+        Failures are kept whichever flush wrote the job, so a job written by the
+        flush timer is still reported to the caller that later asks about it.
+
+        Args:
+            jobs: Jobs handed to add(), identified by job ID or URL
+
+        Returns:
+            Jobs among the given ones that could not be stored
+        """
+        failed = []
+        with self._lock:
+            for job in jobs:
+                key = _failure_key(job)
+                if key in self._failed_keys:
+                    failed.append(job)
+            self._failed_keys.difference_update(_failure_key(job) for job in failed)
+        return failed
+
+    def _write(self, batch: List[JobCreate]) -> int:
+        try:
+            stored = len(self._job_repository_factory().create_many(batch))
+        except Exception as e:
+            logger.warning(
+                "Batch write of %d jobs failed - %s. Retrying one job at a time", len(batch), e
+            )
+            return self._write_one_by_one(batch)
+
+        with self._lock:
+            self.stored_count += stored
+        return stored
+
+    def _write_one_by_one(self, batch: List[JobCreate]) -> int:
+        stored = 0
+        failed: List[JobCreate] = []
+        job_repo = self._job_repository_factory()
+        for job in batch:
+            try:
+                job_repo.create(job)
+                stored += 1
+            except JobAlreadyExistsError:
+                logger.debug("Job already stored (ID: %s)", job.get("job_id"))
+            except Exception as e:
+                logger.error("Error storing job (ID: %s): %s", job.get("job_id"), e)
+                failed.append(job)
+
+        with self._lock:
+            self.stored_count += stored
+            self.failed_count += len(failed)
+            self._failed_keys.update(_failure_key(job) for job in failed)
+        return stored
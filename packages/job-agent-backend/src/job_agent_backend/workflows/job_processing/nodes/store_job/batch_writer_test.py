@@ -0,0 +1,99 @@
+"""Tests for JobBatchWriter."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from job_agent_platform_contracts.job_repository.exceptions import JobAlreadyExistsError
+
+from .batch_writer import JobBatchWriter
+
+
+def _job(job_id):
+    return {"job_id": job_id, "title": f"Job {job_id}"}
+
+
+@pytest.fixture
+def mock_repository():
+    """Repository whose create_many stores every job it is given."""
+    repository = MagicMock()
+    repository.create_many.side_effect = lambda jobs: [MagicMock() for _ in jobs]
+    return repository
+
+
+class TestJobBatchWriter:
+    """Tests for JobBatchWriter."""
+
+    def test_writes_batch_when_batch_size_is_reached(self, mock_repository):
+        """A full buffer is written with one create_many call."""
+        writer = JobBatchWriter(lambda: mock_repository, batch_size=2, flush_interval_ms=60_000)
+
+        writer.add(_job(1))
+        mock_repository.create_many.assert_not_called()
+        writer.add(_job(2))
+
+        mock_repository.create_many.assert_called_once_with([_job(1), _job(2)])
+        assert writer.stored_count == 2
+        assert writer.pending_count == 0
+
+    def test_writes_batch_after_flush_interval(self, mock_repository):
+        """A partial buffer is written once its oldest job waited flush_interval_ms."""
+        written = threading.Event()
+        mock_repository.create_many.side_effect = lambda jobs: written.set() or list(jobs)
+        writer = JobBatchWriter(lambda: mock_repository, batch_size=10, flush_interval_ms=10)
+
+        writer.add(_job(1))
+
+        assert written.wait(timeout=5)
+        mock_repository.create_many.assert_called_once_with([_job(1)])
+
+    def test_flush_writes_buffered_jobs(self, mock_repository):
+        """flush() writes whatever is buffered and is a no-op when empty."""
+        writer = JobBatchWriter(lambda: mock_repository, batch_size=10, flush_interval_ms=60_000)
+        writer.add(_job(1))
+
+        assert writer.flush() == 1
+        assert writer.flush() == 0
+        mock_repository.create_many.assert_called_once_with([_job(1)])
+
+    def test_failed_batch_is_retried_one_job_at_a_time(self, mock_repository):
+        """A failing batch falls back to create(), skipping duplicates and counting failures."""
+        mock_repository.create_many.side_effect = Exception("Database error")
+        mock_repository.create.side_effect = [
+            MagicMock(),
+            JobAlreadyExistsError(external_id="2", source="unknown"),
+            Exception("Bad job"),
+        ]
+        writer = JobBatchWriter(lambda: mock_repository, batch_size=10, flush_interval_ms=60_000)
+        for job_id in (1, 2, 3):
+            writer.add(_job(job_id))
+
+        assert writer.flush() == 1
+        assert mock_repository.create.call_count == 3
+        assert writer.stored_count == 1
+        assert writer.failed_count == 1
+
+    def test_pop_failed_reports_jobs_that_could_not_be_stored(self, mock_repository):
+        """Jobs that failed in any flush are reported once, duplicates are not failures."""
+        mock_repository.create_many.side_effect = Exception("Database error")
+        mock_repository.create.side_effect = [
+            MagicMock(),
+            JobAlreadyExistsError(external_id="2", source="unknown"),
+            Exception("Bad job"),
+        ]
+        writer = JobBatchWriter(lambda: mock_repository, batch_size=3, flush_interval_ms=60_000)
+        for job_id in (1, 2, 3):
+            writer.add(_job(job_id))
+
+        jobs = [_job(job_id) for job_id in (1, 2, 3)]
+        assert writer.pop_failed(jobs) == [_job(3)]
+        assert writer.pop_failed(jobs) == []
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"batch_size": 0}, {"flush_interval_ms": 0}], ids=["batch", "interval"]
+    )
+    def test_rejects_invalid_limits(self, mock_repository, kwargs):
+        """Batch size and flush interval must be positive."""
+        with pytest.raises(ValueError):
+            JobBatchWriter(lambda: mock_repository, **kwargs)
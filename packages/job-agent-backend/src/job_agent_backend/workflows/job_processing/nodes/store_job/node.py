@@ -1,14 +1,17 @@
 """Store job node implementation."""
 
 import logging
-from typing import Callable
+from typing import Callable, List, Optional
 
 from job_agent_platform_contracts import IJobRepository
 from job_scrapper_contracts import JobDict
 
+from job_agent_backend.contracts import IModelFactory
 from job_agent_platform_contracts.job_repository.schemas import JobCreate
 
 from ...state import AgentState
+from ..check_job_relevance.node import build_job_text
+from .batch_writer import JobBatchWriter
 from .result import StoreJobResult
 
 logger = logging.getLogger(__name__)
@@ -16,24 +19,45 @@ logger = logging.getLogger(__name__)
 
 def create_store_job_node(
     job_repository_factory: Callable[[], IJobRepository],
+    job_writer: Optional[JobBatchWriter] = None,
+    model_factory: Optional[IModelFactory] = None,
 ) -> Callable[[AgentState], StoreJobResult]:
     """
     Factory function to create a store_job_node with injected dependencies.
 
     Args:
         job_repository_factory: Factory used to create job repository instances
+        job_writer: Optional batching writer. If provided, jobs are handed to it and
+                    stored in batches instead of one transaction per job.
+        model_factory: Optional factory providing the embedding model. If provided,
+                       jobs that reach storage without an embedding in the state
+                       (e.g. relevance passed in without one) are embedded before
+                       storing.
 
     Returns:
         Configured store_job_node function
     """
 
+    def embed_job(job: JobDict) -> Optional[List[float]]:
+        if model_factory is None or not job.get("description"):
+            return None
+        try:
+            # Embedded as a document, like the batch relevance check, so this is
+            # answered by the embedding cache when one is configured
+            model = model_factory.get_model(model_id="embedding")
+            return list(model.embed_documents([build_job_text(job)])[0])
+        except Exception as e:
+            logger.warning("Could not embed job (ID: %s): %s", job.get("job_id"), e)
+            return None
+
     def store_job_node(state: AgentState) -> StoreJobResult:
         """
         Store a relevant job to the database.
 
         This node takes a job from the workflow state and stores it in the database
-        using the JobRepository. Only relevant jobs reach this node due to
-        conditional routing in the workflow.
+        using the JobRepository, or queues it on the batching writer if one is
+        configured. Only relevant jobs reach this node due to conditional routing
+        in the workflow.
 
         Args:
             state: Current agent state containing job details
@@ -48,8 +72,6 @@ def create_store_job_node(
         logger.info("Storing job to database (ID: %s)", job_id)
 
         try:
-            job_repo = job_repository_factory()
-
             job_create_data: JobCreate = {**job}
 
             # Pass is_relevant from workflow state (defaults to True for backwards compatibility)
@@ -65,8 +87,18 @@ def create_store_job_node(
                 job_create_data["nice_to_have_skills"] = extracted_nice_to_have_skills
                 logger.debug("Added %d nice-to-have skills", len(extracted_nice_to_have_skills))
 
-            stored_job = job_repo.create(job_create_data)
-            logger.info("Job created successfully (DB ID: %s)", stored_job.id)
+            job_embedding = state.get("job_embedding")
+            if job_embedding is None:
+                job_embedding = embed_job(job)
+            if job_embedding is not None:
+                job_create_data["embedding"] = job_embedding
+
+            if job_writer is not None:
+                job_writer.add(job_create_data)
+                logger.info("Job queued for batched storage (ID: %s)", job_id)
+            else:
+                stored_job = job_repository_factory().create(job_create_data)
+                logger.info("Job created successfully (DB ID: %s)", stored_job.id)
 
         except Exception as e:
             logger.error("Error storing job: %s", e)
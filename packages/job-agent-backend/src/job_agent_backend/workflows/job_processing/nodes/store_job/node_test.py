@@ -257,3 +257,83 @@ class TestStoreJobNodeIsRelevant:
 
         created_job = mock_repository.create.call_args[0][0]
         assert created_job["is_relevant"] is True
+
+    def test_queues_job_on_batch_writer_when_configured(self):
+        """Node hands the job to the batching writer instead of creating it directly."""
+        job_repository_factory = MagicMock()
+        job_writer = MagicMock()
+
+        store_job_node = create_store_job_node(job_repository_factory, job_writer)
+
+        state = {
+            "job": {"job_id": 1, "title": "Python Developer"},
+            "status": "in_progress",
+            "cv_context": "Python developer",
+            "is_relevant": True,
+            "extracted_must_have_skills": [["Python"]],
+        }
+
+        result = store_job_node(state)
+
+        job_repository_factory.assert_not_called()
+        queued_job = job_writer.add.call_args[0][0]
+        assert queued_job["is_relevant"] is True
+        assert queued_job["must_have_skills"] == [["Python"]]
+        assert result["status"] == "in_progress"
+
+
+class TestStoreJobNodeEmbedding:
+    """Tests for storing the job embedding with the job."""
+
+    def _store(self, state, model_factory=None):
+        mock_repository = MagicMock()
+        store_job_node = create_store_job_node(
+            MagicMock(return_value=mock_repository), model_factory=model_factory
+        )
+        store_job_node(state)
+        return mock_repository.create.call_args[0][0]
+
+    def test_stores_embedding_from_relevance_check(self):
+        """Node stores the embedding the relevance check left in the state."""
+        model_factory = MagicMock()
+        state = {
+            "job": {"job_id": 1, "title": "Python Developer", "description": "Python"},
+            "status": "in_progress",
+            "job_embedding": [0.1, 0.2],
+        }
+
+        created_job = self._store(state, model_factory)
+
+        assert created_job["embedding"] == [0.1, 0.2]
+        model_factory.get_model.assert_not_called()
+
+    def test_embeds_job_when_state_has_no_embedding(self):
+        """Node embeds the job text as a document when relevance was decided in batch."""
+        model_factory = MagicMock()
+        model_factory.get_model.return_value.embed_documents.return_value = [[0.3, 0.4]]
+        state = {
+            "job": {"job_id": 1, "title": "Python Developer", "description": "Python"},
+            "status": "in_progress",
+            "is_relevant": True,
+        }
+
+        created_job = self._store(state, model_factory)
+
+        assert created_job["embedding"] == [0.3, 0.4]
+        model_factory.get_model.return_value.embed_documents.assert_called_once_with(
+            ["Python Developer\n\nPython"]
+        )
+
+    def test_stores_job_without_embedding_when_embedding_fails(self):
+        """Node still stores the job if it cannot be embedded."""
+        model_factory = MagicMock()
+        model_factory.get_model.side_effect = RuntimeError("model unavailable")
+        state = {
+            "job": {"job_id": 1, "title": "Python Developer", "description": "Python"},
+            "status": "in_progress",
+        }
+
+        created_job = self._store(state, model_factory)
+
+        assert "embedding" not in created_job
+        assert created_job["job_id"] == 1
@@ -0,0 +1,304 @@
+"""Reusable job processing session.
+
+A session is created once per pipeline run and holds everything that does not
+depend on the individual job: the compiled workflow graph (whose nodes keep their
+resolved models and structured-output wrappers) and the CV embedding. Processing
+a job then only pays for the job-specific work.
+
+A session can also decide relevance for a whole batch of jobs up front (one
+embedding call for all job texts), feeding the result into each job's workflow
+so irrelevant jobs go straight to storage and store_job reuses the job
+embeddings instead of computing them again.
+
+Every entry point has an async counterpart (aprepare, acheck_relevance, aprocess)
+that awaits the models' native async APIs, for callers running on an event loop.
+"""
+
+import asyncio
+import logging
+import threading
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Callable, ContextManager, List, Optional, Sequence, cast
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph.state import CompiledStateGraph
+
+from job_agent_platform_contracts import IJobRepository
+from job_scrapper_contracts import JobDict
+
+from job_agent_backend.contracts import IModelFactory
+from job_agent_backend.utils.timing import StageTimer, TimedStage
+from .job_processing import create_workflow
+from .nodes import JobBatchWriter
+from .shared_results import SharedJobResults
+from .nodes.check_job_relevance import JobRelevance, acheck_jobs_relevance, check_jobs_relevance
+from .state import AgentState
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+
+class JobProcessingSession:
+    """Processes jobs against a single CV, reusing per-run resources across jobs.
+
+    The workflow is compiled and the CV embedded lazily on first use (or by calling
+    prepare()/aprepare()), so creating a session is cheap. A session is safe to
+    share between threads or tasks processing different jobs concurrently.
+    """
+
+    def __init__(
+        self,
+        cv_content: str,
+        job_repository_factory: Callable[[], IJobRepository],
+        model_factory: Optional[IModelFactory] = None,
+        stage_timer: Optional[StageTimer] = None,
+        job_writer: Optional[JobBatchWriter] = None,
+        shared_results: Optional[SharedJobResults] = None,
+        combined_skill_extraction: bool = False,
+    ) -> None:
+        """Initialize the session.
+
+        Args:
+            cv_content: The CV content to match jobs against
+            job_repository_factory: Factory for producing job repository instances
+            model_factory: Factory for creating AI model instances. If not provided,
+                           will be resolved from the DI container on first use.
+            stage_timer: Optional timer recording embedding and per-node timings
+            job_writer: Optional batching writer the workflow stores jobs through.
+                        Jobs stay buffered until it flushes, so callers that need
+                        them persisted must call job_writer.flush().
+            shared_results: Optional memo through which sessions of different CVs
+                            share the results of CV-independent nodes
+            combined_skill_extraction: Extract both skill lists with a single
+                                       extract_skills node instead of two nodes
+
+        Raises:
+            ValueError: If cv_content is empty or job_repository_factory is not callable
+        """
+        if not cv_content:
+            raise ValueError("CV content is required but was not provided")
+
+        if not callable(job_repository_factory):
+            raise ValueError("job_repository_factory must be callable")
+
+        self._cv_content = cv_content
+        self._job_repository_factory = job_repository_factory
+        self._model_factory = model_factory
+        self._stage_timer = stage_timer
+        self._job_writer = job_writer
+        self._shared_results = shared_results
+        self._combined_skill_extraction = combined_skill_extraction
+        self._workflow: Optional[CompiledStateGraph] = None
+        self._cv_embedding: Optional[List[float]] = None
+        self._embedding_model: Optional["Embeddings"] = None
+        self._lock = threading.Lock()
+        self._async_lock = asyncio.Lock()
+
+    @property
+    def cv_content(self) -> str:
+        """CV content this session matches jobs against."""
+        return self._cv_content
+
+    def prepare(self) -> CompiledStateGraph:
+        """Compile the workflow and precompute the CV embedding if not done yet.
+
+        Returns:
+            The compiled workflow shared by all jobs in this session
+        """
+        with self._lock:
+            if self._workflow is None:
+                model_factory = self._resolve_model_factory()
+                self._cv_embedding = self._embed_cv(model_factory)
+                self._workflow = self._compile(model_factory)
+            return self._workflow
+
+    async def aprepare(self) -> CompiledStateGraph:
+        """Async variant of prepare(), embedding the CV with the model's async API.
+
+        Returns:
+            The compiled workflow shared by all jobs in this session
+        """
+        if self._workflow is not None:
+            return self._workflow
+
+        async with self._async_lock:
+            if self._workflow is None:
+                model_factory = self._resolve_model_factory()
+                cv_embedding = await self._aembed_cv(model_factory)
+                with self._lock:
+                    if self._workflow is None:
+                        self._cv_embedding = cv_embedding
+                        self._workflow = self._compile(model_factory)
+            return self._workflow
+
+    def check_relevance(self, jobs: Sequence[JobDict]) -> List[JobRelevance]:
+        """Decide relevance for a batch of jobs with a single embedding call.
+
+        Args:
+            jobs: Jobs to score against the session CV
+
+        Returns:
+            Relevance flag and job embedding for each job, in input order. Flags are
+            None when the batch check is unavailable, leaving the decision to the
+            per-job workflow.
+        """
+        self.prepare()
+        if not jobs or self._cv_embedding is None or self._embedding_model is None:
+            return [JobRelevance(is_relevant=None)] * len(jobs)
+
+        try:
+            with self._measure(TimedStage.EMBEDDING):
+                return list(check_jobs_relevance(jobs, self._cv_embedding, self._embedding_model))
+        except Exception as e:
+            logger.warning("Batch relevance check failed - %s. Falling back to per-job checks", e)
+            return [JobRelevance(is_relevant=None)] * len(jobs)
+
+    async def acheck_relevance(self, jobs: Sequence[JobDict]) -> List[JobRelevance]:
+        """Async variant of check_relevance().
+
+        Args:
+            jobs: Jobs to score against the session CV
+
+        Returns:
+            Relevance flag and job embedding for each job, in input order, with
+            None flags where undecided
+        """
+        await self.aprepare()
+        if not jobs or self._cv_embedding is None or self._embedding_model is None:
+            return [JobRelevance(is_relevant=None)] * len(jobs)
+
+        try:
+            with self._measure(TimedStage.EMBEDDING):
+                return list(
+                    await acheck_jobs_relevance(jobs, self._cv_embedding, self._embedding_model)
+                )
+        except Exception as e:
+            logger.warning("Batch relevance check failed - %s. Falling back to per-job checks", e)
+            return [JobRelevance(is_relevant=None)] * len(jobs)
+
+    def process(
+        self,
+        job: JobDict,
+        is_relevant: Optional[bool] = None,
+        job_embedding: Optional[List[float]] = None,
+    ) -> AgentState:
+        """Run the workflow on a single job.
+
+        Args:
+            job: Job dictionary to process
+            is_relevant: Relevance decided by check_relevance(). If provided, the
+                         workflow skips its own relevance computation.
+            job_embedding: Job embedding computed by check_relevance(). If provided,
+                           store_job stores it instead of embedding the job again.
+
+        Returns:
+            Final agent state containing the job processing results
+        """
+        workflow = self.prepare()
+
+        final_state = cast(
+            AgentState, workflow.invoke(self._initial_state(job, is_relevant, job_embedding))
+        )
+
+        logger.info("Workflow completed with status: %s", final_state["status"])
+
+        return final_state
+
+    async def aprocess(
+        self,
+        job: JobDict,
+        is_relevant: Optional[bool] = None,
+        job_embedding: Optional[List[float]] = None,
+    ) -> AgentState:
+        """Async variant of process(), running the workflow with ainvoke().
+
+        Model-bound nodes await the models' async APIs; nodes without an async
+        implementation are run by LangGraph in a worker thread.
+
+        Args:
+            job: Job dictionary to process
+            is_relevant: Relevance decided by acheck_relevance(), if any
+            job_embedding: Job embedding computed by acheck_relevance(), if any
+
+        Returns:
+            Final agent state containing the job processing results
+        """
+        workflow = await self.aprepare()
+
+        final_state = cast(
+            AgentState, await workflow.ainvoke(self._initial_state(job, is_relevant, job_embedding))
+        )
+
+        logger.info("Workflow completed with status: %s", final_state["status"])
+
+        return final_state
+
+    def _initial_state(
+        self,
+        job: JobDict,
+        is_relevant: Optional[bool],
+        job_embedding: Optional[List[float]],
+    ) -> AgentState:
+        initial_state: AgentState = {
+            "job": job,
+            "status": "started",
+            "cv_context": self._cv_content,
+        }
+        if self._cv_embedding is not None:
+            initial_state["cv_embedding"] = self._cv_embedding
+        if is_relevant is not None:
+            initial_state["is_relevant"] = is_relevant
+        if job_embedding is not None:
+            initial_state["job_embedding"] = job_embedding
+        return initial_state
+
+    def _compile(self, model_factory: IModelFactory) -> CompiledStateGraph:
+        workflow_config: RunnableConfig = {
+            "configurable": {
+                "job_repository_factory": self._job_repository_factory,
+                "model_factory": model_factory,
+                "stage_timer": self._stage_timer,
+                "job_writer": self._job_writer,
+                "shared_results": self._shared_results,
+                "combined_skill_extraction": self._combined_skill_extraction,
+            }
+        }
+        return create_workflow(workflow_config)
+
+    def _measure(self, stage: TimedStage) -> ContextManager[None]:
+        if self._stage_timer is None:
+            return nullcontext()
+        return self._stage_timer.measure(stage)
+
+    def _resolve_model_factory(self) -> IModelFactory:
+        if self._model_factory is None:
+            from job_agent_backend.container import container
+
+            self._model_factory = container.model_factory()
+        return self._model_factory
+
+    def _embed_cv(self, model_factory: IModelFactory) -> Optional[List[float]]:
+        try:
+            self._embedding_model = model_factory.get_model(model_id="embedding")
+            with self._measure(TimedStage.EMBEDDING):
+                return self._embedding_model.embed_query(self._cv_content)
+        except Exception as e:
+            logger.warning(
+                "Could not precompute CV embedding - %s. Falling back to per-job embedding", e
+            )
+            return None
+
+    async def _aembed_cv(self, model_factory: IModelFactory) -> Optional[List[float]]:
+        try:
+            embedding_model = model_factory.get_model(model_id="embedding")
+            with self._measure(TimedStage.EMBEDDING):
+                cv_embedding = await embedding_model.aembed_query(self._cv_content)
+            self._embedding_model = embedding_model
+            return cv_embedding
+        except Exception as e:
+            logger.warning(
+                "Could not precompute CV embedding - %s. Falling back to per-job embedding", e
+            )
+            return None
@@ -0,0 +1,102 @@
+"""Benchmark for per-job overhead of JobProcessingSession.
+
+Compares processing a batch of jobs with one-off run_job_processing calls (which
+compile the workflow and embed the CV for every job) against a single reused
+session. Model calls are simulated with a fixed latency so the measurement
+reflects the per-job overhead rather than model speed.
+
+Run with: pytest -m benchmark -s
+"""
+
+import time
+from statistics import mean
+from unittest.mock import MagicMock
+
+import pytest
+
+from job_agent_backend.workflows import JobProcessingSession, run_job_processing
+from job_agent_backend.workflows.job_processing.nodes.extract_must_have_skills.schemas import (
+    SkillsExtraction,
+)
+
+
+pytestmark = pytest.mark.benchmark
+
+JOB_COUNT = 20
+EMBEDDING_LATENCY_SECONDS = 0.005
+
+
+class _SlowEmbeddings:
+    """Embedding model stub with a fixed per-call latency."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls += 1
+        time.sleep(EMBEDDING_LATENCY_SECONDS)
+        return [1.0, 0.5, 0.0]
+
+
+def _create_model_factory(embeddings: _SlowEmbeddings) -> MagicMock:
+    structured_model = MagicMock()
+    structured_model.invoke.return_value = SkillsExtraction(skills=[["Python"]])
+    skills_model = MagicMock()
+    skills_model.with_structured_output.return_value = structured_model
+
+    factory = MagicMock()
+    factory.get_model.side_effect = lambda model_id: (
+        embeddings if model_id == "embedding" else skills_model
+    )
+    return factory
+
+
+def _jobs() -> list[dict]:
+    return [
+        {"job_id": i, "title": "Python Developer", "description": "Python, Django, PostgreSQL"}
+        for i in range(JOB_COUNT)
+    ]
+
+
+def _time_per_job(process) -> list[float]:
+    timings = []
+    for job in _jobs():
+        started = time.perf_counter()
+        process(job)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def test_session_reduces_per_job_overhead(sample_cv_content, job_repository_factory_stub):
+    """A reused session costs less per job than one-off workflow runs."""
+    one_off_embeddings = _SlowEmbeddings()
+    one_off_factory = _create_model_factory(one_off_embeddings)
+    one_off_timings = _time_per_job(
+        lambda job: run_job_processing(
+            job,
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=one_off_factory,
+        )
+    )
+
+    session_embeddings = _SlowEmbeddings()
+    session = JobProcessingSession(
+        sample_cv_content,
+        job_repository_factory=job_repository_factory_stub,
+        model_factory=_create_model_factory(session_embeddings),
+    )
+    session.prepare()
+    session_timings = _time_per_job(session.process)
+
+    one_off_ms = mean(one_off_timings) * 1000
+    session_ms = mean(session_timings) * 1000
+    print(
+        f"\nPer-job time over {JOB_COUNT} jobs: one-off {one_off_ms:.2f} ms, "
+        f"session {session_ms:.2f} ms ({one_off_ms / session_ms:.1f}x), "
+        f"embedding calls {one_off_embeddings.calls} vs {session_embeddings.calls}"
+    )
+
+    assert one_off_embeddings.calls == 2 * JOB_COUNT
+    assert session_embeddings.calls == JOB_COUNT + 1
+    assert session_ms < one_off_ms
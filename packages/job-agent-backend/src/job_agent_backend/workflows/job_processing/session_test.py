@@ -0,0 +1,443 @@
+"""Tests for JobProcessingSession."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from job_agent_backend.workflows.job_processing.nodes.extract_must_have_skills.schemas import (
+    SkillsExtraction,
+)
+from job_agent_backend.workflows.job_processing.nodes.extract_skills.schemas import (
+    CombinedSkillsExtraction,
+)
+from job_agent_backend.utils.timing import StageTimer
+from job_agent_backend.workflows.job_processing.nodes.check_job_relevance import JobRelevance
+from job_agent_backend.workflows.job_processing.session import JobProcessingSession
+from job_agent_backend.workflows.job_processing.shared_results import SharedJobResults
+
+
+CV_VECTOR = [1.0, 0.0, 0.0]
+RELEVANT_JOB_VECTOR = [0.8, 0.6, 0.0]
+IRRELEVANT_JOB_VECTOR = [0.1, 0.995, 0.0]
+
+
+def create_embedding_model(cv_content: str) -> MagicMock:
+    """Create an embedding model returning fixed vectors for the CV and for jobs."""
+    model = MagicMock()
+    model.embed_query.side_effect = lambda text: (
+        CV_VECTOR if text == cv_content else RELEVANT_JOB_VECTOR
+    )
+    model.embed_documents.side_effect = lambda texts: [
+        IRRELEVANT_JOB_VECTOR if "Java" in text else RELEVANT_JOB_VECTOR for text in texts
+    ]
+    model.aembed_query = AsyncMock(side_effect=model.embed_query.side_effect)
+    model.aembed_documents = AsyncMock(side_effect=model.embed_documents.side_effect)
+    return model
+
+
+def create_model_factory(embedding_model: MagicMock) -> MagicMock:
+    """Create a model factory serving the embedding model and a skills model."""
+    skills_model = MagicMock()
+    structured_model = MagicMock()
+    structured_model.invoke.return_value = SkillsExtraction(skills=[["Python"]])
+    structured_model.ainvoke = AsyncMock(return_value=SkillsExtraction(skills=[["Go"]]))
+    skills_model.with_structured_output.return_value = structured_model
+
+    factory = MagicMock()
+    factory.get_model.side_effect = lambda model_id: (
+        embedding_model if model_id == "embedding" else skills_model
+    )
+    return factory
+
+
+def make_job(job_id: int) -> dict:
+    return {"job_id": job_id, "title": "Python Developer", "description": "Python and Django"}
+
+
+class TestJobProcessingSession:
+    """Test suite for JobProcessingSession."""
+
+    def test_rejects_empty_cv(self, job_repository_factory_stub):
+        """Session requires CV content."""
+        with pytest.raises(ValueError, match="CV content is required"):
+            JobProcessingSession("", job_repository_factory=job_repository_factory_stub)
+
+    def test_rejects_non_callable_repository_factory(self, sample_cv_content):
+        """Session requires a callable job repository factory."""
+        with pytest.raises(ValueError, match="job_repository_factory must be callable"):
+            JobProcessingSession(sample_cv_content, job_repository_factory="not callable")
+
+    def test_creation_is_lazy(self, sample_cv_content, job_repository_factory_stub):
+        """Creating a session does not touch models or compile the workflow."""
+        model_factory = MagicMock()
+
+        with patch(
+            "job_agent_backend.workflows.job_processing.session.create_workflow"
+        ) as mock_create_workflow:
+            JobProcessingSession(
+                sample_cv_content,
+                job_repository_factory=job_repository_factory_stub,
+                model_factory=model_factory,
+            )
+
+        mock_create_workflow.assert_not_called()
+        model_factory.get_model.assert_not_called()
+
+    def test_compiles_workflow_once_for_many_jobs(
+        self, sample_cv_content, job_repository_factory_stub
+    ):
+        """The workflow graph is compiled once and reused for each job."""
+        model_factory = create_model_factory(create_embedding_model(sample_cv_content))
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=model_factory,
+        )
+
+        with patch(
+            "job_agent_backend.workflows.job_processing.session.create_workflow"
+        ) as mock_create_workflow:
+            mock_create_workflow.return_value.invoke.return_value = {"status": "completed"}
+            for job_id in range(3):
+                session.process(make_job(job_id))
+
+        mock_create_workflow.assert_called_once()
+        assert mock_create_workflow.return_value.invoke.call_count == 3
+
+    def test_embeds_cv_once_for_many_jobs(self, sample_cv_content, job_repository_factory_stub):
+        """The CV is embedded once per session, jobs are embedded individually."""
+        embedding_model = create_embedding_model(sample_cv_content)
+        model_factory = create_model_factory(embedding_model)
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=model_factory,
+        )
+
+        results = [session.process(make_job(job_id)) for job_id in range(3)]
+
+        embedded_texts = [call.args[0] for call in embedding_model.embed_query.call_args_list]
+        assert embedded_texts.count(sample_cv_content) == 1
+        assert len(embedded_texts) == 4
+        assert all(result["is_relevant"] is True for result in results)
+        assert all(result["extracted_must_have_skills"] == [["Python"]] for result in results)
+
+    def test_reuses_structured_output_wrappers(
+        self, sample_cv_content, job_repository_factory_stub
+    ):
+        """Structured-output wrappers are created once per extraction node."""
+        model_factory = create_model_factory(create_embedding_model(sample_cv_content))
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=model_factory,
+        )
+
+        for job_id in range(3):
+            session.process(make_job(job_id))
+
+        skills_model = model_factory.get_model(model_id="skill-extraction")
+        assert skills_model.with_structured_output.call_count == 2
+
+    def test_combined_skill_extraction_uses_one_model_call_per_job(
+        self, sample_cv_content, job_repository_factory_stub
+    ):
+        """Combined extraction fills both skill lists from a single structured call."""
+        model_factory = create_model_factory(create_embedding_model(sample_cv_content))
+        structured_model = model_factory.get_model(
+            model_id="skill-extraction"
+        ).with_structured_output.return_value
+        structured_model.invoke.return_value = CombinedSkillsExtraction(
+            must_have_skills=[["Python"]], nice_to_have_skills=[["Docker"]]
+        )
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=model_factory,
+            combined_skill_extraction=True,
+        )
+
+        results = [session.process(make_job(job_id)) for job_id in range(2)]
+
+        assert all(result["extracted_must_have_skills"] == [["Python"]] for result in results)
+        assert all(result["extracted_nice_to_have_skills"] == [["Docker"]] for result in results)
+        assert all(result["status"] == "completed" for result in results)
+        assert structured_model.invoke.call_count == 2
+
+    def test_combined_skill_extraction_skips_irrelevant_jobs(
+        self, sample_cv_content, job_repository_factory_stub
+    ):
+        """Irrelevant jobs go straight to storage in combined extraction mode."""
+        model_factory = create_model_factory(create_embedding_model(sample_cv_content))
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=model_factory,
+            combined_skill_extraction=True,
+        )
+
+        result = session.process(make_job(1), is_relevant=False)
+
+        assert result["is_relevant"] is False
+        assert "extracted_must_have_skills" not in result
+        assert "extracted_nice_to_have_skills" not in result
+        assert result["status"] == "completed"
+        skills_model = model_factory.get_model(model_id="skill-extraction")
+        skills_model.with_structured_output.return_value.invoke.assert_not_called()
+
+    def test_falls_back_when_cv_embedding_fails(
+        self, sample_cv_content, job_repository_factory_stub
+    ):
+        """Jobs are still processed when the CV embedding cannot be precomputed."""
+        model_factory = MagicMock()
+        model_factory.get_model.side_effect = Exception("Model unavailable")
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=model_factory,
+        )
+
+        result = session.process(make_job(1))
+
+        assert "cv_embedding" not in result
+        assert result["is_relevant"] is True
+        assert result["status"] == "completed"
+
+    def test_check_relevance_scores_batch_with_one_embedding_call(
+        self, sample_cv_content, job_repository_factory_stub
+    ):
+        """Batch relevance embeds all jobs at once and reuses the CV embedding."""
+        embedding_model = create_embedding_model(sample_cv_content)
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=create_model_factory(embedding_model),
+        )
+        jobs = [make_job(1), {"job_id": 2, "title": "Java Architect", "description": "Java"}]
+
+        relevance = session.check_relevance(jobs)
+
+        assert relevance == [
+            JobRelevance(True, RELEVANT_JOB_VECTOR),
+            JobRelevance(False, IRRELEVANT_JOB_VECTOR),
+        ]
+        embedding_model.embed_documents.assert_called_once()
+        embedding_model.embed_query.assert_called_once_with(sample_cv_content)
+
+    def test_precomputed_irrelevant_job_skips_extraction(
+        self, sample_cv_content, job_repository_factory_stub
+    ):
+        """A job marked irrelevant by the batch check goes straight to storage."""
+        embedding_model = create_embedding_model(sample_cv_content)
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=create_model_factory(embedding_model),
+        )
+
+        result = session.process(make_job(1), is_relevant=False)
+
+        assert result["is_relevant"] is False
+        assert "extracted_must_have_skills" not in result
+        assert result["status"] == "completed"
+        embedding_model.embed_query.assert_called_once_with(sample_cv_content)
+
+    def test_batch_embedding_is_stored_without_embedding_the_job_again(self, sample_cv_content):
+        """store_job stores the embedding from the batch check instead of re-embedding."""
+        embedding_model = create_embedding_model(sample_cv_content)
+        repository = MagicMock()
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=lambda: repository,
+            model_factory=create_model_factory(embedding_model),
+        )
+
+        [relevance] = session.check_relevance([make_job(1)])
+        session.process(make_job(1), *relevance)
+
+        embedding_model.embed_documents.assert_called_once()
+        embedding_model.embed_query.assert_called_once_with(sample_cv_content)
+        assert repository.create.call_args.args[0]["embedding"] == RELEVANT_JOB_VECTOR
+
+    async def test_async_batch_embedding_is_stored_without_embedding_the_job_again(
+        self, sample_cv_content
+    ):
+        """The async path hands the batch embeddings to store_job the same way."""
+        embedding_model = create_embedding_model(sample_cv_content)
+        repository = MagicMock()
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=lambda: repository,
+            model_factory=create_model_factory(embedding_model),
+        )
+
+        [relevance] = await session.acheck_relevance([make_job(1)])
+        await session.aprocess(make_job(1), *relevance)
+
+        embedding_model.aembed_documents.assert_awaited_once()
+        embedding_model.embed_documents.assert_not_called()
+        assert repository.create.call_args.args[0]["embedding"] == RELEVANT_JOB_VECTOR
+
+    def test_check_relevance_falls_back_when_batch_embedding_fails(
+        self, sample_cv_content, job_repository_factory_stub
+    ):
+        """Relevance is left undecided when the batch embedding call fails."""
+        embedding_model = create_embedding_model(sample_cv_content)
+        embedding_model.embed_documents.side_effect = Exception("Model unavailable")
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=create_model_factory(embedding_model),
+        )
+
+        assert session.check_relevance([make_job(1), make_job(2)]) == [
+            JobRelevance(None),
+            JobRelevance(None),
+        ]
+
+    def test_check_relevance_undecided_without_cv_embedding(
+        self, sample_cv_content, job_repository_factory_stub
+    ):
+        """Relevance is left undecided when the CV embedding is unavailable."""
+        model_factory = MagicMock()
+        model_factory.get_model.side_effect = Exception("Model unavailable")
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=model_factory,
+        )
+
+        assert session.check_relevance([make_job(1)]) == [JobRelevance(None)]
+
+    def test_stage_timer_records_embedding_and_node_timings(
+        self, sample_cv_content, job_repository_factory_stub
+    ):
+        """With a stage timer, embeddings and every executed node are timed."""
+        stage_timer = StageTimer()
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=create_model_factory(create_embedding_model(sample_cv_content)),
+            stage_timer=stage_timer,
+        )
+
+        [relevance] = session.check_relevance([make_job(1)])
+        session.process(make_job(1), *relevance)
+
+        stages = stage_timer.summary()["stages"]
+        assert stages["embedding"]["calls"] == 2
+        for node in (
+            "check_job_relevance",
+            "extract_must_have_skills",
+            "extract_nice_to_have_skills",
+            "store_job",
+        ):
+            assert stages[node]["calls"] == 1
+
+    async def test_stage_timer_records_async_node_timings(
+        self, sample_cv_content, job_repository_factory_stub
+    ):
+        """Native async nodes are timed the same way under ainvoke()."""
+        stage_timer = StageTimer()
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=create_model_factory(create_embedding_model(sample_cv_content)),
+            stage_timer=stage_timer,
+        )
+
+        await session.aprocess(make_job(1))
+
+        stages = stage_timer.summary()["stages"]
+        assert stages["extract_must_have_skills"]["calls"] == 1
+        assert stages["extract_nice_to_have_skills"]["calls"] == 1
+        assert stages["store_job"]["calls"] == 1
+
+    def test_shared_results_extract_skills_once_across_cvs(self, job_repository_factory_stub):
+        """Sessions for different CVs share skill extraction but score relevance each."""
+        shared_results = SharedJobResults()
+        sessions = []
+        for cv_content in ("Python developer", "Senior Python engineer"):
+            model_factory = create_model_factory(create_embedding_model(cv_content))
+            sessions.append(
+                (
+                    JobProcessingSession(
+                        cv_content,
+                        job_repository_factory=job_repository_factory_stub,
+                        model_factory=model_factory,
+                        shared_results=shared_results,
+                    ),
+                    model_factory,
+                )
+            )
+
+        results = [session.process(make_job(1)) for session, _ in sessions]
+
+        structured_calls = [
+            factory.get_model(model_id="skill-extraction").with_structured_output.return_value
+            for _, factory in sessions
+        ]
+        assert sum(model.invoke.call_count for model in structured_calls) == 2
+        assert [result["extracted_must_have_skills"] for result in results] == [
+            [["Python"]],
+            [["Python"]],
+        ]
+        for _, factory in sessions:
+            factory.get_model(model_id="embedding").embed_query.assert_called()
+        assert shared_results.hits == 2
+
+    async def test_aprocess_uses_async_model_calls(
+        self, sample_cv_content, job_repository_factory_stub
+    ):
+        """Async processing embeds the CV and extracts skills through async model APIs."""
+        embedding_model = create_embedding_model(sample_cv_content)
+        model_factory = create_model_factory(embedding_model)
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=model_factory,
+        )
+
+        results = [await session.aprocess(make_job(job_id)) for job_id in range(2)]
+
+        embedding_model.aembed_query.assert_awaited_once_with(sample_cv_content)
+        assert all(result["extracted_must_have_skills"] == [["Go"]] for result in results)
+        assert all(result["extracted_nice_to_have_skills"] == [["Go"]] for result in results)
+        assert all(result["status"] == "completed" for result in results)
+        structured_model = model_factory.get_model(model_id="skill-extraction")
+        structured_model.with_structured_output.return_value.invoke.assert_not_called()
+
+    async def test_acheck_relevance_scores_batch_with_one_async_call(
+        self, sample_cv_content, job_repository_factory_stub
+    ):
+        """Async batch relevance awaits one aembed_documents call."""
+        embedding_model = create_embedding_model(sample_cv_content)
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=create_model_factory(embedding_model),
+        )
+        jobs = [make_job(1), {"job_id": 2, "title": "Java Architect", "description": "Java"}]
+
+        relevance = await session.acheck_relevance(jobs)
+
+        assert relevance == [
+            JobRelevance(True, RELEVANT_JOB_VECTOR),
+            JobRelevance(False, IRRELEVANT_JOB_VECTOR),
+        ]
+        embedding_model.aembed_documents.assert_awaited_once()
+        embedding_model.embed_documents.assert_not_called()
+
+    async def test_acheck_relevance_undecided_without_cv_embedding(
+        self, sample_cv_content, job_repository_factory_stub
+    ):
+        """Async relevance is left undecided when the CV embedding is unavailable."""
+        model_factory = MagicMock()
+        model_factory.get_model.side_effect = Exception("Model unavailable")
+        session = JobProcessingSession(
+            sample_cv_content,
+            job_repository_factory=job_repository_factory_stub,
+            model_factory=model_factory,
+        )
+
+        assert await session.acheck_relevance([make_job(1)]) == [JobRelevance(None)]
@@ -0,0 +1,147 @@
+"""Results of CV-independent workflow nodes shared between sessions.
+
+Skill extraction depends only on the job description, not on the CV a session
+matches jobs against. When several users process the same scraped jobs, sessions
+given the same SharedJobResults run such nodes once per job: the first session
+computes the result, sessions processing the job concurrently wait for it, and
+later ones reuse it.
+"""
+
+import asyncio
+import copy
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from job_agent_platform_contracts import CacheStats
+
+from .state import AgentState
+
+T = TypeVar("T")
+
+# Number of node results kept before the least recently used ones are dropped
+DEFAULT_MAX_ENTRIES = 10_000
+
+# Result handed to sessions waiting on a computation that failed
+_FAILED = object()
+
+
+class SharedJobResults:
+    """Thread-safe memo of node results keyed by node name and job description.
+
+    Only wrap functions whose result depends on nothing but the job description,
+    and that raise when they fail. Failed computations are not kept: sessions that
+    were waiting for one compute the result themselves, and later sessions retry
+    it. A function that turns its errors into a fallback result would have that
+    fallback shared, so nodes wrap only their model call and fall back outside.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize the memo.
+
+        Args:
+            max_entries: Number of node results kept before the least recently
+                         used ones are dropped
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._results: OrderedDict[tuple[str, str], Future[Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> CacheStats:
+        """Get the number of hits and misses counted so far."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def wrap(self, node: str, fn: Callable[[AgentState], T]) -> Callable[[AgentState], T]:
+        """Return node function fn sharing its result for each job description."""
+
+        @functools.wraps(fn)
+        def shared(state: AgentState) -> T:
+            key = self._key(node, state)
+            if key is None:
+                return fn(state)
+
+            future, is_owner = self._claim(key)
+            if not is_owner:
+                shared_result = future.result()
+                return fn(state) if shared_result is _FAILED else _copy(shared_result)
+
+            try:
+                result = fn(state)
+            except BaseException:
+                self._fail(key, future)
+                raise
+            future.set_result(result)
+            return _copy(result)
+
+        return shared
+
+    def wrap_async(
+        self, node: str, afn: Callable[[AgentState], Awaitable[T]]
+    ) -> Callable[[AgentState], Awaitable[T]]:
+        """Return coroutine node function afn sharing its result for each job description."""
+
+        @functools.wraps(afn)
+        async def shared(state: AgentState) -> T:
+            key = self._key(node, state)
+            if key is None:
+                return await afn(state)
+
+            future, is_owner = self._claim(key)
+            if not is_owner:
+                shared_result = await asyncio.wrap_future(future)
+                return await afn(state) if shared_result is _FAILED else _copy(shared_result)
+
+            try:
+                result = await afn(state)
+            except BaseException:
+                self._fail(key, future)
+                raise
+            future.set_result(result)
+            return _copy(result)
+
+        return shared
+
+    @staticmethod
+    def _key(node: str, state: AgentState) -> Optional[tuple[str, str]]:
+        description = state["job"].get("description")
+        if not description:
+            return None
+        return node, hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+    def _claim(self, key: tuple[str, str]) -> tuple[Future[Any], bool]:
+        """Return the future holding the result for key and whether the caller computes it."""
+        with self._lock:
+            future = self._results.get(key)
+            if future is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return future, False
+
+            future = Future()
+            self._results[key] = future
+            while len(self._results) > self._max_entries:
+                self._results.popitem(last=False)
+            self.misses += 1
+            return future, True
+
+    def _fail(self, key: tuple[str, str], future: Future[Any]) -> None:
+        with self._lock:
+            if self._results.get(key) is future:
+                del self._results[key]
+        future.set_result(_FAILED)
+
+
+def _copy(result: T) -> T:
+    """Copy a shared result so sessions never mutate each other's state."""
+    return copy.deepcopy(result)
@@ -0,0 +1,163 @@
+"""Tests for SharedJobResults."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from job_agent_backend.workflows.job_processing.nodes.extract_must_have_skills.node import (
+    create_extract_must_have_skills_async_node,
+    create_extract_must_have_skills_node,
+)
+from job_agent_backend.workflows.job_processing.nodes.extract_must_have_skills.schemas import (
+    SkillsExtraction,
+)
+from job_agent_backend.workflows.job_processing.shared_results import SharedJobResults
+
+
+def make_state(description: str = "Python and Django") -> dict:
+    return {"job": {"job_id": 1, "description": description}, "cv_context": "CV"}
+
+
+def make_model_factory(structured_model: MagicMock) -> MagicMock:
+    model_factory = MagicMock()
+    model_factory.get_model.return_value.with_structured_output.return_value = structured_model
+    return model_factory
+
+
+class TestSharedJobResults:
+    """Test suite for SharedJobResults."""
+
+    def test_reuses_result_for_same_description(self):
+        """A node runs once per description and callers get independent copies."""
+        node = MagicMock(return_value={"skills": [["Python"]]})
+        shared = SharedJobResults().wrap("extract", node)
+
+        first = shared(make_state())
+        second = shared(make_state())
+
+        node.assert_called_once()
+        assert first == second == {"skills": [["Python"]]}
+        first["skills"].append(["Go"])
+        assert shared(make_state()) == {"skills": [["Python"]]}
+
+    def test_results_are_keyed_by_node_and_description(self):
+        """Different nodes and descriptions do not share results."""
+        results = SharedJobResults()
+        node = MagicMock(return_value={})
+
+        results.wrap("a", node)(make_state("one"))
+        results.wrap("a", node)(make_state("two"))
+        results.wrap("b", node)(make_state("one"))
+
+        assert node.call_count == 3
+        assert results.misses == 3
+        assert results.stats() == {"hits": 0, "misses": 3}
+
+    def test_jobs_without_description_are_not_shared(self):
+        """Nodes run for every job without a description."""
+        results = SharedJobResults()
+        node = MagicMock(return_value={})
+        shared = results.wrap("extract", node)
+
+        shared(make_state(""))
+        shared(make_state(""))
+
+        assert node.call_count == 2
+        assert results.hits == results.misses == 0
+
+    def test_concurrent_callers_wait_for_one_computation(self):
+        """Sessions processing the same job at once share a single computation."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def node(state):
+            calls.append(state)
+            started.set()
+            release.wait(timeout=5)
+            return {"skills": [["Python"]]}
+
+        shared = SharedJobResults().wrap("extract", node)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(shared, make_state())]
+            started.wait(timeout=5)
+            futures += [executor.submit(shared, make_state()) for _ in range(2)]
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        assert len(calls) == 1
+        assert results == [{"skills": [["Python"]]}] * 3
+
+    def test_failed_computation_is_retried(self):
+        """A failure is not cached, so the next caller computes again."""
+        node = MagicMock(side_effect=[RuntimeError("model down"), {"skills": []}])
+        shared = SharedJobResults().wrap("extract", node)
+
+        with pytest.raises(RuntimeError):
+            shared(make_state())
+
+        assert shared(make_state()) == {"skills": []}
+        assert node.call_count == 2
+
+    def test_node_model_error_is_not_shared(self):
+        """A node falling back after a model error leaves the next session to retry."""
+        results = SharedJobResults()
+        structured_model = MagicMock()
+        structured_model.invoke.side_effect = [
+            ConnectionError("ollama unreachable"),
+            SkillsExtraction(skills=[["Python"]]),
+        ]
+        node = create_extract_must_have_skills_node(
+            make_model_factory(structured_model),
+            share=lambda fn: results.wrap("extract_must_have_skills", fn),
+        )
+
+        assert node(make_state()) == {"extracted_must_have_skills": []}
+        assert node(make_state()) == {"extracted_must_have_skills": [["Python"]]}
+        assert node(make_state()) == {"extracted_must_have_skills": [["Python"]]}
+        assert structured_model.invoke.call_count == 2
+
+    async def test_async_node_model_error_is_not_shared(self):
+        """The async node retries after a model error the same way."""
+        results = SharedJobResults()
+        structured_model = MagicMock()
+        structured_model.ainvoke = AsyncMock(
+            side_effect=[TimeoutError("timed out"), SkillsExtraction(skills=[["Go"]])]
+        )
+        node = create_extract_must_have_skills_async_node(
+            make_model_factory(structured_model),
+            share=lambda afn: results.wrap_async("extract_must_have_skills", afn),
+        )
+
+        assert await node(make_state()) == {"extracted_must_have_skills": []}
+        assert await node(make_state()) == {"extracted_must_have_skills": [["Go"]]}
+        assert await node(make_state()) == {"extracted_must_have_skills": [["Go"]]}
+        assert structured_model.ainvoke.await_count == 2
+
+    def test_evicts_least_recently_used_results(self):
+        """Only max_entries results are kept."""
+        node = MagicMock(return_value={})
+        shared = SharedJobResults(max_entries=1).wrap("extract", node)
+
+        shared(make_state("one"))
+        shared(make_state("two"))
+        shared(make_state("one"))
+
+        assert node.call_count == 3
+
+    async def test_async_wrapper_shares_results(self):
+        """The async wrapper shares results the same way."""
+        results = SharedJobResults()
+        anode = AsyncMock(return_value={"skills": [["Go"]]})
+        shared = results.wrap_async("extract", anode)
+
+        assert await shared(make_state()) == {"skills": [["Go"]]}
+        assert await shared(make_state()) == {"skills": [["Go"]]}
+        anode.assert_awaited_once()
+
+    def test_rejects_non_positive_max_entries(self):
+        """At least one result must be kept."""
+        with pytest.raises(ValueError):
+            SharedJobResults(max_entries=0)
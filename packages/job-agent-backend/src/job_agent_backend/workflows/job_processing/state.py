@@ -3,9 +3,10 @@
 This module defines the state schema that flows through the langgraph workflow.
 """
 
-from typing import Any, Callable, List, cast
+from typing import Any, Awaitable, Callable, List, cast
 from typing_extensions import TypeAlias, TypedDict, NotRequired
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph._node import _Node
 from job_scrapper_contracts import JobDict
 
@@ -18,7 +19,10 @@ class AgentState(TypedDict):
         job: Single job dictionary to process
         status: Current status of the workflow
         cv_context: CV/resume content for context
+        cv_embedding: Precomputed embedding of cv_context, shared across jobs (optional)
         is_relevant: Whether the job is relevant to the candidate's CV (optional)
+        job_embedding: Embedding of the job text computed by the relevance check (optional)
+        duplicate_job_id: ID of the stored near-duplicate whose skills were reused (optional)
         extracted_must_have_skills: 2D list of extracted must-have skills (optional).
             Outer list = AND groups, inner lists = OR alternatives.
         extracted_nice_to_have_skills: 2D list of extracted nice-to-have skills (optional).
@@ -28,7 +32,10 @@ class AgentState(TypedDict):
     job: JobDict
     status: str
     cv_context: str
+    cv_embedding: NotRequired[List[float]]
     is_relevant: NotRequired[bool]
+    job_embedding: NotRequired[List[float]]
+    duplicate_job_id: NotRequired[int]
     extracted_must_have_skills: NotRequired[List[List[str]]]
     extracted_nice_to_have_skills: NotRequired[List[List[str]]]
 
@@ -52,3 +59,23 @@ def as_node(fn: Callable[[AgentState], Any]) -> NodeFunc:
         Same function cast to NodeFunc for LangGraph compatibility
     """
     return cast(NodeFunc, fn)
+
+
+def as_dual_node(
+    fn: Callable[[AgentState], Any],
+    afn: Callable[[AgentState], Awaitable[Any]],
+) -> NodeFunc:
+    """
+    Combine sync and async implementations of a node into one LangGraph node.
+
+    The graph runs fn when invoked synchronously and awaits afn when invoked
+    through ainvoke/astream, so async runs do not hand the node to a worker thread.
+
+    Args:
+        fn: Node function used by invoke()
+        afn: Coroutine function with the same behaviour, used by ainvoke()
+
+    Returns:
+        Runnable node cast to NodeFunc for LangGraph compatibility
+    """
+    return cast(NodeFunc, RunnableLambda(fn, afunc=afn, name=fn.__name__))
@@ -11,9 +11,20 @@ from job_agent_platform_contracts.job_repository import (
     DatabaseConnectionError,
 )
 from job_agent_platform_contracts.cv_repository import ICVRepository
-from job_agent_platform_contracts.core import JobProcessingResult, PipelineSummary
+from job_agent_platform_contracts.core import (
+    CacheStats,
+    JobProcessingResult,
+    PipelineSummary,
+    PipelineTimings,
+    StageTimings,
+)
 from job_agent_platform_contracts.core.orchestrator import IJobAgentOrchestrator
 from job_agent_platform_contracts.essay_repository import IEssayRepository
+from job_agent_platform_contracts.pipeline_run_repository import (
+    IPipelineRunRepository,
+    PipelineRun,
+    PipelineRunStatus,
+)
 
 __version__ = "0.1.0"
 
@@ -21,9 +32,15 @@ __all__ = [
     "IJobRepository",
     "ICVRepository",
     "IEssayRepository",
+    "IPipelineRunRepository",
+    "PipelineRun",
+    "PipelineRunStatus",
     "IJobAgentOrchestrator",
+    "CacheStats",
     "JobProcessingResult",
     "PipelineSummary",
+    "PipelineTimings",
+    "StageTimings",
     "JobAgentError",
     "RepositoryError",
     "JobAlreadyExistsError",
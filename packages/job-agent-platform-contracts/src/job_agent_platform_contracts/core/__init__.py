@@ -1,6 +1,17 @@
 """Core contract types for orchestrator workflows."""
 
 from job_agent_platform_contracts.core.job_processing_result import JobProcessingResult
-from job_agent_platform_contracts.core.pipeline_summary import PipelineSummary
+from job_agent_platform_contracts.core.pipeline_summary import (
+    CacheStats,
+    PipelineSummary,
+    PipelineTimings,
+    StageTimings,
+)
 
-__all__ = ["JobProcessingResult", "PipelineSummary"]
+__all__ = [
+    "CacheStats",
+    "JobProcessingResult",
+    "PipelineSummary",
+    "PipelineTimings",
+    "StageTimings",
+]
@@ -1,12 +1,13 @@
 """Interface for job agent orchestration."""
 
 from pathlib import Path
-from typing import Iterable, Optional, Protocol, Sequence
+from typing import AsyncGenerator, Iterable, Optional, Protocol, Sequence
 
 from job_scrapper_contracts import JobDict
 
 from job_agent_platform_contracts.core.job_processing_result import JobProcessingResult
-from job_agent_platform_contracts.core.pipeline_summary import PipelineSummary
+from job_agent_platform_contracts.core.pipeline_summary import PipelineSummary, PipelineTimings
+from job_agent_platform_contracts.pipeline_run_repository.schemas import PipelineRun
 
 
 class IJobAgentOrchestrator(Protocol):
@@ -28,6 +29,35 @@ class IJobAgentOrchestrator(Protocol):
         """Load the processed CV content for the user."""
         ...
 
+    def start_run(
+        self,
+        user_id: int,
+        min_salary: int = 4000,
+        employment_location: str = "remote",
+        days: Optional[int] = None,
+    ) -> Optional[PipelineRun]:
+        """Start a checkpointed run, or resume the user's unfinished run for the same search.
+
+        Args:
+            user_id: User the run belongs to
+            min_salary: Minimum salary filter
+            employment_location: Employment type or location filter
+            days: Number of days to look back. If None, auto-calculates from latest
+                  job in repository
+
+        Returns:
+            The resumed or created run, or None if runs are not checkpointed
+        """
+        ...
+
+    def get_pending_jobs(self, run: PipelineRun) -> list[JobDict]:
+        """Return the jobs of a run that passed filtering but were not processed yet."""
+        ...
+
+    def finish_run(self, run: PipelineRun) -> None:
+        """Mark a run as completed so it is not resumed."""
+        ...
+
     def scrape_jobs(
         self,
         min_salary: int = 4000,
@@ -46,8 +76,44 @@ class IJobAgentOrchestrator(Protocol):
         """
         ...
 
-    def filter_jobs_list(self, jobs: Sequence[JobDict]) -> list[JobDict]:
-        """Filter job listings according to the configured rules."""
+    def scrape_jobs_streaming_async(
+        self,
+        min_salary: int = 4000,
+        employment_location: str = "remote",
+        days: Optional[int] = None,
+        timeout: int = 30,
+        run: Optional[PipelineRun] = None,
+    ) -> AsyncGenerator[tuple[list[JobDict], int], None]:
+        """Asynchronously yield scraped job batches as they arrive.
+
+        Args:
+            min_salary: Minimum salary filter
+            employment_location: Employment type or location filter
+            days: Number of days to look back. If None, auto-calculates from latest
+                  job in repository
+            timeout: Request timeout in seconds
+            run: Optional run from start_run; scraping resumes with the run's date
+                 cutoff and is skipped if the run already finished scraping
+
+        Yields:
+            Tuple of (batch_jobs, total_jobs_so_far)
+        """
+        ...
+
+    def filter_jobs_list(
+        self, jobs: Sequence[JobDict], run: Optional[PipelineRun] = None
+    ) -> list[JobDict]:
+        """Filter job listings according to the configured rules.
+
+        With a run, passed jobs are recorded in it and jobs it already recorded are
+        left out.
+        """
+        ...
+
+    async def filter_jobs_list_async(
+        self, jobs: Sequence[JobDict], run: Optional[PipelineRun] = None
+    ) -> list[JobDict]:
+        """Asynchronously filter job listings according to the configured rules."""
         ...
 
     def process_job(
@@ -62,8 +128,46 @@ class IJobAgentOrchestrator(Protocol):
         self,
         jobs: Sequence[JobDict],
         cv_content: str,
+        max_workers: Optional[int] = None,
+        preserve_order: bool = False,
+        run: Optional[PipelineRun] = None,
     ) -> Iterable[tuple[int, int, JobProcessingResult]]:
-        """Yield processing results for each job alongside progress metadata."""
+        """Yield processing results for each job alongside progress metadata.
+
+        Args:
+            jobs: Jobs to process
+            cv_content: Cleaned CV content
+            max_workers: Number of jobs to process concurrently. If None, uses the
+                        implementation default.
+            preserve_order: If True, yield results in input order instead of
+                           completion order
+            run: Optional run from start_run in which each job is marked processed
+        """
+        ...
+
+    def process_jobs_async(
+        self,
+        jobs: Sequence[JobDict],
+        cv_content: str,
+        max_workers: Optional[int] = None,
+        preserve_order: bool = False,
+        run: Optional[PipelineRun] = None,
+    ) -> AsyncGenerator[tuple[int, int, JobProcessingResult], None]:
+        """Asynchronously yield processing results for each job with progress metadata.
+
+        Args:
+            jobs: Jobs to process
+            cv_content: Cleaned CV content
+            max_workers: Number of jobs to process concurrently. If None, uses the
+                        implementation default.
+            preserve_order: If True, yield results in input order instead of
+                           completion order
+            run: Optional run from start_run in which each job is marked processed
+        """
+        ...
+
+    def get_pipeline_timings(self) -> PipelineTimings:
+        """Return per-stage timings, job latency percentiles and throughput recorded so far."""
         ...
 
     def run_complete_pipeline(
@@ -73,6 +177,7 @@ class IJobAgentOrchestrator(Protocol):
         employment_location: str = "remote",
         days: Optional[int] = None,
         timeout: int = 30,
+        max_workers: Optional[int] = None,
     ) -> PipelineSummary:
         """Execute the end-to-end job processing workflow and return summary data.
 
@@ -83,5 +188,7 @@ class IJobAgentOrchestrator(Protocol):
             days: Number of days to look back. If None, auto-calculates from latest
                   job in repository
             timeout: Request timeout in seconds
+            max_workers: Number of jobs to process concurrently. If None, uses the
+                        implementation default.
         """
         ...
@@ -1,7 +1,46 @@
 from typing_extensions import TypedDict
 
 
+class StageTimings(TypedDict):
+    """Accumulated timings of one pipeline stage across all its calls."""
+
+    wall_seconds: float
+    cpu_seconds: float
+    calls: int
+
+
+class PipelineTimings(TypedDict):
+    """Latency and throughput breakdown of a pipeline run.
+
+    Stages are keyed by name: scrape_wait (time blocked on the scrapper), filter,
+    embedding (batch relevance and CV embedding) and each job processing workflow
+    node, e.g. check_job_relevance, the skill extraction nodes and store_job.
+    """
+
+    elapsed_seconds: float
+    jobs_per_second: float
+    job_latency_p50_seconds: float
+    job_latency_p95_seconds: float
+    stages: dict[str, StageTimings]
+
+
+class CacheStats(TypedDict):
+    """Lookups answered (hits) and not answered (misses) by a cache."""
+
+    hits: int
+    misses: int
+
+
 class PipelineSummary(TypedDict):
+    """Counts, timings and cache lookups of a pipeline run.
+
+    Caches are keyed by name (shared_results, response_cache, embedding_cache). They
+    are shared by all runs of the process, so their counts include lookups made by
+    runs overlapping this one.
+    """
+
     total_scraped: int
     total_filtered: int
     total_processed: int
+    timings: PipelineTimings
+    caches: dict[str, CacheStats]
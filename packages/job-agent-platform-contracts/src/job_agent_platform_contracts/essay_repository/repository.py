@@ -1,6 +1,6 @@
 """Repository interface for essay operations."""
 
-from typing import List, Optional, Protocol, Tuple, runtime_checkable
+from typing import Dict, List, Optional, Protocol, Tuple, runtime_checkable
 
 from job_agent_platform_contracts.essay_repository.schemas import (
     EssayCreate,
@@ -98,13 +98,17 @@ class IEssayRepository(Protocol):
         """
         ...
 
-    def search_by_embedding(self, embedding: List[float], limit: int) -> List[Essay]:
+    def search_by_embedding(
+        self, embedding: List[float], limit: int, ef_search: Optional[int] = None
+    ) -> List[Essay]:
         """
         Search essays by vector similarity.
 
         Args:
             embedding: The query embedding vector (1536 dimensions)
             limit: Maximum number of results to return
+            ef_search: Size of the approximate search's candidate list, trading
+                      latency for recall. Implementations choose the default.
 
         Returns:
             List of Essay entities ordered by cosine similarity
@@ -131,6 +135,7 @@ class IEssayRepository(Protocol):
         limit: int,
         vector_weight: float = 0.5,
         diversity: float = 0.5,
+        ef_search: Optional[int] = None,
     ) -> List[EssaySearchResult]:
         """
         Hybrid search combining vector similarity and full-text search.
@@ -146,22 +151,62 @@ class IEssayRepository(Protocol):
                           Text weight is (1 - vector_weight). Default 0.5.
             diversity: MMR diversity parameter (0.0 to 1.0).
                       0.0 = max diversity, 1.0 = max relevance. Default 0.5.
+            ef_search: Size of the vector search's candidate list, trading
+                      latency for recall. Implementations choose the default.
 
         Returns:
             List of EssaySearchResult ordered by MMR score
         """
         ...
 
-    def update_embedding(self, essay_id: int, embedding: List[float]) -> bool:
+    def update_embedding(self, essay_id: int, embedding: List[float], content_version: int) -> bool:
         """
-        Update the embedding for an essay.
+        Update the embedding for an essay and clear its pending marker.
+
+        Nothing is changed if the essay was edited after content_version was read.
 
         Args:
             essay_id: The essay's primary key identifier
             embedding: The embedding vector (1536 dimensions)
+            content_version: The essay's content_version the embedding was computed from
 
         Returns:
-            True if updated, False if essay not found
+            True if updated, False if essay not found or edited since
+        """
+        ...
+
+    def get_pending_embeddings(self, limit: int, after_id: int = 0) -> List[Essay]:
+        """
+        Get a page of essays whose embedding is missing or stale.
+
+        Essays are marked pending when they are created or updated and stay
+        pending until their new embedding is stored.
+
+        Args:
+            limit: Maximum number of essays to return
+            after_id: Only essays with a greater ID are returned, so pages are
+                fetched by passing the last ID of the previous page
+
+        Returns:
+            List of Essay entities ordered by ID (may be empty)
+        """
+        ...
+
+    def update_embeddings(self, embeddings: Dict[int, Tuple[int, List[float]]]) -> int:
+        """
+        Update the embeddings of several essays in one statement.
+
+        Essays edited after their content_version was read are left unchanged.
+
+        Args:
+            embeddings: (content_version, embedding vector) pairs by essay ID, where
+                content_version is the one the embedding was computed from
+
+        Returns:
+            Number of essays updated
+
+        Raises:
+            TransactionError: If database transaction fails
         """
         ...
 
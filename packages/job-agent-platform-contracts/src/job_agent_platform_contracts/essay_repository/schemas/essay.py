@@ -18,5 +18,6 @@ class Essay(BaseModel):
     question: Optional[str] = None
     answer: str
     keywords: Optional[List[str]] = None
+    content_version: int = 0
     created_at: datetime
     updated_at: datetime
@@ -1,7 +1,7 @@
 """Repository interface for job operations."""
 
 from datetime import datetime
-from typing import List, Optional, Protocol, runtime_checkable
+from typing import List, Optional, Protocol, Sequence, runtime_checkable
 
 from job_scrapper_contracts import Job, JobDict
 
@@ -34,6 +34,25 @@ class IJobRepository(Protocol):
         """
         ...
 
+    def create_many(self, jobs_data: Sequence[JobCreate]) -> List[Job]:
+        """
+        Create many jobs in a single batch operation.
+
+        Jobs that already exist, or repeat an earlier job of the batch, are
+        skipped rather than failing the whole batch.
+
+        Args:
+            jobs_data: Typed dictionaries describing the jobs to persist.
+
+        Returns:
+            Created job entities, excluding skipped duplicates
+
+        Raises:
+            ValidationError: If data validation fails
+            TransactionError: If database transaction fails
+        """
+        ...
+
     def get_by_external_id(self, external_id: str, source: Optional[str] = None) -> Optional[Job]:
         """
         Get job by external ID and optional source.
@@ -74,6 +93,35 @@ class IJobRepository(Protocol):
         """
         ...
 
+    def search_by_embedding(self, embedding: Sequence[float], limit: int) -> List[Job]:
+        """
+        Get the stored jobs most similar to an embedding, such as a CV embedding.
+
+        Args:
+            embedding: Query embedding vector
+            limit: Maximum number of jobs to return
+
+        Returns:
+            Jobs ordered by cosine similarity, most similar first. Jobs without an
+            embedding, filtered jobs and expired jobs are left out.
+        """
+        ...
+
+    def find_near_duplicate(self, description: str) -> Optional[Job]:
+        """
+        Get the most recent relevant job whose description nearly matches the given one.
+
+        Used to reuse the skills extracted for a vacancy that is re-posted with
+        small edits under a new external id.
+
+        Args:
+            description: Job description to match
+
+        Returns:
+            The matching job with its extracted skills, or None if there is none
+        """
+        ...
+
     def save_filtered_jobs(self, jobs: List[JobDict]) -> int:
         """
         Save multiple filtered jobs in a batch operation.
@@ -20,6 +20,9 @@ class JobCreate(TypedDict, total=False):
 
     Example: [["JavaScript", "Python"], ["React"]] means
     "(JavaScript OR Python) AND React"
+
+    The embedding field holds the vector the job text was embedded as during
+    relevance checking, stored for similarity search over stored jobs.
     """
 
     job_id: int
@@ -42,3 +45,4 @@ class JobCreate(TypedDict, total=False):
 
     is_relevant: bool
     is_filtered: bool
+    embedding: List[float]
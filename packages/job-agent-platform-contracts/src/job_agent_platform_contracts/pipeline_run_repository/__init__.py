@@ -0,0 +1,13 @@
+"""Pipeline run repository contracts."""
+
+from job_agent_platform_contracts.pipeline_run_repository.repository import (
+    IPipelineRunRepository,
+    PipelineRunStatus,
+)
+from job_agent_platform_contracts.pipeline_run_repository.schemas import PipelineRun
+
+__all__ = [
+    "IPipelineRunRepository",
+    "PipelineRun",
+    "PipelineRunStatus",
+]
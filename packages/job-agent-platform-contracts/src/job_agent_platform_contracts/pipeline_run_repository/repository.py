@@ -0,0 +1,120 @@
+"""Repository interface for the pipeline run ledger."""
+
+from datetime import datetime
+from enum import StrEnum
+from typing import List, Optional, Protocol, Sequence, runtime_checkable
+
+from job_scrapper_contracts import JobDict
+
+from job_agent_platform_contracts.pipeline_run_repository.schemas import PipelineRun
+
+
+class PipelineRunStatus(StrEnum):
+    """Lifecycle states of a pipeline run."""
+
+    RUNNING = "running"
+    COMPLETED = "completed"
+
+
+@runtime_checkable
+class IPipelineRunRepository(Protocol):
+    """
+    Interface for the pipeline run ledger.
+
+    The ledger persists the progress of a pipeline run: the batches received from
+    the scrapper, the jobs that passed filtering and which of them have been
+    processed. A run that is interrupted (restart, scrapper timeout) stays in the
+    RUNNING state and can be resumed from its last processed job.
+    """
+
+    def create_run(self, user_id: int, search_key: str, posted_after: datetime) -> PipelineRun:
+        """
+        Start a new run.
+
+        Args:
+            user_id: User the run belongs to
+            search_key: Canonical representation of the search parameters
+            posted_after: Date cutoff the run scrapes from, kept for resumption
+
+        Returns:
+            Created run in the RUNNING state
+        """
+        ...
+
+    def find_unfinished_run(
+        self, user_id: int, search_key: str, started_after: datetime
+    ) -> Optional[PipelineRun]:
+        """
+        Find the latest RUNNING run for the same user and search.
+
+        Args:
+            user_id: User the run belongs to
+            search_key: Canonical representation of the search parameters
+            started_after: Runs created before this time are not resumed
+
+        Returns:
+            The most recent matching run, or None
+        """
+        ...
+
+    def record_batch(
+        self, run_id: int, scraped_count: int, passed_jobs: Sequence[JobDict]
+    ) -> List[JobDict]:
+        """
+        Record a received batch and the jobs of it that passed filtering.
+
+        Passed jobs are stored as pending. Jobs already recorded for the run
+        (e.g. scraped again after a restart) are not recorded twice.
+
+        Args:
+            run_id: Run identifier
+            scraped_count: Number of jobs in the scraped batch
+            passed_jobs: Jobs of the batch that passed filtering
+
+        Returns:
+            The passed jobs that were not yet recorded for the run, in input order
+        """
+        ...
+
+    def get_pending_jobs(self, run_id: int) -> List[JobDict]:
+        """
+        Get the recorded jobs of a run that have not been processed yet.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            Pending jobs in the order they were recorded
+        """
+        ...
+
+    def mark_jobs_processed(self, run_id: int, jobs: Sequence[JobDict]) -> int:
+        """
+        Mark recorded jobs as processed in one transaction.
+
+        Args:
+            run_id: Run identifier
+            jobs: The processed jobs
+
+        Returns:
+            Number of jobs newly marked as processed
+        """
+        ...
+
+    def mark_scrape_completed(self, run_id: int) -> None:
+        """
+        Record that the scrapper delivered every batch for the run.
+
+        Args:
+            run_id: Run identifier
+        """
+        ...
+
+    def complete_run(self, run_id: int) -> None:
+        """
+        Mark a run as COMPLETED so it is never resumed.
+
+        Args:
+            run_id: Run identifier
+        """
+        ...
@@ -0,0 +1,9 @@
+"""Pipeline run repository schemas."""
+
+from job_agent_platform_contracts.pipeline_run_repository.schemas.pipeline_run import (
+    PipelineRun,
+)
+
+__all__ = [
+    "PipelineRun",
+]
@@ -0,0 +1,28 @@
+"""Pipeline run response schema."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class PipelineRun(BaseModel):
+    """Response schema representing a checkpointed pipeline run.
+
+    A run records the search it was started for and its progress, so an
+    interrupted run can be resumed instead of started over.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    search_key: str
+    posted_after: datetime
+    status: str
+    scrape_completed: bool
+    batches_received: int
+    total_scraped: int
+    total_filtered: int
+    total_processed: int
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,93 @@
+"""add_pipeline_run_ledger
+
+Revision ID: c3d4e5f6g7h8
+Revises: b2c3d4e5f6g7
+Create Date: 2026-10-16 12:00:00.000000
+
+Adds the ledger used to checkpoint pipeline runs:
+- pipeline_runs: one row per run with its search, date cutoff, status and counters
+- pipeline_run_jobs: jobs that passed filtering for a run, with their payload and
+  whether they have been processed, unique per run and job key
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+revision: str = "c3d4e5f6g7h8"
+down_revision: Union[str, None] = "b2c3d4e5f6g7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the pipeline_runs and pipeline_run_jobs tables."""
+    op.create_table(
+        "pipeline_runs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("search_key", sa.String(length=500), nullable=False),
+        sa.Column("posted_after", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("scrape_completed", sa.Boolean(), nullable=False),
+        sa.Column("batches_received", sa.Integer(), nullable=False),
+        sa.Column("total_scraped", sa.Integer(), nullable=False),
+        sa.Column("total_filtered", sa.Integer(), nullable=False),
+        sa.Column("total_processed", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        schema="jobs",
+    )
+    op.create_index(
+        op.f("ix_jobs_pipeline_runs_id"), "pipeline_runs", ["id"], unique=False, schema="jobs"
+    )
+    op.create_index(
+        op.f("ix_jobs_pipeline_runs_user_id"),
+        "pipeline_runs",
+        ["user_id"],
+        unique=False,
+        schema="jobs",
+    )
+    op.create_index(
+        op.f("ix_jobs_pipeline_runs_status"),
+        "pipeline_runs",
+        ["status"],
+        unique=False,
+        schema="jobs",
+    )
+
+    op.create_table(
+        "pipeline_run_jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("run_id", sa.Integer(), nullable=False),
+        sa.Column("job_key", sa.String(length=300), nullable=False),
+        sa.Column("payload", JSONB(), nullable=False),
+        sa.Column("is_processed", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["run_id"], ["jobs.pipeline_runs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("run_id", "job_key", name="uq_pipeline_run_jobs_run_id_job_key"),
+        schema="jobs",
+    )
+    op.create_index(
+        op.f("ix_jobs_pipeline_run_jobs_run_id"),
+        "pipeline_run_jobs",
+        ["run_id"],
+        unique=False,
+        schema="jobs",
+    )
+
+
+def downgrade() -> None:
+    """Drop the pipeline run ledger tables."""
+    op.drop_index(
+        op.f("ix_jobs_pipeline_run_jobs_run_id"), table_name="pipeline_run_jobs", schema="jobs"
+    )
+    op.drop_table("pipeline_run_jobs", schema="jobs")
+    op.drop_index(op.f("ix_jobs_pipeline_runs_status"), table_name="pipeline_runs", schema="jobs")
+    op.drop_index(op.f("ix_jobs_pipeline_runs_user_id"), table_name="pipeline_runs", schema="jobs")
+    op.drop_index(op.f("ix_jobs_pipeline_runs_id"), table_name="pipeline_runs", schema="jobs")
+    op.drop_table("pipeline_runs", schema="jobs")
@@ -0,0 +1,48 @@
+"""add_job_embeddings
+
+Revision ID: d4e5f6g7h8i9
+Revises: c3d4e5f6g7h8
+Create Date: 2026-10-16 14:00:00.000000
+
+Stores the embedding of each processed job so stored jobs can be ranked against a
+CV without re-encoding them:
+- Enables the pgvector extension
+- Adds the nullable embedding column (512 dimensions for
+  sentence-transformers/distiluse-base-multilingual-cased-v2)
+- Creates an HNSW index with cosine distance ops for top-K similarity queries
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "d4e5f6g7h8i9"
+down_revision: Union[str, None] = "c3d4e5f6g7h8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the embedding column and its HNSW index to the jobs table."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+    op.execute("ALTER TABLE jobs.jobs ADD COLUMN embedding vector(512)")
+
+    # pgvector leaves NULL embeddings out of the index, so jobs stored before
+    # this migration do not take up space in it
+    op.execute(
+        """
+        CREATE INDEX ix_jobs_embedding_hnsw
+        ON jobs.jobs
+        USING hnsw (embedding vector_cosine_ops)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Remove the embedding column and its index from the jobs table."""
+    op.execute("DROP INDEX IF EXISTS jobs.ix_jobs_embedding_hnsw")
+    op.drop_column("jobs", "embedding", schema="jobs")
+
+    # Note: We don't drop the pgvector extension as it may be used by other schemas
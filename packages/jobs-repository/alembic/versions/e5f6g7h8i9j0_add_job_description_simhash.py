@@ -0,0 +1,57 @@
+"""add_job_description_simhash
+
+Revision ID: e5f6g7h8i9j0
+Revises: d4e5f6g7h8i9
+Create Date: 2026-10-16 16:00:00.000000
+
+Stores a SimHash fingerprint of each job description so re-posted vacancies can
+reuse the skills extracted for the original posting:
+- Adds the nullable description_simhash column (64-bit fingerprint)
+- Adds its four 16-bit bands, each indexed for near-duplicate candidate lookups
+
+Fingerprints are computed by the application when jobs are stored. Jobs stored
+before this migration have none and are never matched as near-duplicates.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "e5f6g7h8i9j0"
+down_revision: Union[str, None] = "d4e5f6g7h8i9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SIMHASH_BANDS = 4
+
+
+def upgrade() -> None:
+    """Add the description fingerprint and its indexed bands to the jobs table."""
+    op.add_column(
+        "jobs",
+        sa.Column("description_simhash", sa.BigInteger(), nullable=True),
+        schema="jobs",
+    )
+    for band in range(SIMHASH_BANDS):
+        op.add_column(
+            "jobs",
+            sa.Column(f"simhash_band_{band}", sa.Integer(), nullable=True),
+            schema="jobs",
+        )
+        op.create_index(
+            op.f(f"ix_jobs_jobs_simhash_band_{band}"),
+            "jobs",
+            [f"simhash_band_{band}"],
+            unique=False,
+            schema="jobs",
+        )
+
+
+def downgrade() -> None:
+    """Remove the description fingerprint and its bands from the jobs table."""
+    for band in reversed(range(SIMHASH_BANDS)):
+        op.drop_index(op.f(f"ix_jobs_jobs_simhash_band_{band}"), table_name="jobs", schema="jobs")
+        op.drop_column("jobs", f"simhash_band_{band}", schema="jobs")
+    op.drop_column("jobs", "description_simhash", schema="jobs")
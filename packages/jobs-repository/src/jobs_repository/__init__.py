@@ -4,6 +4,7 @@ from db_core import (
     DatabaseConfig,
     get_database_config,
     get_engine,
+    warm_pool,
     reset_engine,
     get_db_session,
     get_session_factory,
@@ -13,13 +14,21 @@ from db_core import (
 )
 
 from jobs_repository.models.base import Base
-from jobs_repository.models import Job, Company, Location, Category, Industry
+from jobs_repository.models import (
+    Job,
+    Company,
+    Location,
+    Category,
+    Industry,
+    PipelineRun,
+    PipelineRunJob,
+)
 
-from jobs_repository.repository import JobRepository
+from jobs_repository.repository import JobRepository, PipelineRunRepository
 
 from jobs_repository.mapper import JobMapper
 
-from jobs_repository.container import get, get_job_repository
+from jobs_repository.container import get, get_job_repository, get_pipeline_run_repository
 
 from job_agent_platform_contracts.job_repository.schemas import JobCreate
 
@@ -30,6 +39,7 @@ __all__ = [
     "DatabaseConfig",
     "get_database_config",
     "get_engine",
+    "warm_pool",
     "reset_engine",
     "get_db_session",
     "get_session_factory",
@@ -41,9 +51,13 @@ __all__ = [
     "Location",
     "Category",
     "Industry",
+    "PipelineRun",
+    "PipelineRunJob",
     "JobRepository",
+    "PipelineRunRepository",
     "JobMapper",
     "get",
     "get_job_repository",  # Deprecated: use get(IJobRepository)
+    "get_pipeline_run_repository",
     "JobCreate",
 ]
@@ -3,10 +3,11 @@
 from typing import Any, Callable, Type, TypeVar
 
 from dependency_injector import containers, providers
-from job_agent_platform_contracts import IJobRepository
+from job_agent_platform_contracts import IJobRepository, IPipelineRunRepository
 
 from db_core import get_session_factory
 from jobs_repository.repository.job_repository import JobRepository
+from jobs_repository.repository.pipeline_run_repository import PipelineRunRepository
 from jobs_repository.services import ReferenceDataService
 from jobs_repository.mapper import JobMapper
 
@@ -32,12 +33,18 @@ class JobsRepositoryContainer(containers.DeclarativeContainer):
         session_factory=session_factory,
     )
 
+    pipeline_run_repository = providers.Factory(
+        PipelineRunRepository,
+        session_factory=session_factory,
+    )
+
 
 container = JobsRepositoryContainer()
 
 
 _DEPENDENCY_MAP: dict[Type[Any], Callable[[], Any]] = {
     IJobRepository: lambda: container.job_repository(),
+    IPipelineRunRepository: lambda: container.pipeline_run_repository(),
 }
 
 
@@ -72,3 +79,15 @@ def get_job_repository() -> IJobRepository:
         A configured JobRepository instance
     """
     return container.job_repository()
+
+
+def get_pipeline_run_repository() -> IPipelineRunRepository:
+    """Get a pipeline run repository instance.
+
+    This is a convenience function for use as a factory in DI containers.
+    Equivalent to calling get(IPipelineRunRepository).
+
+    Returns:
+        A configured PipelineRunRepository instance
+    """
+    return container.pipeline_run_repository()
@@ -4,8 +4,17 @@ from unittest.mock import MagicMock
 
 from dependency_injector import providers
 
-from jobs_repository.container import JobsRepositoryContainer, get_job_repository, container
+from job_agent_platform_contracts import IPipelineRunRepository
+
+from jobs_repository.container import (
+    JobsRepositoryContainer,
+    container,
+    get,
+    get_job_repository,
+    get_pipeline_run_repository,
+)
 from jobs_repository.repository.job_repository import JobRepository
+from jobs_repository.repository.pipeline_run_repository import PipelineRunRepository
 
 
 class TestJobsRepositoryContainer:
@@ -69,3 +78,18 @@ class TestGetJobRepository:
             assert repo1 is not repo2
         finally:
             container.session_factory.reset_override()
+
+
+class TestGetPipelineRunRepository:
+    """Test suite for get_pipeline_run_repository function."""
+
+    def test_returns_pipeline_run_repository_instance(self):
+        """Test that the factory and get() both resolve PipelineRunRepository."""
+        mock_factory = MagicMock()
+
+        container.session_factory.override(providers.Object(mock_factory))
+        try:
+            assert isinstance(get_pipeline_run_repository(), PipelineRunRepository)
+            assert isinstance(get(IPipelineRunRepository), PipelineRunRepository)
+        finally:
+            container.session_factory.reset_override()
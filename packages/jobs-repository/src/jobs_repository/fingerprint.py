@@ -0,0 +1,71 @@
+"""SimHash fingerprints of job descriptions for near-duplicate detection.
+
+Re-posted vacancies come with a new external id and small edits to the text, so
+exact matching misses them. SimHash maps similar texts to 64-bit fingerprints
+differing in few bits. Fingerprints are split into four 16-bit bands: two
+fingerprints at most three bits apart share at least one band, so candidates are
+found with an indexed equality lookup on the bands.
+"""
+
+import hashlib
+import re
+from collections import Counter
+from typing import Optional
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+# Fingerprints differing in at most this many bits belong to near-duplicate texts
+MAX_NEAR_DUPLICATE_DISTANCE = SIMHASH_BANDS - 1
+
+_BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+_SHINGLE_SIZE = 3
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def simhash(text: Optional[str]) -> Optional[int]:
+    """
+    Compute the SimHash fingerprint of a text from its word 3-shingles.
+
+    Case, punctuation and whitespace do not affect the fingerprint.
+
+    Args:
+        text: Text to fingerprint
+
+    Returns:
+        Unsigned 64-bit fingerprint, or None if the text has no words
+    """
+    tokens = _TOKEN_PATTERN.findall(text.lower()) if text else []
+    if not tokens:
+        return None
+
+    shingle_count = max(len(tokens) - _SHINGLE_SIZE + 1, 1)
+    shingles = Counter(
+        " ".join(tokens[start : start + _SHINGLE_SIZE]) for start in range(shingle_count)
+    )
+
+    weights = [0] * SIMHASH_BITS
+    for shingle, count in shingles.items():
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        shingle_hash = int.from_bytes(digest, "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if shingle_hash >> bit & 1 else -count
+
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def simhash_bands(fingerprint: int) -> list[int]:
+    """Split a fingerprint into its 16-bit bands, lowest bits first."""
+    return [fingerprint >> (band * _BAND_BITS) & _BAND_MASK for band in range(SIMHASH_BANDS)]
+
+
+def hamming_distance(first: int, second: int) -> int:
+    """Count the bits two fingerprints differ in."""
+    return ((first ^ second) & ((1 << SIMHASH_BITS) - 1)).bit_count()
+
+
+def to_signed(fingerprint: int) -> int:
+    """Convert an unsigned fingerprint to the signed form stored in a BIGINT column."""
+    return (
+        fingerprint - (1 << SIMHASH_BITS) if fingerprint >= 1 << (SIMHASH_BITS - 1) else fingerprint
+    )
@@ -0,0 +1,64 @@
+"""Tests for SimHash description fingerprints."""
+
+from jobs_repository.fingerprint import (
+    MAX_NEAR_DUPLICATE_DISTANCE,
+    hamming_distance,
+    simhash,
+    simhash_bands,
+    to_signed,
+)
+
+DESCRIPTION = (
+    "We are looking for a Senior Python Developer with strong experience in Django, "
+    "PostgreSQL and Docker. You will design and implement backend services, mentor "
+    "junior developers and participate in code reviews across several product teams."
+)
+
+
+class TestSimhash:
+    """Tests for the simhash function and its helpers."""
+
+    def test_same_text_has_same_fingerprint(self):
+        assert simhash(DESCRIPTION) == simhash(DESCRIPTION)
+
+    def test_formatting_does_not_change_fingerprint(self):
+        reformatted = DESCRIPTION.upper().replace(",", " ;").replace(". ", ".\n\n")
+
+        assert simhash(reformatted) == simhash(DESCRIPTION)
+
+    def test_small_edit_stays_near(self):
+        edited = DESCRIPTION.replace("several product teams", "several teams")
+
+        distance = hamming_distance(simhash(edited), simhash(DESCRIPTION))
+
+        assert 0 < distance <= 12
+
+    def test_different_texts_are_far_apart(self):
+        other = "Java architect for a banking platform with Spring Boot and Hibernate on AWS."
+
+        assert hamming_distance(simhash(other), simhash(DESCRIPTION)) > (
+            MAX_NEAR_DUPLICATE_DISTANCE
+        )
+
+    def test_text_without_words_has_no_fingerprint(self):
+        assert simhash(None) is None
+        assert simhash("") is None
+        assert simhash(" - ... ") is None
+
+    def test_near_fingerprints_share_a_band(self):
+        fingerprint = simhash(DESCRIPTION)
+        # Flip one bit in each of three bands
+        near = fingerprint ^ (1 << 3) ^ (1 << 20) ^ (1 << 40)
+
+        shared = [a == b for a, b in zip(simhash_bands(fingerprint), simhash_bands(near))]
+
+        assert hamming_distance(fingerprint, near) == 3
+        assert shared.count(True) == 1
+
+    def test_signed_form_keeps_the_distance(self):
+        fingerprint = (1 << 63) | 5
+
+        signed = to_signed(fingerprint)
+
+        assert -(1 << 63) <= signed < 0
+        assert hamming_distance(signed, fingerprint) == 0
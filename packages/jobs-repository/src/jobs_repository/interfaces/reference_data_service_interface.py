@@ -1,6 +1,7 @@
 """Interface for reference data service."""
 
 from abc import ABC, abstractmethod
+from typing import Iterable, Type
 
 from sqlalchemy.orm import Session
 
@@ -25,3 +26,12 @@ class IReferenceDataService(ABC):
     @abstractmethod
     def get_or_create_industry(self, session: Session, name: str) -> Industry:
         """Get existing industry or create new one."""
+
+    @abstractmethod
+    def get_or_create_ids(
+        self,
+        session: Session,
+        model: Type[Company | Location | Category | Industry],
+        values: Iterable[str],
+    ) -> dict[str, int]:
+        """Get or create many entities of one model, returning their IDs by value."""
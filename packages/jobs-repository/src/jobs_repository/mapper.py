@@ -5,7 +5,9 @@ from typing import TYPE_CHECKING
 from dateutil import parser as date_parser
 
 from job_scrapper_contracts import JobDict
+from jobs_repository.fingerprint import simhash, simhash_bands, to_signed
 from jobs_repository.interfaces import IJobMapper
+from jobs_repository.models.job import JOB_EMBEDDING_DIMENSIONS
 from jobs_repository.types import JobModelDict, JobSerializedDict
 
 if TYPE_CHECKING:
@@ -24,6 +26,7 @@ class ProcessedJobDict(JobDict, total=False):
     nice_to_have_skills: list[list[str]]
     is_relevant: bool
     is_filtered: bool
+    embedding: list[float]
 
 
 class JobMapper(IJobMapper):
@@ -54,6 +57,7 @@ class JobMapper(IJobMapper):
         mapped_data: JobModelDict = {}
 
         self._map_simple_fields(job_data, mapped_data)
+        self._map_fingerprint(job_data, mapped_data)
 
         self._map_company(job_data, mapped_data)
         self._map_location(job_data, mapped_data)
@@ -89,6 +93,23 @@ class JobMapper(IJobMapper):
         mapped_data["is_relevant"] = processed_data.get("is_relevant", True)
         mapped_data["is_filtered"] = processed_data.get("is_filtered", False)
 
+        # Embeddings of another size cannot be stored, e.g. after an embedding model change
+        embedding = processed_data.get("embedding")
+        if embedding is not None and len(embedding) == JOB_EMBEDDING_DIMENSIONS:
+            mapped_data["embedding"] = list(embedding)
+
+    def _map_fingerprint(self, job_data: JobDict, mapped_data: JobModelDict) -> None:
+        """Fingerprint the description for near-duplicate lookups."""
+        fingerprint = simhash(job_data.get("description"))
+        if fingerprint is None:
+            return
+        bands = simhash_bands(fingerprint)
+        mapped_data["description_simhash"] = to_signed(fingerprint)
+        mapped_data["simhash_band_0"] = bands[0]
+        mapped_data["simhash_band_1"] = bands[1]
+        mapped_data["simhash_band_2"] = bands[2]
+        mapped_data["simhash_band_3"] = bands[3]
+
     def _map_company(self, job_data: JobDict, mapped_data: JobModelDict) -> None:
         """Extract company name from nested object."""
         if company_data := job_data.get("company"):
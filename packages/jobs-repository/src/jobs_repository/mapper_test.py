@@ -4,7 +4,9 @@ from datetime import datetime
 
 import pytest
 
+from jobs_repository.fingerprint import simhash, simhash_bands, to_signed
 from jobs_repository.mapper import JobMapper
+from jobs_repository.models.job import JOB_EMBEDDING_DIMENSIONS
 
 
 class TestJobMapper:
@@ -598,3 +600,61 @@ class TestJobMapperWith2DSkillStructure:
         assert result["nice_to_have_skills"] == [["Docker", "Kubernetes"], ["AWS"]]
         assert result["title"] == "Senior Software Engineer"
         assert result["external_id"] == "12345"
+
+
+class TestJobMapperEmbedding:
+    """Tests for JobMapper embedding field handling."""
+
+    @pytest.fixture
+    def mapper(self):
+        """Create a JobMapper instance."""
+        return JobMapper()
+
+    def test_map_to_model_includes_embedding(self, mapper):
+        """Test that an embedding of the stored size is included in mapped data."""
+        embedding = [0.5] * JOB_EMBEDDING_DIMENSIONS
+        job_data = {"job_id": 1, "title": "Test", "embedding": embedding}
+
+        result = mapper.map_to_model(job_data)
+
+        assert result["embedding"] == embedding
+
+    def test_map_to_model_drops_embedding_of_other_size(self, mapper):
+        """Test that an embedding the column cannot hold is left out."""
+        job_data = {"job_id": 1, "title": "Test", "embedding": [0.5, 0.5]}
+
+        result = mapper.map_to_model(job_data)
+
+        assert "embedding" not in result
+
+    def test_map_to_model_without_embedding(self, mapper):
+        """Test that jobs without an embedding map without one."""
+        result = mapper.map_to_model({"job_id": 1, "title": "Test"})
+
+        assert "embedding" not in result
+
+
+class TestJobMapperFingerprint:
+    """Tests for JobMapper description fingerprint handling."""
+
+    @pytest.fixture
+    def mapper(self):
+        """Create a JobMapper instance."""
+        return JobMapper()
+
+    def test_map_to_model_fingerprints_description(self, mapper):
+        """Test the description SimHash and its bands are included in mapped data."""
+        result = mapper.map_to_model(
+            {"job_id": 1, "title": "Test", "description": "Python developer for APIs"}
+        )
+
+        fingerprint = simhash("Python developer for APIs")
+        assert result["description_simhash"] == to_signed(fingerprint)
+        assert [result[f"simhash_band_{band}"] for band in range(4)] == simhash_bands(fingerprint)
+
+    def test_map_to_model_without_description(self, mapper):
+        """Test that jobs without a description map without a fingerprint."""
+        result = mapper.map_to_model({"job_id": 1, "title": "Test"})
+
+        assert "description_simhash" not in result
+        assert "simhash_band_0" not in result
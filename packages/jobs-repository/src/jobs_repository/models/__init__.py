@@ -6,6 +6,7 @@ from jobs_repository.models.location import Location
 from jobs_repository.models.category import Category
 from jobs_repository.models.industry import Industry
 from jobs_repository.models.job import Job
+from jobs_repository.models.pipeline_run import PipelineRun, PipelineRunJob
 
 __all__ = [
     "Base",
@@ -14,4 +15,6 @@ __all__ = [
     "Category",
     "Industry",
     "Job",
+    "PipelineRun",
+    "PipelineRunJob",
 ]
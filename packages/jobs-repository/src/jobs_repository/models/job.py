@@ -3,9 +3,10 @@
 from datetime import datetime, UTC
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import BigInteger, ForeignKey, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from pgvector.sqlalchemy import Vector
 
 from jobs_repository.models.base import Base
 
@@ -15,6 +16,9 @@ if TYPE_CHECKING:
     from jobs_repository.models.category import Category
     from jobs_repository.models.industry import Industry
 
+# Dimensions of sentence-transformers/distiluse-base-multilingual-cased-v2 embeddings
+JOB_EMBEDDING_DIMENSIONS = 512
+
 
 class Job(Base):
     """Job listing model."""
@@ -28,6 +32,15 @@ class Job(Base):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     must_have_skills: Mapped[Optional[list[list[str]]]] = mapped_column(JSONB, nullable=True)
     nice_to_have_skills: Mapped[Optional[list[list[str]]]] = mapped_column(JSONB, nullable=True)
+    embedding: Mapped[Optional[list[float]]] = mapped_column(
+        Vector(JOB_EMBEDDING_DIMENSIONS), nullable=True
+    )
+    # SimHash of the description and its 16-bit bands, see jobs_repository.fingerprint
+    description_simhash: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    simhash_band_0: Mapped[Optional[int]] = mapped_column(index=True, nullable=True)
+    simhash_band_1: Mapped[Optional[int]] = mapped_column(index=True, nullable=True)
+    simhash_band_2: Mapped[Optional[int]] = mapped_column(index=True, nullable=True)
+    simhash_band_3: Mapped[Optional[int]] = mapped_column(index=True, nullable=True)
 
     company_id: Mapped[Optional[int]] = mapped_column(
         ForeignKey("jobs.companies.id"), index=True, nullable=True
@@ -0,0 +1,77 @@
+"""Pipeline run ledger models."""
+
+from datetime import datetime, UTC
+from typing import Any
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from job_agent_platform_contracts.pipeline_run_repository import PipelineRunStatus
+
+from jobs_repository.models.base import Base
+
+
+class PipelineRun(Base):
+    """A checkpointed pipeline run and its progress counters."""
+
+    __tablename__ = "pipeline_runs"
+    __table_args__ = {"schema": "jobs"}
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(BigInteger, index=True)
+    search_key: Mapped[str] = mapped_column(String(500))
+    posted_after: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    status: Mapped[str] = mapped_column(
+        String(20), default=PipelineRunStatus.RUNNING.value, index=True
+    )
+    scrape_completed: Mapped[bool] = mapped_column(default=False)
+
+    batches_received: Mapped[int] = mapped_column(default=0)
+    total_scraped: Mapped[int] = mapped_column(default=0)
+    total_filtered: Mapped[int] = mapped_column(default=0)
+    total_processed: Mapped[int] = mapped_column(default=0)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
+
+    jobs: Mapped[list["PipelineRunJob"]] = relationship(
+        back_populates="run", cascade="all, delete-orphan"
+    )
+
+    def __repr__(self) -> str:
+        """String representation of PipelineRun."""
+        return f"<PipelineRun(id={self.id}, user_id={self.user_id}, status='{self.status}')>"
+
+
+class PipelineRunJob(Base):
+    """A job recorded for a pipeline run after it passed filtering."""
+
+    __tablename__ = "pipeline_run_jobs"
+    __table_args__ = (
+        UniqueConstraint("run_id", "job_key", name="uq_pipeline_run_jobs_run_id_job_key"),
+        {"schema": "jobs"},
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    run_id: Mapped[int] = mapped_column(
+        ForeignKey("jobs.pipeline_runs.id", ondelete="CASCADE"), index=True
+    )
+    job_key: Mapped[str] = mapped_column(String(300))
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB)
+    is_processed: Mapped[bool] = mapped_column(default=False)
+
+    run: Mapped["PipelineRun"] = relationship(back_populates="jobs")
+
+    def __repr__(self) -> str:
+        """String representation of PipelineRunJob."""
+        return (
+            f"<PipelineRunJob(run_id={self.run_id}, job_key='{self.job_key}', "
+            f"is_processed={self.is_processed})>"
+        )
@@ -1,7 +1,9 @@
 """Repository module - data access layer."""
 
 from jobs_repository.repository.job_repository import JobRepository
+from jobs_repository.repository.pipeline_run_repository import PipelineRunRepository
 
 __all__ = [
     "JobRepository",
+    "PipelineRunRepository",
 ]
@@ -6,16 +6,23 @@ jobs and looking them up by external identifier.
 """
 
 from datetime import datetime, timedelta, UTC
-from typing import Optional
+from typing import Any, Optional, Sequence, cast
 
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy import select, or_, func
+from sqlalchemy import select, or_, func, null
 
 from db_core import BaseRepository, TransactionError
 from job_agent_platform_contracts import IJobRepository
 from job_scrapper_contracts import JobDict
-from jobs_repository.models import Job, Company
+from jobs_repository.fingerprint import (
+    MAX_NEAR_DUPLICATE_DISTANCE,
+    hamming_distance,
+    simhash,
+    simhash_bands,
+)
+from jobs_repository.models import Job, Company, Location, Category, Industry
 from jobs_repository.interfaces import IReferenceDataService, IJobMapper
 from jobs_repository.types import JobModelDict
 from job_agent_platform_contracts.job_repository.schemas import JobCreate
@@ -25,6 +32,18 @@ from job_agent_platform_contracts.job_repository.exceptions import (
 )
 
 
+# (name field, foreign key field, model) for each reference entity of a job
+_REFERENCE_FIELDS = (
+    ("company_name", "company_id", Company),
+    ("location_region", "location_id", Location),
+    ("category_name", "category_id", Category),
+    ("industry_name", "industry_id", Industry),
+)
+
+# Most recent jobs sharing a SimHash band that are compared with a description
+_NEAR_DUPLICATE_CANDIDATES = 100
+
+
 class JobRepository(BaseRepository, IJobRepository):
     """Repository that persists jobs and manages related reference data.
 
@@ -183,6 +202,131 @@ class JobRepository(BaseRepository, IJobRepository):
         except SQLAlchemyError as e:
             raise TransactionError(f"Failed to create job: {e}") from e
 
+    def create_many(self, jobs_data: Sequence[JobCreate]) -> list[Job]:
+        """
+        Create many jobs in one transaction with a constant number of round trips.
+
+        Reference data is resolved for the whole batch at once and the jobs are
+        written with a single multi-row ``INSERT ... ON CONFLICT DO NOTHING
+        RETURNING``. Jobs that already exist (by external_id or source_url),
+        repeat an earlier job of the batch, or lose a race against a concurrent
+        insert are skipped instead of failing the batch.
+
+        Args:
+            jobs_data: Jobs in JobCreate format, as accepted by create()
+
+        Returns:
+            The created Job instances in insertion order, excluding skipped jobs
+
+        Raises:
+            ValidationError: If data validation fails
+            TransactionError: If database transaction fails
+        """
+        if not jobs_data:
+            return []
+
+        try:
+            with self._session_scope(commit=True) as session:
+                mapped_jobs = self._dedupe_mapped_jobs(
+                    [self.mapper.map_to_model(job_data) for job_data in jobs_data]
+                )
+
+                existing_external_ids, existing_source_urls = self._bulk_find_existing_jobs(
+                    session, mapped_jobs
+                )
+                new_jobs = [
+                    mapped_data
+                    for mapped_data in mapped_jobs
+                    if mapped_data.get("external_id") not in existing_external_ids
+                    and mapped_data.get("source_url") not in existing_source_urls
+                ]
+                if not new_jobs:
+                    return []
+
+                self._resolve_reference_data_bulk(session, new_jobs)
+
+                stmt = (
+                    self._insert_ignoring_conflicts(session)
+                    .values(self._to_insert_rows(new_jobs))
+                    .returning(Job.id)
+                )
+                job_ids = list(session.scalars(stmt).all())
+                if not job_ids:
+                    return []
+
+                stmt = select(Job).where(Job.id.in_(job_ids)).order_by(Job.id)
+                stmt = self._apply_relationship_loading(stmt)
+                jobs = list(session.scalars(stmt).unique().all())
+
+                if self._close_session:
+                    for job in jobs:
+                        session.expunge(job)
+                return jobs
+
+        except IntegrityError as e:
+            raise ValidationError("data", f"Integrity constraint violated: {e}") from e
+        except SQLAlchemyError as e:
+            raise TransactionError(f"Failed to create jobs: {e}") from e
+
+    @staticmethod
+    def _dedupe_mapped_jobs(mapped_jobs: list[JobModelDict]) -> list[JobModelDict]:
+        """Drop jobs repeating the external_id or source_url of an earlier job."""
+        seen_external_ids: set[str] = set()
+        seen_source_urls: set[str] = set()
+        unique_jobs = []
+        for mapped_data in mapped_jobs:
+            external_id = mapped_data.get("external_id")
+            source_url = mapped_data.get("source_url")
+            if external_id in seen_external_ids or source_url in seen_source_urls:
+                continue
+            if external_id:
+                seen_external_ids.add(external_id)
+            if source_url:
+                seen_source_urls.add(source_url)
+            unique_jobs.append(mapped_data)
+        return unique_jobs
+
+    def _resolve_reference_data_bulk(
+        self, session: Session, mapped_jobs: list[JobModelDict]
+    ) -> None:
+        """Resolve reference data for a batch with one lookup per entity type.
+
+        Like _resolve_reference_data, but for every job of the batch at once.
+
+        Args:
+            session: SQLAlchemy session
+            mapped_jobs: Mutable job dictionaries that will be modified in place
+        """
+        rows = [cast(dict[str, Any], mapped_data) for mapped_data in mapped_jobs]
+        for name_field, id_field, model in _REFERENCE_FIELDS:
+            names = [row.pop(name_field, None) for row in rows]
+            ids = self._reference_data_service.get_or_create_ids(
+                session, model, (name for name in names if name)
+            )
+            for row, name in zip(rows, names):
+                if name:
+                    row[id_field] = ids[name]
+
+    @staticmethod
+    def _to_insert_rows(mapped_jobs: list[JobModelDict]) -> list[dict[str, Any]]:
+        """Give every row of a multi-row INSERT the same columns.
+
+        Columns some jobs leave out are set to NULL, except columns with a default,
+        which SQLAlchemy fills in per row.
+        """
+        columns = Job.__table__.c
+        keys = {key for mapped_data in mapped_jobs for key in mapped_data}
+        missing = {key: null() for key in keys if columns[key].default is None}
+        return [{**missing, **mapped_data} for mapped_data in mapped_jobs]
+
+    @staticmethod
+    def _insert_ignoring_conflicts(session: Session) -> Any:
+        """Return an INSERT on jobs for the session's dialect that skips conflicting rows."""
+        dialect_insert = (
+            sqlite.insert if session.get_bind().dialect.name == "sqlite" else postgresql.insert
+        )
+        return dialect_insert(Job).on_conflict_do_nothing()
+
     def get_by_external_id(self, external_id: str, source: Optional[str] = None) -> Optional[Job]:
         """
         Get job by external ID and optional source.
@@ -205,10 +349,7 @@ class JobRepository(BaseRepository, IJobRepository):
             return job
 
     def has_active_job_with_title_and_company(self, title: str, company_name: str) -> bool:
-        reference_time = datetime.now(UTC)
-        expires_column = Job.__table__.c.expires_at
-        if not getattr(expires_column.type, "timezone", False):
-            reference_time = reference_time.replace(tzinfo=None)
+        reference_time = self._expiry_reference_time()
 
         with self._session_scope(commit=False) as session:
             stmt = (
@@ -221,6 +362,15 @@ class JobRepository(BaseRepository, IJobRepository):
             )
             return session.scalar(stmt) is not None
 
+    @staticmethod
+    def _expiry_reference_time() -> datetime:
+        """Return the current time in the form expires_at is compared with."""
+        reference_time = datetime.now(UTC)
+        expires_column = Job.__table__.c.expires_at
+        if not getattr(expires_column.type, "timezone", False):
+            reference_time = reference_time.replace(tzinfo=None)
+        return reference_time
+
     def get_existing_urls_by_source(self, source: str, days: Optional[int] = None) -> list[str]:
         """
         Get existing job URLs for a given source, optionally filtered by time window.
@@ -380,6 +530,113 @@ class JobRepository(BaseRepository, IJobRepository):
 
         return saved_count
 
+    def search_by_embedding(self, embedding: Sequence[float], limit: int) -> list[Job]:
+        """
+        Get the stored jobs most similar to an embedding, such as a CV embedding.
+
+        Args:
+            embedding: Query embedding vector
+            limit: Maximum number of jobs to return
+
+        Returns:
+            Jobs ordered by cosine similarity, most similar first. Jobs without an
+            embedding, filtered jobs and expired jobs are left out.
+
+        Note:
+            This method requires PostgreSQL with the pgvector extension. The ids are
+            selected by a plain ORDER BY distance LIMIT query, so the HNSW index on
+            jobs.embedding serves it; the jobs are loaded afterwards.
+        """
+        with self._session_scope(commit=False) as session:
+            job_ids = list(session.scalars(self._similar_job_ids_query(embedding, limit)))
+            if not job_ids:
+                return []
+
+            stmt = self._apply_relationship_loading(select(Job).where(Job.id.in_(job_ids)))
+            jobs_by_id = {job.id: job for job in session.scalars(stmt).unique()}
+            jobs = [jobs_by_id[job_id] for job_id in job_ids if job_id in jobs_by_id]
+
+            if self._close_session:
+                for job in jobs:
+                    session.expunge(job)
+
+            return jobs
+
+    @classmethod
+    def _similar_job_ids_query(cls, embedding: Sequence[float], limit: int) -> Any:
+        reference_time = cls._expiry_reference_time()
+        return (
+            select(Job.id)
+            .where(Job.embedding.is_not(None))
+            .where(Job.is_filtered.is_(False))
+            .where(or_(Job.expires_at.is_(None), Job.expires_at >= reference_time))
+            .order_by(Job.embedding.cosine_distance(list(embedding)))
+            .limit(limit)
+        )
+
+    def find_near_duplicate(self, description: str) -> Optional[Job]:
+        """
+        Get the most recent relevant job whose description nearly matches the given one.
+
+        Descriptions are compared by SimHash fingerprint, so re-posted vacancies
+        with small edits are found even under a new external id.
+
+        Args:
+            description: Job description to match
+
+        Returns:
+            The most recent relevant job with extracted skills whose description
+            fingerprint is at most MAX_NEAR_DUPLICATE_DISTANCE bits away, or None
+        """
+        fingerprint = simhash(description)
+        if fingerprint is None:
+            return None
+
+        with self._session_scope(commit=False) as session:
+            candidates = session.execute(self._near_duplicate_candidates_query(fingerprint))
+            job_id = next(
+                (
+                    candidate.id
+                    for candidate in candidates
+                    if (candidate.must_have_skills or candidate.nice_to_have_skills)
+                    and hamming_distance(candidate.description_simhash, fingerprint)
+                    <= MAX_NEAR_DUPLICATE_DISTANCE
+                ),
+                None,
+            )
+            if job_id is None:
+                return None
+
+            stmt = self._apply_relationship_loading(select(Job).where(Job.id == job_id))
+            job = session.scalar(stmt)
+            if job and self._close_session:
+                session.expunge(job)
+            return job
+
+    @staticmethod
+    def _near_duplicate_candidates_query(fingerprint: int) -> Any:
+        """Select recent relevant jobs sharing at least one SimHash band with fingerprint."""
+        band_columns = (
+            Job.simhash_band_0,
+            Job.simhash_band_1,
+            Job.simhash_band_2,
+            Job.simhash_band_3,
+        )
+        return (
+            select(Job.id, Job.description_simhash, Job.must_have_skills, Job.nice_to_have_skills)
+            .where(
+                or_(
+                    *(
+                        column == band
+                        for column, band in zip(band_columns, simhash_bands(fingerprint))
+                    )
+                )
+            )
+            .where(Job.is_relevant.is_(True))
+            .order_by(Job.id.desc())
+            .limit(_NEAR_DUPLICATE_CANDIDATES)
+        )
+
     def get_latest_updated_at(self) -> Optional[datetime]:
         """
         Get the most recent updated_at timestamp from all jobs.
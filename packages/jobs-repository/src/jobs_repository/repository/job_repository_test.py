@@ -3,11 +3,13 @@
 from unittest.mock import patch, MagicMock
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
 
 from jobs_repository.repository import JobRepository
 from jobs_repository.models import Job, Company, Location, Category, Industry
+from jobs_repository.models.job import JOB_EMBEDDING_DIMENSIONS
 from job_agent_platform_contracts.job_repository.exceptions import (
     JobAlreadyExistsError,
     ValidationError,
@@ -1404,3 +1406,222 @@ class TestJobRepositoryGetLatestUpdatedAt:
 
         assert result is not None
         assert isinstance(result, datetime)
+
+
+class TestJobRepositoryCreateMany:
+    """Tests for create_many method."""
+
+    @pytest.fixture
+    def repository(self, reference_data_service, job_mapper, db_session):
+        """Create a JobRepository instance."""
+        return JobRepository(reference_data_service, job_mapper, db_session)
+
+    def test_create_many_returns_empty_list_for_no_jobs(self, repository):
+        """Test an empty batch creates nothing."""
+        assert repository.create_many([]) == []
+
+    def test_create_many_stores_all_jobs_with_relationships(
+        self, repository, sample_job_dict, sample_job_create_dict, db_session
+    ):
+        """Test jobs of a batch are stored with their reference data and skills."""
+        jobs = repository.create_many([sample_job_dict, sample_job_create_dict])
+
+        assert [job.external_id for job in jobs] == ["12345", "54321"]
+        assert jobs[0].company_rel.name == "Example Corp"
+        assert jobs[0].location_rel.region == "New York, NY"
+        assert jobs[1].category_rel.name == "DevOps"
+        assert jobs[1].industry_rel.name == "Cloud Computing"
+        assert jobs[1].must_have_skills == [["AWS"], ["Terraform"], ["Docker"], ["Kubernetes"]]
+        assert jobs[0].must_have_skills is None
+        assert jobs[0].is_relevant is True
+        assert db_session.query(Job).count() == 2
+
+    def test_create_many_shares_reference_data_within_batch(self, repository, db_session):
+        """Test jobs naming the same company reuse one company row."""
+        jobs = repository.create_many(
+            [
+                {"job_id": 1, "title": "Job 1", "company": {"name": "Shared Co"}},
+                {"job_id": 2, "title": "Job 2", "company": {"name": "Shared Co"}},
+                {"job_id": 3, "title": "Job 3"},
+            ]
+        )
+
+        assert jobs[0].company_id == jobs[1].company_id
+        assert jobs[2].company_id is None
+        assert db_session.query(Company).count() == 1
+
+    def test_create_many_reuses_existing_reference_data(
+        self, repository, sample_company, db_session
+    ):
+        """Test reference data that already exists is not duplicated."""
+        jobs = repository.create_many(
+            [{"job_id": 1, "title": "Job 1", "company": {"name": sample_company.name}}]
+        )
+
+        assert jobs[0].company_id == sample_company.id
+        assert db_session.query(Company).count() == 1
+
+    def test_create_many_skips_existing_and_repeated_jobs(
+        self, repository, sample_job_dict, db_session
+    ):
+        """Test jobs already stored or repeated in the batch are skipped."""
+        repository.create(sample_job_dict)
+
+        jobs = repository.create_many(
+            [
+                sample_job_dict,
+                {"job_id": 2, "title": "Job 2", "url": "https://example.com/jobs/2"},
+                {"job_id": 2, "title": "Job 2 again"},
+                {"job_id": 3, "title": "Job 3", "url": "https://example.com/jobs/2"},
+            ]
+        )
+
+        assert [job.title for job in jobs] == ["Job 2"]
+        assert db_session.query(Job).count() == 2
+
+    def test_create_many_uses_single_insert(self, repository, in_memory_engine):
+        """Test the batch is written with one INSERT statement for jobs."""
+        from sqlalchemy import event
+
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(in_memory_engine, "before_cursor_execute", record)
+        try:
+            repository.create_many(
+                [{"job_id": i, "title": f"Job {i}", "company": {"name": "Co"}} for i in range(20)]
+            )
+        finally:
+            event.remove(in_memory_engine, "before_cursor_execute", record)
+
+        job_inserts = [s for s in statements if s.startswith("INSERT INTO jobs ")]
+        assert len(job_inserts) == 1
+        assert "ON CONFLICT DO NOTHING" in job_inserts[0]
+        assert len(statements) < 20
+
+    def test_create_many_handles_sqlalchemy_error(self, repository, sample_job_dict, db_session):
+        """Test database errors are reported as TransactionError."""
+        with patch.object(db_session, "execute", side_effect=SQLAlchemyError("DB error")):
+            with pytest.raises(TransactionError):
+                repository.create_many([sample_job_dict])
+
+
+class TestJobRepositorySearchByEmbedding:
+    """Tests for storing job embeddings and searching by them."""
+
+    @pytest.fixture
+    def repository(self, reference_data_service, job_mapper, db_session):
+        """Create a JobRepository instance."""
+        return JobRepository(reference_data_service, job_mapper, db_session)
+
+    def test_create_many_stores_embeddings(self, repository, db_session):
+        """Test embeddings passed with the jobs are stored with them."""
+        embedding = [float(i) / JOB_EMBEDDING_DIMENSIONS for i in range(JOB_EMBEDDING_DIMENSIONS)]
+
+        repository.create_many(
+            [
+                {"job_id": 1, "title": "Job 1", "embedding": embedding},
+                {"job_id": 2, "title": "Job 2"},
+            ]
+        )
+
+        stored = {job.external_id: job.embedding for job in db_session.query(Job)}
+        assert list(stored["1"]) == pytest.approx(embedding)
+        assert stored["2"] is None
+
+    def test_similarity_query_orders_by_cosine_distance(self):
+        """Test the id query is a plain top-K cosine distance query the HNSW index serves."""
+        from sqlalchemy.dialects import postgresql
+
+        query = JobRepository._similar_job_ids_query([0.1, 0.2], limit=5)
+        sql = str(query.compile(dialect=postgresql.dialect()))
+
+        assert "jobs.embedding IS NOT NULL" in sql
+        assert "jobs.is_filtered IS false" in sql
+        assert "ORDER BY jobs.embedding <=>" in sql
+        assert "LIMIT" in sql
+
+    def test_search_by_embedding_returns_jobs_in_similarity_order(self, repository, sample_job):
+        """Test jobs are returned in the order the similarity query ranks them."""
+        other = repository.create({"job_id": 2, "title": "Other job"})
+
+        with patch.object(
+            JobRepository,
+            "_similar_job_ids_query",
+            return_value=select(Job.id).order_by(Job.id.desc()),
+        ):
+            jobs = repository.search_by_embedding([0.1, 0.2], limit=5)
+
+        assert [job.id for job in jobs] == [other.id, sample_job.id]
+        assert jobs[1].company_rel.name == sample_job.company_rel.name
+
+
+class TestJobRepositoryFindNearDuplicate:
+    """Tests for finding re-posted jobs by description fingerprint."""
+
+    DESCRIPTION = (
+        "We are hiring a backend engineer to build payment services in Python. "
+        "You will design APIs with Django, run PostgreSQL in production and "
+        "mentor two junior developers. Experience with Kubernetes is a plus."
+    )
+
+    @pytest.fixture
+    def repository(self, reference_data_service, job_mapper, db_session):
+        """Create a JobRepository instance."""
+        return JobRepository(reference_data_service, job_mapper, db_session)
+
+    def _create(self, repository, job_id, description, **fields):
+        return repository.create(
+            {
+                "job_id": job_id,
+                "title": "Backend Engineer",
+                "description": description,
+                "must_have_skills": [["Python"], ["Django"]],
+                "nice_to_have_skills": [["Kubernetes"]],
+                **fields,
+            }
+        )
+
+    def test_finds_reposted_job_with_small_edits(self, repository):
+        """Test a re-post with whitespace, case and punctuation edits matches the original."""
+        original = self._create(repository, 1, self.DESCRIPTION)
+        reposted = "  " + self.DESCRIPTION.upper().replace(".", "!") + "\n"
+
+        match = repository.find_near_duplicate(reposted)
+
+        assert match is not None
+        assert match.id == original.id
+        assert match.must_have_skills == [["Python"], ["Django"]]
+
+    def test_returns_most_recent_match(self, repository):
+        """Test the latest of several matching jobs is returned."""
+        self._create(repository, 1, self.DESCRIPTION)
+        latest = self._create(repository, 2, self.DESCRIPTION)
+
+        assert repository.find_near_duplicate(self.DESCRIPTION).id == latest.id
+
+    def test_ignores_different_descriptions(self, repository):
+        """Test an unrelated description does not match."""
+        self._create(repository, 1, self.DESCRIPTION)
+
+        match = repository.find_near_duplicate(
+            "Senior Java architect for a banking platform. Spring Boot, Hibernate and "
+            "AWS experience required, ten years of enterprise development expected."
+        )
+
+        assert match is None
+
+    def test_ignores_irrelevant_jobs_and_jobs_without_skills(self, repository):
+        """Test only relevant jobs with extracted skills are reused."""
+        self._create(repository, 1, self.DESCRIPTION, is_relevant=False)
+        self._create(repository, 2, self.DESCRIPTION, must_have_skills=[], nice_to_have_skills=[])
+
+        assert repository.find_near_duplicate(self.DESCRIPTION) is None
+
+    def test_returns_none_for_empty_description(self, repository):
+        """Test a description without words never matches."""
+        self._create(repository, 1, self.DESCRIPTION)
+
+        assert repository.find_near_duplicate("  ...  ") is None
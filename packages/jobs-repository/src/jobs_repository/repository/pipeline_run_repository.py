@@ -0,0 +1,292 @@
+"""Repository implementation for the pipeline run ledger.
+
+The ledger stores the progress of each pipeline run in the jobs schema: one row per
+run with its search, date cutoff and counters, and one row per job that passed
+filtering with its payload and whether it has been processed. An interrupted run
+is resumed from its pending jobs instead of being scraped and processed again.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, cast
+
+from sqlalchemy import CursorResult, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from db_core import BaseRepository, TransactionError
+from job_agent_platform_contracts.pipeline_run_repository import (
+    IPipelineRunRepository,
+    PipelineRunStatus,
+)
+from job_agent_platform_contracts.pipeline_run_repository.schemas import (
+    PipelineRun as PipelineRunSchema,
+)
+from job_scrapper_contracts import JobDict
+from jobs_repository.models import PipelineRun, PipelineRunJob
+
+
+def get_job_key(job: JobDict) -> str:
+    """Identify a job within a run.
+
+    Uses the source job ID, then the job URL, and finally a hash of the payload
+    for jobs that carry neither.
+
+    Args:
+        job: Job dictionary
+
+    Returns:
+        Stable key for the job
+    """
+    if job.get("job_id") is not None:
+        return str(job["job_id"])
+    if url := job.get("url"):
+        return str(url)
+    payload = json.dumps(job, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PipelineRunRepository(BaseRepository, IPipelineRunRepository):
+    """Repository that persists pipeline runs and the jobs recorded for them."""
+
+    def __init__(self, session: Optional[Session] = None, session_factory=None):
+        """
+        Initialize the repository with a managed or external session.
+
+        Args:
+            session: Existing SQLAlchemy session to reuse
+            session_factory: Callable returning SQLAlchemy session instances
+        """
+        super().__init__(session=session, session_factory=session_factory)
+
+    def create_run(
+        self, user_id: int, search_key: str, posted_after: datetime
+    ) -> PipelineRunSchema:
+        """
+        Start a new run.
+
+        Args:
+            user_id: User the run belongs to
+            search_key: Canonical representation of the search parameters
+            posted_after: Date cutoff the run scrapes from, kept for resumption
+
+        Returns:
+            Created run in the RUNNING state
+
+        Raises:
+            TransactionError: If database transaction fails
+        """
+        try:
+            with self._session_scope(commit=True) as session:
+                run = PipelineRun(
+                    user_id=user_id,
+                    search_key=search_key,
+                    posted_after=posted_after,
+                    status=PipelineRunStatus.RUNNING.value,
+                    scrape_completed=False,
+                    batches_received=0,
+                    total_scraped=0,
+                    total_filtered=0,
+                    total_processed=0,
+                )
+                session.add(run)
+                session.flush()
+                return PipelineRunSchema.model_validate(run)
+        except SQLAlchemyError as e:
+            raise TransactionError(f"Failed to create pipeline run: {e}") from e
+
+    def find_unfinished_run(
+        self, user_id: int, search_key: str, started_after: datetime
+    ) -> Optional[PipelineRunSchema]:
+        """
+        Find the latest RUNNING run for the same user and search.
+
+        Args:
+            user_id: User the run belongs to
+            search_key: Canonical representation of the search parameters
+            started_after: Runs created before this time are not resumed
+
+        Returns:
+            The most recent matching run, or None
+        """
+        created_column = PipelineRun.__table__.c.created_at
+        if not getattr(created_column.type, "timezone", False):
+            started_after = started_after.replace(tzinfo=None)
+
+        with self._session_scope(commit=False) as session:
+            stmt = (
+                select(PipelineRun)
+                .where(
+                    PipelineRun.user_id == user_id,
+                    PipelineRun.search_key == search_key,
+                    PipelineRun.status == PipelineRunStatus.RUNNING.value,
+                    PipelineRun.created_at >= started_after,
+                )
+                .order_by(PipelineRun.created_at.desc(), PipelineRun.id.desc())
+                .limit(1)
+            )
+            run = session.scalar(stmt)
+            return PipelineRunSchema.model_validate(run) if run is not None else None
+
+    def record_batch(
+        self, run_id: int, scraped_count: int, passed_jobs: Sequence[JobDict]
+    ) -> List[JobDict]:
+        """
+        Record a received batch and the jobs of it that passed filtering.
+
+        Args:
+            run_id: Run identifier
+            scraped_count: Number of jobs in the scraped batch
+            passed_jobs: Jobs of the batch that passed filtering
+
+        Returns:
+            The passed jobs that were not yet recorded for the run, in input order
+
+        Raises:
+            TransactionError: If database transaction fails
+        """
+        keyed_jobs: dict[str, JobDict] = {}
+        for job in passed_jobs:
+            keyed_jobs.setdefault(get_job_key(job), job)
+
+        try:
+            with self._session_scope(commit=True) as session:
+                existing_keys: set[str] = set()
+                if keyed_jobs:
+                    stmt = select(PipelineRunJob.job_key).where(
+                        PipelineRunJob.run_id == run_id,
+                        PipelineRunJob.job_key.in_(list(keyed_jobs)),
+                    )
+                    existing_keys = set(session.scalars(stmt).all())
+
+                new_jobs: List[JobDict] = []
+                for key, job in keyed_jobs.items():
+                    if key in existing_keys:
+                        continue
+                    session.add(
+                        PipelineRunJob(
+                            run_id=run_id,
+                            job_key=key,
+                            payload=self._to_payload(job),
+                            is_processed=False,
+                        )
+                    )
+                    new_jobs.append(job)
+
+                session.execute(
+                    update(PipelineRun)
+                    .where(PipelineRun.id == run_id)
+                    .values(
+                        batches_received=PipelineRun.batches_received + 1,
+                        total_scraped=PipelineRun.total_scraped + scraped_count,
+                        total_filtered=PipelineRun.total_filtered + len(new_jobs),
+                    )
+                )
+                return new_jobs
+        except SQLAlchemyError as e:
+            raise TransactionError(f"Failed to record pipeline run batch: {e}") from e
+
+    def get_pending_jobs(self, run_id: int) -> List[JobDict]:
+        """
+        Get the recorded jobs of a run that have not been processed yet.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            Pending jobs in the order they were recorded
+        """
+        with self._session_scope(commit=False) as session:
+            stmt = (
+                select(PipelineRunJob.payload)
+                .where(PipelineRunJob.run_id == run_id, PipelineRunJob.is_processed.is_(False))
+                .order_by(PipelineRunJob.id)
+            )
+            return [JobDict(**payload) for payload in session.scalars(stmt).all()]
+
+    def mark_jobs_processed(self, run_id: int, jobs: Sequence[JobDict]) -> int:
+        """
+        Mark recorded jobs as processed.
+
+        All jobs are marked with one UPDATE, and the run's counter is raised by the
+        number of rows it changed in the same transaction. Jobs that were never
+        recorded for the run, or are already marked, are ignored.
+
+        Args:
+            run_id: Run identifier
+            jobs: The processed jobs
+
+        Returns:
+            Number of jobs newly marked as processed
+
+        Raises:
+            TransactionError: If database transaction fails
+        """
+        job_keys = {get_job_key(job) for job in jobs}
+        if not job_keys:
+            return 0
+
+        try:
+            with self._session_scope(commit=True) as session:
+                # UPDATE statements return a CursorResult, which carries the rowcount
+                result = cast(
+                    CursorResult[Any],
+                    session.execute(
+                        update(PipelineRunJob)
+                        .where(
+                            PipelineRunJob.run_id == run_id,
+                            PipelineRunJob.job_key.in_(job_keys),
+                            PipelineRunJob.is_processed.is_(False),
+                        )
+                        .values(is_processed=True)
+                    ),
+                )
+                marked = result.rowcount
+                if marked:
+                    session.execute(
+                        update(PipelineRun)
+                        .where(PipelineRun.id == run_id)
+                        .values(total_processed=PipelineRun.total_processed + marked)
+                    )
+                return marked
+        except SQLAlchemyError as e:
+            raise TransactionError(f"Failed to mark pipeline run jobs processed: {e}") from e
+
+    def mark_scrape_completed(self, run_id: int) -> None:
+        """
+        Record that the scrapper delivered every batch for the run.
+
+        Args:
+            run_id: Run identifier
+
+        Raises:
+            TransactionError: If database transaction fails
+        """
+        self._update_run(run_id, scrape_completed=True)
+
+    def complete_run(self, run_id: int) -> None:
+        """
+        Mark a run as COMPLETED so it is never resumed.
+
+        Args:
+            run_id: Run identifier
+
+        Raises:
+            TransactionError: If database transaction fails
+        """
+        self._update_run(run_id, status=PipelineRunStatus.COMPLETED.value)
+
+    def _update_run(self, run_id: int, **values: Any) -> None:
+        try:
+            with self._session_scope(commit=True) as session:
+                session.execute(
+                    update(PipelineRun).where(PipelineRun.id == run_id).values(**values)
+                )
+        except SQLAlchemyError as e:
+            raise TransactionError(f"Failed to update pipeline run: {e}") from e
+
+    @staticmethod
+    def _to_payload(job: JobDict) -> dict[str, Any]:
+        """Convert a job to a JSON-safe payload (e.g. datetimes become ISO strings)."""
+        return json.loads(json.dumps(job, default=str))
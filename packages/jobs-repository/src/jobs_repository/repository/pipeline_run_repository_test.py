@@ -0,0 +1,171 @@
+"""Tests for PipelineRunRepository class."""
+
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from db_core import TransactionError
+from job_agent_platform_contracts.pipeline_run_repository import PipelineRunStatus
+from jobs_repository.repository import PipelineRunRepository
+from jobs_repository.repository.pipeline_run_repository import get_job_key
+
+
+POSTED_AFTER = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _job(job_id: int) -> dict:
+    return {
+        "job_id": job_id,
+        "title": f"Job {job_id}",
+        "url": f"https://example.com/jobs/{job_id}",
+        "date_posted": datetime(2024, 1, 2, tzinfo=UTC),
+    }
+
+
+class TestGetJobKey:
+    """Test suite for get_job_key."""
+
+    def test_prefers_job_id(self):
+        """The source job ID identifies the job."""
+        assert get_job_key({"job_id": 42, "url": "https://example.com/jobs/42"}) == "42"
+
+    def test_falls_back_to_url(self):
+        """Jobs without an ID are identified by URL."""
+        assert get_job_key({"url": "https://example.com/jobs/42"}) == "https://example.com/jobs/42"
+
+    def test_falls_back_to_payload_hash(self):
+        """Jobs without ID and URL get a stable key from their content."""
+        assert get_job_key({"title": "A"}) == get_job_key({"title": "A"})
+        assert get_job_key({"title": "A"}) != get_job_key({"title": "B"})
+
+
+class TestPipelineRunRepository:
+    """Test suite for PipelineRunRepository class."""
+
+    @pytest.fixture
+    def repository(self, db_session):
+        """Create a PipelineRunRepository instance."""
+        return PipelineRunRepository(db_session)
+
+    @pytest.fixture
+    def run(self, repository):
+        """Create a running pipeline run."""
+        return repository.create_run(1, '{"days": 1}', POSTED_AFTER)
+
+    def test_create_run_starts_running(self, run):
+        """A new run is RUNNING with zeroed counters."""
+        assert run.id is not None
+        assert run.status == PipelineRunStatus.RUNNING
+        assert run.scrape_completed is False
+        assert run.batches_received == 0
+        assert run.total_processed == 0
+
+    def test_find_unfinished_run_returns_latest_matching_run(self, repository, run):
+        """The newest RUNNING run for the same user and search is found."""
+        newer = repository.create_run(1, '{"days": 1}', POSTED_AFTER)
+        repository.create_run(2, '{"days": 1}', POSTED_AFTER)
+
+        found = repository.find_unfinished_run(
+            1, '{"days": 1}', datetime.now(UTC) - timedelta(hours=1)
+        )
+
+        assert found is not None
+        assert found.id == newer.id
+
+    def test_find_unfinished_run_ignores_other_searches(self, repository, run):
+        """Runs for different search parameters are not resumed."""
+        found = repository.find_unfinished_run(
+            1, '{"days": 7}', datetime.now(UTC) - timedelta(hours=1)
+        )
+
+        assert found is None
+
+    def test_find_unfinished_run_ignores_completed_runs(self, repository, run):
+        """Completed runs are never resumed."""
+        repository.complete_run(run.id)
+
+        found = repository.find_unfinished_run(
+            1, '{"days": 1}', datetime.now(UTC) - timedelta(hours=1)
+        )
+
+        assert found is None
+
+    def test_find_unfinished_run_ignores_stale_runs(self, repository, run):
+        """Runs started before the cutoff are not resumed."""
+        found = repository.find_unfinished_run(
+            1, '{"days": 1}', datetime.now(UTC) + timedelta(hours=1)
+        )
+
+        assert found is None
+
+    def test_record_batch_returns_only_new_jobs(self, repository, run):
+        """Jobs already recorded for the run are not returned again."""
+        first = repository.record_batch(run.id, 3, [_job(1), _job(2)])
+        second = repository.record_batch(run.id, 2, [_job(2), _job(3), _job(3)])
+
+        assert [job["job_id"] for job in first] == [1, 2]
+        assert [job["job_id"] for job in second] == [3]
+
+        found = repository.find_unfinished_run(
+            1, '{"days": 1}', datetime.now(UTC) - timedelta(hours=1)
+        )
+        assert found.batches_received == 2
+        assert found.total_scraped == 5
+        assert found.total_filtered == 3
+
+    def test_get_pending_jobs_excludes_processed_jobs(self, repository, run):
+        """Only unprocessed jobs are pending, in recording order."""
+        repository.record_batch(run.id, 3, [_job(1), _job(2), _job(3)])
+
+        repository.mark_jobs_processed(run.id, [_job(2)])
+
+        pending = repository.get_pending_jobs(run.id)
+        assert [job["job_id"] for job in pending] == [1, 3]
+        assert pending[0]["date_posted"] == "2024-01-02 00:00:00+00:00"
+
+    def test_mark_jobs_processed_counts_each_job_once(self, repository, run):
+        """Marking a job twice, or an unrecorded job, does not inflate the counter."""
+        repository.record_batch(run.id, 1, [_job(1)])
+
+        assert repository.mark_jobs_processed(run.id, [_job(1), _job(1), _job(99)]) == 1
+        assert repository.mark_jobs_processed(run.id, [_job(1)]) == 0
+        assert repository.mark_jobs_processed(run.id, []) == 0
+
+        found = repository.find_unfinished_run(
+            1, '{"days": 1}', datetime.now(UTC) - timedelta(hours=1)
+        )
+        assert found.total_processed == 1
+
+    def test_mark_jobs_processed_marks_a_batch_in_one_transaction(self, repository, run):
+        """A batch is marked with one UPDATE and counted by the rows it changed."""
+        repository.record_batch(run.id, 4, [_job(1), _job(2), _job(3), _job(4)])
+        repository.mark_jobs_processed(run.id, [_job(1)])
+
+        assert repository.mark_jobs_processed(run.id, [_job(1), _job(2), _job(3)]) == 2
+
+        assert [job["job_id"] for job in repository.get_pending_jobs(run.id)] == [4]
+        found = repository.find_unfinished_run(
+            1, '{"days": 1}', datetime.now(UTC) - timedelta(hours=1)
+        )
+        assert found.total_processed == 3
+
+    def test_mark_scrape_completed(self, repository, run):
+        """The scrape completion flag is persisted."""
+        repository.mark_scrape_completed(run.id)
+
+        found = repository.find_unfinished_run(
+            1, '{"days": 1}', datetime.now(UTC) - timedelta(hours=1)
+        )
+        assert found.scrape_completed is True
+
+    def test_record_batch_raises_transaction_error(self, repository, run, db_session, monkeypatch):
+        """Database errors are reported as TransactionError."""
+
+        def failing_execute(*args, **kwargs):
+            raise SQLAlchemyError("boom")
+
+        monkeypatch.setattr(db_session, "execute", failing_execute)
+
+        with pytest.raises(TransactionError):
+            repository.record_batch(run.id, 1, [_job(1)])
@@ -1,9 +1,9 @@
 """Service for managing reference data entities."""
 
-from typing import Type, TypeVar
+from typing import Iterable, Type, TypeVar
 
 from sqlalchemy import select, ColumnElement
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import InstrumentedAttribute, Session
 
 from jobs_repository.interfaces import IReferenceDataService
 from jobs_repository.models import Company, Location, Category, Industry
@@ -30,6 +30,43 @@ class ReferenceDataService(IReferenceDataService):
         """Get existing industry or create new one."""
         return self._get_or_create(session, Industry, Industry.name == name, {"name": name})
 
+    def get_or_create_ids(
+        self, session: Session, model: Type[T], values: Iterable[str]
+    ) -> dict[str, int]:
+        """
+        Get or create many entities of one model in two round trips.
+
+        Existing entities are looked up with a single IN query and the missing
+        ones are inserted together in one flush.
+
+        Args:
+            session: SQLAlchemy session
+            model: Model class to query/create
+            values: Names (regions for locations) of the entities
+
+        Returns:
+            Mapping of each value to its entity ID
+        """
+        wanted = set(values)
+        if not wanted:
+            return {}
+
+        column = self._lookup_column(model)
+        stmt = select(column, model.id).where(column.in_(wanted))
+        ids: dict[str, int] = {value: entity_id for value, entity_id in session.execute(stmt)}
+
+        missing = [model(**{column.key: value}) for value in sorted(wanted - ids.keys())]
+        if missing:
+            session.add_all(missing)
+            session.flush()
+            ids.update({getattr(entity, column.key): entity.id for entity in missing})
+        return ids
+
+    @staticmethod
+    def _lookup_column(model: Type[T]) -> InstrumentedAttribute[str]:
+        """Return the unique column reference entities of model are looked up by."""
+        return model.region if model is Location else model.name
+
     def _get_or_create(
         self, session: Session, model: Type[T], condition: ColumnElement[bool], data: dict
     ) -> T:
@@ -183,3 +183,33 @@ class TestReferenceDataServiceEdgeCases:
 
         assert company1.id == company2.id == company3.id
         assert db_session.query(Company).filter_by(name="Consistent Corp").count() == 1
+
+
+class TestReferenceDataServiceGetOrCreateIds:
+    """Tests for get_or_create_ids method."""
+
+    def test_returns_existing_and_new_ids(self, reference_data_service, sample_company, db_session):
+        """Test existing entities are reused and missing ones created."""
+        ids = reference_data_service.get_or_create_ids(
+            db_session, Company, [sample_company.name, "New Co", "New Co"]
+        )
+
+        assert ids[sample_company.name] == sample_company.id
+        assert (
+            db_session.scalar(select(Company.id).where(Company.name == "New Co")) == ids["New Co"]
+        )
+        assert db_session.query(Company).count() == 2
+
+    def test_looks_up_locations_by_region(
+        self, reference_data_service, sample_location, db_session
+    ):
+        """Test locations are matched on their region."""
+        ids = reference_data_service.get_or_create_ids(
+            db_session, Location, [sample_location.region]
+        )
+
+        assert ids == {sample_location.region: sample_location.id}
+
+    def test_returns_empty_mapping_for_no_values(self, reference_data_service, db_session):
+        """Test no values means no queries and no entities."""
+        assert reference_data_service.get_or_create_ids(db_session, Industry, []) == {}
@@ -18,6 +18,12 @@ class JobModelDict(TypedDict, total=False):
     description: Optional[str]
     must_have_skills: Optional[list[list[str]]]
     nice_to_have_skills: Optional[list[list[str]]]
+    embedding: Optional[list[float]]
+    description_simhash: Optional[int]
+    simhash_band_0: Optional[int]
+    simhash_band_1: Optional[int]
+    simhash_band_2: Optional[int]
+    simhash_band_3: Optional[int]
 
     company_id: Optional[int]
     company_name: Optional[str]
@@ -4,12 +4,21 @@ from dataclasses import dataclass
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Callable, Optional, Protocol
-from unittest.mock import MagicMock
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, Protocol, TypeVar
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 
+T = TypeVar("T")
+
+
+async def async_iter(items: Iterable[T]) -> AsyncIterator[T]:
+    """Wrap items in an async generator, mirroring the orchestrator's async API."""
+    for item in items:
+        yield item
+
+
 # Protocol definitions for DI mocking (avoid importing production BotDependencies)
 class OrchestratorFactory(Protocol):
     def __call__(self, *, logger: Optional[Callable[[str], None]] = None) -> MagicMock: ...
@@ -296,6 +305,8 @@ def mock_orchestrator_factory():
         load_cv_error: Optional[Exception] = None,
         scrape_error: Optional[Exception] = None,
         upload_cv_error: Optional[Exception] = None,
+        run: Optional[MagicMock] = None,
+        pending_jobs: Optional[list[dict]] = None,
     ) -> MagicMock:
         orchestrator = MagicMock()
         orchestrator.has_cv.return_value = has_cv
@@ -312,15 +323,27 @@ def mock_orchestrator_factory():
         if upload_cv_error:
             orchestrator.upload_cv.side_effect = upload_cv_error
 
-        # Configure scrape_jobs_streaming
+        # Configure run checkpointing (no run ledger unless a run is given)
+        orchestrator.start_run.return_value = run
+        orchestrator.get_pending_jobs.return_value = pending_jobs or []
+
+        orchestrator.get_pipeline_timings.return_value = {
+            "elapsed_seconds": 1.0,
+            "jobs_per_second": 0.0,
+            "job_latency_p50_seconds": 0.0,
+            "job_latency_p95_seconds": 0.0,
+            "stages": {},
+        }
+
+        # Configure scrape_jobs_streaming_async
         if scrape_error:
-            orchestrator.scrape_jobs_streaming.side_effect = scrape_error
+            orchestrator.scrape_jobs_streaming_async.side_effect = scrape_error
         else:
-            orchestrator.scrape_jobs_streaming.return_value = iter(scraped_jobs or [])
+            orchestrator.scrape_jobs_streaming_async.return_value = async_iter(scraped_jobs or [])
 
         # Configure filter and process
-        orchestrator.filter_jobs_list.return_value = filtered_jobs or []
-        orchestrator.process_jobs_iterator.return_value = iter(processed_jobs or [])
+        orchestrator.filter_jobs_list_async = AsyncMock(return_value=filtered_jobs or [])
+        orchestrator.process_jobs_async.return_value = async_iter(processed_jobs or [])
 
         return orchestrator
 
@@ -4,6 +4,7 @@ from typing import Optional
 
 from typing_extensions import TypedDict
 
+from job_agent_platform_contracts import PipelineTimings
 from job_scrapper_contracts import JobDict
 
 
@@ -126,11 +127,40 @@ def format_job_message(result: JobResultDict, job_number: int, total_jobs: int)
     return message
 
 
+def format_pipeline_timings(timings: PipelineTimings) -> str:
+    """Format the latency and throughput breakdown of a search.
+
+    Stages are listed slowest first by wall-clock time.
+
+    Args:
+        timings: Timings recorded by the orchestrator
+
+    Returns:
+        Formatted timings section
+    """
+    lines = [
+        "⏱️ Performance:",
+        f"• Elapsed: {timings['elapsed_seconds']:.1f}s ({timings['jobs_per_second']:.2f} jobs/s)",
+        f"• Job latency: p50 {timings['job_latency_p50_seconds']:.2f}s, "
+        f"p95 {timings['job_latency_p95_seconds']:.2f}s",
+    ]
+    stages = sorted(
+        timings["stages"].items(), key=lambda item: item[1]["wall_seconds"], reverse=True
+    )
+    for name, stage in stages:
+        lines.append(
+            f"• {name}: {stage['wall_seconds']:.2f}s wall, "
+            f"{stage['cpu_seconds']:.2f}s CPU ({stage['calls']} calls)"
+        )
+    return "\n".join(lines)
+
+
 def format_search_summary(
     total_scraped: int,
     passed_filters: int,
     processed: int,
     relevant: int,
+    timings: Optional[PipelineTimings] = None,
 ) -> str:
     """Format search results summary.
 
@@ -139,19 +169,22 @@ def format_search_summary(
         passed_filters: Number of jobs that passed filters
         processed: Number of jobs processed
         relevant: Number of relevant jobs found
+        timings: Optional per-stage timings to include
 
     Returns:
         Formatted summary message
     """
-    return (
+    summary = (
         f"✅ Search completed!\n\n"
         f"📊 Results:\n"
         f"• Total scraped: {total_scraped}\n"
         f"• Passed filters: {passed_filters}\n"
         f"• Processed: {processed}\n"
         f"• Relevant jobs: {relevant}\n\n"
-        f"Sending relevant jobs..."
     )
+    if timings is not None:
+        summary += f"{format_pipeline_timings(timings)}\n\n"
+    return summary + "Sending relevant jobs..."
 
 
 def format_search_parameters(
@@ -372,6 +372,36 @@ class TestFormatSearchSummary:
         summary = format_search_summary(0, 0, 0, 0)
         assert "0" in summary
 
+    def test_omits_timings_by_default(self):
+        """Summary has no performance section unless timings are given."""
+        summary = format_search_summary(1, 1, 1, 1)
+        assert "Performance" not in summary
+
+    def test_includes_timings_breakdown(self):
+        """Summary shows throughput, latency percentiles and stages slowest first."""
+        timings = {
+            "elapsed_seconds": 20.0,
+            "jobs_per_second": 1.25,
+            "job_latency_p50_seconds": 1.5,
+            "job_latency_p95_seconds": 4.25,
+            "stages": {
+                "filter": {"wall_seconds": 0.5, "cpu_seconds": 0.4, "calls": 3},
+                "extract_must_have_skills": {
+                    "wall_seconds": 12.0,
+                    "cpu_seconds": 0.1,
+                    "calls": 25,
+                },
+            },
+        }
+
+        summary = format_search_summary(100, 50, 25, 10, timings=timings)
+
+        assert "1.25 jobs/s" in summary
+        assert "p50 1.50s" in summary
+        assert "p95 4.25s" in summary
+        assert summary.index("• extract_must_have_skills") < summary.index("• filter:")
+        assert summary.endswith("Sending relevant jobs...")
+
 
 class TestFormatSearchParameters:
     """Tests for format_search_parameters function."""
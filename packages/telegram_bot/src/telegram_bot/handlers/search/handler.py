@@ -3,11 +3,15 @@
 import asyncio
 import logging
 import traceback
-from typing import Any
+from contextlib import aclosing
+from typing import Optional
 
 from telegram import Update
 from telegram.ext import ContextTypes
 
+from job_agent_platform_contracts import PipelineRun
+from job_scrapper_contracts import JobDict
+
 from telegram_bot.di import get_dependencies
 
 from . import formatter
@@ -93,62 +97,23 @@ async def search_jobs_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
         relevant_count = 0
         sent_job_count = 0
 
-        def create_streaming_generator():
-            return orchestrator.scrape_jobs_streaming(
-                params["min_salary"],
-                params["employment_location"],
-                params["days"],
-                params["timeout"],
-            )
-
-        streaming_gen = await loop.run_in_executor(None, create_streaming_generator)
-
-        def get_next_batch(gen):
-            try:
-                return next(gen), False
-            except StopIteration:
-                return None, True
-
-        while True:
-            batch_result, is_done = await loop.run_in_executor(None, get_next_batch, streaming_gen)
-
-            if is_done:
-                break
-
-            batch_jobs, total_jobs_so_far = batch_result
-
-            if not active_searches.get(user_id, False):
-                await message.reply_text("🛑 Search cancelled by user.")
-                return
-
-            total_scraped = total_jobs_so_far
-            await message.reply_text(f"📄 Scraped {len(batch_jobs)} jobs (total: {total_scraped})")
-
-            filtered_batch = await loop.run_in_executor(
-                None, orchestrator.filter_jobs_list, batch_jobs
-            )
-            total_filtered += len(filtered_batch)
-
-            if not filtered_batch:
-                await message.reply_text("⏭️  No jobs passed filters, continuing...")
-                continue
-
-            await message.reply_text(f"🔍 {len(filtered_batch)} jobs passed filters, processing...")
-
-            def process_batch() -> list[tuple[int, int, Any]]:
-                return list(orchestrator.process_jobs_iterator(filtered_batch, cleaned_cv))
+        async def process_and_report(jobs: list[JobDict], run: Optional[PipelineRun]) -> bool:
+            """Process jobs and send the relevant ones. Returns False if cancelled."""
+            nonlocal total_processed, relevant_count, sent_job_count
 
             batch_relevant = []
-            for idx, total_batch, result in await loop.run_in_executor(None, process_batch):
-                if not active_searches.get(user_id, False):
-                    await message.reply_text("🛑 Search cancelled by user.")
-                    return
+            processed_jobs = orchestrator.process_jobs_async(jobs, cleaned_cv, run=run)
+            async with aclosing(processed_jobs):
+                async for _, _, result in processed_jobs:
+                    if not active_searches.get(user_id, False):
+                        await message.reply_text("🛑 Search cancelled by user.")
+                        return False
 
-                total_processed += 1
+                    total_processed += 1
 
-                if result.get("is_relevant"):
-                    batch_relevant.append(result)
-                    relevant_count += 1
+                    if result.get("is_relevant"):
+                        batch_relevant.append(result)
+                        relevant_count += 1
 
             if batch_relevant:
                 await message.reply_text(f"✨ Found {len(batch_relevant)} relevant job(s)!")
@@ -160,7 +125,62 @@ async def search_jobs_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
                     )
                     await message.reply_text(job_message)
             else:
-                await message.reply_text(f"⏭️  Processed {len(filtered_batch)} jobs, none relevant")
+                await message.reply_text(f"⏭️  Processed {len(jobs)} jobs, none relevant")
+            return True
+
+        run = await loop.run_in_executor(
+            None,
+            orchestrator.start_run,
+            user_id,
+            params["min_salary"],
+            params["employment_location"],
+            params["days"],
+        )
+        if run is not None:
+            pending_jobs = await loop.run_in_executor(None, orchestrator.get_pending_jobs, run)
+            if pending_jobs:
+                await message.reply_text(
+                    f"♻️ Resuming previous search: {len(pending_jobs)} job(s) left to process..."
+                )
+                total_filtered += len(pending_jobs)
+                if not await process_and_report(pending_jobs, run):
+                    return
+
+        scraped_batches = orchestrator.scrape_jobs_streaming_async(
+            params["min_salary"],
+            params["employment_location"],
+            params["days"],
+            params["timeout"],
+            run=run,
+        )
+
+        async with aclosing(scraped_batches):
+            async for batch_jobs, total_jobs_so_far in scraped_batches:
+                if not active_searches.get(user_id, False):
+                    await message.reply_text("🛑 Search cancelled by user.")
+                    return
+
+                total_scraped = total_jobs_so_far
+                await message.reply_text(
+                    f"📄 Scraped {len(batch_jobs)} jobs (total: {total_scraped})"
+                )
+
+                filtered_batch = await orchestrator.filter_jobs_list_async(batch_jobs, run=run)
+                total_filtered += len(filtered_batch)
+
+                if not filtered_batch:
+                    await message.reply_text("⏭️  No jobs passed filters, continuing...")
+                    continue
+
+                await message.reply_text(
+                    f"🔍 {len(filtered_batch)} jobs passed filters, processing..."
+                )
+
+                if not await process_and_report(filtered_batch, run):
+                    return
+
+        if run is not None:
+            await loop.run_in_executor(None, orchestrator.finish_run, run)
 
         await message.reply_text(
             formatter.format_search_summary(
@@ -168,6 +188,7 @@ async def search_jobs_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
                 passed_filters=total_filtered,
                 processed=total_processed,
                 relevant=relevant_count,
+                timings=orchestrator.get_pipeline_timings(),
             )
         )
 
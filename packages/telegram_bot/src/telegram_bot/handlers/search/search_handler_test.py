@@ -1,8 +1,10 @@
 """Tests for search command handler."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
-from telegram_bot.conftest import MockUser
+from telegram_bot.conftest import MockUser, async_iter
 from telegram_bot.handlers.search.handler import search_jobs_handler
 from telegram_bot.handlers.state import active_searches
 
@@ -186,7 +188,7 @@ class TestSearchHandlerErrorHandling:
     async def test_handles_scrape_error(self, handler_test_setup_factory, mock_orchestrator):
         """Handler should handle errors during scraping."""
         # mock_orchestrator defaults to has_cv=True; configure scrape error
-        mock_orchestrator.scrape_jobs_streaming.side_effect = Exception("Scrape failed")
+        mock_orchestrator.scrape_jobs_streaming_async.side_effect = Exception("Scrape failed")
         setup = handler_test_setup_factory(user_id=7402)
 
         await search_jobs_handler(setup.update, setup.context)
@@ -245,19 +247,19 @@ class TestSearchHandlerWithJobs:
         """Handler should process scraped jobs through the pipeline."""
         # mock_orchestrator defaults to has_cv=True; configure jobs
         jobs_batch = [{"id": 1, "title": "Developer"}]
-        mock_orchestrator.scrape_jobs_streaming.return_value = iter([(jobs_batch, 1)])
-        mock_orchestrator.filter_jobs_list.return_value = jobs_batch
+        mock_orchestrator.scrape_jobs_streaming_async.return_value = async_iter([(jobs_batch, 1)])
+        mock_orchestrator.filter_jobs_list_async.return_value = jobs_batch
         setup = handler_test_setup_factory(user_id=7601)
 
         await search_jobs_handler(setup.update, setup.context)
 
-        mock_orchestrator.filter_jobs_list.assert_called()
+        mock_orchestrator.filter_jobs_list_async.assert_awaited()
 
     async def test_reports_scraped_job_count(self, handler_test_setup_factory, mock_orchestrator):
         """Handler should report the number of scraped jobs."""
         # mock_orchestrator defaults to has_cv=True; configure jobs
         jobs_batch = [{"id": i, "title": f"Job {i}"} for i in range(5)]
-        mock_orchestrator.scrape_jobs_streaming.return_value = iter([(jobs_batch, 5)])
+        mock_orchestrator.scrape_jobs_streaming_async.return_value = async_iter([(jobs_batch, 5)])
         setup = handler_test_setup_factory(user_id=7602)
 
         await search_jobs_handler(setup.update, setup.context)
@@ -269,8 +271,8 @@ class TestSearchHandlerWithJobs:
         # mock_orchestrator defaults to has_cv=True; configure jobs
         jobs_batch = [{"id": i} for i in range(10)]
         filtered_jobs = [{"id": i} for i in range(3)]
-        mock_orchestrator.scrape_jobs_streaming.return_value = iter([(jobs_batch, 10)])
-        mock_orchestrator.filter_jobs_list.return_value = filtered_jobs
+        mock_orchestrator.scrape_jobs_streaming_async.return_value = async_iter([(jobs_batch, 10)])
+        mock_orchestrator.filter_jobs_list_async.return_value = filtered_jobs
         setup = handler_test_setup_factory(user_id=7603)
 
         await search_jobs_handler(setup.update, setup.context)
@@ -291,9 +293,9 @@ class TestSearchHandlerWithJobs:
                 "url": "https://example.com/job/1",
             },
         }
-        mock_orchestrator.scrape_jobs_streaming.return_value = iter([(jobs_batch, 1)])
-        mock_orchestrator.filter_jobs_list.return_value = jobs_batch
-        mock_orchestrator.process_jobs_iterator.return_value = iter([(0, 1, relevant_job)])
+        mock_orchestrator.scrape_jobs_streaming_async.return_value = async_iter([(jobs_batch, 1)])
+        mock_orchestrator.filter_jobs_list_async.return_value = jobs_batch
+        mock_orchestrator.process_jobs_async.return_value = async_iter([(0, 1, relevant_job)])
         setup = handler_test_setup_factory(user_id=7604)
 
         await search_jobs_handler(setup.update, setup.context)
@@ -301,6 +303,78 @@ class TestSearchHandlerWithJobs:
         assert any("Python Developer" in text for text in setup.message._reply_texts)
         assert any("Test Corp" in text for text in setup.message._reply_texts)
 
+    async def test_cancellation_closes_scrape_stream(
+        self, handler_test_setup_factory, mock_orchestrator
+    ):
+        """Handler should stop the async scrape stream when the search is cancelled."""
+        user_id = 7605
+        stream_closed = []
+
+        async def scraped_batches():
+            try:
+                yield [{"id": 1}], 1
+                active_searches[user_id] = False
+                yield [{"id": 2}], 2
+            finally:
+                stream_closed.append(True)
+
+        mock_orchestrator.scrape_jobs_streaming_async.return_value = scraped_batches()
+        setup = handler_test_setup_factory(user_id=user_id)
+
+        await search_jobs_handler(setup.update, setup.context)
+
+        assert any("cancelled" in text.lower() for text in setup.message._reply_texts)
+        assert stream_closed == [True]
+        mock_orchestrator.filter_jobs_list_async.assert_awaited_once()
+
+
+class TestSearchHandlerResume:
+    """Tests for resuming checkpointed search runs."""
+
+    async def test_processes_pending_jobs_before_scraping(
+        self, handler_test_setup_factory, mock_orchestrator
+    ):
+        """Jobs left over from an interrupted run are processed first."""
+        run = MagicMock()
+        pending_job = {"id": 1, "title": "Developer"}
+        mock_orchestrator.start_run.return_value = run
+        mock_orchestrator.get_pending_jobs.return_value = [pending_job]
+        mock_orchestrator.process_jobs_async.return_value = async_iter(
+            [(1, 1, {"is_relevant": False})]
+        )
+        setup = handler_test_setup_factory(user_id=7701, args=["days=1"])
+
+        await search_jobs_handler(setup.update, setup.context)
+
+        mock_orchestrator.start_run.assert_called_once_with(7701, 4000, "remote", 1)
+        mock_orchestrator.get_pending_jobs.assert_called_once_with(run)
+        assert any("Resuming" in text for text in setup.message._reply_texts)
+        process_args = mock_orchestrator.process_jobs_async.call_args
+        assert process_args.args[0] == [pending_job]
+        assert process_args.kwargs["run"] is run
+        assert mock_orchestrator.scrape_jobs_streaming_async.call_args.kwargs["run"] is run
+        mock_orchestrator.finish_run.assert_called_once_with(run)
+
+    async def test_cancelled_search_leaves_run_unfinished(
+        self, handler_test_setup_factory, mock_orchestrator
+    ):
+        """A cancelled search is not marked finished, so it can be resumed."""
+        user_id = 7702
+        run = MagicMock()
+        mock_orchestrator.start_run.return_value = run
+
+        async def scraped_batches():
+            active_searches[user_id] = False
+            yield [{"id": 1}], 1
+
+        mock_orchestrator.scrape_jobs_streaming_async.return_value = scraped_batches()
+        setup = handler_test_setup_factory(user_id=user_id)
+
+        await search_jobs_handler(setup.update, setup.context)
+
+        assert any("cancelled" in text.lower() for text in setup.message._reply_texts)
+        mock_orchestrator.finish_run.assert_not_called()
+
 
 class TestSearchHandlerDaysParameter:
     """Tests for days parameter handling in search handler.
@@ -321,8 +395,8 @@ class TestSearchHandlerDaysParameter:
 
         await search_jobs_handler(setup.update, setup.context)
 
-        # Verify scrape_jobs_streaming was called with days=None
-        call_args = mock_orchestrator.scrape_jobs_streaming.call_args
+        # Verify scrape_jobs_streaming_async was called with days=None
+        call_args = mock_orchestrator.scrape_jobs_streaming_async.call_args
         days_arg = call_args[0][2]  # Third positional argument (days)
         assert days_arg is None, "days should be None when not provided"
 
@@ -335,8 +409,8 @@ class TestSearchHandlerDaysParameter:
 
         await search_jobs_handler(setup.update, setup.context)
 
-        # Verify scrape_jobs_streaming was called with days=7
-        call_args = mock_orchestrator.scrape_jobs_streaming.call_args
+        # Verify scrape_jobs_streaming_async was called with days=7
+        call_args = mock_orchestrator.scrape_jobs_streaming_async.call_args
         days_arg = call_args[0][2]  # Third positional argument (days)
         assert days_arg == 7, "days should be 7 when explicitly provided"
 
@@ -0,0 +1,20 @@
+"""Import-time regression tests based on `python -X importtime` output."""
+
+import pytest
+
+from job_agent_backend.conftest import import_times, imported_heavy_modules
+
+
+class TestBotImportTime:
+    """The bot starts without importing the modules needed by its first command."""
+
+    def test_heavy_modules_are_not_imported(self) -> None:
+        times = import_times("telegram_bot.main")
+
+        assert imported_heavy_modules(times) == []
+
+    @pytest.mark.benchmark
+    def test_reports_import_time(self) -> None:
+        times = import_times("telegram_bot.main")
+
+        print(f"\ntelegram_bot.main imported in {times['telegram_bot.main']:.3f}s")
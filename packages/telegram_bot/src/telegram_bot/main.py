@@ -10,19 +10,42 @@ Or from the package directory:
 import argparse
 import atexit
 import logging
+import threading
 
 from dotenv import load_dotenv
 
+from job_agent_backend.container import get_essay_search_service, warm_up
+
 from telegram_bot.bot import create_bot
 
 
+def _resume_pending_essays() -> None:
+    """Embed essays left pending by failed background work or the last shutdown."""
+    logger = logging.getLogger(__name__)
+    try:
+        updated = get_essay_search_service().backfill_embeddings()
+    except Exception as e:
+        logger.warning("Failed to resume pending essay embeddings: %s", e)
+        return
+    if updated:
+        logger.info("Generated embeddings for %d pending essays", updated)
+
+
 def main() -> None:
     """Main entry point for the Telegram bot."""
     parser = argparse.ArgumentParser(description="Job Agent Telegram Bot")
     parser.add_argument(
         "--check",
         action="store_true",
-        help="Validate startup (imports, dependencies, handlers) and exit without polling",
+        help=(
+            "Validate startup (imports, dependencies, handlers), report how long each "
+            "warm-up step took and exit without polling"
+        ),
+    )
+    parser.add_argument(
+        "--no-warmup",
+        action="store_true",
+        help="Skip preloading models, opening database connections and checking the broker",
     )
 
     args = parser.parse_args()
@@ -54,10 +77,20 @@ def main() -> None:
     bot = create_bot()
     bot.build_application()
 
+    if not args.no_warmup:
+        # Each step logs how long it took, so --check reports the warm-up too
+        logger.info("Warming up models and database pool, checking message broker...")
+        steps = warm_up()
+        failed = [step.name for step in steps if step.error is not None]
+        if failed:
+            logger.warning("Warm-up steps failed: %s", ", ".join(failed))
+
     if args.check:
         logger.info("Startup check passed: bot initialized successfully")
         return
 
+    # Runs at backfill priority, behind essays added through the bot
+    threading.Thread(target=_resume_pending_essays, name="essay-backfill", daemon=True).start()
     bot.run()
 
 